@@ -18,6 +18,10 @@ class Settings(BaseSettings):
     stale_threshold_ms: int = Field(default=300000, ge=1)
     stale_cleanup_every_n_flushes: int = Field(default=60, ge=1)
     polis_fetch_timeout_seconds: float = Field(default=30.0, gt=0)
+    content_processing_processes: int = Field(default=2, ge=0)
+    google_language_detection_max_concurrency: int = Field(default=8, ge=1)
+    language_detection_cache_max_entries: int = Field(default=50000, ge=0)
+    language_detection_cache_ttl_seconds: int = Field(default=2592000, ge=0)
 
     google_cloud_project_id: str | None = Field(
         default=None,
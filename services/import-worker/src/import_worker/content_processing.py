@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING
+
+from import_worker.html import process_user_generated_html_with_counted_text
+from import_worker.language_detection import (
+    GoogleLanguageDetector,
+    SourceLanguageHint,
+    SourceLanguageMetadata,
+    detect_source_languages,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from multiprocessing.context import BaseContext
+
+    from import_worker.language_detection_cache import LanguageDetectionCache
+
+LOGGER = logging.getLogger(__name__)
+# Below this, pickling texts to worker processes costs more than it saves
+PARALLEL_HTML_MIN_TEXTS = 200
+HTML_CHUNKS_PER_WORKER = 4
+
+# A module-level function plus partial pickles without importing lingua in the children
+_sanitize_output_html = partial(
+    process_user_generated_html_with_counted_text,
+    enable_links=True,
+    mode="output",
+)
+
+
+class HtmlProcessPool:
+    """Process pool for HTML sanitization, replaced when a worker process dies.
+
+    Shared by every import thread; a batch that hits a broken pool raises
+    BrokenProcessPool once, and later batches run on the replacement.
+    """
+
+    def __init__(self, *, max_workers: int, mp_context: BaseContext | None = None) -> None:
+        self.max_workers = max_workers
+        # forkserver children never inherit the worker's threads or DB sockets
+        self._mp_context = mp_context or multiprocessing.get_context("forkserver")
+        self._lock = threading.Lock()
+        self._executor = self._start_executor()
+
+    def _start_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._mp_context)
+
+    def sanitize(self, texts: Sequence[str]) -> list[tuple[str, str]]:
+        with self._lock:
+            executor = self._executor
+        chunksize = max(1, len(texts) // (self.max_workers * HTML_CHUNKS_PER_WORKER))
+        try:
+            return list(executor.map(_sanitize_output_html, texts, chunksize=chunksize))
+        except BrokenProcessPool:
+            self._replace_broken_executor(executor)
+            raise
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._executor.shutdown()
+
+    def _replace_broken_executor(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            # Another thread may already have replaced it
+            if self._executor is broken:
+                LOGGER.warning("Replacing broken HTML sanitization process pool")
+                self._executor = self._start_executor()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass(frozen=True)
+class ContentProcessingOptions:
+    html_pool: HtmlProcessPool | None = None
+    google_max_concurrency: int = 1
+    language_detection_cache: LanguageDetectionCache | None = None
+
+
+@dataclass(frozen=True)
+class ProcessedOpinionContent:
+    content: str
+    content_plain_text: str
+    source_language: SourceLanguageMetadata
+
+
+def process_opinion_contents(
+    texts: Sequence[str],
+    *,
+    is_seed: Sequence[bool],
+    content_language_hints: list[SourceLanguageHint],
+    google_detector: GoogleLanguageDetector | None,
+    options: ContentProcessingOptions,
+) -> list[ProcessedOpinionContent]:
+    """Sanitize and detect the language of a conversation's opinions as one batch.
+
+    HTML sanitization is CPU-bound pure Python, so it runs on the options'
+    process pool when one is given and the batch is large enough. If that
+    pool breaks, the batch is sanitized inline instead.
+    Language detection then runs once over every plain text; only seed
+    opinions may fall back to Google.
+    """
+    sanitized: list[tuple[str, str]] | None = None
+    html_pool = options.html_pool
+    if html_pool is not None and len(texts) >= PARALLEL_HTML_MIN_TEXTS:
+        try:
+            sanitized = html_pool.sanitize(texts)
+        except BrokenProcessPool:
+            LOGGER.warning("HTML sanitization pool broke, sanitizing %d texts inline", len(texts))
+    if sanitized is None:
+        sanitized = [_sanitize_output_html(text) for text in texts]
+
+    source_languages = detect_source_languages(
+        [content_plain_text for _, content_plain_text in sanitized],
+        google_detector=google_detector,
+        language_hints=content_language_hints,
+        use_google=is_seed,
+        google_max_concurrency=options.google_max_concurrency,
+        cache=options.language_detection_cache,
+    )
+    return [
+        ProcessedOpinionContent(
+            content=content,
+            content_plain_text=content_plain_text,
+            source_language=source_language,
+        )
+        for (content, content_plain_text), source_language in zip(
+            sanitized,
+            source_languages,
+            strict=True,
+        )
+    ]
@@ -1,28 +1,43 @@
 from __future__ import annotations
 
 import csv
+from array import array
 from io import StringIO
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
 
 from import_worker.import_models import (
     CommentCsvRow,
+    ImportedVotes,
     ImportPolisResults,
     PolisComment,
     PolisConversationData,
-    PolisVoteRecord,
     SummaryCsvRow,
-    VoteCsvRow,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
 SUMMARY_FILE = "summaryFile"
 COMMENTS_FILE = "commentsFile"
 VOTES_FILE = "votesFile"
+MAX_REPORTED_ERRORS = 10
+VOTE_REQUIRED_COLUMNS = ("timestamp", "datetime", "comment-id", "voter-id", "vote")
+VOTE_OPTIONAL_COLUMNS = ("important",)
+# Voter and comment ids are packed into one int key for deduplication
+MAX_VOTE_ID = 2**31 - 1
+
+type CsvSource = str | Iterable[str]
+
+
+def _lines(source: CsvSource) -> Iterable[str]:
+    return StringIO(source) if isinstance(source, str) else source
 
 
-def _parse_summary_csv(content: str) -> SummaryCsvRow:
+def _parse_summary_csv(content: CsvSource) -> SummaryCsvRow:
     data: dict[str, str] = {}
-    for row in csv.reader(StringIO(content), skipinitialspace=True):
+    for row in csv.reader(_lines(content), skipinitialspace=True):
         if len(row) >= 2:
             data[row[0].strip()] = row[1].strip()
     return SummaryCsvRow.model_validate(data)
@@ -30,19 +45,19 @@ def _parse_summary_csv(content: str) -> SummaryCsvRow:
 
 def _parse_table_csv[T: BaseModel](
     *,
-    content: str,
+    content: CsvSource,
     row_model: type[T],
     name: str,
 ) -> list[T]:
     rows: list[T] = []
     errors: list[str] = []
-    reader = csv.DictReader(StringIO(content), skipinitialspace=True)
+    reader = csv.DictReader(_lines(content), skipinitialspace=True)
     for row_number, row in enumerate(reader, start=2):
         try:
             rows.append(row_model.model_validate(row))
         except Exception as error:
             errors.append(f"Row {row_number}: {error}")
-            if len(errors) >= 10:
+            if len(errors) >= MAX_REPORTED_ERRORS:
                 break
 
     if errors:
@@ -52,7 +67,133 @@ def _parse_table_csv[T: BaseModel](
     return rows
 
 
-def build_import_from_csv(files: dict[str, str]) -> ImportPolisResults:
+def _parse_vote_id(value: str, *, column: str) -> int:
+    parsed = int(value)
+    if not 0 <= parsed <= MAX_VOTE_ID:
+        msg = f"{column} must be between 0 and {MAX_VOTE_ID}"
+        raise ValueError(msg)
+    return parsed
+
+
+def _iter_vote_rows(content: CsvSource) -> Iterator[tuple[int, int, int, int]]:
+    """Yield (timestamp, voter_id, comment_id, vote) per row without a model per row.
+
+    Accepts known columns only, integer fields, vote in {-1, 0, 1} and
+    important in {0, 1}. Raises once the stream ends, or after
+    MAX_REPORTED_ERRORS invalid rows.
+    """
+    reader = csv.reader(_lines(content), skipinitialspace=True)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("Votes CSV contains no data rows")
+    columns = [column.strip() for column in header]
+    unknown_columns = set(columns) - {*VOTE_REQUIRED_COLUMNS, *VOTE_OPTIONAL_COLUMNS}
+    missing_columns = [column for column in VOTE_REQUIRED_COLUMNS if column not in columns]
+    if unknown_columns or missing_columns or len(set(columns)) != len(columns):
+        raise ValueError(
+            "Votes CSV validation failed:\n"
+            f"Header: expected columns {', '.join(VOTE_REQUIRED_COLUMNS)} "
+            f"and optionally {', '.join(VOTE_OPTIONAL_COLUMNS)}, got {', '.join(columns)}",
+        )
+    timestamp_index = columns.index("timestamp")
+    voter_index = columns.index("voter-id")
+    comment_index = columns.index("comment-id")
+    vote_index = columns.index("vote")
+    important_index = columns.index("important") if "important" in columns else None
+
+    errors: list[str] = []
+    row_number = 1
+    for row in reader:
+        if not row:
+            continue
+        row_number += 1
+        try:
+            if len(row) != len(columns):
+                msg = f"expected {len(columns)} fields, got {len(row)}"
+                raise ValueError(msg)
+            vote = int(row[vote_index])
+            if vote not in {-1, 0, 1}:
+                msg = "vote must be -1, 0, or 1"
+                raise ValueError(msg)
+            if important_index is not None and int(row[important_index]) not in {0, 1}:
+                msg = "important must be 0 or 1"
+                raise ValueError(msg)
+            parsed = (
+                int(row[timestamp_index]),
+                _parse_vote_id(row[voter_index], column="voter-id"),
+                _parse_vote_id(row[comment_index], column="comment-id"),
+                vote,
+            )
+        except ValueError as error:
+            errors.append(f"Row {row_number}: {error}")
+            if len(errors) >= MAX_REPORTED_ERRORS:
+                break
+            continue
+        if not errors:
+            yield parsed
+
+    if errors:
+        raise ValueError("Votes CSV validation failed:\n" + "\n".join(errors))
+    if row_number == 1:
+        raise ValueError("Votes CSV contains no data rows")
+
+
+def _parse_votes_csv(content: CsvSource) -> ImportedVotes:
+    """Stream the votes CSV into compact columns, keeping the latest vote per voter/comment.
+
+    "Latest" is by timestamp, with later rows winning ties, and votes keep
+    the order of each pair's earliest vote. This matches sorting every row
+    by timestamp and deduplicating, without holding the rows: memory grows
+    with the distinct (voter, comment) pairs only, at roughly 150 bytes each
+    while parsing and 17 bytes each in the result.
+    """
+    slot_by_key: dict[int, int] = {}
+    # Per slot: the earliest vote (ordering) and the latest vote (value)
+    first_timestamps = array("q")
+    first_rows = array("q")
+    latest_timestamps = array("q")
+    keys = array("q")
+    votes = array("b")
+    row_count = 0
+    for row_index, (timestamp, voter_id, comment_id, vote) in enumerate(
+        _iter_vote_rows(content),
+    ):
+        row_count = row_index + 1
+        key = voter_id << 32 | comment_id
+        slot = slot_by_key.get(key)
+        if slot is None:
+            slot_by_key[key] = len(keys)
+            first_timestamps.append(timestamp)
+            first_rows.append(row_index)
+            latest_timestamps.append(timestamp)
+            keys.append(key)
+            votes.append(vote)
+            continue
+        if timestamp < first_timestamps[slot]:
+            first_timestamps[slot] = timestamp
+            first_rows[slot] = row_index
+        if timestamp >= latest_timestamps[slot]:
+            latest_timestamps[slot] = timestamp
+            votes[slot] = vote
+    del slot_by_key, latest_timestamps
+
+    order = sorted(
+        range(len(keys)),
+        key=lambda slot: first_timestamps[slot] * row_count + first_rows[slot],
+    )
+    return ImportedVotes(
+        participant_ids=array("q", (keys[slot] >> 32 for slot in order)),
+        statement_ids=array("q", (keys[slot] & MAX_VOTE_ID for slot in order)),
+        votes=array("b", (votes[slot] for slot in order)),
+    )
+
+
+def build_import_from_csv(files: Mapping[str, CsvSource]) -> ImportPolisResults:
+    """Build an import from the three Polis export files.
+
+    Each file may be a string or any iterable of lines, such as an open text
+    file. Votes are streamed and never materialized as row models.
+    """
     summary_content = files.get(SUMMARY_FILE)
     comments_content = files.get(COMMENTS_FILE)
     votes_content = files.get(VOTES_FILE)
@@ -65,16 +206,7 @@ def build_import_from_csv(files: dict[str, str]) -> ImportPolisResults:
         row_model=CommentCsvRow,
         name="Comments",
     )
-    votes = _parse_table_csv(
-        content=votes_content,
-        row_model=VoteCsvRow,
-        name="Votes",
-    )
-
-    sorted_votes = sorted(votes, key=lambda row: row.timestamp)
-    deduplicated_votes: dict[tuple[int, int], VoteCsvRow] = {}
-    for vote in sorted_votes:
-        deduplicated_votes[(vote.voter_id, vote.comment_id)] = vote
+    votes = _parse_votes_csv(votes_content)
 
     return ImportPolisResults(
         report_id=None,
@@ -104,16 +236,5 @@ def build_import_from_csv(files: dict[str, str]) -> ImportPolisResults:
             )
             for comment in comments
         ],
-        votes_data=[
-            PolisVoteRecord(
-                statement_id=vote.comment_id,
-                participant_id=vote.voter_id,
-                vote=vote.vote,
-                conversation_id=None,
-                datetime=vote.datetime,
-                modified=None,
-                weight_x_32767=None,
-            )
-            for vote in deduplicated_votes.values()
-        ],
+        votes_data=votes,
     )
@@ -121,6 +121,16 @@ def process_user_generated_html(
     return normalized
 
 
+def process_user_generated_html_with_counted_text(
+    value: str,
+    *,
+    enable_links: bool,
+    mode: str = "output",
+) -> tuple[str, str]:
+    processed = process_user_generated_html(value, enable_links=enable_links, mode=mode)
+    return processed, html_to_counted_text(processed)
+
+
 def html_to_counted_text(value: str) -> str:
     text_with_newlines = re.sub(r"</p>", "\n", value, flags=re.IGNORECASE)
     text_with_newlines = re.sub(
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Literal
+from array import array
+from typing import TYPE_CHECKING, Literal, NamedTuple
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter, field_validator
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 
 class PolisConversationData(BaseModel):
@@ -53,14 +57,82 @@ class PolisVoteRecord(BaseModel):
         return value
 
 
+class ImportedVote(NamedTuple):
+    participant_id: int
+    statement_id: int
+    vote: int
+
+
+class ImportedVotes:
+    """Deduplicated votes stored as parallel arrays, about 17 bytes per vote.
+
+    Iteration and indexing build one `ImportedVote` at a time, so large
+    imports never hold a Python object per vote.
+    """
+
+    def __init__(
+        self,
+        *,
+        participant_ids: array[int],
+        statement_ids: array[int],
+        votes: array[int],
+    ) -> None:
+        if not len(participant_ids) == len(statement_ids) == len(votes):
+            msg = "vote columns must have the same length"
+            raise ValueError(msg)
+        self.participant_ids = participant_ids
+        self.statement_ids = statement_ids
+        self.votes = votes
+
+    @classmethod
+    def from_records(cls, records: Iterable[PolisVoteRecord]) -> ImportedVotes:
+        participant_ids = array("q")
+        statement_ids = array("q")
+        votes = array("b")
+        for record in records:
+            participant_ids.append(record.participant_id)
+            statement_ids.append(record.statement_id)
+            votes.append(record.vote)
+        return cls(participant_ids=participant_ids, statement_ids=statement_ids, votes=votes)
+
+    def __len__(self) -> int:
+        return len(self.votes)
+
+    def __getitem__(self, index: int) -> ImportedVote:
+        return ImportedVote(
+            participant_id=self.participant_ids[index],
+            statement_id=self.statement_ids[index],
+            vote=self.votes[index],
+        )
+
+    def __iter__(self) -> Iterator[ImportedVote]:
+        for participant_id, statement_id, vote in zip(
+            self.participant_ids,
+            self.statement_ids,
+            self.votes,
+            strict=True,
+        ):
+            yield ImportedVote(participant_id=participant_id, statement_id=statement_id, vote=vote)
+
+
+POLIS_VOTE_RECORDS = TypeAdapter(list[PolisVoteRecord])
+
+
 class ImportPolisResults(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
     report_id: str | None
     conversation_id: str | int | None
     conversation_data: PolisConversationData
     comments_data: list[PolisComment]
-    votes_data: list[PolisVoteRecord]
+    votes_data: ImportedVotes
+
+    @field_validator("votes_data", mode="before")
+    @classmethod
+    def pack_votes_data(cls, value: object) -> object:
+        if isinstance(value, ImportedVotes):
+            return value
+        return ImportedVotes.from_records(POLIS_VOTE_RECORDS.validate_python(value))
 
 
 class SummaryCsvRow(BaseModel):
@@ -100,22 +172,3 @@ class CommentCsvRow(BaseModel):
             msg = "moderated must be -1, 0, or 1"
             raise ValueError(msg)
         return value
-
-
-class VoteCsvRow(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-
-    timestamp: int
-    datetime: str
-    comment_id: int = Field(alias="comment-id")
-    voter_id: int = Field(alias="voter-id")
-    vote: int
-    important: int | None = Field(default=None, ge=0, le=1)
-
-    @field_validator("vote")
-    @classmethod
-    def validate_vote(cls, value: int) -> int:
-        if value not in {-1, 0, 1}:
-            msg = "vote must be -1, 0, or 1"
-            raise ValueError(msg)
-        return value
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
-from pydantic import BaseModel, TypeAdapter
+from psycopg import sql as psycopg_sql
 from reddwarf.data_loader import Loader
-from sqlalchemy import and_, case, desc, select, update
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    Uuid,
+    and_,
+    desc,
+    select,
+    text,
+    update,
+)
 from sqlalchemy import insert as sqlalchemy_insert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from import_worker.content_processing import (
+    ContentProcessingOptions,
+    ProcessedOpinionContent,
+    process_opinion_contents,
+)
 from import_worker.csv_import import build_import_from_csv
 from import_worker.generated_import_contracts import FailureReason
 from import_worker.generated_models import (
@@ -30,13 +52,11 @@ from import_worker.generated_models import (
     Notification,
     NotificationImport,
     Opinion,
-    OpinionContent,
     OpinionGroupSpec,
     OpinionModeration,
     PolisConversationConfig,
     User,
     Vote,
-    VoteContent,
 )
 from import_worker.generated_shared_types import (
     MAX_LENGTH_CONVERSATION_BODY_HTML,
@@ -45,7 +65,7 @@ from import_worker.generated_shared_types import (
 )
 from import_worker.html import html_to_counted_text, process_user_generated_html
 from import_worker.ids import generate_random_slug_id, generate_uuid
-from import_worker.import_models import ImportPolisResults
+from import_worker.import_models import POLIS_VOTE_RECORDS, ImportedVotes, ImportPolisResults
 from import_worker.language_detection import (
     GoogleLanguageDetector,
     SourceLanguageHint,
@@ -56,8 +76,10 @@ from import_worker.polis_url import extract_polis_id_from_url
 
 if TYPE_CHECKING:
     import uuid
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Executor, Future
 
+    import psycopg
     from sqlalchemy.orm import Session
 
     from import_worker.queue import ImportNotificationEvent, ImportRequest
@@ -81,8 +103,20 @@ class PolisLoader(Protocol):
 
     def load_api_data_conversation(self) -> object: ...
 
+    def load_votes(self, *, cancelled: threading.Event) -> None: ...
+
+
+class PolisVotesCancelledError(RuntimeError):
+    pass
+
 
 class RedDwarfPolisLoader:
+    """Loads everything except votes on construction; call `load_votes` next.
+
+    Votes are the slow part (the API path makes one request per participant),
+    so the importer downloads them while it writes the conversation.
+    """
+
     def __init__(
         self,
         *,
@@ -127,8 +161,18 @@ class RedDwarfPolisLoader:
     def load_api_data_conversation(self) -> object:
         return self._loader.load_api_data_conversation()
 
+    def load_votes(self, *, cancelled: threading.Event) -> None:
+        self._loader.load_deferred_votes(cancelled=cancelled)
+
 
 class TimeoutRedDwarfLoader(Loader):
+    """red-dwarf Loader with request timeouts and votes loaded on demand.
+
+    load_api_data and load_remote_export_data follow reddwarf.data_loader.Loader
+    at the red-dwarf commit pinned in pyproject.toml, minus the vote downloads;
+    re-check them against upstream when bumping that pin.
+    """
+
     _request_timeout_seconds: float
 
     def __init__(
@@ -157,9 +201,93 @@ class TimeoutRedDwarfLoader(Loader):
 
         session.request = request_with_timeout
 
+    def load_api_data(self) -> None:
+        # Loader.load_api_data without the per-participant vote requests
+        loader: Any = self
+        if loader.report_id:
+            loader.load_api_data_report()
+            conversation_id_from_report_id = loader.report_data["conversation_id"]
+            if loader.conversation_id and (
+                loader.conversation_id != conversation_id_from_report_id
+            ):
+                raise ValueError("report_id conflicts with conversation_id")
+            loader.conversation_id = conversation_id_from_report_id
+        loader.load_api_data_conversation()
+        loader.load_api_data_comments()
+        loader.load_api_data_math()
+
+    def load_remote_export_data(self) -> None:
+        # Loader.load_remote_export_data without votes.csv
+        loader: Any = self
+        loader.load_remote_export_data_comments(self._export_directory_url())
+        comments_data: list[dict[str, object]] = loader.comments_data
+        if comments_data and comments_data[0]["is_meta"] is None:
+            # The CSV export may lack is_meta; the API comments carry it
+            warnings.warn(
+                "CSV import is missing is_meta field. "
+                "Attempting to load comments data from API instead...",
+                stacklevel=2,
+            )
+            try:
+                if loader.report_id and not loader.conversation_id:
+                    loader.load_api_data_report()
+                    loader.conversation_id = loader.report_data["conversation_id"]
+                loader.load_api_data_comments()
+            except Exception as error:
+                msg = "Polis CSV export is missing is_meta and the API fallback failed"
+                raise ValueError(msg) from error
+
+    def load_deferred_votes(self, *, cancelled: threading.Event) -> None:
+        loader: Any = self
+        if loader.data_source == "csv_export":
+            _raise_if_votes_cancelled(cancelled)
+            loader.load_remote_export_data_votes(self._export_directory_url())
+            loader.filter_duplicate_votes(keep="recent")
+        else:
+            self.load_api_data_votes(last_participant_id=loader.math_data["n"], cancelled=cancelled)
+
+    def load_api_data_votes(
+        self,
+        last_participant_id: int | None = None,
+        *,
+        cancelled: threading.Event | None = None,
+    ) -> None:
+        # Loader.load_api_data_votes makes one request per participant; once
+        # cancelled, the next one raises instead of going out
+        load_api_data_votes: Any = vars(Loader)["load_api_data_votes"]
+        if cancelled is None:
+            load_api_data_votes(self, last_participant_id=last_participant_id)
+            return
+        session: Any = self.session
+        original_get = session.get
+
+        def get_unless_cancelled(url: str, **kwargs: Any) -> Any:
+            _raise_if_votes_cancelled(cancelled)
+            return original_get(url, **kwargs)
+
+        session.get = get_unless_cancelled
+        try:
+            load_api_data_votes(self, last_participant_id=last_participant_id)
+        finally:
+            session.get = original_get
+
+    def _export_directory_url(self) -> str:
+        loader: Any = self
+        if loader.directory_url:
+            return loader.directory_url
+        if loader.report_id:
+            return loader.get_polis_export_directory_url(loader.report_id)
+        msg = "Cannot determine CSV export URL without report_id or directory_url"
+        raise ValueError(msg)
+
+
+def _raise_if_votes_cancelled(cancelled: threading.Event) -> None:
+    if cancelled.is_set():
+        msg = "Polis vote download cancelled"
+        raise PolisVotesCancelledError(msg)
+
 
 LOGGER = logging.getLogger(__name__)
-CHUNK_SIZE = 1000
 
 
 @dataclass(frozen=True)
@@ -223,30 +351,113 @@ class AnalysisSchedule:
     should_enqueue_analysis: bool
 
 
-class InsertedOpinionRow(BaseModel):
-    id: int
-    slug_id: str
-
-
-class InsertedOpinionContentRow(BaseModel):
-    id: int
-    opinion_id: int
-
-
-class InsertedVoteRow(BaseModel):
-    id: int
-    polis_vote_id: int | None
-
-
-class InsertedVoteContentRow(BaseModel):
-    id: int
-    vote_id: int
-
-
-INSERTED_OPINION_ROWS = TypeAdapter(list[InsertedOpinionRow])
-INSERTED_OPINION_CONTENT_ROWS = TypeAdapter(list[InsertedOpinionContentRow])
-INSERTED_VOTE_ROWS = TypeAdapter(list[InsertedVoteRow])
-INSERTED_VOTE_CONTENT_ROWS = TypeAdapter(list[InsertedVoteContentRow])
+# Transaction-scoped staging tables for the opinion and vote COPY loads. The
+# final tables reference each other through current_content_id, so rows
+# can't be COPYed into them directly.
+OPINION_STAGING_TABLE = Table(
+    "opinion_import_staging",
+    MetaData(),
+    Column("opinion_id", Integer, nullable=False),
+    Column("opinion_content_id", Integer, nullable=False),
+    Column("slug_id", Text, nullable=False),
+    Column("author_id", Uuid(as_uuid=True), nullable=False),
+    Column("is_seed", Boolean, nullable=False),
+    Column("num_agrees", Integer, nullable=False),
+    Column("num_disagrees", Integer, nullable=False),
+    Column("num_passes", Integer, nullable=False),
+    Column("content", Text, nullable=False),
+    Column("content_plain_text", Text, nullable=False),
+    Column("source_language_code", Text),
+    Column("source_raw_language_code", Text),
+    Column("source_language_provider", Text),
+    Column("source_language_confidence", Float(precision=53)),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+OPINION_STAGING_COPY_COLUMNS = (
+    ("opinion_id", "int4"),
+    ("opinion_content_id", "int4"),
+    ("slug_id", "text"),
+    ("author_id", "uuid"),
+    ("is_seed", "bool"),
+    ("num_agrees", "int4"),
+    ("num_disagrees", "int4"),
+    ("num_passes", "int4"),
+    ("content", "text"),
+    ("content_plain_text", "text"),
+    ("source_language_code", "text"),
+    ("source_raw_language_code", "text"),
+    ("source_language_provider", "text"),
+    ("source_language_confidence", "float8"),
+)
+INSERT_STAGED_OPINIONS = text(
+    """
+    WITH inserted_opinion AS (
+        INSERT INTO opinion (
+            id, slug_id, author_id, conversation_id, current_content_id,
+            is_seed, num_agrees, num_disagrees, num_passes, updated_at
+        )
+        OVERRIDING SYSTEM VALUE
+        SELECT
+            opinion_id, slug_id, author_id, :conversation_id, opinion_content_id,
+            is_seed, num_agrees, num_disagrees, num_passes, :updated_at
+        FROM opinion_import_staging
+    )
+    INSERT INTO opinion_content (
+        id, opinion_id, conversation_content_id, content, content_plain_text,
+        source_language_code, source_raw_language_code, source_language_provider,
+        source_language_confidence
+    )
+    OVERRIDING SYSTEM VALUE
+    SELECT
+        opinion_content_id, opinion_id, :conversation_content_id, content, content_plain_text,
+        CAST(source_language_code AS spoken_language_code), source_raw_language_code,
+        CAST(source_language_provider AS language_detection_provider),
+        source_language_confidence
+    FROM opinion_import_staging
+    """,
+)
+VOTE_STAGING_TABLE = Table(
+    "vote_import_staging",
+    MetaData(),
+    Column("author_id", Uuid(as_uuid=True), nullable=False),
+    Column("opinion_id", Integer, nullable=False),
+    Column("opinion_content_id", Integer, nullable=False),
+    Column("polis_vote_id", Integer, nullable=False),
+    Column("vote", Text, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+VOTE_STAGING_COPY_COLUMNS = (
+    ("author_id", "uuid"),
+    ("opinion_id", "int4"),
+    ("opinion_content_id", "int4"),
+    ("polis_vote_id", "int4"),
+    ("vote", "text"),
+)
+# Both inserts run in one statement, so the foreign keys between vote and
+# vote_content are only checked once both sets of rows exist.
+INSERT_STAGED_VOTES = text(
+    """
+    WITH staged AS MATERIALIZED (
+        SELECT
+            nextval(pg_get_serial_sequence('vote', 'id')) AS vote_id,
+            nextval(pg_get_serial_sequence('vote_content', 'id')) AS vote_content_id,
+            author_id, opinion_id, opinion_content_id, polis_vote_id, vote
+        FROM vote_import_staging
+    ),
+    inserted_vote AS (
+        INSERT INTO vote (id, author_id, opinion_id, polis_vote_id, current_content_id, updated_at)
+        OVERRIDING SYSTEM VALUE
+        SELECT vote_id, author_id, opinion_id, polis_vote_id, vote_content_id, :updated_at
+        FROM staged
+    )
+    INSERT INTO vote_content (id, vote_id, opinion_content_id, vote)
+    OVERRIDING SYSTEM VALUE
+    SELECT vote_content_id, vote_id, opinion_content_id, CAST(vote AS vote_enum_all)
+    FROM staged
+    """,
+)
 
 
 def now_zero_ms() -> datetime:
@@ -257,11 +468,6 @@ def _elapsed_ms(started_at: float) -> float:
     return (time.perf_counter() - started_at) * 1000
 
 
-def _chunks[T](items: list[T], chunk_size: int) -> Iterable[list[T]]:
-    for index in range(0, len(items), chunk_size):
-        yield items[index : index + chunk_size]
-
-
 def _truncate_with_ellipsis(value: str, *, max_length: int, ellipsis: str) -> str:
     if len(value) <= max_length:
         return value
@@ -300,11 +506,27 @@ def import_translation_target_language_codes(
     return list(dict.fromkeys(target_languages))[:3]
 
 
-def _build_imported_polis_conversation(
+@dataclass(frozen=True)
+class ImportSource:
+    # votes_data stays empty until `votes` resolves, except for CSV uploads
+    imported: ImportPolisResults
+    polis_url_type: str
+    votes: Future[ImportedVotes] | None
+
+
+def start_import_source(
     request: ImportRequest,
     *,
     polis_fetch_timeout_seconds: float,
-) -> tuple[ImportPolisResults, str]:
+    votes_executor: Executor,
+    votes_cancelled: threading.Event,
+) -> ImportSource:
+    """Load the conversation and comments, and start downloading votes.
+
+    The vote download runs on `votes_executor` so the conversation and its
+    opinion contents can be prepared meanwhile; see `wait_for_votes`. Setting
+    `votes_cancelled` stops the download before its next Polis request.
+    """
     load_started_at = time.perf_counter()
     if request.type == "csv":
         imported = build_import_from_csv(request.files.model_dump(by_alias=True))
@@ -316,7 +538,7 @@ def _build_imported_polis_conversation(
             len(imported.votes_data),
             _elapsed_ms(load_started_at),
         )
-        return imported, "csv"
+        return ImportSource(imported=imported, polis_url_type="csv", votes=None)
 
     polis_id = extract_polis_id_from_url(request.polis_url)
     loader: PolisLoader
@@ -343,19 +565,49 @@ def _build_imported_polis_conversation(
             "conversation_id": loader.conversation_id,
             "conversation_data": loader.conversation_data,
             "comments_data": loader.comments_data,
-            "votes_data": loader.votes_data,
+            "votes_data": [],
         },
     )
     LOGGER.info(
         "Loaded import source importSlugId=%s importType=url polisUrlType=%s comments=%s "
-        "votes=%s durationMs=%.1f",
+        "durationMs=%.1f",
         request.import_slug_id,
         polis_url_type,
         len(imported.comments_data),
-        len(imported.votes_data),
         _elapsed_ms(load_started_at),
     )
-    return imported, polis_url_type
+
+    def load_votes() -> ImportedVotes:
+        votes_started_at = time.perf_counter()
+        loader.load_votes(cancelled=votes_cancelled)
+        votes = ImportedVotes.from_records(POLIS_VOTE_RECORDS.validate_python(loader.votes_data))
+        LOGGER.info(
+            "Downloaded import votes importSlugId=%s votes=%s durationMs=%.1f",
+            request.import_slug_id,
+            len(votes),
+            _elapsed_ms(votes_started_at),
+        )
+        return votes
+
+    return ImportSource(
+        imported=imported,
+        polis_url_type=polis_url_type,
+        votes=votes_executor.submit(load_votes),
+    )
+
+
+def wait_for_votes(request: ImportRequest, *, source: ImportSource) -> ImportPolisResults:
+    if source.votes is None:
+        return source.imported
+    wait_started_at = time.perf_counter()
+    votes = source.votes.result()
+    LOGGER.info(
+        "Waited for import votes importSlugId=%s votes=%s waitMs=%.1f",
+        request.import_slug_id,
+        len(votes),
+        _elapsed_ms(wait_started_at),
+    )
+    return source.imported.model_copy(update={"votes_data": votes})
 
 
 def _conversation_urls(
@@ -541,7 +793,7 @@ def _insert_imported_users(
     participant_ids = sorted(
         {
             *[comment.participant_id for comment in imported.comments_data],
-            *[vote.participant_id for vote in imported.votes_data],
+            *imported.votes_data.participant_ids,
         },
     )
     user_id_per_participant_id = {
@@ -563,17 +815,17 @@ def _insert_imported_users(
     moderated_statement_ids = {
         comment.statement_id for comment in imported.comments_data if comment.moderated == -1
     }
-    participant_ids_from_unmoderated_votes = [
-        vote.participant_id
-        for vote in imported.votes_data
-        if vote.statement_id not in moderated_statement_ids
-    ]
-    participant_ids_from_all_votes = [vote.participant_id for vote in imported.votes_data]
-    participant_count = len(set(participant_ids_from_unmoderated_votes))
-    vote_count = len(participant_ids_from_unmoderated_votes)
+    participant_ids_from_unmoderated_votes: set[int] = set()
+    vote_count = 0
+    for vote in imported.votes_data:
+        if vote.statement_id not in moderated_statement_ids:
+            participant_ids_from_unmoderated_votes.add(vote.participant_id)
+            vote_count += 1
+    participant_ids_from_all_votes = set(imported.votes_data.participant_ids)
+    participant_count = len(participant_ids_from_unmoderated_votes)
     opinion_count = len(imported.comments_data) - len(moderated_statement_ids)
     if participant_count != imported.conversation_data.participant_count:
-        participant_count_for_all_votes = len(set(participant_ids_from_all_votes))
+        participant_count_for_all_votes = len(participant_ids_from_all_votes)
         LOGGER.warning(
             "[Import] Calculated participantCount=%s but Polis returned %s. "
             "ParticipantCountIncludingModerated=%s",
@@ -587,7 +839,7 @@ def _insert_imported_users(
         participant_count=participant_count,
         vote_count=vote_count,
         opinion_count=opinion_count,
-        total_participant_count=len(set(participant_ids_from_all_votes)),
+        total_participant_count=len(participant_ids_from_all_votes),
         total_vote_count=len(imported.votes_data),
         total_opinion_count=len(imported.comments_data),
         moderated_opinion_count=len(moderated_statement_ids),
@@ -609,14 +861,43 @@ def imported_opinion_source_language_metadata(
     )
 
 
+def _process_imported_opinion_contents(
+    *,
+    imported: ImportPolisResults,
+    conversation_ids: ConversationIds,
+    google_detector: GoogleLanguageDetector | None,
+    content_processing: ContentProcessingOptions,
+) -> list[ProcessedOpinionContent]:
+    return process_opinion_contents(
+        [
+            _truncate_with_ellipsis(
+                comment.txt,
+                max_length=MAX_LENGTH_OPINION_HTML_OUTPUT,
+                ellipsis=" [...]",
+            )
+            for comment in imported.comments_data
+        ],
+        is_seed=[comment.is_seed or False for comment in imported.comments_data],
+        content_language_hints=conversation_ids.content_language_hints,
+        google_detector=google_detector,
+        options=content_processing,
+    )
+
+
 def _insert_opinions(
     session: Session,
     *,
     imported: ImportPolisResults,
     conversation_ids: ConversationIds,
     participant_data: ParticipantData,
-    google_detector: GoogleLanguageDetector | None,
+    processed_contents: list[ProcessedOpinionContent],
 ) -> OpinionInsertData:
+    """COPY opinions and their contents with ids reserved up front.
+
+    Both rows reference each other, so they go through a staging table and
+    one statement that inserts both, with current_content_id already set.
+    `processed_contents` lines up with `imported.comments_data`.
+    """
     vote_counts_by_statement_id: dict[int, dict[str, int]] = {}
     for vote in imported.votes_data:
         counts = vote_counts_by_statement_id.setdefault(
@@ -630,105 +911,71 @@ def _insert_opinions(
         else:
             counts["passes"] += 1
 
-    statement_id_per_opinion_slug_id: dict[str, int] = {}
-    opinion_values: list[dict[str, Any]] = []
-    for comment in imported.comments_data:
-        opinion_slug_id = generate_random_slug_id()
-        statement_id_per_opinion_slug_id[opinion_slug_id] = comment.statement_id
+    opinion_ids = _allocate_ids(session, table_name="opinion", count=len(imported.comments_data))
+    opinion_content_ids = _allocate_ids(
+        session,
+        table_name="opinion_content",
+        count=len(imported.comments_data),
+    )
+    opinion_id_per_statement_id: dict[int, int] = {}
+    opinion_content_id_per_opinion_id: dict[int, int] = {}
+    staged_values: list[dict[str, object]] = []
+    seed_opinion_content_sources: list[SeedOpinionContentSource] = []
+    for comment, opinion_id, opinion_content_id, processed_content in zip(
+        imported.comments_data,
+        opinion_ids,
+        opinion_content_ids,
+        processed_contents,
+        strict=True,
+    ):
+        opinion_id_per_statement_id[comment.statement_id] = opinion_id
+        opinion_content_id_per_opinion_id[opinion_id] = opinion_content_id
         counts = vote_counts_by_statement_id.get(
             comment.statement_id,
             {"agrees": 0, "disagrees": 0, "passes": 0},
         )
-        opinion_values.append(
+        source_language_metadata = processed_content.source_language
+        staged_values.append(
             {
-                "slug_id": opinion_slug_id,
+                "opinion_id": opinion_id,
+                "opinion_content_id": opinion_content_id,
+                "slug_id": generate_random_slug_id(),
                 "author_id": participant_data.user_id_per_participant_id[comment.participant_id],
-                "current_content_id": None,
-                "conversation_id": conversation_ids.conversation_id,
                 "is_seed": comment.is_seed or False,
                 "num_agrees": counts["agrees"],
                 "num_disagrees": counts["disagrees"],
                 "num_passes": counts["passes"],
-            },
-        )
-
-    raw_inserted_opinion_rows: object = (
-        session.execute(
-            sqlalchemy_insert(Opinion)
-            .values(opinion_values)
-            .returning(Opinion.id, Opinion.slug_id),
-        )
-        .mappings()
-        .all()
-    )
-    inserted_opinion_rows = INSERTED_OPINION_ROWS.validate_python(
-        raw_inserted_opinion_rows,
-    )
-    opinion_id_per_statement_id = {
-        statement_id_per_opinion_slug_id[row.slug_id]: row.id for row in inserted_opinion_rows
-    }
-
-    content_values: list[dict[str, Any]] = []
-    source_language_code_per_opinion_id: dict[int, str | None] = {}
-    for comment in imported.comments_data:
-        content = process_user_generated_html(
-            _truncate_with_ellipsis(
-                comment.txt,
-                max_length=MAX_LENGTH_OPINION_HTML_OUTPUT,
-                ellipsis=" [...]",
-            ),
-            enable_links=True,
-            mode="output",
-        )
-        content_plain_text = html_to_counted_text(content)
-        opinion_id = opinion_id_per_statement_id[comment.statement_id]
-        source_language_metadata = imported_opinion_source_language_metadata(
-            content_plain_text=content_plain_text,
-            is_seed=comment.is_seed or False,
-            content_language_hints=conversation_ids.content_language_hints,
-            google_detector=google_detector,
-        )
-        source_language_code_per_opinion_id[opinion_id] = (
-            source_language_metadata.language_code
-        )
-        content_values.append(
-            {
-                "opinion_id": opinion_id,
-                "conversation_content_id": conversation_ids.conversation_content_id,
-                "content": content,
-                "content_plain_text": content_plain_text,
+                "content": processed_content.content,
+                "content_plain_text": processed_content.content_plain_text,
                 "source_language_code": source_language_metadata.language_code,
                 "source_raw_language_code": source_language_metadata.raw_language_code,
                 "source_language_provider": source_language_metadata.provider,
                 "source_language_confidence": source_language_metadata.confidence,
             },
         )
-    raw_inserted_content_rows: object = (
-        session.execute(
-            sqlalchemy_insert(OpinionContent)
-            .values(content_values)
-            .returning(OpinionContent.id, OpinionContent.opinion_id),
-        )
-        .mappings()
-        .all()
+        if comment.is_seed:
+            seed_opinion_content_sources.append(
+                SeedOpinionContentSource(
+                    content_id=opinion_content_id,
+                    source_language_code=source_language_metadata.language_code,
+                ),
+            )
+
+    OPINION_STAGING_TABLE.create(session.connection())
+    _copy_rows(
+        session,
+        table_name=OPINION_STAGING_TABLE.name,
+        columns=OPINION_STAGING_COPY_COLUMNS,
+        values=staged_values,
     )
-    inserted_content_rows = INSERTED_OPINION_CONTENT_ROWS.validate_python(
-        raw_inserted_content_rows,
+    session.execute(
+        INSERT_STAGED_OPINIONS,
+        {
+            "conversation_id": conversation_ids.conversation_id,
+            "conversation_content_id": conversation_ids.conversation_content_id,
+            "updated_at": now_zero_ms(),
+        },
     )
-    opinion_content_id_per_opinion_id = {row.opinion_id: row.id for row in inserted_content_rows}
-
-    for chunk in _chunks(inserted_content_rows, CHUNK_SIZE):
-        session.execute(
-            update(Opinion)
-            .where(Opinion.id.in_([row.opinion_id for row in chunk]))
-            .values(
-                current_content_id=case(
-                    *[(Opinion.id == row.opinion_id, row.id) for row in chunk],
-                    else_=Opinion.current_content_id,
-                ),
-                updated_at=now_zero_ms(),
-            ),
-        )
 
     moderated_values = [
         {
@@ -742,18 +989,6 @@ def _insert_opinions(
     if moderated_values:
         session.execute(sqlalchemy_insert(OpinionModeration), moderated_values)
     session.commit()
-    seed_opinion_content_sources: list[SeedOpinionContentSource] = []
-    for comment in imported.comments_data:
-        if not comment.is_seed:
-            continue
-        opinion_id = opinion_id_per_statement_id[comment.statement_id]
-        opinion_content_id = opinion_content_id_per_opinion_id[opinion_id]
-        seed_opinion_content_sources.append(
-            SeedOpinionContentSource(
-                content_id=opinion_content_id,
-                source_language_code=source_language_code_per_opinion_id[opinion_id],
-            ),
-        )
 
     return OpinionInsertData(
         opinion_id_per_statement_id=opinion_id_per_statement_id,
@@ -768,76 +1003,71 @@ def _insert_votes(
     imported: ImportPolisResults,
     opinions: OpinionInsertData,
     participant_data: ParticipantData,
-    conversation_slug_id: str,
 ) -> None:
-    vote_values: list[dict[str, Any]] = []
-    vote_content_inputs: dict[int, dict[str, Any]] = {}
-    for polis_vote_id, vote in enumerate(imported.votes_data):
-        opinion_id = opinions.opinion_id_per_statement_id[vote.statement_id]
-        vote_values.append(
-            {
+    """COPY votes into a staging table, then insert votes and vote contents in one statement.
+
+    Rows are streamed into COPY one at a time. Vote and vote-content ids are
+    drawn from their identity sequences inside the insert, so
+    current_content_id is set without a follow-up UPDATE.
+    """
+
+    def staged_votes() -> Iterator[dict[str, object]]:
+        for polis_vote_id, vote in enumerate(imported.votes_data):
+            opinion_id = opinions.opinion_id_per_statement_id[vote.statement_id]
+            yield {
                 "author_id": participant_data.user_id_per_participant_id[vote.participant_id],
                 "opinion_id": opinion_id,
-                "current_content_id": None,
+                "opinion_content_id": opinions.opinion_content_id_per_opinion_id[opinion_id],
                 "polis_vote_id": polis_vote_id,
-            },
-        )
-        vote_content_inputs[polis_vote_id] = {
-            "opinion_content_id": opinions.opinion_content_id_per_opinion_id[opinion_id],
-            "vote": "agree" if vote.vote == 1 else "disagree" if vote.vote == -1 else "pass",
-        }
-
-    inserted_vote_rows: list[InsertedVoteRow] = []
-    for chunk in _chunks(vote_values, CHUNK_SIZE):
-        raw_inserted_vote_rows: object = (
-            session.execute(
-                sqlalchemy_insert(Vote).values(chunk).returning(Vote.id, Vote.polis_vote_id),
-            )
-            .mappings()
-            .all()
-        )
-        inserted_vote_rows.extend(
-            INSERTED_VOTE_ROWS.validate_python(raw_inserted_vote_rows),
-        )
+                "vote": "agree" if vote.vote == 1 else "disagree" if vote.vote == -1 else "pass",
+            }
 
-    vote_content_values: list[dict[str, Any]] = []
-    for row in inserted_vote_rows:
-        if row.polis_vote_id is None or row.polis_vote_id not in vote_content_inputs:
-            raise RuntimeError(
-                "[Import] Data is out of sync while importing "
-                f"voteId={row.id}, polisVoteId={row.polis_vote_id} "
-                f"with conversationSlugId={conversation_slug_id}",
-            )
-        vote_content_values.append({"vote_id": row.id, **vote_content_inputs[row.polis_vote_id]})
+    VOTE_STAGING_TABLE.create(session.connection())
+    _copy_rows(
+        session,
+        table_name=VOTE_STAGING_TABLE.name,
+        columns=VOTE_STAGING_COPY_COLUMNS,
+        values=staged_votes(),
+    )
+    session.execute(INSERT_STAGED_VOTES, {"updated_at": now_zero_ms()})
+    session.commit()
 
-    inserted_vote_content_rows: list[InsertedVoteContentRow] = []
-    for chunk in _chunks(vote_content_values, CHUNK_SIZE):
-        raw_inserted_vote_content_rows: object = (
-            session.execute(
-                sqlalchemy_insert(VoteContent)
-                .values(chunk)
-                .returning(VoteContent.id, VoteContent.vote_id),
-            )
-            .mappings()
-            .all()
-        )
-        inserted_vote_content_rows.extend(
-            INSERTED_VOTE_CONTENT_ROWS.validate_python(raw_inserted_vote_content_rows),
-        )
 
-    for chunk in _chunks(inserted_vote_content_rows, CHUNK_SIZE):
-        session.execute(
-            update(Vote)
-            .where(Vote.id.in_([row.vote_id for row in chunk]))
-            .values(
-                current_content_id=case(
-                    *[(Vote.id == row.vote_id, row.id) for row in chunk],
-                    else_=Vote.current_content_id,
-                ),
-                updated_at=now_zero_ms(),
+def _allocate_ids(session: Session, *, table_name: str, count: int) -> list[int]:
+    """Reserve `count` ids from the table's identity sequence in one round-trip."""
+    if count == 0:
+        return []
+    return list(
+        session.scalars(
+            text(
+                "SELECT nextval(pg_get_serial_sequence(:table_name, 'id')) "
+                "FROM generate_series(1, :count)",
             ),
-        )
-    session.commit()
+            {"table_name": table_name, "count": count},
+        ),
+    )
+
+
+def _copy_rows(
+    session: Session,
+    *,
+    table_name: str,
+    columns: tuple[tuple[str, str], ...],
+    values: Iterable[dict[str, object]],
+) -> None:
+    driver_connection = cast(
+        "psycopg.Connection[Any]",
+        session.connection().connection.driver_connection,
+    )
+    column_names = [column_name for column_name, _copy_type in columns]
+    statement = psycopg_sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(
+        psycopg_sql.Identifier(table_name),
+        psycopg_sql.SQL(", ").join(psycopg_sql.Identifier(name) for name in column_names),
+    )
+    with driver_connection.cursor() as cursor, cursor.copy(statement) as copy:
+        copy.set_types([copy_type for _column_name, copy_type in columns])
+        for value in values:
+            copy.write_row([value[column_name] for column_name in column_names])
 
 
 def _create_content_translation_work(
@@ -1308,9 +1538,13 @@ def process_import_request(
     request: ImportRequest,
     google_detector: GoogleLanguageDetector | None = None,
     polis_fetch_timeout_seconds: float,
+    content_processing: ContentProcessingOptions | None = None,
 ) -> ImportProcessResult:
     conversation_id: int | None = None
     import_started_at = time.perf_counter()
+    # Downloads this import's votes while the conversation is written
+    votes_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="polis-votes")
+    votes_cancelled = threading.Event()
     try:
         import_user_id = _get_import_user_id(session, import_slug_id=request.import_slug_id)
         if str(import_user_id) != request.actor_user_id:
@@ -1320,9 +1554,11 @@ def process_import_request(
                 f"import owner {import_user_id}",
             )
 
-        imported, polis_url_type = _build_imported_polis_conversation(
+        source = start_import_source(
             request,
             polis_fetch_timeout_seconds=polis_fetch_timeout_seconds,
+            votes_executor=votes_executor,
+            votes_cancelled=votes_cancelled,
         )
         active_google_detector = google_detector_for_import(
             request=request,
@@ -1332,8 +1568,8 @@ def process_import_request(
         conversation_ids = _create_conversation(
             session,
             request=request,
-            imported=imported,
-            polis_url_type=polis_url_type,
+            imported=source.imported,
+            polis_url_type=source.polis_url_type,
             google_detector=active_google_detector,
         )
         conversation_id = conversation_ids.conversation_id
@@ -1345,6 +1581,22 @@ def process_import_request(
             _elapsed_ms(phase_started_at),
         )
         phase_started_at = time.perf_counter()
+        processed_contents = _process_imported_opinion_contents(
+            imported=source.imported,
+            conversation_ids=conversation_ids,
+            google_detector=active_google_detector,
+            content_processing=content_processing or ContentProcessingOptions(),
+        )
+        LOGGER.info(
+            "Processed imported statement contents importSlugId=%s conversationSlugId=%s "
+            "statements=%s durationMs=%.1f",
+            request.import_slug_id,
+            conversation_ids.conversation_slug_id,
+            len(processed_contents),
+            _elapsed_ms(phase_started_at),
+        )
+        imported = wait_for_votes(request, source=source)
+        phase_started_at = time.perf_counter()
         participant_data = _insert_imported_users(
             session,
             imported=imported,
@@ -1365,7 +1617,7 @@ def process_import_request(
             imported=imported,
             conversation_ids=conversation_ids,
             participant_data=participant_data,
-            google_detector=active_google_detector,
+            processed_contents=processed_contents,
         )
         LOGGER.info(
             "Inserted imported statements importSlugId=%s conversationSlugId=%s "
@@ -1385,7 +1637,6 @@ def process_import_request(
             imported=imported,
             opinions=opinions,
             participant_data=participant_data,
-            conversation_slug_id=conversation_ids.conversation_slug_id,
         )
         LOGGER.info(
             "Inserted imported votes importSlugId=%s conversationSlugId=%s votes=%s "
@@ -1466,6 +1717,11 @@ def process_import_request(
             _soft_delete_imported_users_for_conversation(session, conversation_id=conversation_id)
             session.commit()
         raise
+    finally:
+        # A failed import must not wait for a vote download it no longer needs,
+        # and a download already running stops before its next request
+        votes_cancelled.set()
+        votes_executor.shutdown(wait=False, cancel_futures=True)
 
 
 def mark_import_failed(
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from importlib import import_module
-from typing import Literal, Protocol, TypeGuard
+from typing import TYPE_CHECKING, Literal, Protocol, TypeGuard
 
 from lingua import Language, LanguageDetectorBuilder
 
 from import_worker.generated_models import SpokenLanguageCode
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from import_worker.language_detection_cache import LanguageDetectionCache
+
 LINGUA_MINIMUM_RELATIVE_DISTANCE = 0.2
 LINGUA_MINIMUM_LANGUAGE_CONFIDENCE = 0.4
 HIGH_GLOBAL_LANGUAGE_CONFIDENCE = 0.55
@@ -89,36 +95,142 @@ def detect_source_language(
     google_detector: GoogleLanguageDetector | None = None,
     language_hints: list[SourceLanguageHint] | None = None,
 ) -> SourceLanguageMetadata:
-    cleaned_text = text.strip()
-    if cleaned_text == "":
-        return SourceLanguageMetadata(language_code=None, confidence=None)
+    return detect_source_languages(
+        [text],
+        google_detector=google_detector,
+        language_hints=language_hints,
+    )[0]
 
-    local_detection_policy = local_language_detection_policy_for_text(cleaned_text)
-    if not local_detection_policy.allow_local_detection:
-        if google_detector is None:
-            return SourceLanguageMetadata(language_code=None, confidence=None)
-        return _detect_source_language_with_google(
-            cleaned_text,
+
+def detect_source_languages(
+    texts: Sequence[str],
+    *,
+    google_detector: GoogleLanguageDetector | None = None,
+    language_hints: list[SourceLanguageHint] | None = None,
+    use_google: Sequence[bool] | None = None,
+    google_max_concurrency: int = 1,
+    cache: LanguageDetectionCache | None = None,
+) -> list[SourceLanguageMetadata]:
+    """Detect the source language of many texts, one result per text.
+
+    Lingua scores the whole batch through its multi-threaded APIs. Texts it
+    leaves undetected fall back to Google when `use_google` allows it (all
+    texts by default), with up to `google_max_concurrency` requests in flight.
+    With a `cache`, repeated texts are detected once and earlier results reused.
+    """
+    if cache is None:
+        return _detect_source_languages_uncached(
+            texts,
             google_detector=google_detector,
+            language_hints=language_hints,
+            use_google=use_google,
+            google_max_concurrency=google_max_concurrency,
         )
 
     hints = language_hints or []
-    local_metadata = _detect_source_language_with_lingua_cleaned(cleaned_text)
-    hinted_metadata = resolve_hinted_source_language(
-        cleaned_text,
-        global_metadata=local_metadata,
+    google_allowed = [
+        google_detector is not None and (use_google is None or use_google[index])
+        for index in range(len(texts))
+    ]
+    keys = [
+        cache.key(text.strip(), language_hints=hints, use_google=allowed)
+        for text, allowed in zip(texts, google_allowed, strict=True)
+    ]
+    found = cache.get_many(list(dict.fromkeys(keys)))
+    first_index_per_missing_key: dict[str, int] = {}
+    for index, key in enumerate(keys):
+        if key not in found:
+            first_index_per_missing_key.setdefault(key, index)
+    missing_indexes = list(first_index_per_missing_key.values())
+    detected = _detect_source_languages_uncached(
+        [texts[index] for index in missing_indexes],
+        google_detector=google_detector,
         language_hints=hints,
+        use_google=[google_allowed[index] for index in missing_indexes],
+        google_max_concurrency=google_max_concurrency,
     )
-    if hinted_metadata.language_code is not None:
-        return hinted_metadata
+    detected_per_key = {
+        keys[index]: metadata for index, metadata in zip(missing_indexes, detected, strict=True)
+    }
+    # A Google request that raised leaves no provider; retry those next time
+    cache.put_many(
+        {
+            keys[index]: metadata
+            for index, metadata in zip(missing_indexes, detected, strict=True)
+            if not (google_allowed[index] and metadata.provider is None)
+        },
+    )
+    return [found.get(key) or detected_per_key[key] for key in keys]
 
-    if google_detector is None:
-        return hinted_metadata
 
-    return _detect_source_language_with_google(
-        cleaned_text,
-        google_detector=google_detector,
+def _detect_source_languages_uncached(
+    texts: Sequence[str],
+    *,
+    google_detector: GoogleLanguageDetector | None,
+    language_hints: list[SourceLanguageHint] | None,
+    use_google: Sequence[bool] | None,
+    google_max_concurrency: int,
+) -> list[SourceLanguageMetadata]:
+    cleaned_texts = [text.strip() for text in texts]
+    results = [SourceLanguageMetadata(language_code=None, confidence=None) for _ in texts]
+    local_indexes: list[int] = []
+    google_indexes: list[int] = []
+    for index, cleaned_text in enumerate(cleaned_texts):
+        if cleaned_text == "":
+            continue
+        if local_language_detection_policy_for_text(cleaned_text).allow_local_detection:
+            local_indexes.append(index)
+        else:
+            google_indexes.append(index)
+
+    local_texts = [cleaned_texts[index] for index in local_indexes]
+    local_metadata = _detect_source_languages_with_lingua_cleaned(local_texts)
+    # Strong global results never consult the hints, so skip scoring them
+    hinted_positions = [
+        position
+        for position, metadata in enumerate(local_metadata)
+        if metadata.language_code is None
+        or _confidence_value(metadata) < HIGH_GLOBAL_LANGUAGE_CONFIDENCE
+    ]
+    hinted_metadata_by_position = dict(
+        zip(
+            hinted_positions,
+            _compute_hinted_source_languages_batch(
+                [local_texts[position] for position in hinted_positions],
+                language_hints=language_hints or [],
+            ),
+            strict=True,
+        ),
     )
+    for position, index in enumerate(local_indexes):
+        results[index] = _choose_hinted_source_language(
+            global_metadata=local_metadata[position],
+            hinted_metadata=hinted_metadata_by_position.get(position, []),
+        )
+        if results[index].language_code is None:
+            google_indexes.append(index)
+
+    if google_detector is None:
+        return results
+    google_indexes = [index for index in google_indexes if use_google is None or use_google[index]]
+
+    def detect_with_google(index: int) -> SourceLanguageMetadata:
+        return _detect_source_language_with_google(
+            cleaned_texts[index],
+            google_detector=google_detector,
+        )
+
+    if google_max_concurrency <= 1 or len(google_indexes) <= 1:
+        google_results = [detect_with_google(index) for index in google_indexes]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(google_max_concurrency, len(google_indexes)),
+            thread_name_prefix="google-language-detection",
+        ) as executor:
+            google_results = list(executor.map(detect_with_google, google_indexes))
+    for index, metadata in zip(google_indexes, google_results, strict=True):
+        results[index] = metadata
+    return results
 
 
 def _confidence_value(metadata: SourceLanguageMetadata) -> float:
@@ -131,7 +243,20 @@ def resolve_hinted_source_language(
     global_metadata: SourceLanguageMetadata,
     language_hints: list[SourceLanguageHint],
 ) -> SourceLanguageMetadata:
-    hinted_metadata = _compute_hinted_source_languages(text, language_hints=language_hints)
+    return _choose_hinted_source_language(
+        global_metadata=global_metadata,
+        hinted_metadata=_compute_hinted_source_languages_batch(
+            [text],
+            language_hints=language_hints,
+        )[0],
+    )
+
+
+def _choose_hinted_source_language(
+    *,
+    global_metadata: SourceLanguageMetadata,
+    hinted_metadata: list[tuple[SourceLanguageMetadata, float]],
+) -> SourceLanguageMetadata:
     best_hint = hinted_metadata[0] if len(hinted_metadata) > 0 else None
     second_best_hint = hinted_metadata[1] if len(hinted_metadata) > 1 else None
 
@@ -169,39 +294,96 @@ def _hint_has_enough_margin(
     return best_hint[1] - second_best_hint[1] >= MINIMUM_HINT_CONFIDENCE_MARGIN
 
 
-def _compute_hinted_source_languages(
-    text: str,
+def _compute_hinted_source_languages_batch(
+    texts: list[str],
     *,
     language_hints: list[SourceLanguageHint],
-) -> list[tuple[SourceLanguageMetadata, float]]:
+) -> list[list[tuple[SourceLanguageMetadata, float]]]:
+    """Per text, every hinted language's metadata and weighted score, best first."""
+    weighted_languages: list[tuple[Language, float]] = []
     seen_languages: set[Language] = set()
-    hinted_metadata: list[tuple[SourceLanguageMetadata, float]] = []
     for hint in language_hints:
         language = _LANGUAGE_CODE_TO_LINGUA_LANGUAGE.get(hint.language_code)
         if language is None or language in seen_languages:
             continue
         seen_languages.add(language)
-        language_code = _language_to_code(language, text=text)
-        if language_code is None:
-            continue
-        confidence = _detector.compute_language_confidence(text, language)
-        metadata = SourceLanguageMetadata(
-            language_code=language_code,
+        weighted_languages.append((language, hint.weight))
+
+    hinted_metadata: list[list[tuple[SourceLanguageMetadata, float]]] = [[] for _ in texts]
+    if not texts:
+        return hinted_metadata
+    for language, weight in weighted_languages:
+        confidences = _detector.compute_language_confidence_in_parallel(texts, language)
+        for text, text_hinted_metadata, confidence in zip(
+            texts,
+            hinted_metadata,
+            confidences,
+            strict=True,
+        ):
+            language_code = _language_to_code(language, text=text)
+            if language_code is None:
+                continue
+            metadata = SourceLanguageMetadata(
+                language_code=language_code,
+                confidence=confidence,
+                raw_language_code=_lingua_raw_language_code(language),
+                provider="lingua",
+            )
+            text_hinted_metadata.append((metadata, _confidence_value(metadata) + weight))
+    return [
+        sorted(text_hinted_metadata, key=lambda item: item[1], reverse=True)
+        for text_hinted_metadata in hinted_metadata
+    ]
+
+
+def _detect_source_language_with_lingua_cleaned(cleaned_text: str) -> SourceLanguageMetadata:
+    return _detect_source_languages_with_lingua_cleaned([cleaned_text])[0]
+
+
+def _detect_source_languages_with_lingua_cleaned(
+    cleaned_texts: list[str],
+) -> list[SourceLanguageMetadata]:
+    if not cleaned_texts:
+        return []
+    detected_languages = _detector.detect_languages_in_parallel_of(cleaned_texts)
+    positions_by_language: dict[Language, list[int]] = {}
+    for position, detected_language in enumerate(detected_languages):
+        if detected_language is not None:
+            positions_by_language.setdefault(detected_language, []).append(position)
+    confidences = [0.0] * len(cleaned_texts)
+    for detected_language, positions in positions_by_language.items():
+        language_confidences = _detector.compute_language_confidence_in_parallel(
+            [cleaned_texts[position] for position in positions],
+            detected_language,
+        )
+        for position, confidence in zip(positions, language_confidences, strict=True):
+            confidences[position] = confidence
+
+    return [
+        _lingua_source_language_metadata(
+            cleaned_text,
+            detected_language=detected_language,
             confidence=confidence,
-            raw_language_code=_lingua_raw_language_code(language),
-            provider="lingua",
         )
-        hinted_metadata.append((metadata, _confidence_value(metadata) + hint.weight))
-    return sorted(hinted_metadata, key=lambda item: item[1], reverse=True)
+        for cleaned_text, detected_language, confidence in zip(
+            cleaned_texts,
+            detected_languages,
+            confidences,
+            strict=True,
+        )
+    ]
 
 
-def _detect_source_language_with_lingua_cleaned(cleaned_text: str) -> SourceLanguageMetadata:
-    detected_language = _detector.detect_language_of(cleaned_text)
+def _lingua_source_language_metadata(
+    cleaned_text: str,
+    *,
+    detected_language: Language | None,
+    confidence: float,
+) -> SourceLanguageMetadata:
     if detected_language is None:
         return SourceLanguageMetadata(language_code=None, confidence=None)
 
     raw_language_code = _lingua_raw_language_code(detected_language)
-    confidence = _detector.compute_language_confidence(cleaned_text, detected_language)
     language_code = _language_to_code(detected_language, text=cleaned_text)
     if confidence < LINGUA_MINIMUM_LANGUAGE_CONFIDENCE:
         return SourceLanguageMetadata(
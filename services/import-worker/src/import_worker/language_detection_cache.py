@@ -0,0 +1,170 @@
+"""Content-hash keyed cache of source-language detection results.
+
+Re-imports of the same conversation, duplicated seed statements and short
+stock answers ("I agree") otherwise rerun lingua, and sometimes a Google
+request, for text that was already detected.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from importlib.metadata import version
+from typing import TYPE_CHECKING, Protocol
+
+from pydantic import TypeAdapter, ValidationError
+
+from import_worker.language_detection import SourceLanguageHint, SourceLanguageMetadata
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+LOGGER = logging.getLogger(__name__)
+LANGUAGE_DETECTION_CACHE_KEY_PREFIX = "import:language-detection:"
+# Bump when thresholds or code normalization in language_detection change
+LANGUAGE_DETECTION_LOGIC_VERSION = 1
+DETECTOR_VERSION = (
+    f"lingua-{version('lingua-language-detector')}/logic-{LANGUAGE_DETECTION_LOGIC_VERSION}"
+)
+SOURCE_LANGUAGE_METADATA_ADAPTER = TypeAdapter(SourceLanguageMetadata)
+
+
+class LanguageDetectionCacheStore(Protocol):
+    def mget(self, keys: list[str]) -> list[str | None]: ...
+
+    def set_many(self, values: dict[str, str], *, ttl_seconds: int) -> None: ...
+
+
+@dataclass(frozen=True)
+class LanguageDetectionCacheStats:
+    hits: int
+    shared_hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LanguageDetectionCache:
+    """LRU of detection results, optionally backed by a shared Valkey tier.
+
+    max_entries <= 0 disables the local tier. Shared across import threads,
+    so access is locked; shared-tier errors degrade to misses.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        shared_store: LanguageDetectionCacheStore | None = None,
+        shared_ttl_seconds: int = 0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.shared_store = shared_store if shared_ttl_seconds > 0 else None
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self._entries: OrderedDict[str, SourceLanguageMetadata] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(
+        self,
+        cleaned_text: str,
+        *,
+        language_hints: list[SourceLanguageHint],
+        use_google: bool,
+    ) -> str:
+        # Hint order matters: duplicate languages keep the first hint's weight
+        payload = json.dumps(
+            [
+                DETECTOR_VERSION,
+                use_google,
+                [[hint.language_code, hint.weight] for hint in language_hints],
+                cleaned_text,
+            ],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        digest = hashlib.sha256(payload.encode()).hexdigest()
+        return f"{LANGUAGE_DETECTION_CACHE_KEY_PREFIX}{digest}"
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, SourceLanguageMetadata]:
+        found: dict[str, SourceLanguageMetadata] = {}
+        with self._lock:
+            for key in keys:
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = cached
+        local_hits = len(found)
+
+        missing_keys = [key for key in keys if key not in found]
+        shared_found = self._get_shared(missing_keys)
+        found.update(shared_found)
+        self._put_local(shared_found)
+        with self._lock:
+            self._hits += local_hits + len(shared_found)
+            self._shared_hits += len(shared_found)
+            self._misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, values: dict[str, SourceLanguageMetadata]) -> None:
+        self._put_local(values)
+        if self.shared_store is None or not values:
+            return
+        try:
+            self.shared_store.set_many(
+                {
+                    key: SOURCE_LANGUAGE_METADATA_ADAPTER.dump_json(metadata).decode()
+                    for key, metadata in values.items()
+                },
+                ttl_seconds=self.shared_ttl_seconds,
+            )
+        except Exception:
+            LOGGER.warning("Failed to store language detections in Valkey", exc_info=True)
+
+    def stats(self) -> LanguageDetectionCacheStats:
+        with self._lock:
+            return LanguageDetectionCacheStats(
+                hits=self._hits,
+                shared_hits=self._shared_hits,
+                misses=self._misses,
+            )
+
+    def _get_shared(self, keys: list[str]) -> dict[str, SourceLanguageMetadata]:
+        if self.shared_store is None or not keys:
+            return {}
+        try:
+            raw_values = self.shared_store.mget(keys)
+        except Exception:
+            LOGGER.warning("Failed to read language detections from Valkey", exc_info=True)
+            return {}
+        found: dict[str, SourceLanguageMetadata] = {}
+        for key, raw_value in zip(keys, raw_values, strict=True):
+            if raw_value is None:
+                continue
+            try:
+                found[key] = SOURCE_LANGUAGE_METADATA_ADAPTER.validate_json(raw_value)
+            except ValidationError:
+                continue
+        return found
+
+    def _put_local(self, values: dict[str, SourceLanguageMetadata]) -> None:
+        if self.max_entries <= 0 or not values:
+            return
+        with self._lock:
+            for key, metadata in values.items():
+                self._entries[key] = metadata
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -32,6 +32,10 @@ class ImportValkeyClient(Protocol):
 
     def zadd(self, name: str, mapping: dict[str, int], nx: bool = False) -> int: ...
 
+    def mget(self, keys: list[str]) -> list[str | None]: ...
+
+    def set_many(self, values: dict[str, str], *, ttl_seconds: int) -> None: ...
+
     def close(self) -> None: ...
 
 
@@ -12,6 +12,7 @@ from pydantic import TypeAdapter
 from valkey import Valkey
 
 from import_worker.config import Settings
+from import_worker.content_processing import ContentProcessingOptions, HtmlProcessPool
 from import_worker.database import create_primary_engine, create_session_factory
 from import_worker.google_language_detection import initialize_google_language_detection_service
 from import_worker.importer import (
@@ -20,6 +21,7 @@ from import_worker.importer import (
     mark_import_failed,
     process_import_request,
 )
+from import_worker.language_detection_cache import LanguageDetectionCache
 from import_worker.queue import (
     IMPORT_BUFFER_KEY,
     ImportValkeyClient,
@@ -53,6 +55,7 @@ logging.basicConfig(
 LOGGER = logging.getLogger(__name__)
 type LpopResult = str | list[str] | None
 LPOP_RESULT: TypeAdapter[LpopResult] = TypeAdapter(LpopResult)
+MGET_RESULT: TypeAdapter[list[str | None]] = TypeAdapter(list[str | None])
 INT_RESULT = TypeAdapter(int)
 _running = True
 
@@ -73,6 +76,15 @@ class SyncValkeyClient:
     def zadd(self, name: str, mapping: dict[str, int], nx: bool = False) -> int:
         return INT_RESULT.validate_python(self._client.zadd(name, mapping, nx=nx))
 
+    def mget(self, keys: list[str]) -> list[str | None]:
+        return MGET_RESULT.validate_python(self._client.mget(keys))
+
+    def set_many(self, values: dict[str, str], *, ttl_seconds: int) -> None:
+        pipeline = self._client.pipeline(transaction=False)
+        for name, value in values.items():
+            pipeline.set(name, value, ex=ttl_seconds)
+        pipeline.execute()
+
     def close(self) -> None:
         self._client.close()
 
@@ -220,6 +232,7 @@ def _process_request(
     request: ImportRequest,
     google_detector: GoogleLanguageDetector | None,
     polis_fetch_timeout_seconds: float,
+    content_processing: ContentProcessingOptions,
 ) -> ProcessedImport:
     with session_factory() as session:
         try:
@@ -229,8 +242,19 @@ def _process_request(
                 request=request,
                 google_detector=google_detector,
                 polis_fetch_timeout_seconds=polis_fetch_timeout_seconds,
+                content_processing=content_processing,
             )
             LOGGER.info("Completed %s import %s", request.type, request.import_slug_id)
+            if content_processing.language_detection_cache is not None:
+                cache_stats = content_processing.language_detection_cache.stats()
+                LOGGER.info(
+                    "Language detection cache since start hits=%s sharedHits=%s misses=%s "
+                    "hitRatio=%.2f",
+                    cache_stats.hits,
+                    cache_stats.shared_hits,
+                    cache_stats.misses,
+                    cache_stats.hit_ratio,
+                )
             return ProcessedImport(result=result, failure_event=None)
         except Exception:
             LOGGER.exception("Import %s failed", request.import_slug_id)
@@ -313,6 +337,25 @@ def _create_google_language_detector(settings: Settings) -> GoogleLanguageDetect
     )
 
 
+def _create_content_processing_options(
+    settings: Settings,
+    *,
+    vk: ImportValkeyClient,
+) -> ContentProcessingOptions:
+    html_pool = None
+    if settings.content_processing_processes > 0:
+        html_pool = HtmlProcessPool(max_workers=settings.content_processing_processes)
+    return ContentProcessingOptions(
+        html_pool=html_pool,
+        google_max_concurrency=settings.google_language_detection_max_concurrency,
+        language_detection_cache=LanguageDetectionCache(
+            max_entries=settings.language_detection_cache_max_entries,
+            shared_store=vk,
+            shared_ttl_seconds=settings.language_detection_cache_ttl_seconds,
+        ),
+    )
+
+
 def run_worker(settings: Settings) -> None:
     global _running
 
@@ -356,6 +399,7 @@ def run_worker(settings: Settings) -> None:
     vk = connected_queue.client
     queue_depth = connected_queue.queue_depth
     LOGGER.info("Import worker Valkey connected (queue_depth=%s)", queue_depth)
+    content_processing = _create_content_processing_options(settings, vk=vk)
     flush_count = 0
 
     if queue_depth == 0:
@@ -452,6 +496,7 @@ def run_worker(settings: Settings) -> None:
                     request=request,
                     google_detector=google_detector,
                     polis_fetch_timeout_seconds=settings.polis_fetch_timeout_seconds,
+                    content_processing=content_processing,
                 )
                 pending_futures[future] = request
 
@@ -460,6 +505,8 @@ def run_worker(settings: Settings) -> None:
             except Exception:
                 LOGGER.exception("Ready import completion failed")
 
+    if content_processing.html_pool is not None:
+        content_processing.html_pool.shutdown()
     vk.close()
     engine.dispose()
 
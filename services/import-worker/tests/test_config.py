@@ -15,6 +15,10 @@ IMPORT_WORKER_ENV_KEYS = (
     "IMPORT_WORKER_STALE_THRESHOLD_MS",
     "IMPORT_WORKER_STALE_CLEANUP_EVERY_N_FLUSHES",
     "IMPORT_WORKER_POLIS_FETCH_TIMEOUT_SECONDS",
+    "IMPORT_WORKER_CONTENT_PROCESSING_PROCESSES",
+    "IMPORT_WORKER_GOOGLE_LANGUAGE_DETECTION_MAX_CONCURRENCY",
+    "IMPORT_WORKER_LANGUAGE_DETECTION_CACHE_MAX_ENTRIES",
+    "IMPORT_WORKER_LANGUAGE_DETECTION_CACHE_TTL_SECONDS",
     "IMPORT_WORKER_GOOGLE_CLOUD_PROJECT_ID",
     "IMPORT_WORKER_GOOGLE_CLOUD_TRANSLATION_ENDPOINT",
     "IMPORT_WORKER_GOOGLE_CLOUD_TRANSLATION_LOCATION",
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import multiprocessing
+
+from import_worker.content_processing import (
+    PARALLEL_HTML_MIN_TEXTS,
+    ContentProcessingOptions,
+    HtmlProcessPool,
+    ProcessedOpinionContent,
+    process_opinion_contents,
+)
+
+TEXTS = [
+    f"<p>Statement {index} about https://example.com/{index} and <b>parks</b></p>"
+    f"<script>alert({index})</script>"
+    for index in range(PARALLEL_HTML_MIN_TEXTS)
+]
+
+
+def _process(options: ContentProcessingOptions) -> list[ProcessedOpinionContent]:
+    return process_opinion_contents(
+        TEXTS,
+        is_seed=[False] * len(TEXTS),
+        content_language_hints=[],
+        google_detector=None,
+        options=options,
+    )
+
+
+def _sanitized(items: list[ProcessedOpinionContent]) -> list[tuple[str, str]]:
+    return [(item.content, item.content_plain_text) for item in items]
+
+
+def test_process_pool_matches_inline_opinion_processing() -> None:
+    inline = _process(ContentProcessingOptions())
+    html_pool = HtmlProcessPool(max_workers=2)
+    try:
+        pooled = _process(ContentProcessingOptions(html_pool=html_pool))
+    finally:
+        html_pool.shutdown()
+
+    assert _sanitized(pooled) == _sanitized(inline)
+    assert "<script>" not in pooled[0].content
+    assert pooled[0].content_plain_text.startswith("Statement 0 about")
+
+
+def test_broken_process_pool_is_replaced_and_batch_runs_inline() -> None:
+    inline = _sanitized(_process(ContentProcessingOptions()))
+    # spawn children are this process's own, so the test can kill them
+    html_pool = HtmlProcessPool(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+    options = ContentProcessingOptions(html_pool=html_pool)
+    try:
+        assert _sanitized(_process(options)) == inline
+        for child in multiprocessing.active_children():
+            child.kill()
+            child.join()
+
+        assert _sanitized(_process(options)) == inline
+        assert multiprocessing.active_children() == []
+        assert _sanitized(_process(options)) == inline
+        assert multiprocessing.active_children() != []
+    finally:
+        html_pool.shutdown()
@@ -1,4 +1,7 @@
+import pytest
+
 from import_worker.csv_import import build_import_from_csv
+from import_worker.import_models import ImportedVote, ImportPolisResults
 
 
 def test_build_import_from_csv_uses_existing_api_file_keys() -> None:
@@ -38,3 +41,83 @@ def test_build_import_from_csv_uses_existing_api_file_keys() -> None:
     assert len(imported.votes_data) == 2
     assert imported.votes_data[1].participant_id == 8
     assert imported.votes_data[1].vote == 1
+
+
+def _files(votes_lines: list[str]) -> dict[str, str | list[str]]:
+    return {
+        "summaryFile": "".join(
+            ["topic,Test\n", "voters,3\n", "voters-in-conv,3\n", "commenters,1\n"],
+        )
+        + "comments,2\ngroups,0\n",
+        "commentsFile": "".join(
+            [
+                "timestamp,datetime,comment-id,author-id,agrees,disagrees,moderated,",
+                "comment-body\n",
+                "1,2024-01-01,10,7,0,0,0,Hello\n",
+                "1,2024-01-01,11,7,0,0,0,World\n",
+            ],
+        ),
+        "votesFile": votes_lines,
+    }
+
+
+def test_build_import_from_csv_streams_votes_keeping_latest_per_pair() -> None:
+    imported = build_import_from_csv(
+        _files(
+            [
+                "timestamp,datetime,comment-id,voter-id,vote,important\n",
+                "5,d,11,9,1,0\n",
+                "3,d,10,8,1,0\n",
+                "9,d,10,8,-1,1\n",
+                "1,d,11,9,-1,0\n",
+                "9,d,10,8,0,0\n",
+                "4,d,10,7,1,0\n",
+            ],
+        ),
+    )
+
+    # Earliest vote per pair sets the order, latest (later row on ties) the value
+    assert [tuple(vote) for vote in imported.votes_data] == [
+        (9, 11, 1),
+        (8, 10, 0),
+        (7, 10, 1),
+    ]
+
+
+def test_build_import_from_csv_reports_invalid_vote_rows() -> None:
+    with pytest.raises(ValueError, match="Row 3: vote must be -1, 0, or 1") as error:
+        build_import_from_csv(
+            _files(
+                [
+                    "timestamp,datetime,comment-id,voter-id,vote\n",
+                    "1,d,10,7,1\n",
+                    "2,d,10,8,2\n",
+                    "3,d,x,8,1\n",
+                ],
+            ),
+        )
+    assert "Row 4: invalid literal" in str(error.value)
+
+    with pytest.raises(ValueError, match="Header: expected columns"):
+        build_import_from_csv(_files(["timestamp,datetime,comment-id,voter-id,vote,extra\n"]))
+    with pytest.raises(ValueError, match="Votes CSV contains no data rows"):
+        build_import_from_csv(_files(["timestamp,datetime,comment-id,voter-id,vote\n"]))
+
+
+def test_import_results_pack_polis_vote_records() -> None:
+    imported = ImportPolisResults.model_validate(
+        {
+            "report_id": None,
+            "conversation_id": None,
+            "conversation_data": {"topic": "Test", "description": ""},
+            "comments_data": [],
+            "votes_data": [
+                {"participant_id": 1, "statement_id": 2, "vote": -1},
+                {"participant_id": 3, "statement_id": 2, "vote": 0, "modified": 1.5},
+            ],
+        },
+    )
+
+    assert len(imported.votes_data) == 2
+    assert imported.votes_data[0] == ImportedVote(participant_id=1, statement_id=2, vote=-1)
+    assert list(imported.votes_data.participant_ids) == [1, 3]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from import_worker import importer
+from import_worker.queue import IMPORT_REQUEST_ADAPTER, ImportRequest
+
+# comments.csv without the is-meta column, as some Polis exports ship it
+EXPORT_COMMENTS_CSV = (
+    "timestamp,datetime,comment-id,author-id,agrees,disagrees,moderated,comment-body\n"
+    "1700000000,,0,0,1,0,1,More trees (export)\n"
+)
+EXPORT_VOTES_CSV = (
+    "timestamp,datetime,comment-id,voter-id,vote\n"
+    "1700000000,,0,0,-1\n"
+    "1700000100,,0,0,1\n"
+    "1700000000,,0,1,1\n"
+)
+
+
+class FakeResponse:
+    def __init__(self, payload: object) -> None:
+        self.text = payload if isinstance(payload, str) else json.dumps(payload)
+
+
+class FakePolisSession:
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+        self.vote_request_started = threading.Event()
+        self.release_votes = threading.Event()
+
+    def get(self, url: str, params: dict[str, object] | None = None) -> FakeResponse:
+        path = url.removeprefix("https://pol.is/api/v3/")
+        self.paths.append(path)
+        if path == "reportExport/r123/comments.csv":
+            return FakeResponse(EXPORT_COMMENTS_CSV)
+        if path == "reportExport/r123/votes.csv":
+            return FakeResponse(EXPORT_VOTES_CSV)
+        if path == "reports":
+            return FakeResponse([{"report_id": "r123", "conversation_id": "12345"}])
+        if path == "conversations":
+            return FakeResponse({"topic": "Parks", "description": "Our parks"})
+        if path == "comments":
+            return FakeResponse(
+                [{"tid": 0, "pid": 0, "txt": "More trees", "created": 1700000000000, "mod": 1}],
+            )
+        if path == "math/pca2":
+            return FakeResponse({"n": 1})
+        assert path == "votes"
+        assert params is not None
+        self.vote_request_started.set()
+        assert self.release_votes.wait(timeout=10)
+        # The Polis API inverts vote signs; the loader flips them back
+        return FakeResponse(
+            [{"pid": params["pid"], "tid": 0, "vote": -1, "modified": 1700000000000}],
+        )
+
+
+def _use_session(monkeypatch: pytest.MonkeyPatch, session: FakePolisSession) -> None:
+    def init_http_client(self: importer.TimeoutRedDwarfLoader) -> None:
+        loader: Any = self
+        loader.session = session
+
+    monkeypatch.setattr(importer.TimeoutRedDwarfLoader, "init_http_client", init_http_client)
+
+
+def _url_request(polis_url: str) -> ImportRequest:
+    return IMPORT_REQUEST_ADAPTER.validate_python(
+        {
+            "importSlugId": "import-1",
+            "userId": "user-1",
+            "actorUserId": "user-1",
+            "projectId": 1,
+            "formData": {
+                "participationMode": "guest",
+                "isIndexed": True,
+                "languageTargetPolicy": {
+                    "source": "conversation_override",
+                    "dynamicTranslationEnabled": False,
+                    "manualTargetLanguageCodes": [],
+                },
+            },
+            "didWrite": "did:key:test",
+            "type": "url",
+            "polisUrl": polis_url,
+        },
+    )
+
+
+def test_polis_votes_download_while_caller_continues(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = FakePolisSession()
+    _use_session(monkeypatch, session)
+    request = _url_request("https://pol.is/12345")
+
+    with ThreadPoolExecutor(max_workers=1) as votes_executor:
+        source = importer.start_import_source(
+            request,
+            polis_fetch_timeout_seconds=1.0,
+            votes_executor=votes_executor,
+            votes_cancelled=threading.Event(),
+        )
+        assert session.vote_request_started.wait(timeout=10)
+        assert source.imported.conversation_data.topic == "Parks"
+        assert [comment.txt for comment in source.imported.comments_data] == ["More trees"]
+        assert len(source.imported.votes_data) == 0
+
+        session.release_votes.set()
+        imported = importer.wait_for_votes(request, source=source)
+
+    assert list(imported.votes_data) == [
+        (0, 0, 1),
+        (1, 0, 1),
+    ]
+    assert session.paths == ["conversations", "comments", "math/pca2", "votes", "votes"]
+
+
+def test_cancelled_polis_votes_download_stops_before_the_next_participant(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = FakePolisSession()
+    _use_session(monkeypatch, session)
+    request = _url_request("https://pol.is/12345")
+    votes_cancelled = threading.Event()
+
+    with ThreadPoolExecutor(max_workers=1) as votes_executor:
+        source = importer.start_import_source(
+            request,
+            polis_fetch_timeout_seconds=1.0,
+            votes_executor=votes_executor,
+            votes_cancelled=votes_cancelled,
+        )
+        assert session.vote_request_started.wait(timeout=10)
+        # The import failed while participant 0's votes were in flight
+        votes_cancelled.set()
+        session.release_votes.set()
+        with pytest.raises(importer.PolisVotesCancelledError):
+            importer.wait_for_votes(request, source=source)
+
+    assert session.paths == ["conversations", "comments", "math/pca2", "votes"]
+
+
+def test_polis_report_export_reads_is_meta_from_the_api(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = FakePolisSession()
+    _use_session(monkeypatch, session)
+    request = _url_request("https://pol.is/report/r123")
+
+    with ThreadPoolExecutor(max_workers=1) as votes_executor:
+        with pytest.warns(UserWarning, match="missing is_meta"):
+            source = importer.start_import_source(
+                request,
+                polis_fetch_timeout_seconds=1.0,
+                votes_executor=votes_executor,
+                votes_cancelled=threading.Event(),
+            )
+        imported = importer.wait_for_votes(request, source=source)
+
+    assert imported.report_id == "r123"
+    assert imported.conversation_id == "12345"
+    assert [comment.txt for comment in imported.comments_data] == ["More trees"]
+    # Only the most recent of participant 0's two votes is kept
+    assert sorted(imported.votes_data) == [(0, 0, 1), (1, 0, 1)]
+    assert session.paths == [
+        "reportExport/r123/comments.csv",
+        "reports",
+        "comments",
+        "conversations",
+        "reportExport/r123/votes.csv",
+    ]
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from import_worker.importer import (
+    OPINION_STAGING_COPY_COLUMNS,
+    OPINION_STAGING_TABLE,
+    VOTE_STAGING_COPY_COLUMNS,
+    VOTE_STAGING_TABLE,
+)
+
+
+@pytest.mark.parametrize(
+    ("table", "copy_columns"),
+    [
+        (OPINION_STAGING_TABLE, OPINION_STAGING_COPY_COLUMNS),
+        (VOTE_STAGING_TABLE, VOTE_STAGING_COPY_COLUMNS),
+    ],
+)
+def test_staging_tables_are_transaction_scoped_and_match_copy_columns(
+    table: Table,
+    copy_columns: tuple[tuple[str, str], ...],
+) -> None:
+    ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+
+    assert ddl.startswith("\nCREATE TEMPORARY TABLE")
+    assert ddl.rstrip().endswith("ON COMMIT DROP")
+    assert [column.name for column in table.columns] == [name for name, _type in copy_columns]
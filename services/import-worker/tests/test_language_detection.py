@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import math
+import threading
+from dataclasses import replace
+
 from import_worker import language_detection
 from import_worker.google_language_detection import (
     GoogleLanguageDetectionConfig,
@@ -367,3 +371,55 @@ def test_import_google_detector_is_enabled_only_for_dynamic_translation() -> Non
         )
         is None
     )
+
+
+def test_batch_source_language_detection_matches_single_text_detection() -> None:
+    texts = [
+        "This is a public conversation about parks, libraries, and civic life.",
+        "Nous devons améliorer les transports publics dans notre ville.",
+        "Parks",
+        "2323",
+        "   ",
+        "Aloha kakou. Pehea kakou e malama ai i ka aina a me na kai o ko kakou kulanakauhale?",
+        "Шаарыбыздагы коомдук транспортту кантип жакшырта алабыз?",
+        "学国会说过还这里",
+    ]
+    hints = [
+        SourceLanguageHint(language_code="en", weight=MANUAL_MAIN_LANGUAGE_HINT_WEIGHT),
+        SourceLanguageHint(language_code="fr", weight=0.0),
+    ]
+
+    batch_metadata = language_detection.detect_source_languages(texts, language_hints=hints)
+    single_metadata = [
+        language_detection.detect_source_language(text, language_hints=hints) for text in texts
+    ]
+
+    assert [replace(item, confidence=None) for item in batch_metadata] == [
+        replace(item, confidence=None) for item in single_metadata
+    ]
+    for batch_item, single_item in zip(batch_metadata, single_metadata, strict=True):
+        if batch_item.confidence is None or single_item.confidence is None:
+            assert batch_item.confidence == single_item.confidence
+        else:
+            assert math.isclose(batch_item.confidence, single_item.confidence, rel_tol=1e-6)
+
+
+def test_batch_source_language_detection_calls_google_concurrently_for_allowed_texts() -> None:
+    both_requests_in_flight = threading.Barrier(2, timeout=10)
+    google_texts: list[str] = []
+
+    def google_detector(text: str) -> SourceLanguageMetadata:
+        google_texts.append(text)
+        both_requests_in_flight.wait()
+        return SourceLanguageMetadata(language_code="ky", confidence=0.92)
+
+    kyrgyz = "Шаарыбыздагы коомдук транспортту кантип жакшырта алабыз?"
+    metadata = language_detection.detect_source_languages(
+        [kyrgyz, kyrgyz, "2323"],
+        google_detector=google_detector,
+        use_google=[True, False, True],
+        google_max_concurrency=4,
+    )
+
+    assert [item.language_code for item in metadata] == ["ky", None, "ky"]
+    assert sorted(google_texts) == ["2323", kyrgyz]
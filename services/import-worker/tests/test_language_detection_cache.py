@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from import_worker import language_detection
+from import_worker.language_detection import (
+    MANUAL_MAIN_LANGUAGE_HINT_WEIGHT,
+    SourceLanguageHint,
+    SourceLanguageMetadata,
+)
+from import_worker.language_detection_cache import LanguageDetectionCache
+
+KYRGYZ_TEXT = "Шаарыбыздагы коомдук транспортту кантип жакшырта алабыз?"
+ENGLISH_TEXT = "This is a public conversation about parks, libraries, and civic life."
+
+
+class FakeSharedStore:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    def set_many(self, values: dict[str, str], *, ttl_seconds: int) -> None:
+        assert ttl_seconds > 0
+        self.values.update(values)
+
+
+def test_cached_detection_skips_repeated_google_requests() -> None:
+    google_texts: list[str] = []
+
+    def google_detector(text: str) -> SourceLanguageMetadata:
+        google_texts.append(text)
+        return SourceLanguageMetadata(language_code="ky", confidence=0.92)
+
+    cache = LanguageDetectionCache(max_entries=100)
+    first = language_detection.detect_source_languages(
+        [KYRGYZ_TEXT, ENGLISH_TEXT, f"  {KYRGYZ_TEXT} "],
+        google_detector=google_detector,
+        cache=cache,
+    )
+    second = language_detection.detect_source_languages(
+        [ENGLISH_TEXT, KYRGYZ_TEXT],
+        google_detector=google_detector,
+        cache=cache,
+    )
+
+    assert [item.language_code for item in first] == ["ky", "en", "ky"]
+    assert second == [first[1], first[0]]
+    assert google_texts == [KYRGYZ_TEXT]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert stats.hit_ratio == 0.5
+
+
+def test_cache_key_separates_hints_and_google_eligibility() -> None:
+    cache = LanguageDetectionCache(max_entries=100)
+    hint = SourceLanguageHint(language_code="en", weight=MANUAL_MAIN_LANGUAGE_HINT_WEIGHT)
+
+    keys = {
+        cache.key(ENGLISH_TEXT, language_hints=[], use_google=False),
+        cache.key(ENGLISH_TEXT, language_hints=[hint], use_google=False),
+        cache.key(ENGLISH_TEXT, language_hints=[], use_google=True),
+    }
+
+    assert len(keys) == 3
+
+
+def test_shared_tier_serves_other_workers_and_skips_failed_google_requests() -> None:
+    store = FakeSharedStore()
+
+    def failing_google_detector(text: str) -> SourceLanguageMetadata:
+        del text
+        raise RuntimeError("google unavailable")
+
+    first_worker = LanguageDetectionCache(
+        max_entries=100,
+        shared_store=store,
+        shared_ttl_seconds=60,
+    )
+    language_detection.detect_source_languages(
+        [ENGLISH_TEXT, KYRGYZ_TEXT],
+        google_detector=failing_google_detector,
+        cache=first_worker,
+    )
+
+    def google_detector(text: str) -> SourceLanguageMetadata:
+        del text
+        return SourceLanguageMetadata(language_code="ky", confidence=0.9)
+
+    second_worker = LanguageDetectionCache(
+        max_entries=100,
+        shared_store=store,
+        shared_ttl_seconds=60,
+    )
+    metadata = language_detection.detect_source_languages(
+        [ENGLISH_TEXT, KYRGYZ_TEXT],
+        google_detector=google_detector,
+        cache=second_worker,
+    )
+
+    assert len(store.values) == 2
+    assert [item.language_code for item in metadata] == ["en", "ky"]
+    stats = second_worker.stats()
+    assert (stats.hits, stats.shared_hits, stats.misses) == (1, 1, 1)
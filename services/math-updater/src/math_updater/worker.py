@@ -32,9 +32,12 @@ from agora_analysis_worker_shared.ai_description_work import (
     recover_expired_ai_description_work,
     retry_ai_description_locale_work_item,
 )
-from agora_analysis_worker_shared.analysis_compute import (
-    RedDwarfContractError,
-    compute_analysis_bundle,
+from agora_analysis_worker_shared.analysis_compute import RedDwarfContractError
+from agora_analysis_worker_shared.analysis_compute_pool import AnalysisComputePool
+from agora_analysis_worker_shared.analysis_result_cache import (
+    AnalysisResultCache,
+    RedDwarfWarmStartCache,
+    analysis_result_cache_key,
 )
 from agora_analysis_worker_shared.config import (
     MathUpdaterConfigError,
@@ -67,7 +70,9 @@ from agora_analysis_worker_shared.description_services import (
     build_description_translator,
 )
 from agora_analysis_worker_shared.input_snapshot import (
+    InputSnapshotCache,
     PreparedInputSnapshot,
+    build_incremental_snapshot_base,
     prepare_input_snapshots_batch,
 )
 from agora_analysis_worker_shared.logging_utils import (
@@ -98,15 +103,12 @@ from sqlalchemy.exc import SQLAlchemyError
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
+    from concurrent.futures import Future
 
     from agora_analysis_worker_shared.ai_description_work import ClaimedAiDescriptionLocaleWorkItem
     from agora_analysis_worker_shared.analysis_compute import ComputedAnalysisBundle
     from agora_analysis_worker_shared.bedrock_label_summary import ParsedLabelSummaryOutput
-    from agora_analysis_worker_shared.db import (
-        ClaimedWorkItem,
-        OpinionGroupConfigRecord,
-        PersistComputedAnalysisResult,
-    )
+    from agora_analysis_worker_shared.db import ClaimedWorkItem, PersistComputedAnalysisResult
     from agora_analysis_worker_shared.description_input import ConversationDescriptionInput
     from agora_analysis_worker_shared.description_translation import (
         DescriptionForTranslation,
@@ -130,6 +132,7 @@ log = logging.getLogger(__name__)
 _running = True
 _lease_heartbeat_stoppers: list[Callable[[], None]] = []
 _lease_heartbeat_stoppers_lock = Lock()
+_compute_pool: AnalysisComputePool | None = None
 STARTUP_RETRY_INTERVAL_SECONDS = 5.0
 
 
@@ -147,6 +150,24 @@ def _stop_lease_heartbeats() -> None:
         stop_heartbeat()
 
 
+def _start_compute_pool(settings: Settings) -> AnalysisComputePool:
+    global _compute_pool
+    _shutdown_compute_pool()
+    _compute_pool = AnalysisComputePool(
+        engine=settings.compute_engine,
+        max_workers=settings.max_compute_concurrency,
+    )
+    return _compute_pool
+
+
+def _shutdown_compute_pool() -> None:
+    global _compute_pool
+    compute_pool = _compute_pool
+    _compute_pool = None
+    if compute_pool is not None:
+        compute_pool.shutdown()
+
+
 def _connect_to_valkey_with_retry(settings: Settings) -> valkey_lib.Valkey | None:
     valkey_url = str(settings.valkey_url)
     while _running:
@@ -213,7 +234,7 @@ def _snapshot_summary(snapshot: PreparedInputSnapshot) -> str:
         f"conversation_id={snapshot.conversation_id} "
         f"opinions={len(snapshot.opinions)} "
         f"participants={len(snapshot.participants)} "
-        f"votes={len(snapshot.votes)}"
+        f"votes={len(snapshot.vote_matrix)}"
     )
 
 
@@ -1105,17 +1126,6 @@ def process_or_finalize_ai_description_first_pass_after_persist(
         return False
 
 
-def _compute_claim_bundle(
-    *,
-    snapshot: PreparedInputSnapshot,
-    config: OpinionGroupConfigRecord,
-) -> ComputedAnalysisBundle:
-    return compute_analysis_bundle(
-        snapshot=snapshot,
-        config=config,
-    )
-
-
 def _is_non_retryable_ai_description_error(error: Exception) -> bool:
     return isinstance(error, DescriptionInputError)
 
@@ -1162,11 +1172,12 @@ def _run_worker_once() -> None:
 
     worker_id = f"math-updater:{uuid.uuid4()}"
     log.info(
-        "[MathUpdater] Starting worker_id=%s claim_batch=%d compute=%d ai=%d "
-        "lease_ttl=%ds heartbeat=%ds recovery=%ds",
+        "[MathUpdater] Starting worker_id=%s claim_batch=%d compute=%d compute_engine=%s "
+        "ai=%d lease_ttl=%ds heartbeat=%ds recovery=%ds",
         worker_id,
         settings.db_claim_batch_size,
         settings.max_compute_concurrency,
+        settings.compute_engine,
         settings.max_ai_description_concurrency,
         settings.lease_ttl_seconds,
         settings.heartbeat_interval_seconds,
@@ -1246,6 +1257,18 @@ def _run_worker_once() -> None:
         lease_ttl_seconds=settings.lease_ttl_seconds,
         interval_seconds=settings.heartbeat_interval_seconds,
     )
+    compute_pool = _start_compute_pool(settings)
+    input_snapshot_cache = InputSnapshotCache(
+        max_conversations=settings.input_snapshot_cache_size,
+    )
+    analysis_result_cache = AnalysisResultCache(
+        max_entries=settings.analysis_result_cache_size,
+        vk=vk,
+        shared_ttl_seconds=settings.analysis_result_shared_cache_ttl_seconds,
+    )
+    red_dwarf_warm_start_cache = RedDwarfWarmStartCache(
+        max_entries=settings.red_dwarf_warm_start_cache_size,
+    )
 
     monotonic_start = time.monotonic()
     last_reconcile = monotonic_start - settings.reconciliation_interval_seconds
@@ -1378,6 +1401,9 @@ def _run_worker_once() -> None:
                 lease_ttl_seconds=settings.lease_ttl_seconds,
                 limit=settings.db_claim_batch_size,
                 analysis_engine_epoch=settings.analysis_engine_epoch,
+                previous_bases_by_conversation_id=input_snapshot_cache.bases_for(
+                    item.conversation_id for item in processable_items
+                ),
             )
         except SQLAlchemyError as error:
             log_database_error(
@@ -1523,13 +1549,27 @@ def _run_worker_once() -> None:
             continue
 
         input_prep_started_at = time.perf_counter()
-        rows_by_conversation_id = claimed_input_batch.rows_by_conversation_id
+        vote_columns_by_conversation_id = claimed_input_batch.vote_columns_by_conversation_id
+        incremental_bases = claimed_input_batch.incremental_bases_by_conversation_id
         snapshots_by_conversation_id = prepare_input_snapshots_batch(
             data_generation_by_conversation_id={
                 claim.conversation_id: claim.data_generation for claim in active_analysis_claims
             },
-            rows_by_conversation_id=rows_by_conversation_id,
+            vote_columns_by_conversation_id=vote_columns_by_conversation_id,
+            incremental_bases_by_conversation_id=incremental_bases,
         )
+        for conversation_id, snapshot in snapshots_by_conversation_id.items():
+            snapshot_base = incremental_bases.get(conversation_id)
+            vote_columns = vote_columns_by_conversation_id.get(conversation_id)
+            if snapshot_base is None and vote_columns is not None:
+                snapshot_base = build_incremental_snapshot_base(
+                    snapshot=snapshot,
+                    columns=vote_columns,
+                )
+            if snapshot_base is None:
+                input_snapshot_cache.discard(conversation_id)
+            else:
+                input_snapshot_cache.remember(snapshot_base)
         try:
             stored_snapshots = upsert_input_snapshots_batch(
                 primary_engine,
@@ -1556,8 +1596,9 @@ def _run_worker_once() -> None:
             )
             continue
         log.info(
-            "[MathUpdater] Prepared %d input snapshot(s) input_prep_ms=%.1f: %s",
+            "[MathUpdater] Prepared %d input snapshot(s) incremental=%d input_prep_ms=%.1f: %s",
             len(stored_snapshots),
+            len(incremental_bases),
             (time.perf_counter() - input_prep_started_at) * 1000,
             "; ".join(
                 _snapshot_summary(snapshot) for snapshot in snapshots_by_conversation_id.values()
@@ -1567,7 +1608,7 @@ def _run_worker_once() -> None:
         empty_claims = [
             claim
             for claim in active_analysis_claims
-            if len(snapshots_by_conversation_id[claim.conversation_id].votes) == 0
+            if len(snapshots_by_conversation_id[claim.conversation_id].vote_matrix) == 0
         ]
         if empty_claims:
             empty_newer_generation_ids: list[int]
@@ -1646,7 +1687,7 @@ def _run_worker_once() -> None:
         non_empty_claims = [
             claim
             for claim in active_analysis_claims
-            if len(snapshots_by_conversation_id[claim.conversation_id].votes) > 0
+            if len(snapshots_by_conversation_id[claim.conversation_id].vote_matrix) > 0
         ]
         if non_empty_claims:
             try:
@@ -1681,44 +1722,70 @@ def _run_worker_once() -> None:
             failed_claims: list[ClaimedWorkItem] = []
             non_retryable_failed_claims: list[ClaimedWorkItem] = []
             compute_started_at = time.perf_counter()
-            with ThreadPoolExecutor(
-                max_workers=settings.max_compute_concurrency,
-            ) as executor:
-                future_by_claim = {
-                    executor.submit(
-                        _compute_claim_bundle,
-                        snapshot=snapshots_by_conversation_id[claim.conversation_id],
-                        config=config_by_spec_id[claim.opinion_group_spec_id],
-                    ): claim
-                    for claim in non_empty_claims
-                }
-                for future in as_completed(future_by_claim):
-                    claim = future_by_claim[future]
-                    try:
-                        bundles_by_conversation_id[claim.conversation_id] = future.result()
-                    except RedDwarfContractError:
-                        log.exception(
-                            "[MathUpdater] Red-dwarf contract failure for "
-                            "conversationSlugId=%s conversationId=%d",
-                            claim.conversation_slug_id,
-                            claim.conversation_id,
-                        )
-                        non_retryable_failed_claims.append(claim)
-                    except Exception:
-                        log.exception(
-                            "[MathUpdater] Compute failed for "
-                            "conversationSlugId=%s conversationId=%d",
-                            claim.conversation_slug_id,
-                            claim.conversation_id,
-                        )
-                        failed_claims.append(claim)
+            result_cache_key_by_conversation_id = {
+                claim.conversation_id: analysis_result_cache_key(
+                    input_hash=snapshots_by_conversation_id[claim.conversation_id].input_hash,
+                    config=config_by_spec_id[claim.opinion_group_spec_id],
+                    analysis_engine_epoch=settings.analysis_engine_epoch,
+                )
+                for claim in non_empty_claims
+            }
+            future_by_claim: dict[Future[ComputedAnalysisBundle], ClaimedWorkItem] = {}
+            for claim in non_empty_claims:
+                cached_bundle = analysis_result_cache.get(
+                    result_cache_key_by_conversation_id[claim.conversation_id]
+                )
+                if cached_bundle is not None:
+                    bundles_by_conversation_id[claim.conversation_id] = cached_bundle
+                    continue
+                future = compute_pool.submit(
+                    snapshot=snapshots_by_conversation_id[claim.conversation_id],
+                    config=config_by_spec_id[claim.opinion_group_spec_id],
+                    warm_start=red_dwarf_warm_start_cache.get(
+                        conversation_id=claim.conversation_id,
+                        opinion_group_spec_id=claim.opinion_group_spec_id,
+                    ),
+                )
+                future_by_claim[future] = claim
+            cached_count = len(bundles_by_conversation_id)
+            for future in as_completed(future_by_claim):
+                claim = future_by_claim[future]
+                try:
+                    bundle = future.result()
+                    bundles_by_conversation_id[claim.conversation_id] = bundle
+                    analysis_result_cache.put(
+                        result_cache_key_by_conversation_id[claim.conversation_id],
+                        bundle,
+                    )
+                    red_dwarf_warm_start_cache.remember(
+                        opinion_group_spec_id=claim.opinion_group_spec_id,
+                        bundle=bundle,
+                    )
+                except RedDwarfContractError:
+                    log.exception(
+                        "[MathUpdater] Red-dwarf contract failure for "
+                        "conversationSlugId=%s conversationId=%d",
+                        claim.conversation_slug_id,
+                        claim.conversation_id,
+                    )
+                    non_retryable_failed_claims.append(claim)
+                except Exception:
+                    log.exception(
+                        "[MathUpdater] Compute failed for "
+                        "conversationSlugId=%s conversationId=%d",
+                        claim.conversation_slug_id,
+                        claim.conversation_id,
+                    )
+                    failed_claims.append(claim)
 
             log.info(
-                "[MathUpdater] Finished compute completed=%d failed=%d non_retryable=%d "
-                "compute_ms=%.1f",
+                "[MathUpdater] Finished compute completed=%d cached=%d failed=%d "
+                "non_retryable=%d compute_engine=%s compute_ms=%.1f",
                 len(bundles_by_conversation_id),
+                cached_count,
                 len(failed_claims),
                 len(non_retryable_failed_claims),
+                compute_pool.engine,
                 (time.perf_counter() - compute_started_at) * 1000,
             )
 
@@ -2040,6 +2107,7 @@ def _run_worker_once() -> None:
                 )
 
     stop_lease_heartbeat()
+    _shutdown_compute_pool()
     primary_engine.dispose()
     read_engine.dispose()
     vk.close()
@@ -2053,6 +2121,7 @@ def main() -> None:
             return
         except Exception:
             _stop_lease_heartbeats()
+            _shutdown_compute_pool()
             log.exception(
                 "[MathUpdater] Worker crashed; restarting in %.1fs",
                 STARTUP_RETRY_INTERVAL_SECONDS,
@@ -10,6 +10,8 @@ https://github.com/SeregPie/MaxDiff
 
 from dataclasses import dataclass
 
+import numpy as np
+
 # ---------------------------------------------------------------------------
 # Types
 # ---------------------------------------------------------------------------
@@ -104,70 +106,40 @@ def bron_kerbosch(edges: list[tuple[str, str]]) -> list[list[str]]:
 class ComparisonMatrix:
     """Tracks pairwise orderings between items with automatic transitive closure.
 
-    The matrix stores: -1 (i before j), +1 (i after j), 0 (same), None (unknown).
-    When a new ordering is added, transitive closure propagates it:
-    if A>B and B>C, then A>C is inferred automatically.
+    Orderings are stored as boolean reachability rows: ``_after[i, j]`` is True
+    when item i is known to come before (beat) item j. Item i is then "after"
+    j when ``_after[j, i]``, the same item when ``i == j``, and unknown
+    otherwise. When a new ordering is added, transitive closure propagates it
+    as row ORs: if A>B and B>C, then A>C is inferred automatically.
     """
 
     def __init__(self, items: list[str]) -> None:
         self._items = list(items)
         self._n = len(items)
         self._index: dict[str, int] = {item: i for i, item in enumerate(items)}
-        # None = unknown, 0 = same, -1 = i<j (i before j), +1 = i>j
-        self._matrix: list[list[int | None]] = [[None] * self._n for _ in range(self._n)]
-        for i in range(self._n):
-            self._matrix[i][i] = 0
+        self._after = np.zeros((self._n, self._n), dtype=np.bool_)
 
     def _idx(self, item: str) -> int:
         return self._index.get(item, -1)
 
-    def _get(self, a: str, b: str) -> int | None:
-        i, j = self._idx(a), self._idx(b)
-        if i < 0 or j < 0:
-            return None
-        return self._matrix[i][j]
-
-    def _set_order(self, before: str, after: str) -> None:
-        i, j = self._idx(before), self._idx(after)
-        if i < 0 or j < 0:
-            return
-        self._matrix[i][j] = -1
-        self._matrix[j][i] = 1
-
-    def _items_before(self, item: str) -> list[str]:
-        """Items known to come before (be better than) the given item."""
-        return [
-            other for other in self._items if (c := self._get(other, item)) is not None and c < 0
-        ]
-
-    def _items_after(self, item: str) -> list[str]:
-        """Items known to come after (be worse than) the given item."""
-        return [
-            other for other in self._items if (c := self._get(other, item)) is not None and c > 0
-        ]
-
     def _order(self, item_before: str, item_after: str) -> None:
         """Record that item_before > item_after, with transitive closure."""
-        if self._get(item_before, item_after) is not None:
-            return  # already known
-        self._set_order(item_before, item_after)
-        # Transitive closure
-        before_items = self._items_before(item_before)
-        after_items = self._items_after(item_after)
-        for b in before_items:
-            self._set_order(b, item_after)
-        for a in after_items:
-            self._set_order(item_before, a)
-        for b in before_items:
-            for a in after_items:
-                self._set_order(b, a)
+        i, j = self._idx(item_before), self._idx(item_after)
+        if i < 0 or j < 0 or i == j or self._after[i, j] or self._after[j, i]:
+            return  # unknown item, same item, or already known
+        # Everything before item_before (and itself) now beats item_after
+        # and everything after it.
+        before_rows = self._after[:, i].copy()
+        before_rows[i] = True
+        after_columns = self._after[j].copy()
+        after_columns[j] = True
+        self._after[before_rows] |= after_columns
 
     def apply_comparison(self, comparison: BWSComparison) -> None:
         """Apply a BWS comparison: best beats everyone, everyone beats worst."""
-        item_set = set(self._items)
-        candidate_set = [c for c in comparison.candidate_set if c in item_set]
-        if comparison.best not in item_set or comparison.worst not in item_set:
+        if comparison.best not in self._index or comparison.worst not in self._index:
             return
+        candidate_set = [c for c in comparison.candidate_set if c in self._index]
 
         # Best beats everyone else in the set
         for other in candidate_set:
@@ -181,26 +153,17 @@ class ComparisonMatrix:
 
     def get_ordered_pairs(self) -> list[tuple[str, str]]:
         """Return all pairs where ordering is known: (winner, loser)."""
+        known = np.triu(self._after | self._after.T, k=1)
         pairs: list[tuple[str, str]] = []
-        for i in range(self._n):
-            for j in range(i + 1, self._n):
-                c = self._matrix[i][j]
-                if c is None or c == 0:
-                    continue
-                if c < 0:
-                    pairs.append((self._items[i], self._items[j]))
-                else:
-                    pairs.append((self._items[j], self._items[i]))
+        for i, j in zip(*np.nonzero(known), strict=True):
+            winner, loser = (int(i), int(j)) if self._after[i, j] else (int(j), int(i))
+            pairs.append((self._items[winner], self._items[loser]))
         return pairs
 
     def get_unordered_pairs(self) -> list[tuple[str, str]]:
         """Return all pairs where ordering is unknown."""
-        pairs: list[tuple[str, str]] = []
-        for i in range(self._n):
-            for j in range(i + 1, self._n):
-                if self._matrix[i][j] is None:
-                    pairs.append((self._items[i], self._items[j]))
-        return pairs
+        unknown = np.triu(~(self._after | self._after.T), k=1)
+        return [(self._items[i], self._items[j]) for i, j in zip(*np.nonzero(unknown), strict=True)]
 
 
 def build_comparison_matrix(*, items: list[str]) -> ComparisonMatrix:
@@ -241,10 +204,19 @@ def bws_to_pairwise(
     for comp in bws_comparisons:
         comparisons_by_user.setdefault(comp.user_id, []).append(comp)
 
+    entity_index = {entity_id: i for i, entity_id in enumerate(entity_ids)}
     result: list[PairwiseWin] = []
 
     for user_id, user_comparisons in comparisons_by_user.items():
-        matrix = ComparisonMatrix(entity_ids)
+        # Only items the user saw can be ordered, so the matrix is sized to
+        # them, kept in entity_ids order so pairs come out in the same order.
+        seen_items = {
+            item
+            for comp in user_comparisons
+            for item in (comp.best, comp.worst, *comp.candidate_set)
+            if item in entity_index
+        }
+        matrix = ComparisonMatrix(sorted(seen_items, key=entity_index.__getitem__))
         for comp in user_comparisons:
             matrix.apply_comparison(comp)
 
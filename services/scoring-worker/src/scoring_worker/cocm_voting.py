@@ -30,9 +30,12 @@ Adaptation from QF to voting rights:
   for voting rights (unlike QF where it prevents double-counting).
 """
 
-import math
+from collections.abc import Mapping
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import NDArray
+
 # ---------------------------------------------------------------------------
 # Types
 # ---------------------------------------------------------------------------
@@ -97,6 +100,72 @@ def build_friend_matrix(
     return fm
 
 
+# ---------------------------------------------------------------------------
+# Friend graph
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class FriendGraph:
+    """Compact form of the friend_matrix, built once per scoring run.
+
+    Users with the same set of (source, group) memberships are collapsed into
+    one membership class. Two users are connected (friend_matrix > 0) exactly
+    when their classes share a group, so connectivity is stored as a
+    classes x classes boolean matrix instead of users x users counts.
+    Class 0 is always the class of users without any group.
+    """
+
+    class_by_user: dict[int, int]
+    connected_classes: NDArray[np.bool_]
+
+    def user_classes(self, user_ids: list[int]) -> NDArray[np.intp]:
+        return np.fromiter(
+            (self.class_by_user.get(user_id, 0) for user_id in user_ids),
+            dtype=np.intp,
+            count=len(user_ids),
+        )
+
+
+def build_friend_graph(
+    *,
+    group_sources: list[GroupSource],
+    user_ids: list[int],
+) -> FriendGraph:
+    """Build the membership-class friend graph from multiple group sources.
+
+    Parameters
+    ----------
+    group_sources : list of group sources, each providing a partition of users
+    user_ids : all user IDs to include (even if not in any group)
+
+    Returns
+    -------
+    FriendGraph : connected_classes[a][b] is True when classes a and b share a group
+    """
+    groups_by_user: dict[int, set[tuple[int, int]]] = {user_id: set() for user_id in user_ids}
+    for source_index, source in enumerate(group_sources):
+        for entry in source.memberships:
+            if entry.user_id in groups_by_user:
+                groups_by_user[entry.user_id].add((source_index, entry.group_id))
+
+    class_by_groups: dict[frozenset[tuple[int, int]], int] = {frozenset(): 0}
+    class_by_user = {
+        user_id: class_by_groups.setdefault(frozenset(groups), len(class_by_groups))
+        for user_id, groups in groups_by_user.items()
+    }
+
+    classes_by_group: dict[tuple[int, int], list[int]] = {}
+    for groups, class_index in class_by_groups.items():
+        for group in groups:
+            classes_by_group.setdefault(group, []).append(class_index)
+    connected_classes = np.zeros((len(class_by_groups), len(class_by_groups)), dtype=np.bool_)
+    for class_indexes in classes_by_group.values():
+        connected_classes[np.ix_(class_indexes, class_indexes)] = True
+
+    return FriendGraph(class_by_user=class_by_user, connected_classes=connected_classes)
+
+
 # ---------------------------------------------------------------------------
 # COCM-adapted voting rights
 # ---------------------------------------------------------------------------
@@ -140,29 +209,75 @@ class COCMVotingRights:
         if not scorers:
             return {}
 
-        scorer_set = set(scorers)
+        return self.compute_voting_rights(
+            scorers_by_entity={0: scorers},
+            trust_scores=trust_scores,
+            friend_graph=build_friend_graph(group_sources=self._group_sources, user_ids=user_ids),
+        )[0]
 
-        # Build friend matrix for relevant users
-        fm = build_friend_matrix(
-            group_sources=self._group_sources,
-            user_ids=user_ids,
-        )
+    def compute_voting_rights(
+        self,
+        *,
+        scorers_by_entity: Mapping[int, list[int]],
+        trust_scores: dict[int, float],
+        friend_graph: FriendGraph,
+    ) -> dict[int, dict[int, float]]:
+        """Compute voting rights for every entity in one pass.
 
-        rights: dict[int, float] = {}
-        for user in scorers:
-            trust = trust_scores.get(user, 1.0)
+        Connected co-scorer counts come from one matrix product: scorers are
+        counted per (membership class, entity), and connected_classes sums
+        those counts over every class sharing a group with the user's class.
 
-            # Count connected co-scorers (Paper Eq. 15: K function, binary)
-            # Connected = shares at least one group (friend_matrix > 0)
-            connected_co_scorers = sum(
-                1 for other in scorer_set if other != user and fm.get(user, {}).get(other, 0) > 0
-            )
+        Parameters
+        ----------
+        scorers_by_entity : user IDs who scored each entity
+        trust_scores : base trust per user (from verification level)
+        friend_graph : graph built by build_friend_graph for this scoring run
 
-            # COCM attenuation: trust / sqrt(1 + connections)
-            # - 0 connections -> full trust (independent voter)
-            # - N connections -> trust / sqrt(N+1) (attenuated)
-            # This gives O(sqrt) collective growth for a group of K
-            # connected voters: K * trust/sqrt(K) = trust * sqrt(K)
-            rights[user] = trust / math.sqrt(1 + connected_co_scorers)
+        Returns
+        -------
+        dict mapping entity_id -> scorer user_id -> voting_right (float)
+        """
+        entity_ids = list(scorers_by_entity)
+        scorers_per_entity = [
+            list(dict.fromkeys(scorers_by_entity[entity_id])) for entity_id in entity_ids
+        ]
+        scorers = [user for entity_scorers in scorers_per_entity for user in entity_scorers]
+        entity_positions = np.repeat(
+            np.arange(len(entity_ids)),
+            [len(entity_scorers) for entity_scorers in scorers_per_entity],
+        )
+        scorer_classes = friend_graph.user_classes(scorers)
+
+        # scorer_counts[c, e] = number of scorers of entity e in membership class c
+        scorer_counts = np.zeros((len(friend_graph.connected_classes), len(entity_ids)))
+        np.add.at(scorer_counts, (scorer_classes, entity_positions), 1.0)
+        connected_counts = friend_graph.connected_classes.astype(np.float64) @ scorer_counts
+
+        # Count connected co-scorers (Paper Eq. 15: K function, binary),
+        # excluding the user themself when their class is self-connected.
+        connected_co_scorers = (
+            connected_counts[scorer_classes, entity_positions]
+            - friend_graph.connected_classes[scorer_classes, scorer_classes]
+        )
+        trust = np.fromiter(
+            (trust_scores.get(user, 1.0) for user in scorers),
+            dtype=np.float64,
+            count=len(scorers),
+        )
 
-        return rights
+        # COCM attenuation: trust / sqrt(1 + connections)
+        # - 0 connections -> full trust (independent voter)
+        # - N connections -> trust / sqrt(N+1) (attenuated)
+        # This gives O(sqrt) collective growth for a group of K
+        # connected voters: K * trust/sqrt(K) = trust * sqrt(K)
+        rights = (trust / np.sqrt(1 + connected_co_scorers)).tolist()
+
+        rights_by_entity: dict[int, dict[int, float]] = {}
+        offset = 0
+        for entity_id, entity_scorers in zip(entity_ids, scorers_per_entity, strict=True):
+            rights_by_entity[entity_id] = dict(
+                zip(entity_scorers, rights[offset : offset + len(entity_scorers)], strict=True)
+            )
+            offset += len(entity_scorers)
+        return rights_by_entity
@@ -0,0 +1,69 @@
+"""Worker-held cache of MaxDiff comparisons per conversation.
+
+Lets `fetch_comparisons_batch` re-read only the `maxdiff_result` rows that
+changed since the conversation was last synced instead of every comparison.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
+
+@dataclass(frozen=True)
+class CachedComparison:
+    best_slug_id: str
+    worst_slug_id: str
+    candidate_set: list[str]
+
+
+@dataclass(frozen=True)
+class CachedMaxdiffResult:
+    participant_id: UUID
+    updated_at: datetime
+    comparisons: tuple[CachedComparison, ...]  # non-deleted, ordered by position
+
+
+@dataclass(frozen=True)
+class CachedConversationComparisons:
+    # Naive UTC, taken before the read that produced `results`
+    synced_at: datetime
+    # maxdiff_result_id -> result, for non-deleted participants only
+    results: dict[int, CachedMaxdiffResult]
+
+
+class ComparisonCache:
+    """LRU of per-conversation comparison sets; max_entries <= 0 disables it.
+
+    Shared by the fast and heavy scheduling lanes, so access is locked.
+    """
+
+    def __init__(self, *, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._conversations: OrderedDict[int, CachedConversationComparisons] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+    def get(self, conversation_id: int) -> CachedConversationComparisons | None:
+        with self._lock:
+            cached = self._conversations.get(conversation_id)
+            if cached is not None:
+                self._conversations.move_to_end(conversation_id)
+            return cached
+
+    def put(self, conversation_id: int, cached: CachedConversationComparisons) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._conversations[conversation_id] = cached
+            self._conversations.move_to_end(conversation_id)
+            while len(self._conversations) > self.max_entries:
+                self._conversations.popitem(last=False)
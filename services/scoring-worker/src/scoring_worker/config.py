@@ -22,6 +22,13 @@ class Settings(BaseSettings):
     reconcile_interval_seconds: int = Field(default=300, ge=1)
     batch_size: int = Field(default=50, ge=1)  # max conversations to ZPOPMIN per cycle
     max_workers: int = Field(default=4, ge=1)  # ThreadPoolExecutor size for parallel Solidago
+    user_learning_processes: int = Field(default=1, ge=1)  # process pool for MaxDiff user fits
+    comparison_cache_max_conversations: int = Field(default=256, ge=0)  # 0 disables the cache
+    heavy_lane_min_weight: int = Field(default=2000, ge=1)  # weight routed to the heavy lane
+    heavy_lane_max_in_flight: int = Field(default=1, ge=1)  # heavy conversations scored at once
+    heavy_lane_aging_seconds: float = Field(default=60.0, gt=0)  # wait that halves heavy priority
+    lane_metrics_log_interval_seconds: float = Field(default=60.0, gt=0)
+    write_coalesce_seconds: float = Field(default=0.25, ge=0)  # window to group ready writes
     backoff_seconds: float = Field(default=10.0, ge=0)  # retry delay after failure
     valkey_retry_interval_seconds: float = Field(default=5.0, gt=0)
 
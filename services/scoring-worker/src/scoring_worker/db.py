@@ -8,13 +8,39 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import and_, func, select, update
+from psycopg import sql as psycopg_sql
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy import (
+    values as sql_values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from scoring_worker.comparison_cache import (
+    CachedComparison,
+    CachedConversationComparisons,
+    CachedMaxdiffResult,
+)
 from scoring_worker.generated_models import (
+    Base,
     Conversation,
     MaxdiffComparison,
     MaxdiffResult,
@@ -38,7 +64,51 @@ from scoring_worker.pipeline_config import PIPELINE_CONFIG
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from sqlalchemy import Engine
+    import psycopg
+    from sqlalchemy import Engine, Executable
+
+    from scoring_worker.comparison_cache import ComparisonCache
+
+# Slack subtracted from ranking_score.computed_at (or a comparison cache sync)
+# before treating a result as unchanged, to absorb clock skew between writers
+# and read-replica lag.
+UNCHANGED_RESULT_MARGIN = timedelta(seconds=5)
+# Result ids per query when re-reading changed results' comparisons
+COMPARISON_FETCH_CHUNK_SIZE = 5_000
+# Stay under PostgreSQL's 65535 bind parameters per statement
+POSTGRES_INSERT_BIND_PARAM_LIMIT = 60_000
+
+# Column order and binary COPY type of each table persisted with bulk_insert_rows
+BULK_COPY_COLUMNS_BY_TABLE: dict[str, tuple[tuple[str, str], ...]] = {
+    "ranking_score_entity": (
+        ("ranking_score_id", "int4"),
+        ("entity_slug_id", "text"),
+        ("score", "float4"),
+        ("uncertainty_left", "float4"),
+        ("uncertainty_right", "float4"),
+        ("participant_count", "int4"),
+    ),
+    "maxdiff_user_entity_score": (
+        ("maxdiff_result_id", "int4"),
+        ("entity_slug_id", "text"),
+        ("score", "float4"),
+        ("uncertainty_left", "float4"),
+        ("uncertainty_right", "float4"),
+    ),
+}
+_USER_SCORE_COPY_COLUMNS = BULK_COPY_COLUMNS_BY_TABLE["maxdiff_user_entity_score"]
+# Transaction-scoped staging table for the per-user score upsert
+_USER_SCORE_STAGING_TABLE = Table(
+    "maxdiff_user_entity_score_staging",
+    MetaData(),
+    Column("maxdiff_result_id", Integer, nullable=False),
+    Column("entity_slug_id", String(8), nullable=False),
+    Column("score", Float(precision=24), nullable=False),
+    Column("uncertainty_left", Float(precision=24), nullable=False),
+    Column("uncertainty_right", Float(precision=24), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
 
 
 @dataclass(frozen=True)
@@ -58,6 +128,14 @@ class ScoredEntity:
     participant_count: int
 
 
+@dataclass(frozen=True)
+class PreviousUserScores:
+    # True when the result has not been updated since the current ranking score
+    is_unchanged: bool
+    # entity_slug_id -> (score, uncertainty_left, uncertainty_right)
+    scores: dict[str, tuple[float, float, float]]
+
+
 @dataclass(frozen=True)
 class SurveyQuestionAnalysisRecord:
     question_id: int
@@ -393,17 +471,29 @@ def fetch_active_items_batch(
     return result
 
 
+@dataclass(frozen=True)
+class MaxdiffCounters:
+    participant_count: int
+    total_participant_count: int
+    vote_count: int
+    total_vote_count: int
+
+
 @dataclass(frozen=True)
 class ComparisonsBatchResult:
     comparisons: dict[int, list[ComparisonRow]]
     # Reverse map: conv_id → {user_idx → maxdiff_result_id}
     user_idx_to_result_id: dict[int, dict[int, int]]
+    # conv_id → counters derived from the same comparison set
+    counters: dict[int, MaxdiffCounters]
 
 
 def fetch_comparisons_batch(
     engine: Engine,
     *,
     conversation_ids: list[int],
+    active_items_by_conv: dict[int, list[str]],
+    cache: ComparisonCache | None = None,
 ) -> ComparisonsBatchResult:
     """Fetch normalized comparisons grouped by conversation_id.
 
@@ -411,99 +501,309 @@ def fetch_comparisons_batch(
     each conversation (each result = one user's session).
 
     Also returns a reverse mapping from user_idx to maxdiff_result.id
-    for writing per-user scores back.
+    for writing per-user scores back, and the conversation-level MaxDiff
+    counters computed from the same comparisons.
+
+    With a `cache`, only results updated since the conversation was last
+    synced have their comparisons re-read; the rest are merged from the
+    cache. Survey eligibility is evaluated once for both outputs.
     """
     if not conversation_ids:
         return ComparisonsBatchResult(
             comparisons={},
             user_idx_to_result_id={},
+            counters={},
         )
 
-    stmt = (
-        select(
-            MaxdiffResult.conversation_id,
-            MaxdiffComparison.maxdiff_result_id,
-            MaxdiffResult.participant_id,
-            MaxdiffComparison.best_slug_id,
-            MaxdiffComparison.worst_slug_id,
-            MaxdiffComparison.candidate_set,
-            MaxdiffComparison.position,
-        )
-        .join(
-            MaxdiffComparison,
-            MaxdiffComparison.maxdiff_result_id == MaxdiffResult.id,
-        )
-        .join(
-            User,
-            User.id == MaxdiffResult.participant_id,
-        )
-        .where(
-            and_(
-                MaxdiffResult.conversation_id.in_(conversation_ids),
-                MaxdiffComparison.deleted_at.is_(None),
-                User.is_deleted.is_(False),
-            ),
+    # Naive UTC, like the maxdiff_result.updated_at values it is compared with
+    synced_at = datetime.now(tz=UTC).replace(tzinfo=None, microsecond=0)
+    cached_by_conv = {
+        cid: cache.get(cid) if cache is not None else None for cid in conversation_ids
+    }
+    results_by_conv: dict[int, dict[int, CachedMaxdiffResult]] = {
+        cid: {} for cid in conversation_ids
+    }
+
+    with Session(engine) as session:
+        # One row per participant: cheap enough to diff against the cache
+        result_rows = session.execute(
+            select(
+                MaxdiffResult.conversation_id,
+                MaxdiffResult.id,
+                MaxdiffResult.participant_id,
+                MaxdiffResult.updated_at,
+            )
+            .join(
+                User,
+                User.id == MaxdiffResult.participant_id,
+            )
+            .where(
+                and_(
+                    MaxdiffResult.conversation_id.in_(conversation_ids),
+                    User.is_deleted.is_(False),
+                ),
+            )
+        ).all()
+
+        stale_result_ids: list[int] = []
+        for row in result_rows:
+            cached = cached_by_conv[row.conversation_id]
+            if cached is None:
+                continue
+            cached_result = cached.results.get(row.id)
+            if (
+                cached_result is not None
+                and cached_result.updated_at == row.updated_at
+                and row.updated_at < cached.synced_at - UNCHANGED_RESULT_MARGIN
+            ):
+                results_by_conv[row.conversation_id][row.id] = cached_result
+            else:
+                stale_result_ids.append(row.id)
+
+        loaded_comparisons = _fetch_result_comparisons(
+            session,
+            conversation_ids=[cid for cid, cached in cached_by_conv.items() if cached is None],
+            result_ids=stale_result_ids,
         )
-        .order_by(
-            MaxdiffResult.conversation_id,
-            MaxdiffComparison.maxdiff_result_id,
-            MaxdiffComparison.position,
+        for row in result_rows:
+            results = results_by_conv[row.conversation_id]
+            if row.id not in results:
+                results[row.id] = CachedMaxdiffResult(
+                    participant_id=row.participant_id,
+                    updated_at=row.updated_at,
+                    comparisons=tuple(loaded_comparisons.get(row.id, ())),
+                )
+
+        eligible_participant_ids_by_conv = _fetch_survey_eligible_participants_batch(
+            session,
+            conversation_ids=conversation_ids,
+            candidate_participant_ids_by_conv={
+                cid: {result.participant_id for result in results.values() if result.comparisons}
+                for cid, results in results_by_conv.items()
+            },
         )
-    )
 
     comparisons: dict[int, list[ComparisonRow]] = {cid: [] for cid in conversation_ids}
-    # Forward: conv_id → {result_id → user_idx}
-    user_idx_maps: dict[int, dict[int, int]] = {}
     # Reverse: conv_id → {user_idx → result_id}
     reverse_maps: dict[int, dict[int, int]] = {}
+    counters: dict[int, MaxdiffCounters] = {}
+    for cid, results in results_by_conv.items():
+        if cache is not None:
+            cache.put(
+                cid,
+                CachedConversationComparisons(synced_at=synced_at, results=results),
+            )
 
-    with Session(engine) as session:
-        raw_rows = list(session.execute(stmt))
-        candidate_participant_ids_by_conv: dict[int, set[UUID]] = {
-            cid: set() for cid in conversation_ids
-        }
-        for row in raw_rows:
-            candidate_participant_ids_by_conv[row.conversation_id].add(row.participant_id)
-
-        eligible_participant_ids_by_conv = _fetch_survey_eligible_participants_batch(
-            session,
-            conversation_ids=conversation_ids,
-            candidate_participant_ids_by_conv=candidate_participant_ids_by_conv,
+        eligible_participant_ids = eligible_participant_ids_by_conv.get(cid)
+        counters[cid] = compute_maxdiff_counters(
+            results=list(results.values()),
+            active_slug_ids=set(active_items_by_conv.get(cid, [])),
+            eligible_participant_ids=eligible_participant_ids,
         )
 
-        for row in raw_rows:
-            cid = row.conversation_id
-            eligible_participant_ids = eligible_participant_ids_by_conv.get(cid)
-            if (
+        for rid in sorted(results):
+            result = results[rid]
+            if not result.comparisons or (
                 eligible_participant_ids is not None
-                and row.participant_id not in eligible_participant_ids
+                and result.participant_id not in eligible_participant_ids
             ):
                 continue
-            rid = row.maxdiff_result_id
-            if cid not in user_idx_maps:
-                user_idx_maps[cid] = {}
-                reverse_maps[cid] = {}
-            idx_map = user_idx_maps[cid]
-            if rid not in idx_map:
-                idx = len(idx_map)
-                idx_map[rid] = idx
-                reverse_maps[cid][idx] = rid
-
-            comparisons[cid].append(
+            idx_map = reverse_maps.setdefault(cid, {})
+            idx = len(idx_map)
+            idx_map[idx] = rid
+            comparisons[cid].extend(
                 ComparisonRow(
-                    best_slug_id=row.best_slug_id,
-                    worst_slug_id=row.worst_slug_id,
-                    candidate_set=row.candidate_set,
-                    user_idx=idx_map[rid],
+                    best_slug_id=comparison.best_slug_id,
+                    worst_slug_id=comparison.worst_slug_id,
+                    candidate_set=comparison.candidate_set,
+                    user_idx=idx,
                 )
+                for comparison in result.comparisons
             )
 
     return ComparisonsBatchResult(
         comparisons=comparisons,
         user_idx_to_result_id=reverse_maps,
+        counters=counters,
+    )
+
+
+def _fetch_result_comparisons(
+    session: Session,
+    *,
+    conversation_ids: list[int],
+    result_ids: list[int],
+) -> dict[int, list[CachedComparison]]:
+    """Load non-deleted comparisons for whole conversations and/or single results."""
+    columns = (
+        MaxdiffComparison.maxdiff_result_id,
+        MaxdiffComparison.best_slug_id,
+        MaxdiffComparison.worst_slug_id,
+        MaxdiffComparison.candidate_set,
+    )
+    order_by = (MaxdiffComparison.maxdiff_result_id, MaxdiffComparison.position)
+    statements: list[Executable] = []
+    if conversation_ids:
+        statements.append(
+            select(*columns)
+            .join(
+                MaxdiffResult,
+                MaxdiffResult.id == MaxdiffComparison.maxdiff_result_id,
+            )
+            .where(
+                and_(
+                    MaxdiffResult.conversation_id.in_(conversation_ids),
+                    MaxdiffComparison.deleted_at.is_(None),
+                ),
+            )
+            .order_by(*order_by)
+        )
+    for start in range(0, len(result_ids), COMPARISON_FETCH_CHUNK_SIZE):
+        statements.append(
+            select(*columns)
+            .where(
+                and_(
+                    MaxdiffComparison.maxdiff_result_id.in_(
+                        result_ids[start : start + COMPARISON_FETCH_CHUNK_SIZE]
+                    ),
+                    MaxdiffComparison.deleted_at.is_(None),
+                ),
+            )
+            .order_by(*order_by)
+        )
+
+    comparisons_by_result: dict[int, list[CachedComparison]] = {}
+    for stmt in statements:
+        for row in session.execute(stmt):
+            comparisons_by_result.setdefault(row.maxdiff_result_id, []).append(
+                CachedComparison(
+                    best_slug_id=row.best_slug_id,
+                    worst_slug_id=row.worst_slug_id,
+                    candidate_set=row.candidate_set,
+                )
+            )
+    return comparisons_by_result
+
+
+def compute_maxdiff_counters(
+    *,
+    results: list[CachedMaxdiffResult],
+    active_slug_ids: set[str],
+    eligible_participant_ids: set[UUID] | None,
+) -> MaxdiffCounters:
+    """Derive conversation-level MaxDiff counters from its comparisons.
+
+    - total_participant_count: distinct users with any comparisons
+    - total_vote_count: total comparison rows across all users
+    - participant_count: distinct survey-eligible users with comparisons
+      where both best AND worst are active items
+    - vote_count: those users' comparison rows where both best AND worst
+      are active items
+    """
+    total_participant_ids: set[UUID] = set()
+    total_votes = 0
+    participant_ids: set[UUID] = set()
+    votes = 0
+    for result in results:
+        if not result.comparisons:
+            continue
+        total_participant_ids.add(result.participant_id)
+        total_votes += len(result.comparisons)
+        if (
+            eligible_participant_ids is not None
+            and result.participant_id not in eligible_participant_ids
+        ):
+            continue
+        active_votes = sum(
+            1
+            for comparison in result.comparisons
+            if comparison.best_slug_id in active_slug_ids
+            and comparison.worst_slug_id in active_slug_ids
+        )
+        if active_votes:
+            participant_ids.add(result.participant_id)
+            votes += active_votes
+
+    return MaxdiffCounters(
+        participant_count=len(participant_ids),
+        total_participant_count=len(total_participant_ids),
+        vote_count=votes,
+        total_vote_count=total_votes,
     )
 
 
+def fetch_previous_user_scores_batch(
+    engine: Engine,
+    *,
+    conversation_ids: list[int],
+) -> dict[int, dict[int, PreviousUserScores]]:
+    """Fetch last run's per-user entity scores grouped by conversation_id.
+
+    Returns conv_id -> {maxdiff_result_id -> PreviousUserScores}. A result
+    counts as unchanged only when the conversation's current ranking score
+    came from the same preference learner and was computed (minus
+    UNCHANGED_RESULT_MARGIN) after the result was last updated.
+    """
+    if not conversation_ids:
+        return {}
+
+    is_unchanged = and_(
+        RankingScore.preference_learning == PIPELINE_CONFIG["preference_learning"],
+        MaxdiffResult.updated_at < RankingScore.computed_at - UNCHANGED_RESULT_MARGIN,
+    )
+    stmt = (
+        select(
+            MaxdiffResult.conversation_id,
+            MaxdiffUserEntityScore.maxdiff_result_id,
+            MaxdiffUserEntityScore.entity_slug_id,
+            MaxdiffUserEntityScore.score,
+            MaxdiffUserEntityScore.uncertainty_left,
+            MaxdiffUserEntityScore.uncertainty_right,
+            func.coalesce(is_unchanged, False).label("is_unchanged"),
+        )
+        .join(
+            MaxdiffResult,
+            MaxdiffResult.id == MaxdiffUserEntityScore.maxdiff_result_id,
+        )
+        .join(
+            Conversation,
+            Conversation.id == MaxdiffResult.conversation_id,
+        )
+        .join(
+            RankingConversationConfig,
+            RankingConversationConfig.id == Conversation.ranking_config_id,
+        )
+        .outerjoin(
+            RankingScore,
+            RankingScore.id == RankingConversationConfig.current_ranking_score_id,
+        )
+        .where(MaxdiffResult.conversation_id.in_(conversation_ids))
+    )
+
+    scores_by_result: dict[int, dict[int, dict[str, tuple[float, float, float]]]] = {
+        cid: {} for cid in conversation_ids
+    }
+    unchanged_result_ids: set[int] = set()
+    with Session(engine) as session:
+        for row in session.execute(stmt):
+            scores_by_result[row.conversation_id].setdefault(row.maxdiff_result_id, {})[
+                row.entity_slug_id
+            ] = (row.score, row.uncertainty_left, row.uncertainty_right)
+            if row.is_unchanged:
+                unchanged_result_ids.add(row.maxdiff_result_id)
+
+    return {
+        cid: {
+            result_id: PreviousUserScores(
+                is_unchanged=result_id in unchanged_result_ids,
+                scores=scores,
+            )
+            for result_id, scores in result_scores.items()
+        }
+        for cid, result_scores in scores_by_result.items()
+    }
+
+
 # --- Batch WRITE ---
 
 
@@ -521,117 +821,223 @@ def write_scores_batch(
     *,
     results: dict[int, tuple[list[ScoredEntity], dict[str, int]]],
     user_scores: list[UserScoreEntry] | None = None,
+    computed_at: datetime | None = None,
 ) -> None:
     """Write scoring results for multiple conversations in one transaction.
 
     `results` maps conversation_id -> (scored_entities, participant_counts).
     `user_scores` is a flat list of per-user entity scores to upsert.
+    `computed_at` should be taken before the scored input was read, so that
+    results updated while scoring never look unchanged on the next run.
     Skips conversations with empty scores.
+
+    Each table is written with one statement for the whole batch: a
+    multi-row RETURNING insert for ranking_score, COPY for the entity and
+    per-user rows, and one conditional UPDATE for the current score ids.
     """
+    results = {conv_id: result for conv_id, result in results.items() if result[0]}
     if not results:
         return
 
     now = datetime.now(tz=UTC).replace(microsecond=0)
+    if computed_at is None:
+        computed_at = now
+    pipeline_config = json.dumps(
+        {
+            "preferenceLearning": PIPELINE_CONFIG["preference_learning"],
+            "votingRights": PIPELINE_CONFIG["voting_rights"],
+            "aggregation": PIPELINE_CONFIG["aggregation"],
+        }
+    )
 
     with Session(engine) as session:
-        for conv_id, (scores, participant_counts) in results.items():
-            if not scores:
-                continue
+        # Insert ranking_score rows (JSONB backup + typed columns)
+        conv_ids = list(results)
+        ranking_score_ids = session.scalars(
+            insert(RankingScore).returning(RankingScore.id, sort_by_parameter_order=True),
+            [
+                {
+                    "conversation_id": conv_id,
+                    "scores": json.dumps(
+                        [
+                            {
+                                "entityId": s.entity_slug_id,
+                                "score": s.score,
+                                "uncertaintyLeft": s.uncertainty_left,
+                                "uncertaintyRight": s.uncertainty_right,
+                            }
+                            for s in scores
+                        ]
+                    ),
+                    "participant_counts": json.dumps(participant_counts),
+                    "group_sources_snapshot": None,
+                    "user_weights_snapshot": None,
+                    "pipeline_config": pipeline_config,
+                    "preference_learning": PIPELINE_CONFIG["preference_learning"],
+                    "voting_rights": PIPELINE_CONFIG["voting_rights"],
+                    "aggregation_config": PIPELINE_CONFIG["aggregation"],
+                    "computed_at": computed_at,
+                    "created_at": now,
+                }
+                for conv_id, (scores, participant_counts) in results.items()
+            ],
+        ).all()
+        ranking_score_id_by_conv = dict(zip(conv_ids, ranking_score_ids, strict=True))
 
-            # Insert ranking_score (JSONB backup + typed columns)
-            ranking_score = RankingScore(
-                conversation_id=conv_id,
-                scores=json.dumps(
-                    [
-                        {
-                            "entityId": s.entity_slug_id,
-                            "score": s.score,
-                            "uncertaintyLeft": s.uncertainty_left,
-                            "uncertaintyRight": s.uncertainty_right,
-                        }
-                        for s in scores
-                    ]
-                ),
-                participant_counts=json.dumps(participant_counts),
-                group_sources_snapshot=None,
-                user_weights_snapshot=None,
-                pipeline_config=json.dumps(
-                    {
-                        "preferenceLearning": PIPELINE_CONFIG["preference_learning"],
-                        "votingRights": PIPELINE_CONFIG["voting_rights"],
-                        "aggregation": PIPELINE_CONFIG["aggregation"],
-                    }
-                ),
-                preference_learning=PIPELINE_CONFIG["preference_learning"],
-                voting_rights=PIPELINE_CONFIG["voting_rights"],
-                aggregation_config=PIPELINE_CONFIG["aggregation"],
-                computed_at=now,
-                created_at=now,
-            )
-            session.add(ranking_score)
-            session.flush()  # get the auto-generated ID
-
-            # Insert normalized entity scores
-            for s in scores:
-                session.add(
-                    RankingScoreEntity(
-                        ranking_score_id=ranking_score.id,
-                        entity_slug_id=s.entity_slug_id,
-                        score=s.score,
-                        uncertainty_left=s.uncertainty_left,
-                        uncertainty_right=s.uncertainty_right,
-                        participant_count=participant_counts.get(s.entity_slug_id, 0),
-                    )
-                )
+        # Insert normalized entity scores
+        bulk_insert_rows(
+            session,
+            model=RankingScoreEntity,
+            values=[
+                {
+                    "ranking_score_id": ranking_score_id_by_conv[conv_id],
+                    "entity_slug_id": s.entity_slug_id,
+                    "score": s.score,
+                    "uncertainty_left": s.uncertainty_left,
+                    "uncertainty_right": s.uncertainty_right,
+                    "participant_count": participant_counts.get(s.entity_slug_id, 0),
+                }
+                for conv_id, (scores, participant_counts) in results.items()
+                for s in scores
+            ],
+        )
 
-            # Conditional update: only if our ID is newer
-            session.execute(
-                update(RankingConversationConfig)
-                .where(
-                    and_(
-                        RankingConversationConfig.id == Conversation.ranking_config_id,
-                        Conversation.id == conv_id,
-                        (
-                            RankingConversationConfig.current_ranking_score_id.is_(None)
-                            | (
-                                RankingConversationConfig.current_ranking_score_id
-                                < ranking_score.id
-                            )
-                        ),
+        # Conditional update: only where our ID is newer
+        new_scores = sql_values(
+            column("conversation_id", Integer),
+            column("ranking_score_id", Integer),
+            name="new_ranking_score",
+        ).data(list(ranking_score_id_by_conv.items()))
+        session.execute(
+            update(RankingConversationConfig)
+            .where(
+                and_(
+                    RankingConversationConfig.id == Conversation.ranking_config_id,
+                    Conversation.id == new_scores.c.conversation_id,
+                    (
+                        RankingConversationConfig.current_ranking_score_id.is_(None)
+                        | (
+                            RankingConversationConfig.current_ranking_score_id
+                            < new_scores.c.ranking_score_id
+                        )
                     ),
-                )
-                .values(current_ranking_score_id=ranking_score.id),
+                ),
             )
+            .values(current_ranking_score_id=new_scores.c.ranking_score_id),
+        )
 
-        # Bulk upsert per-user entity scores
         if user_scores:
-            from sqlalchemy.dialects.postgresql import insert as pg_insert
+            _upsert_user_scores(session, user_scores=user_scores)
 
-            values = [
-                {
-                    "maxdiff_result_id": e.maxdiff_result_id,
-                    "entity_slug_id": e.entity_slug_id,
-                    "score": e.score,
-                    "uncertainty_left": e.uncertainty_left,
-                    "uncertainty_right": e.uncertainty_right,
-                }
-                for e in user_scores
-            ]
-            stmt = pg_insert(MaxdiffUserEntityScore).values(values)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[
-                    MaxdiffUserEntityScore.maxdiff_result_id,
-                    MaxdiffUserEntityScore.entity_slug_id,
-                ],
-                set_={
-                    "score": stmt.excluded.score,
-                    "uncertainty_left": stmt.excluded.uncertainty_left,
-                    "uncertainty_right": stmt.excluded.uncertainty_right,
-                },
+        session.commit()
+
+
+def _upsert_user_scores(session: Session, *, user_scores: list[UserScoreEntry]) -> None:
+    """Replace the per-user entity scores of every result in `user_scores`.
+
+    Rows are COPYed into a transaction-scoped staging table, then merged
+    with set-based statements. Each written result's rows for entities it
+    no longer scores are deleted, so the stored entity set always matches
+    the latest fit, which the unchanged-user check relies on.
+    """
+    staging = _USER_SCORE_STAGING_TABLE
+    staging.create(session.connection())
+    _copy_rows(
+        session,
+        table_name=staging.name,
+        columns=_USER_SCORE_COPY_COLUMNS,
+        values=[
+            {
+                "maxdiff_result_id": e.maxdiff_result_id,
+                "entity_slug_id": e.entity_slug_id,
+                "score": e.score,
+                "uncertainty_left": e.uncertainty_left,
+                "uncertainty_right": e.uncertainty_right,
+            }
+            for e in user_scores
+        ],
+    )
+
+    session.execute(
+        delete(MaxdiffUserEntityScore).where(
+            and_(
+                MaxdiffUserEntityScore.maxdiff_result_id.in_(
+                    select(staging.c.maxdiff_result_id).distinct()
+                ),
+                ~exists().where(
+                    and_(
+                        staging.c.maxdiff_result_id == MaxdiffUserEntityScore.maxdiff_result_id,
+                        staging.c.entity_slug_id == MaxdiffUserEntityScore.entity_slug_id,
+                    )
+                ),
             )
-            session.execute(stmt)
+        )
+    )
 
-        session.commit()
+    column_names = [column_name for column_name, _copy_type in _USER_SCORE_COPY_COLUMNS]
+    stmt = pg_insert(MaxdiffUserEntityScore).from_select(
+        column_names,
+        select(*(staging.c[column_name] for column_name in column_names)),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            MaxdiffUserEntityScore.maxdiff_result_id,
+            MaxdiffUserEntityScore.entity_slug_id,
+        ],
+        set_={
+            "score": stmt.excluded.score,
+            "uncertainty_left": stmt.excluded.uncertainty_left,
+            "uncertainty_right": stmt.excluded.uncertainty_right,
+        },
+    )
+    session.execute(stmt)
+
+
+def _max_rows_per_insert(*, column_count: int) -> int:
+    return max(1, POSTGRES_INSERT_BIND_PARAM_LIMIT // column_count)
+
+
+def bulk_insert_rows(
+    session: Session,
+    *,
+    model: type[Base],
+    values: list[dict[str, object]],
+) -> str:
+    columns = BULK_COPY_COLUMNS_BY_TABLE.get(model.__tablename__)
+    if columns is None:
+        msg = f"no bulk COPY columns for table {model.__tablename__}"
+        raise ValueError(msg)
+    if not values:
+        return "none"
+    if session.get_bind().dialect.name == "postgresql":
+        _copy_rows(session, table_name=model.__tablename__, columns=columns, values=values)
+        return "copy"
+    chunk_size = _max_rows_per_insert(column_count=len(columns))
+    for start in range(0, len(values), chunk_size):
+        session.execute(insert(model).values(values[start : start + chunk_size]))
+    return "insert"
+
+
+def _copy_rows(
+    session: Session,
+    *,
+    table_name: str,
+    columns: tuple[tuple[str, str], ...],
+    values: list[dict[str, object]],
+) -> None:
+    driver_connection = cast(
+        "psycopg.Connection[Any]",
+        session.connection().connection.driver_connection,
+    )
+    column_names = [column_name for column_name, _copy_type in columns]
+    statement = psycopg_sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(
+        psycopg_sql.Identifier(table_name),
+        psycopg_sql.SQL(", ").join(psycopg_sql.Identifier(name) for name in column_names),
+    )
+    with driver_connection.cursor() as cursor, cursor.copy(statement) as copy:
+        copy.set_types([copy_type for _column_name, copy_type in columns])
+        for value in values:
+            copy.write_row([value[column_name] for column_name in column_names])
 
 
 def clear_scores_batch(
@@ -663,141 +1069,31 @@ def clear_scores_batch(
 def update_maxdiff_counters_batch(
     engine: Engine,
     *,
-    conversation_ids: list[int],
-    active_items_by_conv: dict[int, list[str]],
+    counters: dict[int, MaxdiffCounters],
 ) -> None:
-    """Update conversation-level MaxDiff counters for a batch.
+    """Write conversation-level MaxDiff counters for a batch.
 
-    Single source of truth for MaxDiff counters (API no longer computes these):
-    - total_participant_count: distinct users with any comparisons
-    - total_vote_count: total comparison rows across all users
-    - participant_count: distinct users with comparisons where both best
-      AND worst are active items
-    - vote_count: comparison rows where both best AND worst are active items
+    Single source of truth for MaxDiff counters (API no longer computes
+    these). `counters` comes from `fetch_comparisons_batch`; all rows are
+    written with one executemany UPDATE.
     """
-    if not conversation_ids:
+    if not counters:
         return
 
     with Session(engine) as session:
-        candidate_participant_rows = session.execute(
-            select(MaxdiffResult.conversation_id, MaxdiffResult.participant_id)
-            .join(User, User.id == MaxdiffResult.participant_id)
-            .where(
-                and_(
-                    MaxdiffResult.conversation_id.in_(conversation_ids),
-                    User.is_deleted.is_(False),
-                )
-            )
-        ).all()
-        candidate_participant_ids_by_conv: dict[int, set[UUID]] = {
-            cid: set() for cid in conversation_ids
-        }
-        for row in candidate_participant_rows:
-            candidate_participant_ids_by_conv[row.conversation_id].add(row.participant_id)
-
-        eligible_participant_ids_by_conv = _fetch_survey_eligible_participants_batch(
-            session,
-            conversation_ids=conversation_ids,
-            candidate_participant_ids_by_conv=candidate_participant_ids_by_conv,
+        session.execute(
+            update(Conversation),
+            [
+                {
+                    "id": conv_id,
+                    "participant_count": conv_counters.participant_count,
+                    "total_participant_count": conv_counters.total_participant_count,
+                    "vote_count": conv_counters.vote_count,
+                    "total_vote_count": conv_counters.total_vote_count,
+                }
+                for conv_id, conv_counters in counters.items()
+            ],
         )
-
-        for conv_id in conversation_ids:
-            active_slugs = set(active_items_by_conv.get(conv_id, []))
-            eligible_participant_ids = eligible_participant_ids_by_conv.get(conv_id)
-
-            # Total counts (all comparisons, excluding deleted users + soft-deleted rows)
-            total_row = session.execute(
-                select(
-                    func.count(func.distinct(MaxdiffResult.participant_id)).label(
-                        "total_participants"
-                    ),
-                    func.count().label("total_votes"),
-                )
-                .select_from(MaxdiffComparison)
-                .join(
-                    MaxdiffResult,
-                    MaxdiffResult.id == MaxdiffComparison.maxdiff_result_id,
-                )
-                .join(
-                    User,
-                    User.id == MaxdiffResult.participant_id,
-                )
-                .where(
-                    and_(
-                        MaxdiffResult.conversation_id == conv_id,
-                        User.is_deleted.is_(False),
-                        MaxdiffComparison.deleted_at.is_(None),
-                    ),
-                ),
-            ).one()
-
-            if not active_slugs:
-                session.execute(
-                    update(Conversation)
-                    .where(Conversation.id == conv_id)
-                    .values(
-                        participant_count=0,
-                        total_participant_count=total_row.total_participants,
-                        vote_count=0,
-                        total_vote_count=total_row.total_votes,
-                    ),
-                )
-                continue
-
-            if eligible_participant_ids is not None and not eligible_participant_ids:
-                session.execute(
-                    update(Conversation)
-                    .where(Conversation.id == conv_id)
-                    .values(
-                        participant_count=0,
-                        total_participant_count=total_row.total_participants,
-                        vote_count=0,
-                        total_vote_count=total_row.total_votes,
-                    ),
-                )
-                continue
-
-            # Filtered counts (only active items, excluding deleted users + soft-deleted rows)
-            filtered_conditions = [
-                MaxdiffResult.conversation_id == conv_id,
-                User.is_deleted.is_(False),
-                MaxdiffComparison.deleted_at.is_(None),
-                MaxdiffComparison.best_slug_id.in_(active_slugs),
-                MaxdiffComparison.worst_slug_id.in_(active_slugs),
-            ]
-            if eligible_participant_ids is not None:
-                filtered_conditions.append(
-                    MaxdiffResult.participant_id.in_(eligible_participant_ids)
-                )
-
-            filtered_row = session.execute(
-                select(
-                    func.count(func.distinct(MaxdiffResult.participant_id)).label("participants"),
-                    func.count().label("votes"),
-                )
-                .select_from(MaxdiffComparison)
-                .join(
-                    MaxdiffResult,
-                    MaxdiffResult.id == MaxdiffComparison.maxdiff_result_id,
-                )
-                .join(
-                    User,
-                    User.id == MaxdiffResult.participant_id,
-                )
-                .where(and_(*filtered_conditions)),
-            ).one()
-
-            session.execute(
-                update(Conversation)
-                .where(Conversation.id == conv_id)
-                .values(
-                    participant_count=filtered_row.participants,
-                    total_participant_count=total_row.total_participants,
-                    vote_count=filtered_row.votes,
-                    total_vote_count=total_row.total_votes,
-                ),
-            )
-
         session.commit()
 
 
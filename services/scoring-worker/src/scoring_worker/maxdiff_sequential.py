@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -12,6 +18,16 @@ from solidago.scoring_model import DirectScoringModel, ScoringModel
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from solidago.judgments import Judgments as SolidagoJudgments
+
+log = logging.getLogger(__name__)
+
+USER_LEARNING_CHUNKS_PER_PROCESS = 4
+
+_user_learning_pool: ProcessPoolExecutor | None = None
+_user_learning_processes = 1
+_user_learning_pool_lock = threading.Lock()
+
 
 @dataclass(frozen=True)
 class SequentialMaxDiffTask:
@@ -27,30 +43,43 @@ class SequentialMaxDiffFit:
     uncertainty_right: np.ndarray
 
 
+@dataclass(frozen=True)
+class _UserMaxDiffProblem:
+    user_id: int
+    entity_ids: list[int]
+    tasks: list[SequentialMaxDiffTask]
+    initialization: np.ndarray | None
+
+
+@dataclass(frozen=True)
+class _PackedMaxDiffTasks:
+    """Tasks as padded arrays, one row per choice stage.
+
+    Rows ``[0, T)`` are best-choice stages over the whole candidate set and rows
+    ``[T, 2T)`` are worst-choice stages over the candidates left after the best
+    pick. Padding uses coordinate 0 with a masked-out logit, so it gets zero
+    probability and contributes nothing to the gradient or Hessian.
+    """
+
+    num_entities: int
+    coords: np.ndarray
+    mask: np.ndarray
+    signs: np.ndarray
+    chosen_gradient: np.ndarray
+    hessian_indexes: np.ndarray
+
+
 def sequential_maxdiff_loss(
     *,
     scores: np.ndarray,
     tasks: Sequence[SequentialMaxDiffTask],
     prior_std_dev: float,
 ) -> float:
-    regularization = float(np.dot(scores, scores) / (2.0 * prior_std_dev**2))
-    if not tasks:
-        return regularization
-
-    loss = regularization
-    for task in tasks:
-        candidate_coords = np.asarray(task.candidate_set, dtype=np.int64)
-        best_stage_scores = scores[candidate_coords]
-        loss += _logsumexp(best_stage_scores) - scores[task.best_entity]
-
-        remaining_coords = np.asarray(
-            [coord for coord in task.candidate_set if coord != task.best_entity],
-            dtype=np.int64,
-        )
-        worst_stage_scores = -scores[remaining_coords]
-        loss += _logsumexp(worst_stage_scores) + scores[task.worst_entity]
-
-    return float(loss)
+    return _packed_loss(
+        scores=scores,
+        packed=_pack_tasks(tasks, num_entities=len(scores)),
+        prior_std_dev=prior_std_dev,
+    )
 
 
 def sequential_maxdiff_gradient(
@@ -59,22 +88,11 @@ def sequential_maxdiff_gradient(
     tasks: Sequence[SequentialMaxDiffTask],
     prior_std_dev: float,
 ) -> np.ndarray:
-    gradient = scores / (prior_std_dev**2)
-    for task in tasks:
-        candidate_coords = np.asarray(task.candidate_set, dtype=np.int64)
-        best_probabilities = _softmax(scores[candidate_coords])
-        gradient[candidate_coords] += best_probabilities
-        gradient[task.best_entity] -= 1.0
-
-        remaining_coords = np.asarray(
-            [coord for coord in task.candidate_set if coord != task.best_entity],
-            dtype=np.int64,
-        )
-        worst_probabilities = _softmax(-scores[remaining_coords])
-        gradient[remaining_coords] -= worst_probabilities
-        gradient[task.worst_entity] += 1.0
-
-    return gradient
+    return _packed_gradient(
+        scores=scores,
+        packed=_pack_tasks(tasks, num_entities=len(scores)),
+        prior_std_dev=prior_std_dev,
+    )
 
 
 def sequential_maxdiff_hessian(
@@ -83,24 +101,128 @@ def sequential_maxdiff_hessian(
     tasks: Sequence[SequentialMaxDiffTask],
     prior_std_dev: float,
 ) -> np.ndarray:
-    hessian = np.eye(len(scores), dtype=np.float64) / (prior_std_dev**2)
-    for task in tasks:
-        candidate_coords = np.asarray(task.candidate_set, dtype=np.int64)
-        best_probabilities = _softmax(scores[candidate_coords])
-        hessian[np.ix_(candidate_coords, candidate_coords)] += _softmax_covariance(
-            best_probabilities
-        )
+    return _packed_hessian(
+        scores=scores,
+        packed=_pack_tasks(tasks, num_entities=len(scores)),
+        prior_std_dev=prior_std_dev,
+    )
 
-        remaining_coords = np.asarray(
-            [coord for coord in task.candidate_set if coord != task.best_entity],
-            dtype=np.int64,
-        )
-        worst_probabilities = _softmax(-scores[remaining_coords])
-        hessian[np.ix_(remaining_coords, remaining_coords)] += _softmax_covariance(
-            worst_probabilities
+
+def _pack_tasks(
+    tasks: Sequence[SequentialMaxDiffTask],
+    *,
+    num_entities: int,
+) -> _PackedMaxDiffTasks:
+    task_count = len(tasks)
+    width = max((len(task.candidate_set) for task in tasks), default=0)
+    coords = np.zeros((2 * task_count, width), dtype=np.int64)
+    mask = np.zeros((2 * task_count, width), dtype=np.bool_)
+    for index, task in enumerate(tasks):
+        remaining_coords = [coord for coord in task.candidate_set if coord != task.best_entity]
+        if not remaining_coords:
+            msg = "Sequential MaxDiff task needs a candidate besides the best entity"
+            raise ValueError(msg)
+        coords[index, : len(task.candidate_set)] = task.candidate_set
+        mask[index, : len(task.candidate_set)] = True
+        coords[task_count + index, : len(remaining_coords)] = remaining_coords
+        mask[task_count + index, : len(remaining_coords)] = True
+
+    best_entities = np.fromiter((task.best_entity for task in tasks), dtype=np.int64)
+    worst_entities = np.fromiter((task.worst_entity for task in tasks), dtype=np.int64)
+    chosen_gradient = np.bincount(worst_entities, minlength=num_entities).astype(
+        np.float64
+    ) - np.bincount(best_entities, minlength=num_entities).astype(np.float64)
+    return _PackedMaxDiffTasks(
+        num_entities=num_entities,
+        coords=coords,
+        mask=mask,
+        signs=np.repeat([1.0, -1.0], task_count)[:, np.newaxis],
+        chosen_gradient=chosen_gradient,
+        hessian_indexes=(
+            coords[:, :, np.newaxis] * num_entities + coords[:, np.newaxis, :]
+        ).ravel(),
+    )
+
+
+def _stage_log_partitions_and_probabilities(
+    *,
+    scores: np.ndarray,
+    packed: _PackedMaxDiffTasks,
+) -> tuple[np.ndarray, np.ndarray]:
+    logits = np.where(packed.mask, packed.signs * scores[packed.coords], -np.inf)
+    max_logits = logits.max(axis=1, keepdims=True)
+    exp_logits = np.exp(logits - max_logits)
+    partitions = exp_logits.sum(axis=1, keepdims=True)
+    return (max_logits + np.log(partitions))[:, 0], exp_logits / partitions
+
+
+def _packed_loss(
+    *,
+    scores: np.ndarray,
+    packed: _PackedMaxDiffTasks,
+    prior_std_dev: float,
+) -> float:
+    regularization = float(np.dot(scores, scores) / (2.0 * prior_std_dev**2))
+    if len(packed.coords) == 0:
+        return regularization
+
+    log_partitions, _probabilities = _stage_log_partitions_and_probabilities(
+        scores=scores,
+        packed=packed,
+    )
+    return float(regularization + log_partitions.sum() + np.dot(scores, packed.chosen_gradient))
+
+
+def _packed_gradient(
+    *,
+    scores: np.ndarray,
+    packed: _PackedMaxDiffTasks,
+    prior_std_dev: float,
+) -> np.ndarray:
+    gradient = scores / (prior_std_dev**2)
+    if len(packed.coords) == 0:
+        return gradient
+
+    _log_partitions, probabilities = _stage_log_partitions_and_probabilities(
+        scores=scores,
+        packed=packed,
+    )
+    return (
+        gradient
+        + np.bincount(
+            packed.coords.ravel(),
+            weights=(packed.signs * probabilities).ravel(),
+            minlength=packed.num_entities,
         )
+        + packed.chosen_gradient
+    )
+
+
+def _packed_hessian(
+    *,
+    scores: np.ndarray,
+    packed: _PackedMaxDiffTasks,
+    prior_std_dev: float,
+) -> np.ndarray:
+    hessian = np.eye(packed.num_entities, dtype=np.float64) / (prior_std_dev**2)
+    if len(packed.coords) == 0:
+        return hessian
 
-    return hessian
+    _log_partitions, probabilities = _stage_log_partitions_and_probabilities(
+        scores=scores,
+        packed=packed,
+    )
+    # Softmax covariance diag(p) - p p^T for every stage, summed into the
+    # entity x entity Hessian in one pass.
+    stage_covariances = (
+        probabilities[:, :, np.newaxis] * np.eye(probabilities.shape[1])
+        - probabilities[:, :, np.newaxis] * probabilities[:, np.newaxis, :]
+    )
+    return hessian + np.bincount(
+        packed.hessian_indexes,
+        weights=stage_covariances.ravel(),
+        minlength=packed.num_entities**2,
+    ).reshape(packed.num_entities, packed.num_entities)
 
 
 def fit_sequential_maxdiff_map(
@@ -129,19 +251,20 @@ def fit_sequential_maxdiff_map(
             raise ValueError(msg)
 
     scores -= scores.mean()
+    packed = _pack_tasks(tasks, num_entities=num_entities)
 
     for _ in range(max_iter):
-        gradient = sequential_maxdiff_gradient(
+        gradient = _packed_gradient(
             scores=scores,
-            tasks=tasks,
+            packed=packed,
             prior_std_dev=prior_std_dev,
         )
         if float(np.max(np.abs(gradient))) <= convergence_error:
             break
 
-        hessian = sequential_maxdiff_hessian(
+        hessian = _packed_hessian(
             scores=scores,
-            tasks=tasks,
+            packed=packed,
             prior_std_dev=prior_std_dev,
         )
         try:
@@ -151,9 +274,9 @@ def fit_sequential_maxdiff_map(
             step = np.linalg.solve(stabilized_hessian, gradient)
 
         direction = -step
-        current_loss = sequential_maxdiff_loss(
+        current_loss = _packed_loss(
             scores=scores,
-            tasks=tasks,
+            packed=packed,
             prior_std_dev=prior_std_dev,
         )
         directional_derivative = float(np.dot(gradient, direction))
@@ -164,9 +287,9 @@ def fit_sequential_maxdiff_map(
         step_size = 1.0
         next_scores = scores + step_size * direction
         next_scores -= next_scores.mean()
-        next_loss = sequential_maxdiff_loss(
+        next_loss = _packed_loss(
             scores=next_scores,
-            tasks=tasks,
+            packed=packed,
             prior_std_dev=prior_std_dev,
         )
 
@@ -177,9 +300,9 @@ def fit_sequential_maxdiff_map(
             step_size *= 0.5
             next_scores = scores + step_size * direction
             next_scores -= next_scores.mean()
-            next_loss = sequential_maxdiff_loss(
+            next_loss = _packed_loss(
                 scores=next_scores,
-                tasks=tasks,
+                packed=packed,
                 prior_std_dev=prior_std_dev,
             )
 
@@ -194,9 +317,9 @@ def fit_sequential_maxdiff_map(
         msg = f"Sequential MaxDiff failed to converge in {max_iter} iterations"
         raise RuntimeError(msg)
 
-    posterior_hessian = sequential_maxdiff_hessian(
+    posterior_hessian = _packed_hessian(
         scores=scores,
-        tasks=tasks,
+        packed=packed,
         prior_std_dev=prior_std_dev,
     )
     covariance = np.linalg.pinv(posterior_hessian)
@@ -211,7 +334,19 @@ def fit_sequential_maxdiff_map(
 
 
 class SequentialMaxDiffJudgments(Judgments):
-    def __init__(self, *, maxdiff_tasks: pd.DataFrame) -> None:
+    """Per-user MaxDiff tasks.
+
+    ``unchanged_user_ids`` lists users whose tasks are identical to the run that
+    produced their initialization model; the learner reuses those models as-is.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxdiff_tasks: pd.DataFrame,
+        unchanged_user_ids: frozenset[int] = frozenset(),
+    ) -> None:
+        self.unchanged_user_ids = unchanged_user_ids
         tasks_by_user: dict[int, list[dict[str, Any]]] = {}
         for record in maxdiff_tasks.to_dict("records"):
             user_id = int(record["user_id"])
@@ -227,6 +362,49 @@ class SequentialMaxDiffJudgments(Judgments):
         return {"maxdiff_tasks": user_tasks}
 
 
+def start_user_learning_pool(*, processes: int) -> None:
+    """Start the shared process pool used to fit MaxDiff users in parallel.
+
+    Every SequentialMaxDiffLearning run with enough users spreads its per-user
+    fits over this pool, so a single large conversation can use all cores.
+    """
+    global _user_learning_pool, _user_learning_processes
+    with _user_learning_pool_lock:
+        if _user_learning_pool is not None or processes <= 1:
+            return
+        _user_learning_pool = _new_user_learning_pool(processes=processes)
+        _user_learning_processes = processes
+    log.info("[Scoring] Started MaxDiff user-learning pool (%d processes)", processes)
+
+
+def _new_user_learning_pool(*, processes: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _replace_broken_user_learning_pool(broken_pool: ProcessPoolExecutor) -> None:
+    global _user_learning_pool
+    with _user_learning_pool_lock:
+        # Another run may already have replaced it, or the worker shut it down
+        if _user_learning_pool is not broken_pool:
+            return
+        _user_learning_pool = _new_user_learning_pool(processes=_user_learning_processes)
+    log.warning("[Scoring] Replaced broken MaxDiff user-learning pool")
+    broken_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_user_learning_pool() -> None:
+    global _user_learning_pool, _user_learning_processes
+    with _user_learning_pool_lock:
+        pool = _user_learning_pool
+        _user_learning_pool = None
+        _user_learning_processes = 1
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 class SequentialMaxDiffLearning(PreferenceLearning):
     def __init__(
         self,
@@ -235,11 +413,82 @@ class SequentialMaxDiffLearning(PreferenceLearning):
         convergence_error: float = 1e-5,
         high_likelihood_range_threshold: float = 1.0,
         max_iter: int = 100,
+        min_parallel_users: int = 64,
     ) -> None:
         self.prior_std_dev = prior_std_dev
         self.convergence_error = convergence_error
         self.high_likelihood_range_threshold = high_likelihood_range_threshold
         self.max_iter = max_iter
+        self.min_parallel_users = min_parallel_users
+
+    def __call__(
+        self,
+        judgments: SolidagoJudgments,
+        users: pd.DataFrame,
+        entities: pd.DataFrame,
+        initialization: dict[int, ScoringModel] | None = None,
+        new_judgments: SolidagoJudgments | None = None,
+    ) -> dict[int, ScoringModel]:
+        del entities, new_judgments
+
+        user_models: dict[int, ScoringModel] = {} if initialization is None else initialization
+        unchanged_user_ids = (
+            judgments.unchanged_user_ids
+            if isinstance(judgments, SequentialMaxDiffJudgments)
+            else frozenset[int]()
+        )
+        problems: list[_UserMaxDiffProblem] = []
+        for user in users.index:
+            if user in unchanged_user_ids and user in user_models:
+                continue
+            user_judgments = judgments[user]
+            if user_judgments is None:
+                continue
+            problems.append(
+                _user_problem(
+                    user_id=int(user),
+                    user_judgments=user_judgments,
+                    initialization=None if initialization is None else initialization.get(user),
+                )
+            )
+
+        fit_problems = partial(
+            _fit_user_problems,
+            prior_std_dev=self.prior_std_dev,
+            convergence_error=self.convergence_error,
+            high_likelihood_range_threshold=self.high_likelihood_range_threshold,
+            max_iter=self.max_iter,
+        )
+        pool = _user_learning_pool
+        if pool is None or len(problems) < self.min_parallel_users:
+            fitted_models = fit_problems(problems)
+        else:
+            chunk_count = min(
+                len(problems), _user_learning_processes * USER_LEARNING_CHUNKS_PER_PROCESS
+            )
+            log.debug(
+                "[Scoring] Fitting %d MaxDiff users in %d parallel chunk(s)",
+                len(problems),
+                chunk_count,
+            )
+            try:
+                fitted_models = [
+                    model
+                    for chunk_models in pool.map(
+                        fit_problems,
+                        [problems[index::chunk_count] for index in range(chunk_count)],
+                    )
+                    for model in chunk_models
+                ]
+            except BrokenProcessPool:
+                _replace_broken_user_learning_pool(pool)
+                log.warning("[Scoring] Fitting %d MaxDiff users inline", len(problems))
+                fitted_models = fit_problems(problems)
+
+        model_by_user_id = dict(fitted_models)
+        for problem in problems:
+            user_models[problem.user_id] = model_by_user_id[problem.user_id]
+        return user_models
 
     def user_learn(
         self,
@@ -250,62 +499,17 @@ class SequentialMaxDiffLearning(PreferenceLearning):
     ) -> ScoringModel:
         del entities, new_judgments
 
-        tasks_frame = user_judgments["maxdiff_tasks"]
-        task_records = tasks_frame.to_dict("records")
-        if not task_records:
-            return DirectScoringModel()
-
-        ordered_entity_ids: list[int] = []
-        seen_entity_ids: set[int] = set()
-        task_rows: list[tuple[int, int, tuple[int, ...]]] = []
-        for record in task_records:
-            best_entity = int(record["best_entity"])
-            worst_entity = int(record["worst_entity"])
-            candidate_set = tuple(int(entity_id) for entity_id in record["candidate_set"])
-            task_rows.append((best_entity, worst_entity, candidate_set))
-            for entity_id in candidate_set:
-                if entity_id in seen_entity_ids:
-                    continue
-                seen_entity_ids.add(entity_id)
-                ordered_entity_ids.append(entity_id)
-
-        entity_to_coordinate = {
-            entity_id: coordinate for coordinate, entity_id in enumerate(ordered_entity_ids)
-        }
-        tasks = [
-            SequentialMaxDiffTask(
-                best_entity=entity_to_coordinate[best_entity],
-                worst_entity=entity_to_coordinate[worst_entity],
-                candidate_set=tuple(entity_to_coordinate[entity_id] for entity_id in candidate_set),
-            )
-            for best_entity, worst_entity, candidate_set in task_rows
-        ]
-
-        init_scores: np.ndarray | None = None
-        if initialization is not None:
-            init_scores = np.zeros(len(ordered_entity_ids), dtype=np.float64)
-            for entity_id, (score, _left_unc, _right_unc) in initialization.iter_entities():
-                coordinate = entity_to_coordinate.get(entity_id)
-                if coordinate is not None:
-                    init_scores[coordinate] = score
-
-        fit = fit_sequential_maxdiff_map(
-            num_entities=len(ordered_entity_ids),
-            tasks=tasks,
-            initialization=init_scores,
+        ((_user_id, model),) = _fit_user_problems(
+            [
+                _user_problem(
+                    user_id=0, user_judgments=user_judgments, initialization=initialization
+                )
+            ],
             prior_std_dev=self.prior_std_dev,
             convergence_error=self.convergence_error,
             high_likelihood_range_threshold=self.high_likelihood_range_threshold,
             max_iter=self.max_iter,
         )
-
-        model = DirectScoringModel()
-        for coordinate, entity_id in enumerate(ordered_entity_ids):
-            model[entity_id] = (
-                float(fit.scores[coordinate]),
-                float(fit.uncertainty_left[coordinate]),
-                float(fit.uncertainty_right[coordinate]),
-            )
         return model
 
     def to_json(self) -> tuple[str, dict[str, float | int]]:
@@ -329,16 +533,80 @@ class SequentialMaxDiffLearning(PreferenceLearning):
         )
 
 
-def _logsumexp(values: np.ndarray) -> float:
-    max_value = float(np.max(values))
-    return max_value + float(np.log(np.exp(values - max_value).sum()))
-
-
-def _softmax(values: np.ndarray) -> np.ndarray:
-    max_value = np.max(values)
-    exp_values = np.exp(values - max_value)
-    return exp_values / exp_values.sum()
+def _user_problem(
+    *,
+    user_id: int,
+    user_judgments: dict[str, pd.DataFrame],
+    initialization: ScoringModel | None,
+) -> _UserMaxDiffProblem:
+    ordered_entity_ids: list[int] = []
+    seen_entity_ids: set[int] = set()
+    task_rows: list[tuple[int, int, tuple[int, ...]]] = []
+    for record in user_judgments["maxdiff_tasks"].to_dict("records"):
+        best_entity = int(record["best_entity"])
+        worst_entity = int(record["worst_entity"])
+        candidate_set = tuple(int(entity_id) for entity_id in record["candidate_set"])
+        task_rows.append((best_entity, worst_entity, candidate_set))
+        for entity_id in candidate_set:
+            if entity_id in seen_entity_ids:
+                continue
+            seen_entity_ids.add(entity_id)
+            ordered_entity_ids.append(entity_id)
+
+    entity_to_coordinate = {
+        entity_id: coordinate for coordinate, entity_id in enumerate(ordered_entity_ids)
+    }
+    tasks = [
+        SequentialMaxDiffTask(
+            best_entity=entity_to_coordinate[best_entity],
+            worst_entity=entity_to_coordinate[worst_entity],
+            candidate_set=tuple(entity_to_coordinate[entity_id] for entity_id in candidate_set),
+        )
+        for best_entity, worst_entity, candidate_set in task_rows
+    ]
+
+    init_scores: np.ndarray | None = None
+    if initialization is not None and tasks:
+        init_scores = np.zeros(len(ordered_entity_ids), dtype=np.float64)
+        for entity_id, (score, _left_unc, _right_unc) in initialization.iter_entities():
+            coordinate = entity_to_coordinate.get(entity_id)
+            if coordinate is not None:
+                init_scores[coordinate] = score
+
+    return _UserMaxDiffProblem(
+        user_id=user_id,
+        entity_ids=ordered_entity_ids,
+        tasks=tasks,
+        initialization=init_scores,
+    )
 
 
-def _softmax_covariance(probabilities: np.ndarray) -> np.ndarray:
-    return np.diag(probabilities) - np.outer(probabilities, probabilities)
+def _fit_user_problems(
+    problems: list[_UserMaxDiffProblem],
+    *,
+    prior_std_dev: float,
+    convergence_error: float,
+    high_likelihood_range_threshold: float,
+    max_iter: int,
+) -> list[tuple[int, ScoringModel]]:
+    fitted_models: list[tuple[int, ScoringModel]] = []
+    for problem in problems:
+        model = DirectScoringModel()
+        if problem.tasks:
+            fit = fit_sequential_maxdiff_map(
+                num_entities=len(problem.entity_ids),
+                tasks=problem.tasks,
+                initialization=problem.initialization,
+                prior_std_dev=prior_std_dev,
+                convergence_error=convergence_error,
+                high_likelihood_range_threshold=high_likelihood_range_threshold,
+                max_iter=max_iter,
+            )
+            for coordinate, entity_id in enumerate(problem.entity_ids):
+                model[entity_id] = (
+                    float(fit.scores[coordinate]),
+                    float(fit.uncertainty_left[coordinate]),
+                    float(fit.uncertainty_right[coordinate]),
+                )
+        fitted_models.append((problem.user_id, model))
+    return fitted_models
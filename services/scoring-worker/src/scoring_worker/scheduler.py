@@ -0,0 +1,185 @@
+"""Size-based scheduling lanes for the scoring worker.
+
+The dirty-set weight (comparison count) splits conversations into two lanes:
+
+- Fast lane: weight below the heavy threshold. Popped lightest-first in
+  batches and scored inline, so small conversations are never queued behind
+  a slow Solidago run.
+- Heavy lane: weight at or above the threshold. Scored in the background by
+  a bounded pool, so heavy conversations always make progress however busy
+  the fast lane is. Within the lane, waiting conversations age: every
+  `aging_seconds` of waiting halves their effective weight, so the heaviest
+  conversation is eventually picked first.
+
+A conversation is never scored twice at once: while a heavy run is in
+flight, new comparisons re-dirty it, and that entry waits until the run
+has finished instead of starting a second, concurrent run.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
+
+    from scoring_worker.valkey_client import DirtyConversation
+
+LANE_METRICS_MAX_SAMPLES = 10_000
+
+
+class HeavyLaneSelector:
+    """Picks which waiting heavy conversations to claim next, with aging.
+
+    Wait time is measured from the first time this worker saw the member in
+    the heavy lane; members that leave the lane are forgotten, so `select`
+    must be given every waiting heavy member, not a window of them.
+    """
+
+    def __init__(self, *, aging_seconds: float) -> None:
+        self.aging_seconds = aging_seconds
+        self._first_seen: dict[str, float] = {}
+
+    def select(
+        self,
+        candidates: list[DirtyConversation],
+        *,
+        now: float,
+        limit: int,
+    ) -> list[DirtyConversation]:
+        present = {candidate.member for candidate in candidates}
+        for member in list(self._first_seen):
+            if member not in present:
+                del self._first_seen[member]
+        for candidate in candidates:
+            self._first_seen.setdefault(candidate.member, now)
+
+        if limit <= 0:
+            return []
+        ranked = sorted(
+            candidates,
+            key=lambda candidate: (
+                self._aged_weight(candidate, now=now),
+                candidate.conversation_id,
+            ),
+        )
+        return ranked[:limit]
+
+    def waited_seconds(self, member: str, *, now: float) -> float:
+        first_seen = self._first_seen.get(member)
+        return 0.0 if first_seen is None else now - first_seen
+
+    def forget(self, member: str) -> None:
+        self._first_seen.pop(member, None)
+
+    def _aged_weight(self, candidate: DirtyConversation, *, now: float) -> float:
+        waited = self.waited_seconds(candidate.member, now=now)
+        return candidate.weight * 0.5 ** (waited / self.aging_seconds)
+
+
+def _is_waiting(
+    item: DirtyConversation,
+    *,
+    now: float,
+    busy_conversation_ids: Collection[int],
+    backoff_until: Mapping[int, float],
+) -> bool:
+    if item.conversation_id in busy_conversation_ids:
+        return True
+    retry_after = backoff_until.get(item.conversation_id)
+    return retry_after is not None and now < retry_after
+
+
+def claimable_heavy_lane(
+    candidates: list[DirtyConversation],
+    *,
+    selector: HeavyLaneSelector,
+    now: float,
+    busy_conversation_ids: Collection[int],
+    backoff_until: Mapping[int, float],
+) -> list[DirtyConversation]:
+    """Heavy conversations in claim order, without those still scoring or in backoff.
+
+    The skipped ones stay in the dirty set and keep aging.
+    """
+    return [
+        item
+        for item in selector.select(candidates, now=now, limit=len(candidates))
+        if not _is_waiting(
+            item,
+            now=now,
+            busy_conversation_ids=busy_conversation_ids,
+            backoff_until=backoff_until,
+        )
+    ]
+
+
+def split_fast_lane_batch(
+    batch: list[DirtyConversation],
+    *,
+    now: float,
+    busy_conversation_ids: Collection[int],
+    backoff_until: Mapping[int, float],
+) -> tuple[list[DirtyConversation], list[DirtyConversation]]:
+    """Split a popped fast-lane batch into (to_process, to_requeue).
+
+    Conversations still scoring in the heavy lane or in backoff are requeued.
+    """
+    to_process: list[DirtyConversation] = []
+    to_requeue: list[DirtyConversation] = []
+    for item in batch:
+        if _is_waiting(
+            item,
+            now=now,
+            busy_conversation_ids=busy_conversation_ids,
+            backoff_until=backoff_until,
+        ):
+            to_requeue.append(item)
+        else:
+            to_process.append(item)
+    return to_process, to_requeue
+
+
+@dataclass(frozen=True)
+class LaneLatencySnapshot:
+    lane: str
+    count: int
+    p50_seconds: float
+    p95_seconds: float
+    max_seconds: float
+
+
+class LaneMetrics:
+    """Per-lane latency samples (seconds from claim to written), reset on snapshot."""
+
+    def __init__(self, lanes: tuple[str, ...]) -> None:
+        self._samples: dict[str, deque[float]] = {
+            lane: deque(maxlen=LANE_METRICS_MAX_SAMPLES) for lane in lanes
+        }
+
+    def record(self, lane: str, seconds: float) -> None:
+        self._samples[lane].append(seconds)
+
+    def snapshot(self) -> list[LaneLatencySnapshot]:
+        snapshots: list[LaneLatencySnapshot] = []
+        for lane, samples in self._samples.items():
+            ordered = sorted(samples)
+            samples.clear()
+            snapshots.append(
+                LaneLatencySnapshot(
+                    lane=lane,
+                    count=len(ordered),
+                    p50_seconds=_percentile(ordered, 0.5),
+                    p95_seconds=_percentile(ordered, 0.95),
+                    max_seconds=ordered[-1] if ordered else 0.0,
+                )
+            )
+        return snapshots
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
@@ -8,8 +8,9 @@ voting-rights, and aggregation stages aligned with Solidago.
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
 import pandas as pd
 from solidago.aggregation import EntitywiseQrQuantile
@@ -18,11 +19,12 @@ from solidago.pipeline import Pipeline
 from solidago.post_process import NoPostProcess
 from solidago.privacy_settings import PrivacySettings
 from solidago.scaling import NoScaling
+from solidago.scoring_model import DirectScoringModel
 from solidago.trust_propagation import TrustPropagation
 from solidago.voting_rights import AffineOvertrust
 from solidago.voting_rights.base import VotingRights, VotingRightsAssignment
 
-from scoring_worker.cocm_voting import COCMVotingRights, GroupSource
+from scoring_worker.cocm_voting import COCMVotingRights, GroupSource, build_friend_graph
 from scoring_worker.entity_mapping import (
     EntityIdMapper,
     SolidagoEntityScore,
@@ -44,10 +46,12 @@ from scoring_worker.pipeline_config import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from solidago.preference_learning import PreferenceLearning
     from solidago.scoring_model import ScoringModel
 
-    from scoring_worker.db import ComparisonRow
+    from scoring_worker.db import ComparisonRow, PreviousUserScores
 
 log = logging.getLogger(__name__)
 
@@ -65,6 +69,7 @@ class _COCMVotingRightsAssignment(VotingRightsAssignment):
     """Solidago VotingRightsAssignment backed by COCM."""
 
     def __init__(self, *, group_sources: list[GroupSource]) -> None:
+        self._group_sources = group_sources
         self._cocm = COCMVotingRights(group_sources=group_sources)
 
     def __call__(
@@ -93,14 +98,19 @@ class _COCMVotingRightsAssignment(VotingRightsAssignment):
         all_user_ids = [int(user_id) for user_id in users.index]
         trust_dict = {int(uid): float(trust_scores_series[uid]) for uid in all_user_ids}
 
-        for entity_id, user_ids in entity_to_users.items():
-            if not user_ids:
-                continue
-            rights = self._cocm.compute_entity_voting_rights(
-                scorers=list(user_ids),
-                trust_scores=trust_dict,
+        rights_by_entity = self._cocm.compute_voting_rights(
+            scorers_by_entity={
+                entity_id: list(user_ids)
+                for entity_id, user_ids in entity_to_users.items()
+                if user_ids
+            },
+            trust_scores=trust_dict,
+            friend_graph=build_friend_graph(
+                group_sources=self._group_sources,
                 user_ids=all_user_ids,
-            )
+            ),
+        )
+        for entity_id, rights in rights_by_entity.items():
             for user_id, right in rights.items():
                 voting_rights[user_id, entity_id] = right
 
@@ -155,6 +165,67 @@ class ScoringResult:
 class ConversationScoringOutput:
     global_scores: list[ScoringResult]
     user_scores: dict[int, list[ScoringResult]]  # user_idx → per-entity scores
+    reused_user_ids: frozenset[int] = frozenset()  # user_idx whose cached model was kept
+
+
+@dataclass
+class ScoringStageTimings:
+    """Seconds spent per scoring stage, accumulated across calls.
+
+    `pipeline_seconds` covers the whole Solidago run, including the
+    preference learning, voting rights and aggregation stages.
+    """
+
+    input_prep_seconds: float = 0.0
+    preference_learning_seconds: float = 0.0
+    voting_rights_seconds: float = 0.0
+    aggregation_seconds: float = 0.0
+    pipeline_seconds: float = 0.0
+
+
+class _TimedStage:
+    """Wraps one Solidago pipeline stage and adds its run time to `timings`."""
+
+    def __init__(self, stage: Any, *, name: str, timings: ScoringStageTimings) -> None:
+        self._stage = stage
+        self._attribute = f"{name}_seconds"
+        self._timings = timings
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return self._stage(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            setattr(
+                self._timings,
+                self._attribute,
+                getattr(self._timings, self._attribute) + elapsed,
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stage, name)
+
+    def __str__(self) -> str:
+        return str(self._stage)
+
+
+def _timed_pipeline(pipeline: Pipeline, *, timings: ScoringStageTimings) -> Pipeline:
+    return Pipeline(
+        trust_propagation=pipeline.trust_propagation,
+        preference_learning=_TimedStage(
+            pipeline.preference_learning,
+            name="preference_learning",
+            timings=timings,
+        ),
+        voting_rights=cast(
+            "VotingRightsAssignment",
+            _TimedStage(pipeline.voting_rights, name="voting_rights", timings=timings),
+        ),
+        scaling=pipeline.scaling,
+        aggregation=_TimedStage(pipeline.aggregation, name="aggregation", timings=timings),
+        post_process=pipeline.post_process,
+    )
 
 
 def warmup() -> None:
@@ -219,10 +290,16 @@ def score_pairwise_observations(
     observations: list[PairwiseObservation],
     trust_scores: dict[int, float] | None = None,
     group_sources: list[GroupSource] | None = None,
+    timings: ScoringStageTimings | None = None,
 ) -> ConversationScoringOutput | None:
+    """Score pairwise observations with Solidago.
+
+    When `timings` is given, the time spent in each stage is added to it.
+    """
     if len(entity_ids) < 2 or not observations:
         return None
 
+    started_at = time.perf_counter()
     mapper = EntityIdMapper(entity_ids=entity_ids)
     rows = pairwise_observations_to_solidago_rows(observations=observations, mapper=mapper)
     if not rows:
@@ -230,6 +307,8 @@ def score_pairwise_observations(
 
     comparisons_df = pd.DataFrame(rows)
     pipeline = _get_pairwise_pipeline(group_sources=group_sources)
+    if timings is not None:
+        timings.input_prep_seconds += time.perf_counter() - started_at
     return _run_pipeline(
         mapper=mapper,
         user_ids=sorted(int(user_id) for user_id in comparisons_df["user_id"].unique()),
@@ -237,6 +316,7 @@ def score_pairwise_observations(
         pipeline=pipeline,
         preference_learning_name=PAIRWISE_PREFERENCE_LEARNING_NAME,
         trust_scores=trust_scores,
+        timings=timings,
     )
 
 
@@ -246,23 +326,54 @@ def score_maxdiff_observations(
     observations: list[MaxDiffObservation],
     trust_scores: dict[int, float] | None = None,
     group_sources: list[GroupSource] | None = None,
+    previous_user_scores: Mapping[int, PreviousUserScores] | None = None,
+    timings: ScoringStageTimings | None = None,
 ) -> ConversationScoringOutput | None:
+    """Score MaxDiff observations, warm-starting from last run's per-user scores.
+
+    `previous_user_scores` is keyed by observation user_id. Users marked
+    unchanged whose scored entities still match their observations keep
+    their previous model without refitting; every other user with previous
+    scores starts its fit from them. When `timings` is given, the time spent
+    in each stage is added to it.
+    """
     if len(entity_ids) < 2 or not observations:
         return None
 
+    started_at = time.perf_counter()
     mapper = EntityIdMapper(entity_ids=entity_ids)
     tasks_df = maxdiff_observations_to_tasks_frame(observations=observations, mapper=mapper)
     if tasks_df.empty:
         return None
 
+    init_user_models, unchanged_user_ids = _previous_user_models(
+        observations=observations,
+        mapper=mapper,
+        previous_user_scores=previous_user_scores or {},
+    )
+    if init_user_models:
+        log.info(
+            "[Scoring] Warm start: %d users initialized, %d unchanged",
+            len(init_user_models),
+            len(unchanged_user_ids),
+        )
+
     pipeline = _get_maxdiff_pipeline(group_sources=group_sources)
+    if timings is not None:
+        timings.input_prep_seconds += time.perf_counter() - started_at
     return _run_pipeline(
         mapper=mapper,
         user_ids=sorted(int(user_id) for user_id in tasks_df["user_id"].unique()),
-        judgments=SequentialMaxDiffJudgments(maxdiff_tasks=tasks_df),
+        judgments=SequentialMaxDiffJudgments(
+            maxdiff_tasks=tasks_df,
+            unchanged_user_ids=unchanged_user_ids,
+        ),
         pipeline=pipeline,
         preference_learning_name=MAXDIFF_PREFERENCE_LEARNING_NAME,
         trust_scores=trust_scores,
+        init_user_models=init_user_models,
+        reused_user_ids=unchanged_user_ids,
+        timings=timings,
     )
 
 
@@ -272,6 +383,7 @@ def score_comparisons(
     comparisons: list[ComparisonRow],
     trust_scores: dict[int, float] | None = None,
     group_sources: list[GroupSource] | None = None,
+    previous_user_scores: Mapping[int, PreviousUserScores] | None = None,
 ) -> ConversationScoringOutput | None:
     """Compatibility wrapper for the current MaxDiff-only worker path."""
 
@@ -284,9 +396,50 @@ def score_comparisons(
         observations=observations,
         trust_scores=trust_scores,
         group_sources=group_sources,
+        previous_user_scores=previous_user_scores,
     )
 
 
+def _previous_user_models(
+    *,
+    observations: list[MaxDiffObservation],
+    mapper: EntityIdMapper,
+    previous_user_scores: Mapping[int, PreviousUserScores],
+) -> tuple[dict[int, ScoringModel], frozenset[int]]:
+    """Build initialization models and the set of users safe to skip.
+
+    A user is only skipped when their result is unchanged and last run scored
+    exactly the entities they observe now; otherwise an item (de)activation
+    changed their filtered tasks and they are refit from the warm start.
+    """
+    if not previous_user_scores:
+        return {}, frozenset()
+
+    observed_entity_ids_by_user: dict[int, set[str]] = {}
+    for observation in observations:
+        observed_entity_ids_by_user.setdefault(observation.user_id, set()).update(
+            observation.candidate_set
+        )
+
+    init_user_models: dict[int, ScoringModel] = {}
+    unchanged_user_ids: set[int] = set()
+    for user_id, observed_entity_ids in observed_entity_ids_by_user.items():
+        previous = previous_user_scores.get(user_id)
+        if previous is None:
+            continue
+        model = DirectScoringModel()
+        for entity_id, (score, uncertainty_left, uncertainty_right) in previous.scores.items():
+            if entity_id in observed_entity_ids:
+                model[mapper.to_int(entity_id)] = (score, uncertainty_left, uncertainty_right)
+        if not model.scored_entities():
+            continue
+        init_user_models[user_id] = model
+        if previous.is_unchanged and previous.scores.keys() == observed_entity_ids:
+            unchanged_user_ids.add(user_id)
+
+    return init_user_models, frozenset(unchanged_user_ids)
+
+
 def _get_pairwise_pipeline(*, group_sources: list[GroupSource] | None) -> Pipeline:
     if group_sources is not None and len(group_sources) > 0:
         log.info("[Scoring] Using COCM voting rights (%d group sources)", len(group_sources))
@@ -315,6 +468,39 @@ def _run_pipeline(
     pipeline: Pipeline,
     preference_learning_name: str,
     trust_scores: dict[int, float] | None = None,
+    init_user_models: dict[int, ScoringModel] | None = None,
+    reused_user_ids: frozenset[int] = frozenset(),
+    timings: ScoringStageTimings | None = None,
+) -> ConversationScoringOutput | None:
+    if timings is not None:
+        pipeline = _timed_pipeline(pipeline, timings=timings)
+    started_at = time.perf_counter()
+    try:
+        return _score_with_pipeline(
+            mapper=mapper,
+            user_ids=user_ids,
+            judgments=judgments,
+            pipeline=pipeline,
+            preference_learning_name=preference_learning_name,
+            trust_scores=trust_scores,
+            init_user_models=init_user_models,
+            reused_user_ids=reused_user_ids,
+        )
+    finally:
+        if timings is not None:
+            timings.pipeline_seconds += time.perf_counter() - started_at
+
+
+def _score_with_pipeline(
+    *,
+    mapper: EntityIdMapper,
+    user_ids: list[int],
+    judgments: DataFrameJudgments | SequentialMaxDiffJudgments,
+    pipeline: Pipeline,
+    preference_learning_name: str,
+    trust_scores: dict[int, float] | None,
+    init_user_models: dict[int, ScoringModel] | None,
+    reused_user_ids: frozenset[int],
 ) -> ConversationScoringOutput | None:
     users_df = _build_users_dataframe(user_ids=user_ids, trust_scores=trust_scores)
     entities_df = pd.DataFrame(index=pd.Index(mapper.all_int_ids(), name="entity_id"))
@@ -334,6 +520,7 @@ def _run_pipeline(
         entities=entities_df,
         privacy=privacy,
         judgments=judgments,
+        init_user_models=init_user_models,
     )
 
     global_scores = map_scores_from_solidago(
@@ -355,6 +542,7 @@ def _run_pipeline(
     return ConversationScoringOutput(
         global_scores=to_scoring_results(global_scores),
         user_scores=user_scores,
+        reused_user_ids=reused_user_ids,
     )
 
 
@@ -0,0 +1,520 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from importlib import metadata
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from scoring_worker.cocm_voting import GroupSource, UserGroupEntry
+from scoring_worker.db import (
+    ScoredEntity,
+    UserScoreEntry,
+    fetch_comparisons_batch,
+    fetch_previous_user_scores_batch,
+    write_scores_batch,
+)
+from scoring_worker.generated_models import (
+    Conversation,
+    MaxdiffComparison,
+    MaxdiffResult,
+    RankingConversationConfig,
+    User,
+)
+from scoring_worker.observations import MaxDiffObservation, PairwiseObservation
+from scoring_worker.pipeline_config import (
+    MAXDIFF_PREFERENCE_LEARNING_NAME,
+    PAIRWISE_PREFERENCE_LEARNING_NAME,
+)
+from scoring_worker.scoring import (
+    ScoringStageTimings,
+    score_maxdiff_observations,
+    score_pairwise_observations,
+    warmup,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Engine
+
+    from scoring_worker.scoring import ConversationScoringOutput
+
+BENCHMARK_SCHEMA_VERSION = 1
+BENCHMARK_CONVERSATION_ID = 1
+SYNTHETIC_CANDIDATE_SET_SIZE = 4
+SYNTHETIC_GROUP_SOURCE_COUNT = 2
+SYNTHETIC_USERS_PER_GROUP = 25
+OBSERVATION_KINDS = ("maxdiff", "pairwise")
+VOTING_RIGHTS_MODES = ("affine", "cocm")
+# Read-only inputs: copied without constraints so only the columns the
+# scoring queries touch need values.
+_SHADOWED_INPUT_TABLES = (
+    "user",
+    "conversation",
+    "ranking_conversation_config",
+    "survey_config",
+    "maxdiff_result",
+    "maxdiff_comparison",
+)
+# Written by write_scores_batch: keep ids, defaults and the unique index the
+# per-user upsert conflicts on.
+_SHADOWED_OUTPUT_TABLES = (
+    "ranking_score",
+    "ranking_score_entity",
+    "maxdiff_user_entity_score",
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    user_count: int
+    item_count: int
+    comparisons_per_user: int
+
+
+BENCHMARK_CASES = (
+    BenchmarkCase(name="small", user_count=50, item_count=20, comparisons_per_user=10),
+    BenchmarkCase(name="medium", user_count=500, item_count=60, comparisons_per_user=15),
+    BenchmarkCase(name="large", user_count=3_000, item_count=150, comparisons_per_user=20),
+)
+
+
+@dataclass(frozen=True)
+class SyntheticWorkload:
+    entity_ids: list[str]
+    maxdiff_observations: list[MaxDiffObservation]
+    pairwise_observations: list[PairwiseObservation]
+    group_sources: list[GroupSource]
+
+
+@dataclass(frozen=True)
+class _StageTimings:
+    input_prep_ms: float
+    preference_learning_ms: float
+    voting_rights_ms: float
+    aggregation_ms: float
+    pipeline_other_ms: float
+    read_comparisons_ms: float | None
+    write_scores_ms: float | None
+    read_previous_scores_ms: float | None
+
+
+def synthetic_workload(*, case: BenchmarkCase, seed: int) -> SyntheticWorkload:
+    """Users rank items by shared latent quality plus Gumbel noise.
+
+    The same seed always produces the same MaxDiff tasks, pairwise
+    comparisons and COCM group memberships.
+    """
+    rng = np.random.default_rng(seed)
+    entity_ids = [f"it{index:05d}" for index in range(case.item_count)]
+    quality = rng.normal(size=case.item_count)
+
+    maxdiff_observations: list[MaxDiffObservation] = []
+    pairwise_observations: list[PairwiseObservation] = []
+    set_size = min(SYNTHETIC_CANDIDATE_SET_SIZE, case.item_count)
+    for user_id in range(case.user_count):
+        for _ in range(case.comparisons_per_user):
+            candidates = rng.choice(case.item_count, size=set_size, replace=False)
+            utilities = quality[candidates] + rng.gumbel(size=set_size)
+            maxdiff_observations.append(
+                MaxDiffObservation(
+                    user_id=user_id,
+                    best_slug_id=entity_ids[int(candidates[np.argmax(utilities)])],
+                    worst_slug_id=entity_ids[int(candidates[np.argmin(utilities)])],
+                    candidate_set=tuple(entity_ids[int(index)] for index in candidates),
+                )
+            )
+            option_a, option_b = (int(index) for index in candidates[:2])
+            pairwise_observations.append(
+                PairwiseObservation(
+                    user_id=user_id,
+                    option_a_slug_id=entity_ids[option_a],
+                    option_b_slug_id=entity_ids[option_b],
+                    comparison=-1.0 if utilities[0] > utilities[1] else 1.0,
+                    comparison_max=1.0,
+                )
+            )
+
+    group_count = max(2, case.user_count // SYNTHETIC_USERS_PER_GROUP)
+    group_sources = [
+        GroupSource(
+            source_id=f"source-{source_index}",
+            memberships=[
+                UserGroupEntry(user_id=user_id, group_id=int(group_id))
+                for user_id, group_id in enumerate(rng.integers(group_count, size=case.user_count))
+            ],
+        )
+        for source_index in range(SYNTHETIC_GROUP_SOURCE_COUNT)
+    ]
+    return SyntheticWorkload(
+        entity_ids=entity_ids,
+        maxdiff_observations=maxdiff_observations,
+        pairwise_observations=pairwise_observations,
+        group_sources=group_sources,
+    )
+
+
+def run_benchmark_case(
+    *,
+    case: BenchmarkCase,
+    kind: str,
+    voting_rights: str,
+    seed: int,
+    repeat: int,
+    engine: Engine | None = None,
+) -> dict[str, Any]:
+    workload = synthetic_workload(case=case, seed=seed)
+    group_sources = workload.group_sources if voting_rights == "cocm" else None
+    observation_count = (
+        len(workload.maxdiff_observations)
+        if kind == "maxdiff"
+        else len(workload.pairwise_observations)
+    )
+    with_database = engine is not None and kind == "maxdiff"
+    if engine is not None and with_database:
+        _create_shadow_tables(engine)
+        _seed_comparisons(engine, workload=workload)
+
+    timings: list[_StageTimings] = []
+    output: ConversationScoringOutput | None = None
+    try:
+        for _ in range(repeat):
+            read_comparisons_seconds: float | None = None
+            if engine is not None and with_database:
+                started_at = time.perf_counter()
+                fetch_comparisons_batch(
+                    engine,
+                    conversation_ids=[BENCHMARK_CONVERSATION_ID],
+                    active_items_by_conv={BENCHMARK_CONVERSATION_ID: workload.entity_ids},
+                )
+                read_comparisons_seconds = time.perf_counter() - started_at
+
+            output, scoring_timings = _time_scoring(
+                workload=workload,
+                kind=kind,
+                group_sources=group_sources,
+            )
+
+            write_scores_seconds: float | None = None
+            read_previous_scores_seconds: float | None = None
+            if engine is not None and with_database:
+                write_scores_seconds = _time_write(engine, output=output)
+                started_at = time.perf_counter()
+                fetch_previous_user_scores_batch(
+                    engine,
+                    conversation_ids=[BENCHMARK_CONVERSATION_ID],
+                )
+                read_previous_scores_seconds = time.perf_counter() - started_at
+
+            timings.append(
+                _StageTimings(
+                    input_prep_ms=scoring_timings.input_prep_seconds * 1000,
+                    preference_learning_ms=scoring_timings.preference_learning_seconds * 1000,
+                    voting_rights_ms=scoring_timings.voting_rights_seconds * 1000,
+                    aggregation_ms=scoring_timings.aggregation_seconds * 1000,
+                    pipeline_other_ms=_pipeline_other_seconds(scoring_timings) * 1000,
+                    read_comparisons_ms=_to_ms(read_comparisons_seconds),
+                    write_scores_ms=_to_ms(write_scores_seconds),
+                    read_previous_scores_ms=_to_ms(read_previous_scores_seconds),
+                )
+            )
+    finally:
+        if engine is not None and with_database:
+            _drop_shadow_tables(engine)
+
+    return {
+        "name": case.name,
+        "kind": kind,
+        "voting_rights": voting_rights,
+        "users": case.user_count,
+        "items": case.item_count,
+        "comparisons_per_user": case.comparisons_per_user,
+        "observations": observation_count,
+        "scored_entities": 0 if output is None else len(output.global_scores),
+        "timings_ms": {
+            stage: _summarize([getattr(timing, stage) for timing in timings])
+            for stage in _StageTimings.__dataclass_fields__
+        },
+    }
+
+
+def _time_scoring(
+    *,
+    workload: SyntheticWorkload,
+    kind: str,
+    group_sources: list[GroupSource] | None,
+) -> tuple[ConversationScoringOutput | None, ScoringStageTimings]:
+    timings = ScoringStageTimings()
+    if kind == "maxdiff":
+        output = score_maxdiff_observations(
+            entity_ids=workload.entity_ids,
+            observations=workload.maxdiff_observations,
+            group_sources=group_sources,
+            timings=timings,
+        )
+    else:
+        output = score_pairwise_observations(
+            entity_ids=workload.entity_ids,
+            observations=workload.pairwise_observations,
+            group_sources=group_sources,
+            timings=timings,
+        )
+    return output, timings
+
+
+def _pipeline_other_seconds(timings: ScoringStageTimings) -> float:
+    staged = (
+        timings.preference_learning_seconds
+        + timings.voting_rights_seconds
+        + timings.aggregation_seconds
+    )
+    return max(timings.pipeline_seconds - staged, 0.0)
+
+
+def _time_write(engine: Engine, *, output: ConversationScoringOutput | None) -> float | None:
+    if output is None:
+        return None
+    participant_counts: dict[str, int] = {}
+    for user_results in output.user_scores.values():
+        for result in user_results:
+            participant_counts[result.entity_id] = participant_counts.get(result.entity_id, 0) + 1
+    entities = [
+        ScoredEntity(
+            entity_slug_id=result.entity_id,
+            score=result.score,
+            uncertainty_left=result.uncertainty_left,
+            uncertainty_right=result.uncertainty_right,
+            participant_count=participant_counts.get(result.entity_id, 0),
+        )
+        for result in output.global_scores
+    ]
+    user_scores = [
+        UserScoreEntry(
+            maxdiff_result_id=_result_id(user_idx),
+            entity_slug_id=result.entity_id,
+            score=result.score,
+            uncertainty_left=result.uncertainty_left,
+            uncertainty_right=result.uncertainty_right,
+        )
+        for user_idx, user_results in output.user_scores.items()
+        for result in user_results
+    ]
+    started_at = time.perf_counter()
+    write_scores_batch(
+        engine,
+        results={BENCHMARK_CONVERSATION_ID: (entities, participant_counts)},
+        user_scores=user_scores,
+        computed_at=datetime.now(tz=UTC).replace(microsecond=0),
+    )
+    return time.perf_counter() - started_at
+
+
+def _result_id(user_idx: int) -> int:
+    return user_idx + 1
+
+
+def _create_shadow_tables(engine: Engine) -> None:
+    # Unqualified names resolve to these temporary copies first, so the
+    # benchmark never touches real rows. The engine must hold a single
+    # connection (StaticPool) for every helper session to see them.
+    with Session(engine) as session:
+        for table_name in _SHADOWED_INPUT_TABLES:
+            session.execute(
+                text(
+                    f'CREATE TEMPORARY TABLE "{table_name}" AS '
+                    f'SELECT * FROM "public"."{table_name}" WITH NO DATA'
+                )
+            )
+        for table_name in _SHADOWED_OUTPUT_TABLES:
+            session.execute(
+                text(
+                    f'CREATE TEMPORARY TABLE "{table_name}" '
+                    f'(LIKE "public"."{table_name}" '
+                    "INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING INDEXES)"
+                )
+            )
+        session.commit()
+
+
+def _drop_shadow_tables(engine: Engine) -> None:
+    with Session(engine) as session:
+        for table_name in (*_SHADOWED_INPUT_TABLES, *_SHADOWED_OUTPUT_TABLES):
+            session.execute(text(f'DROP TABLE IF EXISTS pg_temp."{table_name}"'))
+        session.commit()
+
+
+def _seed_comparisons(engine: Engine, *, workload: SyntheticWorkload) -> None:
+    seeded_at = datetime.now(tz=UTC).replace(microsecond=0)
+    user_count = len({observation.user_id for observation in workload.maxdiff_observations})
+    positions: dict[int, int] = {}
+    comparison_values: list[dict[str, object]] = []
+    for observation in workload.maxdiff_observations:
+        position = positions.get(observation.user_id, 0)
+        positions[observation.user_id] = position + 1
+        comparison_values.append(
+            {
+                "maxdiff_result_id": _result_id(observation.user_id),
+                "position": position,
+                "best_slug_id": observation.best_slug_id,
+                "worst_slug_id": observation.worst_slug_id,
+                "candidate_set": list(observation.candidate_set),
+                "deleted_at": None,
+            }
+        )
+
+    with Session(engine) as session:
+        session.execute(insert(RankingConversationConfig), [{"id": BENCHMARK_CONVERSATION_ID}])
+        session.execute(
+            insert(Conversation),
+            [{"id": BENCHMARK_CONVERSATION_ID, "ranking_config_id": BENCHMARK_CONVERSATION_ID}],
+        )
+        session.execute(
+            insert(User),
+            [{"id": UUID(int=user_idx + 1), "is_deleted": False} for user_idx in range(user_count)],
+        )
+        session.execute(
+            insert(MaxdiffResult),
+            [
+                {
+                    "id": _result_id(user_idx),
+                    "participant_id": UUID(int=user_idx + 1),
+                    "conversation_id": BENCHMARK_CONVERSATION_ID,
+                    "created_at": seeded_at,
+                    "updated_at": seeded_at,
+                }
+                for user_idx in range(user_count)
+            ],
+        )
+        session.execute(insert(MaxdiffComparison), comparison_values)
+        session.commit()
+
+
+def _to_ms(seconds: float | None) -> float | None:
+    return None if seconds is None else seconds * 1000
+
+
+def _summarize(values: list[float | None]) -> dict[str, float] | None:
+    measured = [value for value in values if value is not None]
+    if not measured:
+        return None
+    return {
+        "min": round(min(measured), 3),
+        "median": round(statistics.median(measured), 3),
+        "max": round(max(measured), 3),
+    }
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    case_names = [case.name for case in BENCHMARK_CASES]
+    parser = argparse.ArgumentParser(
+        prog="python -m scoring_worker.scoring_benchmark",
+        description="Time the Solidago scoring pipeline on synthetic comparison workloads.",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=case_names,
+        dest="cases",
+        help="benchmark case to run; repeat for several (default: small and medium)",
+    )
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=OBSERVATION_KINDS,
+        dest="kinds",
+        help="observation kind to score; repeat for several (default: all)",
+    )
+    parser.add_argument(
+        "--voting-rights",
+        action="append",
+        choices=VOTING_RIGHTS_MODES,
+        dest="voting_rights",
+        help="voting-rights stage; cocm adds synthetic group sources (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--database-url",
+        help=(
+            "local Postgres URL; enables the MaxDiff DB read/write stages, "
+            "which use temporary tables"
+        ),
+    )
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = _parse_args(argv)
+    # Same as worker startup: keep numba compilation out of the first timing
+    warmup()
+    case_by_name = {case.name: case for case in BENCHMARK_CASES}
+    engine = (
+        None
+        if args.database_url is None
+        else create_engine(
+            args.database_url.replace("postgres://", "postgresql+psycopg://", 1),
+            poolclass=StaticPool,
+        )
+    )
+    report = {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "numpy": np.__version__,
+            "solidago": _package_version("solidago"),
+            "preference_learning": {
+                "maxdiff": MAXDIFF_PREFERENCE_LEARNING_NAME,
+                "pairwise": PAIRWISE_PREFERENCE_LEARNING_NAME,
+            },
+        },
+        "cases": [
+            run_benchmark_case(
+                case=case_by_name[name],
+                kind=kind,
+                voting_rights=voting_rights,
+                seed=args.seed,
+                repeat=args.repeat,
+                engine=engine,
+            )
+            for name in args.cases or ["small", "medium"]
+            for kind in args.kinds or list(OBSERVATION_KINDS)
+            for voting_rights in args.voting_rights or list(VOTING_RIGHTS_MODES)
+        ],
+    }
+    if engine is not None:
+        engine.dispose()
+
+    output = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output is None:
+        sys.stdout.write(output)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,13 @@
 Score = comparison count (proxy for Solidago runtime).
 ZPOPMIN grabs lightest conversations first (lowest latency for users).
 ZADD deduplicates by member and always updates the score.
+The score also splits conversations into fast and heavy lanes (see scheduler.py).
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from valkey import Valkey
@@ -35,31 +36,66 @@ class DirtyConversation:
     member: str  # original member string for re-adding on failure
 
 
+# Pop up to ARGV[2] lightest members with score < ARGV[1] in one atomic step.
+_POP_BELOW_WEIGHT_SCRIPT = """
+local members = redis.call(
+    'ZRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[1], 'WITHSCORES', 'LIMIT', 0, ARGV[2]
+)
+for i = 1, #members, 2 do
+    redis.call('ZREM', KEYS[1], members[i])
+end
+return members
+"""
+
+
+def _parse_member(member: object, score: object) -> DirtyConversation:
+    """Member format: "convId:slugId" (set by API's ZADD)."""
+    parts = str(member).split(":", 1)
+    return DirtyConversation(
+        conversation_id=int(parts[0]),
+        slug_id=parts[1] if len(parts) > 1 else "unknown",
+        weight=int(float(str(score))),
+        member=str(member),
+    )
+
+
 def zpopmin_batch(vk: Valkey, *, count: int) -> list[DirtyConversation]:
     """Atomically grab up to `count` lightest conversations.
 
     ZPOPMIN removes and returns members with the lowest scores.
     Lightest-first = fastest to process = lowest user-facing latency.
-
-    Member format: "convId:slugId" (set by API's ZADD).
     """
     results = vk.zpopmin(DIRTY_KEY, count)
     if not results:
         return []
-    batch: list[DirtyConversation] = []
-    for member_str, score in results:
-        parts = str(member_str).split(":", 1)
-        conv_id = int(parts[0])
-        slug_id = parts[1] if len(parts) > 1 else "unknown"
-        batch.append(
-            DirtyConversation(
-                conversation_id=conv_id,
-                slug_id=slug_id,
-                weight=int(score),
-                member=str(member_str),
-            )
-        )
-    return batch
+    return [_parse_member(member, score) for member, score in results]
+
+
+def pop_fast_lane_batch(vk: Valkey, *, count: int, max_weight: int) -> list[DirtyConversation]:
+    """Atomically grab up to `count` lightest conversations lighter than `max_weight`.
+
+    Like zpopmin_batch, but never takes heavy-lane conversations.
+    """
+    flat = cast(
+        "list[object]",
+        vk.eval(_POP_BELOW_WEIGHT_SCRIPT, 1, DIRTY_KEY, max_weight, count),
+    )
+    return [_parse_member(flat[i], flat[i + 1]) for i in range(0, len(flat), 2)]
+
+
+def peek_heavy_lane(vk: Valkey, *, min_weight: int) -> list[DirtyConversation]:
+    """List every waiting conversation with weight >= `min_weight`, lightest first.
+
+    Not capped: a window of the lightest members would hide the heaviest
+    ones from aging, so they would never be picked.
+    """
+    results = vk.zrangebyscore(DIRTY_KEY, min_weight, "+inf", withscores=True)
+    return [_parse_member(member, score) for member, score in results]
+
+
+def claim(vk: Valkey, *, member: str) -> bool:
+    """Remove one member from the dirty set; False if another worker took it first."""
+    return vk.zrem(DIRTY_KEY, member) == 1
 
 
 def queue_depth(vk: Valkey) -> int:
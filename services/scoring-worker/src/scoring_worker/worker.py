@@ -1,10 +1,16 @@
 """Solidago scoring worker.
 
 Batch architecture:
-    1. ZPOPMIN batch (filter out backed-off conversations)
+    1. Pop the lightest fast-lane batch (filter out backed-off conversations)
     2. Batch SELECT all data for all conversations
     3. Parallel Solidago via ThreadPoolExecutor (no DB during scoring)
-    4. Batch WRITE all results in one transaction
+    4. Write-through: each scored conversation is written as soon as it
+       finishes; results ready within write_coalesce_seconds share one
+       transaction, and a failed write is retried per conversation
+
+Heavy conversations (weight >= heavy_lane_min_weight) bypass the batch and are
+claimed one at a time, ordered by aged weight, onto a bounded background pool
+that runs the same steps (see scheduler.py).
 
 Scaling (future ECS/EKS):
     Monitor ZCARD for queue depth trend. Multiple identical workers
@@ -19,24 +25,40 @@ from __future__ import annotations
 import logging
 import signal
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
 from typing import TYPE_CHECKING
 
 import valkey as valkey_lib
 from sqlalchemy import create_engine, text
 
+from scoring_worker.comparison_cache import ComparisonCache
 from scoring_worker.config import Settings
 from scoring_worker.db import (
     ComparisonRow,
+    PreviousUserScores,
     ScoredEntity,
     UserScoreEntry,
     clear_scores_batch,
     fetch_active_items_batch,
     fetch_comparisons_batch,
+    fetch_previous_user_scores_batch,
     reconcile_unscored_conversations,
     update_maxdiff_counters_batch,
     write_scores_batch,
 )
+from scoring_worker.maxdiff_sequential import (
+    shutdown_user_learning_pool,
+    start_user_learning_pool,
+)
+from scoring_worker.scheduler import (
+    HeavyLaneSelector,
+    LaneMetrics,
+    claimable_heavy_lane,
+    split_fast_lane_batch,
+)
 from scoring_worker.scoring import (
     ConversationScoringOutput,
     score_comparisons,
@@ -44,11 +66,15 @@ from scoring_worker.scoring import (
 )
 from scoring_worker.valkey_client import (
     DirtyConversation,
+    claim,
     mark_dirty,
-    zpopmin_batch,
+    peek_heavy_lane,
+    pop_fast_lane_batch,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from sqlalchemy import Engine
 
 logging.basicConfig(
@@ -59,6 +85,8 @@ log = logging.getLogger(__name__)
 
 _running = True
 STARTUP_RETRY_INTERVAL_SECONDS = 5.0
+FAST_LANE = "fast"
+HEAVY_LANE = "heavy"
 
 
 def _handle_signal(signum: int, frame: object) -> None:
@@ -88,9 +116,27 @@ def _score_one(
     *,
     entity_ids: list[str],
     comparisons: list[ComparisonRow],
+    previous_user_scores: dict[int, PreviousUserScores],
 ) -> ConversationScoringOutput | None:
     """Score a single conversation (called in thread pool)."""
-    return score_comparisons(entity_ids=entity_ids, comparisons=comparisons)
+    return score_comparisons(
+        entity_ids=entity_ids,
+        comparisons=comparisons,
+        previous_user_scores=previous_user_scores,
+    )
+
+
+def _previous_user_scores_by_user_idx(
+    *,
+    previous_by_result_id: dict[int, PreviousUserScores],
+    user_idx_to_result_id: dict[int, int],
+) -> dict[int, PreviousUserScores]:
+    """Re-key previous per-user scores from maxdiff_result_id to this batch's user_idx."""
+    return {
+        user_idx: previous_by_result_id[result_id]
+        for user_idx, result_id in user_idx_to_result_id.items()
+        if result_id in previous_by_result_id
+    }
 
 
 def _connect_to_valkey_with_retry(settings: Settings) -> valkey_lib.Valkey | None:
@@ -155,6 +201,363 @@ def _create_engine_with_retry(
     return None
 
 
+@dataclass(frozen=True)
+class _ScoredConversation:
+    item: DirtyConversation
+    entities: list[ScoredEntity]
+    participant_counts: dict[str, int]
+    user_scores: list[UserScoreEntry]  # refit users only
+
+
+def _scored_conversation(
+    item: DirtyConversation,
+    *,
+    output: ConversationScoringOutput,
+    comparisons: list[ComparisonRow],
+    user_idx_to_result_id: dict[int, int],
+) -> _ScoredConversation:
+    """Map one Solidago output to the rows write_scores_batch persists."""
+    pc = _build_participant_counts(comparisons)
+    scored = [
+        ScoredEntity(
+            entity_slug_id=r.entity_id,
+            score=r.score,
+            uncertainty_left=r.uncertainty_left,
+            uncertainty_right=r.uncertainty_right,
+            participant_count=pc.get(r.entity_id, 0),
+        )
+        for r in output.global_scores
+    ]
+    log.info(
+        "[Worker] %s: scored %d entities, %d users (%d reused)",
+        item.slug_id,
+        len(output.global_scores),
+        len(output.user_scores),
+        len(output.reused_user_ids),
+    )
+
+    # Map refit per-user scores to DB entries
+    user_score_entries: list[UserScoreEntry] = []
+    for user_idx, user_results in output.user_scores.items():
+        result_id = user_idx_to_result_id.get(user_idx)
+        if result_id is None or user_idx in output.reused_user_ids:
+            continue
+        user_score_entries.extend(
+            UserScoreEntry(
+                maxdiff_result_id=result_id,
+                entity_slug_id=r.entity_id,
+                score=r.score,
+                uncertainty_left=r.uncertainty_left,
+                uncertainty_right=r.uncertainty_right,
+            )
+            for r in user_results
+        )
+    return _ScoredConversation(
+        item=item,
+        entities=scored,
+        participant_counts=pc,
+        user_scores=user_score_entries,
+    )
+
+
+def _write_conversations(
+    primary_engine: Engine,
+    *,
+    scored: list[_ScoredConversation],
+    cleared: list[DirtyConversation],
+    computed_at: datetime,
+) -> None:
+    if scored:
+        write_scores_batch(
+            primary_engine,
+            results={
+                conversation.item.conversation_id: (
+                    conversation.entities,
+                    conversation.participant_counts,
+                )
+                for conversation in scored
+            },
+            user_scores=[entry for conversation in scored for entry in conversation.user_scores],
+            computed_at=computed_at,
+        )
+    if cleared:
+        clear_scores_batch(
+            primary_engine,
+            conversation_ids=[item.conversation_id for item in cleared],
+        )
+
+
+def _write_ready(
+    primary_engine: Engine,
+    *,
+    scored: list[_ScoredConversation],
+    cleared: list[DirtyConversation],
+    computed_at: datetime,
+) -> list[DirtyConversation]:
+    """Write every ready conversation together; returns those that could not be written.
+
+    If the coalesced write fails, each conversation is retried on its own so
+    one bad conversation does not fail the others.
+    """
+    try:
+        _write_conversations(
+            primary_engine,
+            scored=scored,
+            cleared=cleared,
+            computed_at=computed_at,
+        )
+        return []
+    except Exception:
+        if len(scored) + len(cleared) == 1:
+            item = scored[0].item if scored else cleared[0]
+            log.exception("[Worker] %s: write failed", item.slug_id)
+            return [item]
+        log.exception(
+            "[Worker] Coalesced write of %d conversation(s) failed, retrying one by one",
+            len(scored) + len(cleared),
+        )
+
+    failed_items: list[DirtyConversation] = []
+    for conversation in scored:
+        failed_items.extend(
+            _write_ready(
+                primary_engine,
+                scored=[conversation],
+                cleared=[],
+                computed_at=computed_at,
+            )
+        )
+    for item in cleared:
+        failed_items.extend(
+            _write_ready(
+                primary_engine,
+                scored=[],
+                cleared=[item],
+                computed_at=computed_at,
+            )
+        )
+    return failed_items
+
+
+def process_batch(
+    batch: list[DirtyConversation],
+    *,
+    read_engine: Engine,
+    primary_engine: Engine,
+    comparison_cache: ComparisonCache,
+    max_workers: int,
+    write_coalesce_seconds: float,
+    on_written: Callable[[DirtyConversation], None] | None = None,
+) -> list[DirtyConversation]:
+    """Fetch, score and write one batch; returns the conversations that failed.
+
+    Each conversation is written as soon as it is scored: results that finish
+    within `write_coalesce_seconds` of each other share one write, and
+    `on_written` is called for every conversation once its scores are stored.
+    Raises when the batch as a whole fails (likely a DB connection issue).
+    """
+    conv_ids = [item.conversation_id for item in batch]
+
+    # Step 2: Batch SELECT (input_read_at becomes the new computed_at)
+    input_read_at = datetime.now(tz=UTC).replace(microsecond=0)
+    active_items = fetch_active_items_batch(read_engine, conversation_ids=conv_ids)
+    comparisons_result = fetch_comparisons_batch(
+        read_engine,
+        conversation_ids=conv_ids,
+        active_items_by_conv=active_items,
+        cache=comparison_cache,
+    )
+    comparisons = comparisons_result.comparisons
+    user_idx_to_result_id = comparisons_result.user_idx_to_result_id
+    previous_user_scores = fetch_previous_user_scores_batch(read_engine, conversation_ids=conv_ids)
+
+    # Update counters
+    update_maxdiff_counters_batch(
+        primary_engine,
+        counters=comparisons_result.counters,
+    )
+
+    # Separate: conversations with enough data vs those to clear
+    to_score: list[DirtyConversation] = []
+    to_clear: list[DirtyConversation] = []
+    for item in batch:
+        cid = item.conversation_id
+        items = active_items.get(cid, [])
+        comps = comparisons.get(cid, [])
+        if len(items) < 2 or not comps:
+            to_clear.append(item)
+            log.info(
+                "[Worker] %s: %d items, %d comparisons -> clear",
+                item.slug_id,
+                len(items),
+                len(comps),
+            )
+        else:
+            to_score.append(item)
+
+    if to_clear:
+        clear_scores_batch(
+            primary_engine,
+            conversation_ids=[item.conversation_id for item in to_clear],
+        )
+        if on_written is not None:
+            for item in to_clear:
+                on_written(item)
+
+    # Step 3: Parallel Solidago (ThreadPoolExecutor)
+    failed_items: list[DirtyConversation] = []
+    if not to_score:
+        return failed_items
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        future_to_item = {
+            pool.submit(
+                _score_one,
+                entity_ids=active_items[item.conversation_id],
+                comparisons=comparisons[item.conversation_id],
+                previous_user_scores=_previous_user_scores_by_user_idx(
+                    previous_by_result_id=previous_user_scores.get(item.conversation_id, {}),
+                    user_idx_to_result_id=user_idx_to_result_id.get(item.conversation_id, {}),
+                ),
+            ): item
+            for item in to_score
+        }
+
+        # Step 4: Write-through -- flush whatever is ready once the oldest
+        # ready result has waited write_coalesce_seconds, or nothing is left
+        pending: set[Future[ConversationScoringOutput | None]] = set(future_to_item)
+        ready_scored: list[_ScoredConversation] = []
+        ready_cleared: list[DirtyConversation] = []
+        flush_at: float | None = None
+        while pending or ready_scored or ready_cleared:
+            if pending:
+                timeout = None if flush_at is None else max(0.0, flush_at - time.monotonic())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = future_to_item[future]
+                    try:
+                        output = future.result()
+                    except Exception:
+                        log.exception(
+                            "[Worker] %s: Solidago failed",
+                            item.slug_id,
+                        )
+                        failed_items.append(item)
+                        continue
+                    if output is None:
+                        ready_cleared.append(item)
+                    else:
+                        ready_scored.append(
+                            _scored_conversation(
+                                item,
+                                output=output,
+                                comparisons=comparisons[item.conversation_id],
+                                user_idx_to_result_id=user_idx_to_result_id.get(
+                                    item.conversation_id, {}
+                                ),
+                            )
+                        )
+                    if flush_at is None:
+                        flush_at = time.monotonic() + write_coalesce_seconds
+
+            if not (ready_scored or ready_cleared):
+                continue
+            if pending and flush_at is not None and time.monotonic() < flush_at:
+                continue
+
+            write_failed = _write_ready(
+                primary_engine,
+                scored=ready_scored,
+                cleared=ready_cleared,
+                computed_at=input_read_at,
+            )
+            failed_items.extend(write_failed)
+            if on_written is not None:
+                failed_ids = {item.conversation_id for item in write_failed}
+                for item in [conversation.item for conversation in ready_scored] + ready_cleared:
+                    if item.conversation_id not in failed_ids:
+                        on_written(item)
+            ready_scored = []
+            ready_cleared = []
+            flush_at = None
+
+    return failed_items
+
+
+def _requeue_with_backoff(
+    vk: valkey_lib.Valkey,
+    items: list[DirtyConversation],
+    *,
+    backoff_until: dict[int, float],
+    backoff_seconds: float,
+) -> None:
+    for item in items:
+        backoff_until[item.conversation_id] = time.monotonic() + backoff_seconds
+        mark_dirty(vk, member=item.member, weight=item.weight)
+
+
+def _collect_heavy_lane(
+    vk: valkey_lib.Valkey,
+    *,
+    in_flight: dict[Future[list[DirtyConversation]], tuple[DirtyConversation, float]],
+    backoff_until: dict[int, float],
+    backoff_seconds: float,
+    lane_metrics: LaneMetrics,
+) -> None:
+    """Handle finished heavy-lane conversations; failures are re-added with backoff."""
+    for future in [future for future in in_flight if future.done()]:
+        item, claimed_at = in_flight.pop(future)
+        try:
+            failed_items = future.result()
+        except Exception:
+            log.exception("[Worker] %s: heavy lane batch failed, re-adding", item.slug_id)
+            failed_items = [item]
+        if failed_items:
+            _requeue_with_backoff(
+                vk,
+                failed_items,
+                backoff_until=backoff_until,
+                backoff_seconds=backoff_seconds,
+            )
+        else:
+            lane_metrics.record(HEAVY_LANE, time.monotonic() - claimed_at)
+
+
+def _in_flight_conversation_ids(
+    in_flight: dict[Future[list[DirtyConversation]], tuple[DirtyConversation, float]],
+) -> set[int]:
+    return {item.conversation_id for item, _claimed_at in in_flight.values()}
+
+
+def _record_written(
+    lane_metrics: LaneMetrics,
+    lane: str,
+    claimed_at: float,
+    item: DirtyConversation,
+) -> None:
+    del item
+    lane_metrics.record(lane, time.monotonic() - claimed_at)
+
+
+def _log_lane_metrics(
+    lane_metrics: LaneMetrics, *, heavy_waiting: int, heavy_in_flight: int
+) -> None:
+    for snapshot in lane_metrics.snapshot():
+        log.info(
+            "[Scheduler] %s lane: %d done, p50 %.2fs, p95 %.2fs, max %.2fs",
+            snapshot.lane,
+            snapshot.count,
+            snapshot.p50_seconds,
+            snapshot.p95_seconds,
+            snapshot.max_seconds,
+        )
+    log.info(
+        "[Scheduler] heavy lane: %d waiting, %d in flight",
+        heavy_waiting,
+        heavy_in_flight,
+    )
+
+
 def _run_worker_once() -> None:
     settings = Settings()
 
@@ -162,10 +565,14 @@ def _run_worker_once() -> None:
     signal.signal(signal.SIGINT, _handle_signal)
 
     log.info(
-        "[Worker] Starting (poll: %.1fs, batch: %d, workers: %d)",
+        "[Worker] Starting (poll: %.1fs, batch: %d, workers: %d, user learning processes: %d, "
+        "heavy lane: weight >= %d, %d in flight)",
         settings.poll_interval_seconds,
         settings.batch_size,
         settings.max_workers,
+        settings.user_learning_processes,
+        settings.heavy_lane_min_weight,
+        settings.heavy_lane_max_in_flight,
     )
 
     # Valkey
@@ -198,11 +605,25 @@ def _run_worker_once() -> None:
     log.info("[Worker] PostgreSQL connected (pool_pre_ping=True)")
 
     warmup()
+    start_user_learning_pool(processes=settings.user_learning_processes)
+
+    comparison_cache = ComparisonCache(max_entries=settings.comparison_cache_max_conversations)
 
     # Per-conversation backoff: conv_id -> monotonic time when retry is allowed
     backoff_until: dict[int, float] = {}
 
+    heavy_selector = HeavyLaneSelector(aging_seconds=settings.heavy_lane_aging_seconds)
+    heavy_pool = ThreadPoolExecutor(
+        max_workers=settings.heavy_lane_max_in_flight,
+        thread_name_prefix="heavy-lane",
+    )
+    # Heavy-lane future -> (conversation, monotonic claim time)
+    heavy_in_flight: dict[Future[list[DirtyConversation]], tuple[DirtyConversation, float]] = {}
+    heavy_waiting = 0
+    lane_metrics = LaneMetrics((FAST_LANE, HEAVY_LANE))
+
     last_reconcile = time.monotonic()
+    last_lane_metrics_log = last_reconcile
     log.info("[Worker] Ready")
 
     while _running:
@@ -226,15 +647,73 @@ def _run_worker_once() -> None:
                 log.exception("[Worker] Reconciliation failed")
             last_reconcile = now
 
+        if now - last_lane_metrics_log >= settings.lane_metrics_log_interval_seconds:
+            _log_lane_metrics(
+                lane_metrics,
+                heavy_waiting=heavy_waiting,
+                heavy_in_flight=len(heavy_in_flight),
+            )
+            last_lane_metrics_log = now
+
         # Clean up old backoff entries (> 60s)
         expired = [k for k, v in backoff_until.items() if now - v > 60]
         for k in expired:
             del backoff_until[k]
 
-        # Step 1: ZPOPMIN batch + filter backed-off conversations
-        raw_batch = zpopmin_batch(vk, count=settings.batch_size)
+        # Heavy lane: collect finished runs, then claim by aged weight up to capacity
+        _collect_heavy_lane(
+            vk,
+            in_flight=heavy_in_flight,
+            backoff_until=backoff_until,
+            backoff_seconds=settings.backoff_seconds,
+            lane_metrics=lane_metrics,
+        )
+        heavy_claimed = 0
+        try:
+            heavy_candidates = peek_heavy_lane(vk, min_weight=settings.heavy_lane_min_weight)
+            heavy_waiting = len(heavy_candidates)
+            capacity = settings.heavy_lane_max_in_flight - len(heavy_in_flight)
+            for item in claimable_heavy_lane(
+                heavy_candidates,
+                selector=heavy_selector,
+                now=now,
+                busy_conversation_ids=_in_flight_conversation_ids(heavy_in_flight),
+                backoff_until=backoff_until,
+            ):
+                if heavy_claimed >= capacity:
+                    break
+                if not claim(vk, member=item.member):
+                    continue
+                log.info(
+                    "[Worker] %s: heavy lane claimed (weight %d, waited %.1fs)",
+                    item.slug_id,
+                    item.weight,
+                    heavy_selector.waited_seconds(item.member, now=now),
+                )
+                heavy_selector.forget(item.member)
+                future = heavy_pool.submit(
+                    process_batch,
+                    [item],
+                    read_engine=read_engine,
+                    primary_engine=primary_engine,
+                    comparison_cache=comparison_cache,
+                    max_workers=1,
+                    write_coalesce_seconds=0.0,
+                )
+                heavy_in_flight[future] = (item, time.monotonic())
+                heavy_claimed += 1
+        except Exception:
+            log.exception("[Worker] Heavy lane scheduling failed")
+
+        # Fast lane: pop lightest conversations below the heavy threshold
+        raw_batch = pop_fast_lane_batch(
+            vk,
+            count=settings.batch_size,
+            max_weight=settings.heavy_lane_min_weight,
+        )
         if not raw_batch:
-            time.sleep(settings.poll_interval_seconds)
+            if not heavy_claimed:
+                time.sleep(settings.poll_interval_seconds)
             continue
 
         if not _running:
@@ -247,149 +726,63 @@ def _run_worker_once() -> None:
             )
             break
 
-        to_process: list[DirtyConversation] = []
-        for item in raw_batch:
-            retry_after = backoff_until.get(item.conversation_id)
-            if retry_after is not None and now < retry_after:
-                # Still in backoff -- re-add to dirty, skip
-                mark_dirty(vk, member=item.member, weight=item.weight)
-            else:
-                to_process.append(item)
+        # Still scoring in the heavy lane or in backoff -- re-add to dirty, skip
+        to_process, to_requeue = split_fast_lane_batch(
+            raw_batch,
+            now=now,
+            busy_conversation_ids=_in_flight_conversation_ids(heavy_in_flight),
+            backoff_until=backoff_until,
+        )
+        for item in to_requeue:
+            mark_dirty(vk, member=item.member, weight=item.weight)
 
         if not to_process:
             time.sleep(settings.poll_interval_seconds)
             continue
 
-        conv_ids = [item.conversation_id for item in to_process]
         log.info(
             "[Worker] Processing %d conversation(s): %s",
             len(to_process),
             ", ".join(item.slug_id for item in to_process),
         )
 
+        claimed_at = time.monotonic()
         try:
-            # Step 2: Batch SELECT
-            active_items = fetch_active_items_batch(read_engine, conversation_ids=conv_ids)
-            comparisons_result = fetch_comparisons_batch(read_engine, conversation_ids=conv_ids)
-            comparisons = comparisons_result.comparisons
-            user_idx_to_result_id = comparisons_result.user_idx_to_result_id
-
-            # Update counters
-            update_maxdiff_counters_batch(
-                primary_engine,
-                conversation_ids=conv_ids,
-                active_items_by_conv=active_items,
+            failed_items = process_batch(
+                to_process,
+                read_engine=read_engine,
+                primary_engine=primary_engine,
+                comparison_cache=comparison_cache,
+                max_workers=settings.max_workers,
+                write_coalesce_seconds=settings.write_coalesce_seconds,
+                on_written=partial(_record_written, lane_metrics, FAST_LANE, claimed_at),
             )
-
-            # Separate: conversations with enough data vs those to clear
-            to_score: list[DirtyConversation] = []
-            to_clear: list[int] = []
-            for item in to_process:
-                cid = item.conversation_id
-                items = active_items.get(cid, [])
-                comps = comparisons.get(cid, [])
-                if len(items) < 2 or not comps:
-                    to_clear.append(cid)
-                    log.info(
-                        "[Worker] %s: %d items, %d comparisons -> clear",
-                        item.slug_id,
-                        len(items),
-                        len(comps),
-                    )
-                else:
-                    to_score.append(item)
-
-            if to_clear:
-                clear_scores_batch(primary_engine, conversation_ids=to_clear)
-
-            # Step 3: Parallel Solidago (ThreadPoolExecutor)
-            scoring_results: dict[int, tuple[list[ScoredEntity], dict[str, int]]] = {}
-            all_user_score_entries: list[UserScoreEntry] = []
-            failed_items: list[DirtyConversation] = []
-
-            if to_score:
-                with ThreadPoolExecutor(max_workers=settings.max_workers) as pool:
-                    future_to_item = {
-                        pool.submit(
-                            _score_one,
-                            entity_ids=active_items[item.conversation_id],
-                            comparisons=comparisons[item.conversation_id],
-                        ): item
-                        for item in to_score
-                    }
-
-                    for future in as_completed(future_to_item):
-                        item = future_to_item[future]
-                        try:
-                            output = future.result()
-                            if output is not None:
-                                pc = _build_participant_counts(comparisons[item.conversation_id])
-                                scored = [
-                                    ScoredEntity(
-                                        entity_slug_id=r.entity_id,
-                                        score=r.score,
-                                        uncertainty_left=r.uncertainty_left,
-                                        uncertainty_right=r.uncertainty_right,
-                                        participant_count=pc.get(r.entity_id, 0),
-                                    )
-                                    for r in output.global_scores
-                                ]
-                                scoring_results[item.conversation_id] = (scored, pc)
-                                log.info(
-                                    "[Worker] %s: scored %d entities, %d users",
-                                    item.slug_id,
-                                    len(output.global_scores),
-                                    len(output.user_scores),
-                                )
-
-                                # Map per-user scores to DB entries
-                                idx_map = user_idx_to_result_id.get(item.conversation_id, {})
-                                for user_idx, user_results in output.user_scores.items():
-                                    result_id = idx_map.get(user_idx)
-                                    if result_id is None:
-                                        continue
-                                    for r in user_results:
-                                        all_user_score_entries.append(
-                                            UserScoreEntry(
-                                                maxdiff_result_id=result_id,
-                                                entity_slug_id=r.entity_id,
-                                                score=r.score,
-                                                uncertainty_left=r.uncertainty_left,
-                                                uncertainty_right=r.uncertainty_right,
-                                            )
-                                        )
-                            else:
-                                to_clear.append(item.conversation_id)
-                        except Exception:
-                            log.exception(
-                                "[Worker] %s: Solidago failed",
-                                item.slug_id,
-                            )
-                            failed_items.append(item)
-
-            # Step 4: Batch WRITE
-            if scoring_results:
-                write_scores_batch(
-                    primary_engine,
-                    results=scoring_results,
-                    user_scores=all_user_score_entries,
-                )
-
-            if to_clear:
-                clear_scores_batch(primary_engine, conversation_ids=to_clear)
-
-            # Handle failures: re-add with backoff
-            for item in failed_items:
-                backoff_until[item.conversation_id] = time.monotonic() + settings.backoff_seconds
-                mark_dirty(vk, member=item.member, weight=item.weight)
-
         except Exception:
             # Entire batch failed (likely DB connection issue)
             log.exception("[Worker] Batch failed, re-adding all")
             for item in to_process:
                 mark_dirty(vk, member=item.member, weight=item.weight)
             time.sleep(5)
+            continue
 
+        # Handle failures: re-add with backoff
+        _requeue_with_backoff(
+            vk,
+            failed_items,
+            backoff_until=backoff_until,
+            backoff_seconds=settings.backoff_seconds,
+        )
+
+    # Let in-flight heavy conversations finish writing before tearing down
+    heavy_pool.shutdown(wait=True)
+    _collect_heavy_lane(
+        vk,
+        in_flight=heavy_in_flight,
+        backoff_until=backoff_until,
+        backoff_seconds=settings.backoff_seconds,
+        lane_metrics=lane_metrics,
+    )
+    shutdown_user_learning_pool()
     primary_engine.dispose()
     read_engine.dispose()
     vk.close()
@@ -13,9 +13,13 @@ from collections.abc import Generator
 
 import pytest
 import valkey as valkey_lib
+from sqlalchemy import Engine, create_engine
 from testcontainers.core.config import testcontainers_config
 from testcontainers.core.container import DockerContainer
 from testcontainers.core.wait_strategies import LogMessageWaitStrategy
+from testcontainers.postgres import PostgresContainer
+
+from scoring_worker.generated_models import Base
 
 
 def _configure_docker_host() -> None:
@@ -69,6 +73,26 @@ def valkey_url(valkey_container: DockerContainer) -> str:
     return f"valkey://{host}:{port}/0"
 
 
+@pytest.fixture(scope="session")
+def postgres_container() -> Generator[PostgresContainer]:
+    """Start a single Postgres container for the entire test session."""
+    container = PostgresContainer("postgres:17", driver="psycopg")
+    container.start()
+    yield container
+    container.stop()
+
+
+@pytest.fixture()
+def pg_engine(postgres_container: PostgresContainer) -> Generator[Engine]:
+    """Per-test engine over freshly created scoring tables."""
+    engine = create_engine(postgres_container.get_connection_url())
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
 @pytest.fixture()
 def vk(
     valkey_container: DockerContainer,
@@ -500,3 +500,25 @@ class TestBwsToPairwise:
         # No contradictions
         for uid, winner, loser in pairs:
             assert (uid, loser, winner) not in pairs
+
+    def test_chained_comparisons_close_over_hundreds_of_items(self) -> None:
+        """Overlapping BWS votes along a chain infer the full total order."""
+        items = [f"item{i:03d}" for i in range(301)]
+        comparisons = [
+            bws(
+                user_id=0,
+                best=items[i],
+                worst=items[i + 2],
+                candidate_set=[items[i], items[i + 1], items[i + 2]],
+            )
+            for i in range(0, len(items) - 2, 2)
+        ]
+
+        result = bws_to_pairwise(
+            bws_comparisons=list(reversed(comparisons)),
+            entity_ids=list(reversed(items)),
+        )
+
+        assert len(result) == len(items) * (len(items) - 1) // 2
+        rank = {item: i for i, item in enumerate(items)}
+        assert all(rank[p.winner] < rank[p.loser] for p in result)
@@ -17,10 +17,14 @@ Paper: https://ssrn.com/abstract=4311507
 Tests written FIRST per TDD methodology.
 """
 
+import math
+import random
+
 from scoring_worker.cocm_voting import (
     COCMVotingRights,
     GroupSource,
     UserGroupEntry,
+    build_friend_graph,
     build_friend_matrix,
 )
 
@@ -339,3 +343,61 @@ class TestCOCMCrossValidation:
             f"8 grouped users ({total_grouped:.2f}) should have much less "
             f"total weight than 8 independent ({total_independent:.2f})"
         )
+
+
+# ===========================================================================
+# Friend graph
+# ===========================================================================
+
+
+class TestFriendGraph:
+    def test_batched_rights_match_dense_friend_matrix(self) -> None:
+        """All-entity rights from the friend graph equal the per-entity
+        friend_matrix formula, including users outside every source and
+        users in several groups of one source."""
+        rng = random.Random(3)
+        user_ids = list(range(60))
+        group_sources = [
+            GroupSource(
+                source_id=source_id,
+                memberships=[
+                    UserGroupEntry(user_id=user_id, group_id=rng.randrange(group_count))
+                    for user_id in rng.sample(user_ids, 45)
+                    for _ in range(rng.choice([1, 1, 2]))
+                ],
+            )
+            for source_id, group_count in [("polis", 4), ("company", 9)]
+        ]
+        scorers_by_entity = {
+            entity_id: rng.sample(user_ids, rng.randrange(1, 30)) for entity_id in range(25)
+        }
+        trust_scores = {user_id: rng.uniform(0.2, 1.0) for user_id in user_ids}
+        fm = build_friend_matrix(group_sources=group_sources, user_ids=user_ids)
+
+        rights_by_entity = COCMVotingRights(group_sources=group_sources).compute_voting_rights(
+            scorers_by_entity=scorers_by_entity,
+            trust_scores=trust_scores,
+            friend_graph=build_friend_graph(group_sources=group_sources, user_ids=user_ids),
+        )
+
+        for entity_id, scorers in scorers_by_entity.items():
+            connected_co_scorers = {
+                user: sum(1 for other in scorers if other != user and fm[user][other] > 0)
+                for user in scorers
+            }
+            assert rights_by_entity[entity_id] == {
+                user: trust_scores[user] / math.sqrt(1 + connected_co_scorers[user])
+                for user in scorers
+            }
+
+    def test_users_sharing_no_group_are_not_connected(self) -> None:
+        graph = build_friend_graph(
+            group_sources=[group_source("polis", {0: 1, 1: 1, 2: 2})],
+            user_ids=[0, 1, 2, 3],
+        )
+        classes = graph.user_classes([0, 1, 2, 3]).tolist()
+
+        assert classes[0] == classes[1]
+        assert graph.connected_classes[classes[0], classes[1]]
+        assert not graph.connected_classes[classes[0], classes[2]]
+        assert not graph.connected_classes[classes[3], classes[3]]
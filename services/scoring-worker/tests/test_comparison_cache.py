@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from scoring_worker.comparison_cache import (
+    CachedComparison,
+    CachedConversationComparisons,
+    CachedMaxdiffResult,
+    ComparisonCache,
+)
+from scoring_worker.db import (
+    ComparisonRow,
+    MaxdiffCounters,
+    compute_maxdiff_counters,
+    fetch_comparisons_batch,
+)
+from scoring_worker.generated_models import MaxdiffComparison, MaxdiffResult, User
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+
+# maxdiff_result.updated_at is a timestamp without time zone
+UPDATED_AT = datetime(2026, 1, 1)
+CONVERSATION_ID = 7
+
+
+def _result(participant: int, *pairs: tuple[str, str]) -> CachedMaxdiffResult:
+    return CachedMaxdiffResult(
+        participant_id=UUID(int=participant),
+        updated_at=UPDATED_AT,
+        comparisons=tuple(
+            CachedComparison(best_slug_id=best, worst_slug_id=worst, candidate_set=[best, worst])
+            for best, worst in pairs
+        ),
+    )
+
+
+def _conversation() -> CachedConversationComparisons:
+    return CachedConversationComparisons(synced_at=UPDATED_AT, results={})
+
+
+def test_cache_evicts_least_recently_used_conversation() -> None:
+    cache = ComparisonCache(max_entries=2)
+    first, second, third = _conversation(), _conversation(), _conversation()
+
+    cache.put(1, first)
+    cache.put(2, second)
+    assert cache.get(1) is first
+    cache.put(3, third)
+
+    assert len(cache) == 2
+    assert cache.get(2) is None
+    assert cache.get(1) is first
+    assert cache.get(3) is third
+
+
+def test_disabled_cache_stores_nothing() -> None:
+    cache = ComparisonCache(max_entries=0)
+
+    cache.put(1, _conversation())
+
+    assert len(cache) == 0
+    assert cache.get(1) is None
+
+
+def test_counters_filter_inactive_items_and_ineligible_participants() -> None:
+    results = [
+        _result(1, ("a", "b"), ("a", "c")),
+        _result(2, ("c", "b")),
+        _result(3, ("a", "b")),
+        _result(4),
+    ]
+
+    counters = compute_maxdiff_counters(
+        results=results,
+        active_slug_ids={"a", "b"},
+        eligible_participant_ids={UUID(int=1), UUID(int=2)},
+    )
+
+    assert counters == MaxdiffCounters(
+        participant_count=1,
+        total_participant_count=3,
+        vote_count=1,
+        total_vote_count=4,
+    )
+
+
+def test_counters_without_survey_count_every_participant() -> None:
+    counters = compute_maxdiff_counters(
+        results=[_result(1, ("a", "b")), _result(2, ("b", "a"), ("a", "b"))],
+        active_slug_ids={"a", "b"},
+        eligible_participant_ids=None,
+    )
+
+    assert counters == MaxdiffCounters(
+        participant_count=2,
+        total_participant_count=2,
+        vote_count=3,
+        total_vote_count=3,
+    )
+
+
+def _seed_result(session: Session, *, result_id: int, participant: int) -> None:
+    session.add(
+        User(
+            id=UUID(int=participant),
+            polis_participant_id=participant,
+            username=f"user{participant}",
+            created_at=UPDATED_AT,
+            updated_at=UPDATED_AT,
+        )
+    )
+    session.add(
+        MaxdiffResult(
+            id=result_id,
+            participant_id=UUID(int=participant),
+            conversation_id=CONVERSATION_ID,
+            comparisons=[],
+            created_at=UPDATED_AT,
+            updated_at=UPDATED_AT,
+        )
+    )
+    session.add(
+        MaxdiffComparison(
+            maxdiff_result_id=result_id,
+            position=0,
+            best_slug_id="a",
+            worst_slug_id="b",
+            candidate_set=["a", "b"],
+        )
+    )
+
+
+def test_fetch_reuses_cached_results_and_rereads_updated_ones(pg_engine: Engine) -> None:
+    with Session(pg_engine) as session:
+        _seed_result(session, result_id=1, participant=1)
+        _seed_result(session, result_id=2, participant=2)
+        session.commit()
+    cache = ComparisonCache(max_entries=4)
+
+    first = fetch_comparisons_batch(
+        pg_engine,
+        conversation_ids=[CONVERSATION_ID],
+        active_items_by_conv={CONVERSATION_ID: ["a", "b"]},
+        cache=cache,
+    )
+    with Session(pg_engine) as session:
+        # Only the updated result is re-read, so only it sees its comparison deleted
+        session.execute(update(MaxdiffComparison).values(deleted_at=UPDATED_AT))
+        session.execute(
+            update(MaxdiffResult)
+            .where(MaxdiffResult.id == 2)
+            .values(updated_at=datetime.now(tz=UTC).replace(tzinfo=None))
+        )
+        session.commit()
+    second = fetch_comparisons_batch(
+        pg_engine,
+        conversation_ids=[CONVERSATION_ID],
+        active_items_by_conv={CONVERSATION_ID: ["a", "b"]},
+        cache=cache,
+    )
+
+    assert first.user_idx_to_result_id == {CONVERSATION_ID: {0: 1, 1: 2}}
+    assert second.user_idx_to_result_id == {CONVERSATION_ID: {0: 1}}
+    assert second.comparisons == {
+        CONVERSATION_ID: [
+            ComparisonRow(best_slug_id="a", worst_slug_id="b", candidate_set=["a", "b"], user_idx=0)
+        ]
+    }
+    assert second.counters[CONVERSATION_ID].total_participant_count == 1
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import Engine, create_engine, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from scoring_worker import db
+from scoring_worker.generated_models import (
+    Base,
+    Conversation,
+    ConversationLanguageSettingsSource,
+    ConversationType,
+    MaxdiffUserEntityScore,
+    ParticipationMode,
+    RankingConversationConfig,
+    RankingMode,
+    RankingScore,
+    RankingScoreEntity,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+CREATED_AT = datetime(2026, 1, 1)
+
+
+def _create_engine() -> Engine:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine, tables=[Base.metadata.tables["ranking_score_entity"]])
+    return engine
+
+
+def _scored(*slug_ids: str) -> list[db.ScoredEntity]:
+    return [
+        db.ScoredEntity(
+            entity_slug_id=slug_id,
+            score=float(index),
+            uncertainty_left=0.5,
+            uncertainty_right=0.25,
+            participant_count=index + 1,
+        )
+        for index, slug_id in enumerate(slug_ids)
+    ]
+
+
+def _user_scores(
+    maxdiff_result_id: int,
+    scores: Sequence[tuple[str, float]],
+) -> list[db.UserScoreEntry]:
+    return [
+        db.UserScoreEntry(
+            maxdiff_result_id=maxdiff_result_id,
+            entity_slug_id=slug_id,
+            score=score,
+            uncertainty_left=0.1,
+            uncertainty_right=0.2,
+        )
+        for slug_id, score in scores
+    ]
+
+
+def _seed_conversation(
+    session: Session,
+    *,
+    conversation_id: int,
+    current_ranking_score_id: int | None,
+) -> None:
+    config = RankingConversationConfig(
+        ranking_mode=RankingMode.bws,
+        current_ranking_score_id=current_ranking_score_id,
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+    session.add(config)
+    session.flush()
+    session.add(
+        Conversation(
+            id=conversation_id,
+            slug_id=f"conv{conversation_id}",
+            project_id=1,
+            ranking_config_id=config.id,
+            language_settings_source=ConversationLanguageSettingsSource.project_inherited,
+            participation_mode=ParticipationMode.guest,
+            conversation_type=ConversationType.ranking,
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
+            last_reacted_at=CREATED_AT,
+        )
+    )
+
+
+def _current_ranking_score_id(session: Session, conversation_id: int) -> int | None:
+    return session.scalar(
+        select(RankingConversationConfig.current_ranking_score_id)
+        .join(Conversation, Conversation.ranking_config_id == RankingConversationConfig.id)
+        .where(Conversation.id == conversation_id)
+    )
+
+
+@pytest.mark.parametrize("model", [RankingScoreEntity, MaxdiffUserEntityScore])
+def test_copy_columns_cover_every_written_column(model: type[Base]) -> None:
+    columns = db.BULK_COPY_COLUMNS_BY_TABLE[model.__tablename__]
+
+    assert {column_name for column_name, _copy_type in columns} == {
+        column.name for column in model.__table__.columns
+    } - {"id"}
+
+
+def test_bulk_insert_rejects_tables_without_copy_columns() -> None:
+    engine = _create_engine()
+
+    with Session(engine) as session, pytest.raises(ValueError, match="ranking_score"):
+        db.bulk_insert_rows(session, model=RankingScore, values=[{"conversation_id": 1}])
+
+
+def test_bulk_insert_falls_back_to_chunked_inserts_on_sqlite(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(db, "POSTGRES_INSERT_BIND_PARAM_LIMIT", 12)
+    values: list[dict[str, object]] = [
+        {
+            "ranking_score_id": 3,
+            "entity_slug_id": f"item{index}",
+            "score": float(index),
+            "uncertainty_left": 0.5,
+            "uncertainty_right": 0.25,
+            "participant_count": index + 1,
+        }
+        for index in range(5)
+    ]
+    engine = _create_engine()
+
+    with Session(engine) as session:
+        write_method = db.bulk_insert_rows(session, model=RankingScoreEntity, values=values)
+        rows = session.scalars(select(RankingScoreEntity).order_by(RankingScoreEntity.id)).all()
+
+    assert write_method == "insert"
+    assert [row.entity_slug_id for row in rows] == [f"item{index}" for index in range(5)]
+    assert rows[4].participant_count == 5
+    assert rows[4].uncertainty_right == 0.25
+
+
+def test_rewritten_user_scores_drop_entities_no_longer_scored(pg_engine: Engine) -> None:
+    # The ON CONFLICT target is the unique constraint from the V0052 migration
+    with pg_engine.begin() as connection:
+        connection.execute(
+            text(
+                "ALTER TABLE maxdiff_user_entity_score ADD CONSTRAINT "
+                '"maxdiff_user_entity_score_maxdiff_result_id_entity_slug_id_unique" '
+                "UNIQUE (maxdiff_result_id, entity_slug_id)"
+            )
+        )
+    with Session(pg_engine) as session:
+        _seed_conversation(session, conversation_id=1, current_ranking_score_id=None)
+        session.commit()
+
+    db.write_scores_batch(
+        pg_engine,
+        results={1: (_scored("a", "b", "c"), {})},
+        user_scores=[
+            *_user_scores(10, [("a", 1.0), ("b", 2.0), ("c", 3.0)]),
+            *_user_scores(11, [("a", 4.0)]),
+        ],
+    )
+    db.write_scores_batch(
+        pg_engine,
+        results={1: (_scored("a", "b"), {})},
+        user_scores=_user_scores(10, [("a", 5.0), ("b", 6.0)]),
+    )
+
+    with Session(pg_engine) as session:
+        rows = session.scalars(
+            select(MaxdiffUserEntityScore).order_by(
+                MaxdiffUserEntityScore.maxdiff_result_id,
+                MaxdiffUserEntityScore.entity_slug_id,
+            )
+        ).all()
+
+    assert [(row.maxdiff_result_id, row.entity_slug_id, row.score) for row in rows] == [
+        (10, "a", 5.0),
+        (10, "b", 6.0),
+        # Results missing from a batch keep their rows
+        (11, "a", 4.0),
+    ]
+
+
+def test_current_ranking_score_id_only_moves_forward(pg_engine: Engine) -> None:
+    with Session(pg_engine) as session:
+        _seed_conversation(session, conversation_id=1, current_ranking_score_id=None)
+        # A newer score, written by a concurrent run that committed first
+        _seed_conversation(session, conversation_id=2, current_ranking_score_id=1_000)
+        session.commit()
+
+    db.write_scores_batch(
+        pg_engine,
+        results={1: (_scored("a"), {"a": 1}), 2: (_scored("a"), {"a": 1})},
+    )
+
+    with Session(pg_engine) as session:
+        ranking_score_ids = session.scalars(
+            select(RankingScore.id).order_by(RankingScore.conversation_id)
+        ).all()
+        entity_rows = session.scalars(
+            select(RankingScoreEntity).order_by(RankingScoreEntity.ranking_score_id)
+        ).all()
+
+        assert _current_ranking_score_id(session, 1) == ranking_score_ids[0]
+        assert _current_ranking_score_id(session, 2) == 1_000
+    assert [(row.ranking_score_id, row.participant_count) for row in entity_rows] == [
+        (ranking_score_ids[0], 1),
+        (ranking_score_ids[1], 1),
+    ]
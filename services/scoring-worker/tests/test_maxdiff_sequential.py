@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import multiprocessing
+from typing import TYPE_CHECKING
+
 import numpy as np
+import pandas as pd
 
 from scoring_worker.maxdiff_sequential import (
+    SequentialMaxDiffJudgments,
+    SequentialMaxDiffLearning,
     SequentialMaxDiffTask,
     fit_sequential_maxdiff_map,
+    sequential_maxdiff_gradient,
+    sequential_maxdiff_hessian,
+    sequential_maxdiff_loss,
+    shutdown_user_learning_pool,
+    start_user_learning_pool,
 )
 
+if TYPE_CHECKING:
+    from solidago.scoring_model import ScoringModel
+
 
 def _task(*, best: int, worst: int, candidate_set: tuple[int, ...]) -> SequentialMaxDiffTask:
     return SequentialMaxDiffTask(
@@ -115,3 +129,110 @@ def test_contradictory_tasks_shrink_score_gap() -> None:
     consistent_gap = consistent_fit.scores[0] - consistent_fit.scores[2]
     contradictory_gap = contradictory_fit.scores[0] - contradictory_fit.scores[2]
     assert contradictory_gap < consistent_gap
+
+
+def test_batched_gradient_and_hessian_match_finite_differences() -> None:
+    rng = np.random.default_rng(5)
+    tasks: list[SequentialMaxDiffTask] = []
+    for _ in range(30):
+        candidate_set = tuple(
+            int(coord) for coord in rng.choice(8, size=rng.integers(3, 6), replace=False)
+        )
+        best, worst = candidate_set[:2]
+        tasks.append(_task(best=best, worst=worst, candidate_set=candidate_set))
+    scores = rng.normal(size=8)
+    epsilon = 1e-6
+
+    gradient = sequential_maxdiff_gradient(scores=scores, tasks=tasks, prior_std_dev=7.0)
+    hessian = sequential_maxdiff_hessian(scores=scores, tasks=tasks, prior_std_dev=7.0)
+    basis = np.eye(8) * epsilon
+    numeric_gradient = np.array(
+        [
+            (
+                sequential_maxdiff_loss(scores=scores + step, tasks=tasks, prior_std_dev=7.0)
+                - sequential_maxdiff_loss(scores=scores - step, tasks=tasks, prior_std_dev=7.0)
+            )
+            / (2 * epsilon)
+            for step in basis
+        ]
+    )
+    numeric_hessian = np.array(
+        [
+            (
+                sequential_maxdiff_gradient(scores=scores + step, tasks=tasks, prior_std_dev=7.0)
+                - sequential_maxdiff_gradient(scores=scores - step, tasks=tasks, prior_std_dev=7.0)
+            )
+            / (2 * epsilon)
+            for step in basis
+        ]
+    )
+
+    np.testing.assert_allclose(gradient, numeric_gradient, atol=1e-5)
+    np.testing.assert_allclose(hessian, numeric_hessian, atol=1e-5)
+
+
+def _parallel_learning_inputs() -> tuple[SequentialMaxDiffJudgments, pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(3)
+    records: list[dict[str, object]] = []
+    for user_id in range(1, 9):
+        for _ in range(4):
+            candidate_set = tuple(int(entity) for entity in rng.choice(6, size=4, replace=False))
+            records.append(
+                {
+                    "user_id": user_id,
+                    "best_entity": candidate_set[0],
+                    "worst_entity": candidate_set[-1],
+                    "candidate_set": candidate_set,
+                }
+            )
+    judgments = SequentialMaxDiffJudgments(maxdiff_tasks=pd.DataFrame(records))
+    users = pd.DataFrame(index=pd.Index(range(1, 10), name="user_id"))
+    entities = pd.DataFrame(index=pd.Index(range(6), name="entity_id"))
+    return judgments, users, entities
+
+
+def _assert_same_models(
+    actual: dict[int, ScoringModel],
+    expected: dict[int, ScoringModel],
+) -> None:
+    assert list(actual) == list(expected) == list(range(1, 9))
+    for user_id, expected_model in expected.items():
+        for entity_id in range(6):
+            assert actual[user_id](entity_id) == expected_model(entity_id)
+
+
+def test_parallel_user_learning_matches_serial_fits() -> None:
+    judgments, users, entities = _parallel_learning_inputs()
+    learning = SequentialMaxDiffLearning(min_parallel_users=1)
+
+    serial_models = learning(judgments, users, entities)
+    start_user_learning_pool(processes=2)
+    try:
+        parallel_models = learning(judgments, users, entities)
+    finally:
+        shutdown_user_learning_pool()
+
+    _assert_same_models(parallel_models, serial_models)
+
+
+def test_broken_user_learning_pool_is_replaced_and_run_fits_inline() -> None:
+    judgments, users, entities = _parallel_learning_inputs()
+    learning = SequentialMaxDiffLearning(min_parallel_users=1)
+
+    serial_models = learning(judgments, users, entities)
+    start_user_learning_pool(processes=2)
+    try:
+        learning(judgments, users, entities)
+        for child in multiprocessing.active_children():
+            child.kill()
+            child.join()
+
+        recovered_models = learning(judgments, users, entities)
+        replacement_models = learning(judgments, users, entities)
+        replacement_workers = multiprocessing.active_children()
+    finally:
+        shutdown_user_learning_pool()
+
+    _assert_same_models(recovered_models, serial_models)
+    _assert_same_models(replacement_models, serial_models)
+    assert replacement_workers
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import pytest
+
+from scoring_worker.scheduler import (
+    HeavyLaneSelector,
+    LaneMetrics,
+    claimable_heavy_lane,
+    split_fast_lane_batch,
+)
+from scoring_worker.valkey_client import DirtyConversation
+
+
+def _item(conv_id: int, weight: int) -> DirtyConversation:
+    return DirtyConversation(
+        conversation_id=conv_id,
+        slug_id=f"slug{conv_id}",
+        weight=weight,
+        member=f"{conv_id}:slug{conv_id}",
+    )
+
+
+class TestHeavyLaneSelector:
+    def test_lightest_first_without_waiting(self):
+        selector = HeavyLaneSelector(aging_seconds=60.0)
+        selected = selector.select([_item(1, 9000), _item(2, 3000)], now=0.0, limit=2)
+        assert [item.conversation_id for item in selected] == [2, 1]
+
+    def test_limit_caps_selection(self):
+        selector = HeavyLaneSelector(aging_seconds=60.0)
+        candidates = [_item(i, 2000 + i) for i in range(5)]
+        assert [item.conversation_id for item in selector.select(candidates, now=0.0, limit=2)] == [
+            0,
+            1,
+        ]
+        assert selector.select(candidates, now=0.0, limit=0) == []
+
+    def test_waiting_heavy_conversation_is_eventually_picked_first(self):
+        selector = HeavyLaneSelector(aging_seconds=60.0)
+        heavy = _item(1, 8000)
+        selector.select([heavy], now=0.0, limit=0)
+
+        # A fresh conversation at well under its weight still wins after one half-life...
+        lighter = _item(2, 3000)
+        assert selector.select([heavy, lighter], now=60.0, limit=1) == [lighter]
+        # ...but after three the heavy one's aged weight (1000) beats a fresh 3000.
+        newcomer = _item(3, 3000)
+        assert selector.select([heavy, newcomer], now=180.0, limit=1) == [heavy]
+        assert abs(selector.waited_seconds(heavy.member, now=180.0) - 180.0) < 1e-9
+        assert selector.waited_seconds(newcomer.member, now=180.0) == 0.0
+
+    def test_heaviest_is_picked_while_lighter_conversations_keep_arriving(self):
+        selector = HeavyLaneSelector(aging_seconds=60.0)
+        heaviest = _item(0, 64_000)
+
+        for cycle in range(10):
+            now = cycle * 60.0
+            # The lighter ones are claimed each cycle and replaced by new arrivals
+            arrivals = [_item(cycle * 1000 + i, 2000 + i) for i in range(1, 151)]
+            [selected] = selector.select([heaviest, *arrivals], now=now, limit=1)
+            if selected is heaviest:
+                break
+            selector.forget(selected.member)
+        else:
+            pytest.fail("heaviest conversation was never selected")
+
+        # After five half-lives 64000 ages to 2000, under the lightest fresh arrival
+        assert abs(selector.waited_seconds(heaviest.member, now=now) - 300.0) < 1e-9
+
+    def test_members_that_leave_the_lane_are_forgotten(self):
+        selector = HeavyLaneSelector(aging_seconds=60.0)
+        item = _item(1, 5000)
+        selector.select([item], now=0.0, limit=1)
+        selector.select([], now=30.0, limit=1)
+        selector.select([item], now=90.0, limit=1)
+        assert selector.waited_seconds(item.member, now=90.0) == 0.0
+
+        selector.forget(item.member)
+        assert selector.waited_seconds(item.member, now=100.0) == 0.0
+
+
+class TestInFlightConversations:
+    def test_heavy_conversation_redirtied_while_in_flight_waits_for_its_run(self):
+        selector = HeavyLaneSelector(aging_seconds=60.0)
+        # Conversation 1 is being scored; a new comparison re-added it to the dirty set
+        redirtied, other = _item(1, 5000), _item(2, 9000)
+
+        claimable = claimable_heavy_lane(
+            [redirtied, other],
+            selector=selector,
+            now=0.0,
+            busy_conversation_ids={1},
+            backoff_until={},
+        )
+        assert claimable == [other]
+        # Left unclaimed, it keeps its wait time until the first run is collected
+        assert claimable_heavy_lane(
+            [redirtied, other],
+            selector=selector,
+            now=30.0,
+            busy_conversation_ids=set(),
+            backoff_until={},
+        ) == [redirtied, other]
+        assert selector.waited_seconds(redirtied.member, now=30.0) == 30.0
+
+    def test_heavy_lane_skips_conversations_in_backoff(self):
+        selector = HeavyLaneSelector(aging_seconds=60.0)
+        claimable = claimable_heavy_lane(
+            [_item(1, 5000), _item(2, 9000)],
+            selector=selector,
+            now=10.0,
+            busy_conversation_ids=set(),
+            backoff_until={1: 20.0, 2: 5.0},
+        )
+        assert [item.conversation_id for item in claimable] == [2]
+
+    def test_fast_lane_requeues_conversations_still_scoring_in_heavy_lane(self):
+        reconciled = DirtyConversation(
+            conversation_id=1,
+            slug_id="reconciled",
+            weight=0,
+            member="1:reconciled",
+        )
+        to_process, to_requeue = split_fast_lane_batch(
+            [reconciled, _item(2, 10), _item(3, 10)],
+            now=10.0,
+            busy_conversation_ids={1},
+            backoff_until={3: 20.0},
+        )
+        assert [item.conversation_id for item in to_process] == [2]
+        assert to_requeue == [reconciled, _item(3, 10)]
+
+
+class TestLaneMetrics:
+    def test_snapshot_reports_percentiles_per_lane(self):
+        metrics = LaneMetrics(("fast", "heavy"))
+        for seconds in range(1, 101):
+            metrics.record("fast", float(seconds))
+        metrics.record("heavy", 42.0)
+
+        fast, heavy = metrics.snapshot()
+        assert (fast.lane, fast.count) == ("fast", 100)
+        assert fast.p50_seconds == 51.0
+        assert fast.p95_seconds == 96.0
+        assert fast.max_seconds == 100.0
+        assert (heavy.count, heavy.p50_seconds, heavy.max_seconds) == (1, 42.0, 42.0)
+
+    def test_snapshot_resets_samples(self):
+        metrics = LaneMetrics(("fast",))
+        metrics.record("fast", 1.0)
+        metrics.snapshot()
+        [empty] = metrics.snapshot()
+        assert (empty.count, empty.p50_seconds, empty.p95_seconds, empty.max_seconds) == (
+            0,
+            0.0,
+            0.0,
+            0.0,
+        )
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from scoring_worker.cocm_voting import GroupSource, UserGroupEntry
-from scoring_worker.db import ComparisonRow
+from scoring_worker.db import ComparisonRow, PreviousUserScores
 from scoring_worker.entity_mapping import SolidagoEntityScore
-from scoring_worker.observations import PairwiseObservation
+from scoring_worker.observations import PairwiseObservation, comparison_rows_to_maxdiff_observations
 from scoring_worker.scoring import (
     ConversationScoringOutput,
+    ScoringStageTimings,
     score_comparisons,
+    score_maxdiff_observations,
     score_pairwise_observations,
     to_scoring_results,
 )
@@ -193,6 +195,104 @@ class TestCOCM:
             assert abs(d.score - e.score) < 0.01
 
 
+# --- Warm start ---
+
+
+def _previous_scores(
+    output: ConversationScoringOutput,
+    *,
+    is_unchanged: bool,
+) -> dict[int, PreviousUserScores]:
+    return {
+        user_idx: PreviousUserScores(
+            is_unchanged=is_unchanged,
+            scores={
+                r.entity_id: (r.score, r.uncertainty_left, r.uncertainty_right)
+                for r in user_results
+            },
+        )
+        for user_idx, user_results in output.user_scores.items()
+    }
+
+
+class TestWarmStart:
+    def test_unchanged_users_reuse_previous_models(self) -> None:
+        cold = _score_raw()
+        assert cold is not None
+
+        warm = score_comparisons(
+            entity_ids=IDS,
+            comparisons=COMPS,
+            previous_user_scores=_previous_scores(cold, is_unchanged=True),
+        )
+
+        assert warm is not None
+        assert warm.reused_user_ids == frozenset({0, 1, 2})
+        assert warm.user_scores == cold.user_scores
+        assert warm.global_scores == cold.global_scores
+
+    def test_changed_users_warm_start_to_the_same_fit(self) -> None:
+        cold = _score_raw()
+        assert cold is not None
+
+        warm = score_comparisons(
+            entity_ids=IDS,
+            comparisons=COMPS,
+            previous_user_scores=_previous_scores(cold, is_unchanged=False),
+        )
+
+        assert warm is not None
+        assert warm.reused_user_ids == frozenset()
+        for user_idx, user_results in cold.user_scores.items():
+            warm_by_id = {r.entity_id: r.score for r in warm.user_scores[user_idx]}
+            for r in user_results:
+                assert abs(warm_by_id[r.entity_id] - r.score) < 1e-6
+
+    def test_deactivated_item_forces_refit(self) -> None:
+        cold = _score_raw()
+        assert cold is not None
+
+        warm = score_comparisons(
+            entity_ids=["A", "B", "C"],
+            comparisons=COMPS,
+            previous_user_scores=_previous_scores(cold, is_unchanged=True),
+        )
+
+        assert warm is not None
+        assert warm.reused_user_ids == frozenset()
+        assert all(
+            {r.entity_id for r in user_results} <= {"A", "B", "C"}
+            for user_results in warm.user_scores.values()
+        )
+
+
+class TestStageTimings:
+    def test_timings_record_each_stage_without_changing_scores(self) -> None:
+        observations = comparison_rows_to_maxdiff_observations(entity_ids=IDS, comparisons=COMPS)
+        timings = ScoringStageTimings()
+
+        timed = score_maxdiff_observations(
+            entity_ids=IDS,
+            observations=observations,
+            group_sources=COLLUDING_GROUPS,
+            timings=timings,
+        )
+
+        assert timed == score_maxdiff_observations(
+            entity_ids=IDS,
+            observations=observations,
+            group_sources=COLLUDING_GROUPS,
+        )
+        stage_seconds = [
+            timings.preference_learning_seconds,
+            timings.voting_rights_seconds,
+            timings.aggregation_seconds,
+        ]
+        assert timings.input_prep_seconds > 0
+        assert all(seconds > 0 for seconds in stage_seconds)
+        assert timings.pipeline_seconds >= sum(stage_seconds)
+
+
 class TestPairwiseIntegration:
     def test_pairwise_observations_score_with_majority_preference(self) -> None:
         output = score_pairwise_observations(
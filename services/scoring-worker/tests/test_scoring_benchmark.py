@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+
+from scoring_worker.scoring_benchmark import (
+    BenchmarkCase,
+    run_benchmark_case,
+    synthetic_workload,
+)
+
+CASE = BenchmarkCase(name="tiny", user_count=8, item_count=6, comparisons_per_user=4)
+
+
+def test_synthetic_workload_is_reproducible_for_a_seed() -> None:
+    workload = synthetic_workload(case=CASE, seed=7)
+
+    assert workload == synthetic_workload(case=CASE, seed=7)
+    assert len(workload.entity_ids) == CASE.item_count
+    assert len(workload.maxdiff_observations) == CASE.user_count * CASE.comparisons_per_user
+    assert len(workload.pairwise_observations) == CASE.user_count * CASE.comparisons_per_user
+    for observation in workload.maxdiff_observations:
+        assert observation.best_slug_id != observation.worst_slug_id
+        assert {observation.best_slug_id, observation.worst_slug_id} <= set(
+            observation.candidate_set
+        )
+    for source in workload.group_sources:
+        assert sorted(entry.user_id for entry in source.memberships) == list(range(CASE.user_count))
+
+
+def test_benchmark_case_reports_per_stage_timings_as_json() -> None:
+    for kind, voting_rights in [("maxdiff", "affine"), ("pairwise", "cocm")]:
+        report = run_benchmark_case(
+            case=CASE,
+            kind=kind,
+            voting_rights=voting_rights,
+            seed=7,
+            repeat=2,
+        )
+
+        assert report["name"] == "tiny"
+        assert report["kind"] == kind
+        assert report["voting_rights"] == voting_rights
+        assert report["observations"] == CASE.user_count * CASE.comparisons_per_user
+        assert report["scored_entities"] == CASE.item_count
+        for stage in ["read_comparisons_ms", "write_scores_ms", "read_previous_scores_ms"]:
+            assert report["timings_ms"][stage] is None
+        for stage in [
+            "input_prep_ms",
+            "preference_learning_ms",
+            "voting_rights_ms",
+            "aggregation_ms",
+            "pipeline_other_ms",
+        ]:
+            timing = report["timings_ms"][stage]
+            assert 0 <= timing["min"] <= timing["median"] <= timing["max"]
+        assert json.loads(json.dumps(report)) == report
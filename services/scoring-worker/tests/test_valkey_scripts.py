@@ -15,7 +15,10 @@ if TYPE_CHECKING:
     import valkey as valkey_lib
 
 from scoring_worker.valkey_client import (
+    claim,
     mark_dirty,
+    peek_heavy_lane,
+    pop_fast_lane_batch,
     queue_depth,
     zpopmin_batch,
 )
@@ -81,3 +84,48 @@ class TestZpopminBatch:
         assert len(ids_a) == 3
         assert len(ids_b) == 3
         assert ids_a.isdisjoint(ids_b)
+
+
+class TestSchedulingLanes:
+    """Fast-lane pops stay below the threshold; heavy members are peeked then claimed."""
+
+    def test_fast_lane_skips_heavy_conversations(self, vk: valkey_lib.Valkey):
+        _mark(vk, conv_id=1, weight=5000)
+        _mark(vk, conv_id=2, weight=30)
+        _mark(vk, conv_id=3, weight=1999)
+        batch = pop_fast_lane_batch(vk, count=10, max_weight=2000)
+        assert [item.conversation_id for item in batch] == [2, 3]
+        assert batch[1].weight == 1999
+        assert batch[1].slug_id == "slug3"
+        assert queue_depth(vk) == 1
+
+    def test_fast_lane_returns_up_to_count(self, vk: valkey_lib.Valkey):
+        for i in range(5):
+            _mark(vk, conv_id=i, weight=i)
+        batch = pop_fast_lane_batch(vk, count=2, max_weight=100)
+        assert [item.conversation_id for item in batch] == [0, 1]
+        assert queue_depth(vk) == 3
+
+    def test_peek_heavy_lane_does_not_remove(self, vk: valkey_lib.Valkey):
+        _mark(vk, conv_id=1, weight=9000)
+        _mark(vk, conv_id=2, weight=2000)
+        _mark(vk, conv_id=3, weight=10)
+        heavy = peek_heavy_lane(vk, min_weight=2000)
+        assert [(item.conversation_id, item.weight) for item in heavy] == [(2, 2000), (1, 9000)]
+        assert queue_depth(vk) == 3
+
+    def test_peek_heavy_lane_includes_the_heaviest_behind_many_lighter(self, vk: valkey_lib.Valkey):
+        for i in range(150):
+            _mark(vk, conv_id=i, weight=2000 + i)
+        _mark(vk, conv_id=999, weight=90_000)
+        heavy = peek_heavy_lane(vk, min_weight=2000)
+        assert len(heavy) == 151
+        assert heavy[-1].conversation_id == 999
+
+    def test_claim_succeeds_once(self, vk: valkey_lib.Valkey):
+        """Two workers racing for the same heavy member: only one wins."""
+        _mark(vk, conv_id=7, weight=5000)
+        [item] = peek_heavy_lane(vk, min_weight=2000)
+        assert claim(vk, member=item.member) is True
+        assert claim(vk, member=item.member) is False
+        assert queue_depth(vk) == 0
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, cast
+
+from scoring_worker import worker
+from scoring_worker.comparison_cache import ComparisonCache
+from scoring_worker.db import (
+    ComparisonRow,
+    ComparisonsBatchResult,
+    MaxdiffCounters,
+    PreviousUserScores,
+    ScoredEntity,
+    UserScoreEntry,
+)
+from scoring_worker.scoring import ConversationScoringOutput, ScoringResult
+from scoring_worker.valkey_client import DirtyConversation
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import pytest
+    from sqlalchemy import Engine
+
+ENGINE = cast("Engine", object())
+
+
+def _item(conv_id: int) -> DirtyConversation:
+    return DirtyConversation(
+        conversation_id=conv_id,
+        slug_id=f"slug{conv_id}",
+        weight=10,
+        member=f"{conv_id}:slug{conv_id}",
+    )
+
+
+def _comparisons(conv_id: int) -> list[ComparisonRow]:
+    return [
+        ComparisonRow(
+            best_slug_id=f"a{conv_id}",
+            worst_slug_id=f"b{conv_id}",
+            candidate_set=[f"a{conv_id}", f"b{conv_id}"],
+            user_idx=0,
+        )
+    ]
+
+
+def _output(entity_ids: list[str]) -> ConversationScoringOutput:
+    return ConversationScoringOutput(
+        global_scores=[
+            ScoringResult(
+                entity_id=entity_id,
+                score=0.5,
+                uncertainty_left=0.1,
+                uncertainty_right=0.1,
+            )
+            for entity_id in entity_ids
+        ],
+        user_scores={},
+    )
+
+
+def _score_immediately(
+    *,
+    entity_ids: list[str],
+    comparisons: list[ComparisonRow],
+    previous_user_scores: dict[int, PreviousUserScores],
+) -> ConversationScoringOutput:
+    del comparisons, previous_user_scores
+    return _output(entity_ids)
+
+
+def _returning(value: object) -> Callable[..., object]:
+    def fake(*_args: object, **_kwargs: object) -> object:
+        return value
+
+    return fake
+
+
+def _patch_reads(monkeypatch: pytest.MonkeyPatch, conv_ids: list[int]) -> None:
+    active_items = {cid: [f"a{cid}", f"b{cid}"] for cid in conv_ids}
+    comparisons = ComparisonsBatchResult(
+        comparisons={cid: _comparisons(cid) for cid in conv_ids},
+        user_idx_to_result_id={cid: {0: 100 + cid} for cid in conv_ids},
+        counters={
+            cid: MaxdiffCounters(
+                participant_count=1,
+                total_participant_count=1,
+                vote_count=1,
+                total_vote_count=1,
+            )
+            for cid in conv_ids
+        },
+    )
+    monkeypatch.setattr(worker, "fetch_active_items_batch", _returning(active_items))
+    monkeypatch.setattr(worker, "fetch_comparisons_batch", _returning(comparisons))
+    monkeypatch.setattr(worker, "fetch_previous_user_scores_batch", _returning({}))
+    monkeypatch.setattr(worker, "update_maxdiff_counters_batch", _returning(None))
+    monkeypatch.setattr(worker, "clear_scores_batch", _returning(None))
+
+
+def _process(
+    items: list[DirtyConversation],
+    *,
+    write_coalesce_seconds: float,
+    on_written: Callable[[DirtyConversation], None] | None = None,
+) -> list[DirtyConversation]:
+    return worker.process_batch(
+        items,
+        read_engine=ENGINE,
+        primary_engine=ENGINE,
+        comparison_cache=ComparisonCache(max_entries=0),
+        max_workers=2,
+        write_coalesce_seconds=write_coalesce_seconds,
+        on_written=on_written,
+    )
+
+
+def test_finished_conversation_is_written_before_slow_one_completes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_reads(monkeypatch, [1, 2])
+    release_slow = threading.Event()
+    writes: list[list[int]] = []
+
+    def score_one(
+        *,
+        entity_ids: list[str],
+        comparisons: list[ComparisonRow],
+        previous_user_scores: dict[int, PreviousUserScores],
+    ) -> ConversationScoringOutput:
+        if entity_ids[0] == "a2":
+            assert release_slow.wait(timeout=10)
+        return _score_immediately(
+            entity_ids=entity_ids,
+            comparisons=comparisons,
+            previous_user_scores=previous_user_scores,
+        )
+
+    def write_scores_batch(
+        _engine: Engine,
+        *,
+        results: dict[int, tuple[list[ScoredEntity], dict[str, int]]],
+        user_scores: list[UserScoreEntry] | None = None,
+        computed_at: object = None,
+    ) -> None:
+        del user_scores, computed_at
+        writes.append(sorted(results))
+
+    def on_written(item: DirtyConversation) -> None:
+        if item.conversation_id == 1:
+            # Conversation 2 is still blocked in Solidago when 1 is stored
+            assert writes == [[1]]
+            release_slow.set()
+
+    monkeypatch.setattr(worker, "_score_one", score_one)
+    monkeypatch.setattr(worker, "write_scores_batch", write_scores_batch)
+
+    failed = _process([_item(1), _item(2)], write_coalesce_seconds=0.0, on_written=on_written)
+
+    assert failed == []
+    assert writes == [[1], [2]]
+
+
+def test_failed_coalesced_write_is_retried_per_conversation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_reads(monkeypatch, [1, 2, 3])
+    writes: list[list[int]] = []
+    written: list[int] = []
+
+    def write_scores_batch(
+        _engine: Engine,
+        *,
+        results: dict[int, tuple[list[ScoredEntity], dict[str, int]]],
+        user_scores: list[UserScoreEntry] | None = None,
+        computed_at: object = None,
+    ) -> None:
+        del user_scores, computed_at
+        writes.append(sorted(results))
+        if 2 in results:
+            msg = "constraint violation"
+            raise RuntimeError(msg)
+
+    monkeypatch.setattr(worker, "_score_one", _score_immediately)
+    monkeypatch.setattr(worker, "write_scores_batch", write_scores_batch)
+
+    failed = _process(
+        [_item(1), _item(2), _item(3)],
+        write_coalesce_seconds=5.0,
+        on_written=lambda item: written.append(item.conversation_id),
+    )
+
+    assert [item.conversation_id for item in failed] == [2]
+    assert writes[0] == [1, 2, 3]
+    assert sorted(writes[1:]) == [[1], [2], [3]]
+    assert sorted(written) == [1, 3]
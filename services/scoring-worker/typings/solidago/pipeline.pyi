@@ -7,6 +7,12 @@ from .trust_propagation import TrustPropagation
 from .voting_rights.base import VotingRightsAssignment
 
 class Pipeline:
+    trust_propagation: TrustPropagation
+    preference_learning: object
+    voting_rights: VotingRightsAssignment
+    scaling: object
+    aggregation: object
+    post_process: object
     def __init__(
         self,
         *,
@@ -25,4 +31,5 @@ class Pipeline:
         entities: DataFrame,
         privacy: PrivacySettings,
         judgments: Judgments,
+        init_user_models: dict[int, ScoringModel] | None = ...,
     ) -> tuple[object, object, dict[int, ScoringModel], ScoringModel]: ...
@@ -5,7 +5,18 @@ class Valkey:
     def ping(self) -> bool: ...
     def zadd(self, key: str, mapping: dict[str, int | float]) -> int: ...
     def zpopmin(self, key: str, count: int = ...) -> list[tuple[str, float]]: ...
+    def zrangebyscore(
+        self,
+        key: str,
+        min: int | float | str,  # noqa: A002
+        max: int | float | str,  # noqa: A002
+        start: int | None = ...,
+        num: int | None = ...,
+        withscores: bool = ...,
+    ) -> list[tuple[str, float]]: ...
+    def zrem(self, key: str, *members: str) -> int: ...
     def zcard(self, key: str) -> int: ...
+    def eval(self, script: str, numkeys: int, *keys_and_args: str | int | float) -> Any: ...
     def flushall(self) -> Any: ...
     def close(self) -> None: ...
 
@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from importlib import metadata
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from agora_analysis_worker_shared import db
+from agora_analysis_worker_shared.analysis_compute import (
+    ComputedAnalysisBundle,
+    ComputeStageTimings,
+    RedDwarfRunner,
+    compute_analysis_bundle,
+)
+from agora_analysis_worker_shared.db import (
+    OpinionGroupConfigRecord,
+    OpinionGroupSpecRecord,
+    OpinionGroupVariantRecord,
+)
+from agora_analysis_worker_shared.generated_models import (
+    AnalysisResultOutcomeEnum,
+    AnalysisSnapshotOpinion,
+    OpinionGroupCandidateOpinionMetrics,
+    OpinionGroupOpinionStats,
+    OpinionGroupUser,
+)
+from agora_analysis_worker_shared.input_snapshot import (
+    PreparedInputSnapshot,
+    VoteInputColumns,
+    build_incremental_snapshot_base,
+    prepare_input_snapshot_from_columns,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from sqlalchemy import Engine
+
+    from agora_analysis_worker_shared.generated_models import Base
+
+BENCHMARK_SCHEMA_VERSION = 1
+SYNTHETIC_OPINION_GROUP_COUNT = 3
+SYNTHETIC_PASS_PROBABILITY = 0.15
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    participant_count: int
+    opinion_count: int
+    density: float
+
+
+BENCHMARK_CASES = (
+    BenchmarkCase(name="small", participant_count=200, opinion_count=40, density=0.5),
+    BenchmarkCase(name="medium", participant_count=2_000, opinion_count=150, density=0.3),
+    BenchmarkCase(name="large", participant_count=10_000, opinion_count=400, density=0.15),
+)
+DEFAULT_BENCHMARK_CONFIG = OpinionGroupConfigRecord(
+    spec=OpinionGroupSpecRecord(
+        id=1,
+        min_clusterable_participants=2,
+        min_votes_per_participant=7,
+        max_group_count=6,
+    ),
+    variants=[
+        OpinionGroupVariantRecord(id=group_count, opinion_group_spec_id=1, group_count=group_count)
+        for group_count in range(2, 7)
+    ],
+)
+
+
+@dataclass(frozen=True)
+class _StageTimings:
+    snapshot_prep_ms: float
+    red_dwarf_ms: float
+    post_processing_ms: float
+    silhouette_ms: float
+    persist_ms: float | None
+
+
+@dataclass(frozen=True)
+class _BenchmarkRun:
+    snapshot: PreparedInputSnapshot
+    bundle: ComputedAnalysisBundle
+    timings: _StageTimings
+    persisted_rows: dict[str, int]
+    persist_write_method: str | None
+
+
+def synthetic_vote_columns(*, case: BenchmarkCase, seed: int) -> VoteInputColumns:
+    rng = np.random.default_rng(seed)
+    participant_groups = rng.integers(SYNTHETIC_OPINION_GROUP_COUNT, size=case.participant_count)
+    agree_probabilities = rng.uniform(
+        0.1, 0.9, size=(SYNTHETIC_OPINION_GROUP_COUNT, case.opinion_count)
+    )
+    voted = rng.random((case.participant_count, case.opinion_count)) < case.density
+    participant_codes, opinion_indexes = np.nonzero(voted)
+    draws = rng.random(len(participant_codes))
+    agree_thresholds = (
+        SYNTHETIC_PASS_PROBABILITY
+        + (1 - SYNTHETIC_PASS_PROBABILITY)
+        * agree_probabilities[participant_groups[participant_codes], opinion_indexes]
+    )
+    votes = np.where(
+        draws < SYNTHETIC_PASS_PROBABILITY,
+        0,
+        np.where(draws < agree_thresholds, 1, -1),
+    )
+    opinion_ids = opinion_indexes.astype(np.int64) + 1
+    return VoteInputColumns(
+        data_generations=frozenset({1}),
+        user_ids=[UUID(int=index + 1) for index in range(case.participant_count)],
+        participant_codes=participant_codes.astype(np.int32),
+        opinion_ids=opinion_ids,
+        opinion_content_ids=opinion_ids + 1_000_000,
+        vote_content_ids=np.arange(1, len(votes) + 1, dtype=np.int64),
+        votes=votes.astype(np.int8),
+        has_missing_vote_content_id=False,
+    )
+
+
+def run_benchmark_case(
+    *,
+    case: BenchmarkCase,
+    seed: int,
+    repeat: int,
+    config: OpinionGroupConfigRecord = DEFAULT_BENCHMARK_CONFIG,
+    engine: Engine | None = None,
+    run_red_dwarf_pipeline: RedDwarfRunner | None = None,
+) -> dict[str, Any]:
+    if repeat < 1:
+        msg = f"repeat must be at least 1, got {repeat}"
+        raise ValueError(msg)
+    columns = synthetic_vote_columns(case=case, seed=seed)
+    runs = [
+        _run_once(
+            columns=columns,
+            config=config,
+            engine=engine,
+            run_red_dwarf_pipeline=run_red_dwarf_pipeline,
+        )
+        for _ in range(repeat)
+    ]
+    snapshot = runs[-1].snapshot
+    bundle = runs[-1].bundle
+    return {
+        "name": case.name,
+        "participants": case.participant_count,
+        "opinions": case.opinion_count,
+        "density": case.density,
+        "votes": len(columns),
+        "input_hash": snapshot.input_hash,
+        "outcome": bundle.outcome.value,
+        "successful_group_counts": sorted(
+            candidate.group_count
+            for candidate in bundle.candidates
+            if candidate.outcome == AnalysisResultOutcomeEnum.success
+        ),
+        "persisted_rows": runs[-1].persisted_rows,
+        "persist_write_method": runs[-1].persist_write_method,
+        "timings_ms": {
+            stage: _summarize([getattr(run.timings, stage) for run in runs])
+            for stage in _StageTimings.__dataclass_fields__
+        },
+    }
+
+
+def _summarize(values: list[float | None]) -> dict[str, float] | None:
+    measured = [value for value in values if value is not None]
+    if not measured:
+        return None
+    return {
+        "min": round(min(measured), 3),
+        "median": round(statistics.median(measured), 3),
+        "max": round(max(measured), 3),
+    }
+
+
+def _run_once(
+    *,
+    columns: VoteInputColumns,
+    config: OpinionGroupConfigRecord,
+    engine: Engine | None,
+    run_red_dwarf_pipeline: RedDwarfRunner | None,
+) -> _BenchmarkRun:
+    started_at = time.perf_counter()
+    snapshot = prepare_input_snapshot_from_columns(
+        conversation_id=1,
+        data_generation=1,
+        columns=columns,
+    )
+    build_incremental_snapshot_base(snapshot=snapshot, columns=columns)
+    snapshot_prep_seconds = time.perf_counter() - started_at
+
+    compute_timings = ComputeStageTimings()
+    started_at = time.perf_counter()
+    bundle = compute_analysis_bundle(
+        snapshot=snapshot,
+        config=config,
+        run_red_dwarf_pipeline=run_red_dwarf_pipeline,
+        timings=compute_timings,
+    )
+    compute_seconds = time.perf_counter() - started_at
+
+    persist_seconds: float | None = None
+    persisted_rows: dict[str, int] = {}
+    persist_write_method: str | None = None
+    if engine is not None:
+        persist_seconds, persisted_rows, persist_write_method = _time_persist(
+            engine,
+            snapshot=snapshot,
+            bundle=bundle,
+        )
+
+    return _BenchmarkRun(
+        snapshot=snapshot,
+        bundle=bundle,
+        timings=_StageTimings(
+            snapshot_prep_ms=snapshot_prep_seconds * 1000,
+            red_dwarf_ms=compute_timings.red_dwarf_seconds * 1000,
+            post_processing_ms=max(
+                compute_seconds
+                - compute_timings.red_dwarf_seconds
+                - compute_timings.silhouette_seconds,
+                0.0,
+            )
+            * 1000,
+            silhouette_ms=compute_timings.silhouette_seconds * 1000,
+            persist_ms=None if persist_seconds is None else persist_seconds * 1000,
+        ),
+        persisted_rows=persisted_rows,
+        persist_write_method=persist_write_method,
+    )
+
+
+def _time_persist(
+    engine: Engine,
+    *,
+    snapshot: PreparedInputSnapshot,
+    bundle: ComputedAnalysisBundle,
+) -> tuple[float, dict[str, int], str]:
+    opinion_by_local_index = {opinion.local_opinion_index: opinion for opinion in snapshot.opinions}
+    # Ids that the real persist reads back from RETURNING are synthetic here; the
+    # row values and the bulk write are the ones persist_computed_analysis_results_batch uses.
+    snapshot_opinion_values = [
+        db.snapshot_opinion_insert_value(
+            analysis_snapshot_id=1,
+            opinion=opinion,
+            metrics=metrics,
+        )
+        for metrics in bundle.snapshot_opinions
+        if (opinion := opinion_by_local_index.get(metrics.local_opinion_index)) is not None
+    ]
+    candidate_opinion_metric_values: list[dict[str, object]] = []
+    group_user_values: list[dict[str, object]] = []
+    group_opinion_values: list[Mapping[str, object]] = []
+    group_id = 0
+    for candidate_id, candidate in enumerate(bundle.candidates, start=1):
+        if candidate.outcome != AnalysisResultOutcomeEnum.success:
+            continue
+        candidate_opinion_metric_values.extend(
+            db.candidate_opinion_metrics_insert_value(
+                candidate_id=candidate_id,
+                analysis_snapshot_opinion_id=metric.local_opinion_index + 1,
+                metric=metric,
+            )
+            for metric in candidate.opinion_metrics
+        )
+        for group in candidate.groups:
+            group_id += 1
+            group_user_values.extend(
+                {
+                    "candidate_id": candidate_id,
+                    "group_id": group_id,
+                    "user_id": snapshot.participants[local_participant_index].user_id,
+                }
+                for local_participant_index in group.local_participant_indexes
+            )
+            group_opinion_values.extend(
+                db.group_opinion_stats_insert_value(
+                    group_id=group_id,
+                    analysis_snapshot_opinion_id=opinion_stats.local_opinion_index + 1,
+                    opinion_stats=opinion_stats,
+                )
+                for opinion_stats in group.opinion_stats
+            )
+
+    writes: list[tuple[type[Base], Sequence[Mapping[str, object]]]] = [
+        (AnalysisSnapshotOpinion, snapshot_opinion_values),
+        (OpinionGroupCandidateOpinionMetrics, candidate_opinion_metric_values),
+        (OpinionGroupUser, group_user_values),
+        (OpinionGroupOpinionStats, group_opinion_values),
+    ]
+    write_method = "insert"
+    with Session(engine) as session:
+        # Unqualified names resolve to these temporary copies first, so the writes
+        # skip foreign keys to rows that only exist in a real persist transaction.
+        for model, _values in writes:
+            table_name = model.__tablename__
+            session.execute(
+                text(
+                    f'CREATE TEMPORARY TABLE "{table_name}" '
+                    f'(LIKE "public"."{table_name}" INCLUDING DEFAULTS INCLUDING IDENTITY) '
+                    "ON COMMIT DROP"
+                )
+            )
+        started_at = time.perf_counter()
+        for model, values in writes:
+            if values:
+                write_method = db.bulk_insert_rows(session, model=model, values=values)
+        session.flush()
+        elapsed_seconds = time.perf_counter() - started_at
+        session.rollback()
+
+    return (
+        elapsed_seconds,
+        {model.__tablename__: len(values) for model, values in writes},
+        write_method,
+    )
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed < 1:
+        msg = f"must be at least 1, got {parsed}"
+        raise argparse.ArgumentTypeError(msg)
+    return parsed
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    case_names = [case.name for case in BENCHMARK_CASES]
+    parser = argparse.ArgumentParser(
+        prog="python -m agora_analysis_worker_shared.analysis_benchmark",
+        description="Time the opinion-group analysis pipeline on synthetic vote matrices.",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=case_names,
+        dest="cases",
+        help="benchmark case to run; repeat for several (default: small and medium)",
+    )
+    parser.add_argument("--repeat", type=_positive_int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--database-url",
+        help="local Postgres URL; enables the persist stage, which writes to temporary tables",
+    )
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = _parse_args(argv)
+    case_by_name = {case.name: case for case in BENCHMARK_CASES}
+    engine = None if args.database_url is None else create_engine(args.database_url)
+    report = {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "numpy": np.__version__,
+            "red_dwarf": _package_version("red-dwarf"),
+        },
+        "cases": [
+            run_benchmark_case(
+                case=case_by_name[name],
+                seed=args.seed,
+                repeat=args.repeat,
+                engine=engine,
+            )
+            for name in args.cases or ["small", "medium"]
+        ],
+    }
+    if engine is not None:
+        engine.dispose()
+
+    output = json.dumps(report, indent=2, sort_keys=True) + "\n"
+    if args.output is None:
+        sys.stdout.write(output)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import math
+import time
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Protocol, TypeGuard, cast
@@ -18,16 +19,19 @@ from agora_analysis_worker_shared.generated_models import (
 )
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from agora_analysis_worker_shared.db import (
         OpinionGroupConfigRecord,
         OpinionGroupSpecRecord,
         OpinionGroupVariantRecord,
     )
-    from agora_analysis_worker_shared.input_snapshot import PreparedInputSnapshot, SnapshotVote
+    from agora_analysis_worker_shared.input_snapshot import SnapshotOpinion, VoteMatrixColumns
 
-JsonValue = None | bool | int | float | str | list["JsonValue"] | dict[str, "JsonValue"]
+type JsonValue = bool | int | float | str | list[JsonValue] | dict[str, JsonValue] | None
 JsonObject = dict[str, JsonValue]
 type _RepresentativeOpinionMatchKey = frozenset[tuple[int, VoteEnumSimple]]
+SILHOUETTE_BLOCK_ELEMENT_LIMIT = 1_000_000
 
 
 @dataclass(frozen=True)
@@ -110,6 +114,24 @@ class ComputedAnalysisBundle:
     snapshot_opinions: list[SnapshotOpinionMetrics]
 
 
+@dataclass(frozen=True)
+class RedDwarfWarmStart:
+    init_centers_by_group_count: dict[int, list[list[float]]]
+
+
+@dataclass
+class ComputeStageTimings:
+    red_dwarf_seconds: float = 0.0
+    silhouette_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class _VoteMatrixPrecheck:
+    vote_count: int
+    clusterable_participant_count: int
+    unique_vote_vector_count: int
+
+
 class RedDwarfContractError(RuntimeError):
     pass
 
@@ -135,6 +157,20 @@ _CONTRACT_HIDDEN_REASONS = {
 }
 
 
+class AnalysisComputeInput(Protocol):
+    @property
+    def conversation_id(self) -> int: ...
+
+    @property
+    def data_generation(self) -> int: ...
+
+    @property
+    def opinions(self) -> Sequence[SnapshotOpinion]: ...
+
+    @property
+    def vote_matrix(self) -> VoteMatrixColumns: ...
+
+
 class RedDwarfRunner(Protocol):
     def __call__(
         self,
@@ -144,25 +180,32 @@ class RedDwarfRunner(Protocol):
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> object: ...
 
 
 def compute_analysis_bundle(
     *,
-    snapshot: PreparedInputSnapshot,
+    snapshot: AnalysisComputeInput,
     config: OpinionGroupConfigRecord,
     run_red_dwarf_pipeline: RedDwarfRunner | None = None,
+    warm_start: RedDwarfWarmStart | None = None,
+    timings: ComputeStageTimings | None = None,
 ) -> ComputedAnalysisBundle:
     if not config.variants:
         msg = f"missing opinion-group variants for spec {config.spec.id}"
         raise ValueError(msg)
 
     red_dwarf_runner = run_red_dwarf_pipeline or _run_red_dwarf_pipeline
+    if timings is not None:
+        red_dwarf_runner = _timed_red_dwarf_runner(red_dwarf_runner, timings=timings)
     candidates = _compute_candidates(
         snapshot=snapshot,
         spec=config.spec,
         variants=config.variants,
         run_red_dwarf_pipeline=red_dwarf_runner,
+        warm_start=warm_start,
+        timings=timings,
     )
     candidates_with_assessments = [
         _candidate_with_assessment(candidate) for candidate in candidates
@@ -208,20 +251,55 @@ def compute_analysis_bundle(
     )
 
 
+def _timed_red_dwarf_runner(
+    run_red_dwarf_pipeline: RedDwarfRunner,
+    *,
+    timings: ComputeStageTimings,
+) -> RedDwarfRunner:
+    def timed_runner(
+        *,
+        votes: list[dict[str, int]],
+        min_user_vote_threshold: int,
+        max_group_count: int,
+        force_group_count: int | None = None,
+        candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
+    ) -> object:
+        started_at = time.perf_counter()
+        try:
+            return run_red_dwarf_pipeline(
+                votes=votes,
+                min_user_vote_threshold=min_user_vote_threshold,
+                max_group_count=max_group_count,
+                force_group_count=force_group_count,
+                candidate_group_counts=candidate_group_counts,
+                init_centers=init_centers,
+            )
+        finally:
+            timings.red_dwarf_seconds += time.perf_counter() - started_at
+
+    return timed_runner
+
+
 def _compute_candidates(
     *,
-    snapshot: PreparedInputSnapshot,
+    snapshot: AnalysisComputeInput,
     spec: OpinionGroupSpecRecord,
     variants: list[OpinionGroupVariantRecord],
     run_red_dwarf_pipeline: RedDwarfRunner,
+    warm_start: RedDwarfWarmStart | None,
+    timings: ComputeStageTimings | None,
 ) -> list[ComputedOpinionGroupCandidate]:
     prechecked_candidates: dict[int, ComputedOpinionGroupCandidate] = {}
     runnable_variants: list[OpinionGroupVariantRecord] = []
+    precheck = _precheck_vote_matrix(
+        snapshot=snapshot,
+        min_votes_per_participant=spec.min_votes_per_participant,
+    )
     for variant in variants:
         insufficient_reason = _get_insufficient_data_reason(
-            snapshot=snapshot,
+            precheck=precheck,
             min_clusterable_participants=spec.min_clusterable_participants,
-            min_votes_per_participant=spec.min_votes_per_participant,
             group_count=variant.group_count,
         )
         if insufficient_reason is None:
@@ -240,12 +318,14 @@ def _compute_candidates(
         spec=spec,
         variants=runnable_variants,
         run_red_dwarf_pipeline=run_red_dwarf_pipeline,
+        warm_start=warm_start,
     )
     computed_by_variant_id = {
         **prechecked_candidates,
         **_computed_candidates_from_red_dwarf_result(
             variants=runnable_variants,
             red_dwarf_result=red_dwarf_result,
+            timings=timings,
         ),
     }
     return [computed_by_variant_id[variant.id] for variant in variants]
@@ -253,24 +333,34 @@ def _compute_candidates(
 
 def _run_red_dwarf_for_variants(
     *,
-    snapshot: PreparedInputSnapshot,
+    snapshot: AnalysisComputeInput,
     spec: OpinionGroupSpecRecord,
     variants: list[OpinionGroupVariantRecord],
     run_red_dwarf_pipeline: RedDwarfRunner,
+    warm_start: RedDwarfWarmStart | None,
 ) -> object:
     candidate_group_counts = sorted({variant.group_count for variant in variants})
+    # Red-dwarf takes one list of initial centers and truncates it for smaller k, so the
+    # largest requested group count seeds every candidate.
+    init_centers = (
+        None
+        if warm_start is None
+        else warm_start.init_centers_by_group_count.get(candidate_group_counts[-1])
+    )
     if len(candidate_group_counts) == 1:
         return run_red_dwarf_pipeline(
-            votes=_to_red_dwarf_votes(snapshot.votes),
+            votes=_to_red_dwarf_votes(snapshot.vote_matrix),
             min_user_vote_threshold=spec.min_votes_per_participant,
             max_group_count=spec.max_group_count,
             force_group_count=candidate_group_counts[0],
+            init_centers=init_centers,
         )
     result = run_red_dwarf_pipeline(
-        votes=_to_red_dwarf_votes(snapshot.votes),
+        votes=_to_red_dwarf_votes(snapshot.vote_matrix),
         min_user_vote_threshold=spec.min_votes_per_participant,
         max_group_count=spec.max_group_count,
         candidate_group_counts=candidate_group_counts,
+        init_centers=init_centers,
     )
     return result
 
@@ -279,6 +369,7 @@ def _computed_candidates_from_red_dwarf_result(
     *,
     variants: list[OpinionGroupVariantRecord],
     red_dwarf_result: object,
+    timings: ComputeStageTimings | None,
 ) -> dict[int, ComputedOpinionGroupCandidate]:
     outcome = _get_red_dwarf_outcome(red_dwarf_result)
     if outcome == AnalysisResultOutcomeEnum.insufficient_data.value:
@@ -301,6 +392,7 @@ def _computed_candidates_from_red_dwarf_result(
             variant.id: _success_or_hidden_candidate_from_red_dwarf_result(
                 variant=variant,
                 result=result,
+                timings=timings,
             )
             for variant in variants
         }
@@ -346,6 +438,7 @@ def _computed_candidates_from_red_dwarf_result(
         computed[variant.id] = _candidate_from_red_dwarf_candidate_result(
             variant=variant,
             candidate_result=candidate_result,
+            timings=timings,
         )
     return computed
 
@@ -354,6 +447,7 @@ def _candidate_from_red_dwarf_candidate_result(
     *,
     variant: OpinionGroupVariantRecord,
     candidate_result: object,
+    timings: ComputeStageTimings | None,
 ) -> ComputedOpinionGroupCandidate:
     try:
         outcome = _get_red_dwarf_outcome(candidate_result)
@@ -389,6 +483,7 @@ def _candidate_from_red_dwarf_candidate_result(
     return _success_or_hidden_candidate_from_red_dwarf_result(
         variant=variant,
         result=_get_attr(candidate_result, "result"),
+        timings=timings,
     )
 
 
@@ -396,11 +491,13 @@ def _success_or_hidden_candidate_from_red_dwarf_result(
     *,
     variant: OpinionGroupVariantRecord,
     result: object,
+    timings: ComputeStageTimings | None,
 ) -> ComputedOpinionGroupCandidate:
     try:
         return _success_candidate_from_red_dwarf_result(
             variant=variant,
             result=result,
+            timings=timings,
         )
     except _HiddenCandidateOutputError as error:
         return _hidden_success_candidate(
@@ -422,6 +519,7 @@ def _success_candidate_from_red_dwarf_result(
     *,
     variant: OpinionGroupVariantRecord,
     result: object,
+    timings: ComputeStageTimings | None,
 ) -> ComputedOpinionGroupCandidate:
     participants_df = _get_dataframe_attr(result, "participants_df")
     statements_df = _get_dataframe_attr(result, "statements_df")
@@ -434,7 +532,10 @@ def _success_candidate_from_red_dwarf_result(
         group_comment_stats=group_comment_stats,
         repness=repness,
     )
+    silhouette_started_at = time.perf_counter()
     silhouette = _calculate_silhouette_score(participants_df)
+    if timings is not None:
+        timings.silhouette_seconds += time.perf_counter() - silhouette_started_at
     duplicate_representative_opinion_detail = _duplicate_representative_opinion_detail(groups)
     coefficient_of_variation = _calculate_coefficient_of_variation(groups)
     balance_score = _calculate_balance_score(coefficient_of_variation)
@@ -536,6 +637,7 @@ def _run_red_dwarf_pipeline(
     max_group_count: int,
     force_group_count: int | None = None,
     candidate_group_counts: list[int] | None = None,
+    init_centers: list[list[float]] | None = None,
 ) -> object:
     return run_pipeline(
         votes=votes,
@@ -543,10 +645,51 @@ def _run_red_dwarf_pipeline(
         max_group_count=max_group_count,
         force_group_count=force_group_count,
         candidate_group_counts=candidate_group_counts,
+        init_centers=init_centers,
         random_state=0,
     )
 
 
+def red_dwarf_warm_start_from_bundle(bundle: ComputedAnalysisBundle) -> RedDwarfWarmStart | None:
+    init_centers_by_group_count: dict[int, list[list[float]]] = {}
+    for candidate in bundle.candidates:
+        if not _is_visible_success_candidate(candidate):
+            continue
+        init_centers = _group_centers_from_raw_output(candidate)
+        if init_centers is not None:
+            init_centers_by_group_count[candidate.group_count] = init_centers
+    if not init_centers_by_group_count:
+        return None
+    return RedDwarfWarmStart(init_centers_by_group_count=init_centers_by_group_count)
+
+
+def _group_centers_from_raw_output(
+    candidate: ComputedOpinionGroupCandidate,
+) -> list[list[float]] | None:
+    if not isinstance(candidate.raw_output, dict):
+        return None
+    coordinates_by_participant_index: dict[int, tuple[float, float]] = {}
+    for record in _record_dicts_from_list(candidate.raw_output.get("participants_df")):
+        participant_index = _optional_int(record.get("participant_id"))
+        x = _optional_float(record.get("x"))
+        y = _optional_float(record.get("y"))
+        if participant_index is None or x is None or y is None:
+            continue
+        coordinates_by_participant_index[participant_index] = (x, y)
+
+    init_centers: list[list[float]] = []
+    for group in sorted(candidate.groups, key=lambda item: item.external_id):
+        coordinates = [
+            coordinates_by_participant_index[participant_index]
+            for participant_index in group.local_participant_indexes
+            if participant_index in coordinates_by_participant_index
+        ]
+        if not coordinates:
+            return None
+        init_centers.append(np.mean(np.array(coordinates), axis=0).tolist())
+    return init_centers
+
+
 def _get_red_dwarf_outcome(value: object) -> str:
     outcome = _get_attr(value, "outcome")
     if isinstance(outcome, str):
@@ -572,63 +715,87 @@ def _get_red_dwarf_insufficient_reason(
         return AnalysisInsufficientDataReasonEnum.other, reason_value
 
 
-def _to_red_dwarf_votes(votes: list[SnapshotVote]) -> list[dict[str, int]]:
+def _to_red_dwarf_votes(vote_matrix: VoteMatrixColumns) -> list[dict[str, int]]:
     return [
         {
-            "participant_id": vote.local_participant_index,
-            "statement_id": vote.local_opinion_index,
-            "vote": vote.vote,
+            "participant_id": participant_index,
+            "statement_id": opinion_index,
+            "vote": vote,
         }
-        for vote in votes
+        for participant_index, opinion_index, vote in zip(
+            vote_matrix.participant_indexes.tolist(),
+            vote_matrix.opinion_indexes.tolist(),
+            vote_matrix.votes.tolist(),
+            strict=True,
+        )
     ]
 
 
+def _precheck_vote_matrix(
+    *,
+    snapshot: AnalysisComputeInput,
+    min_votes_per_participant: int,
+) -> _VoteMatrixPrecheck:
+    vote_matrix = snapshot.vote_matrix
+    participant_indexes, vote_counts = np.unique(
+        vote_matrix.participant_indexes,
+        return_counts=True,
+    )
+    clusterable_participant_indexes = participant_indexes[vote_counts >= min_votes_per_participant]
+    return _VoteMatrixPrecheck(
+        vote_count=len(vote_matrix),
+        clusterable_participant_count=len(clusterable_participant_indexes),
+        unique_vote_vector_count=_count_unique_vote_vectors(
+            vote_matrix=vote_matrix,
+            participant_indexes=clusterable_participant_indexes,
+        ),
+    )
+
+
 def _get_insufficient_data_reason(
     *,
-    snapshot: PreparedInputSnapshot,
+    precheck: _VoteMatrixPrecheck,
     min_clusterable_participants: int,
-    min_votes_per_participant: int,
     group_count: int,
 ) -> AnalysisInsufficientDataReasonEnum | None:
-    if not snapshot.votes:
+    if precheck.vote_count == 0:
         return AnalysisInsufficientDataReasonEnum.empty_vote_matrix
-
-    vote_count_by_participant: dict[int, int] = {}
-    vote_by_participant_opinion: dict[tuple[int, int], int] = {}
-    for vote in snapshot.votes:
-        vote_count_by_participant[vote.local_participant_index] = (
-            vote_count_by_participant.get(vote.local_participant_index, 0) + 1
-        )
-        vote_by_participant_opinion[(vote.local_participant_index, vote.local_opinion_index)] = (
-            vote.vote
-        )
-
-    clusterable_participant_indexes = sorted(
-        participant_index
-        for participant_index, vote_count in vote_count_by_participant.items()
-        if vote_count >= min_votes_per_participant
-    )
-    if len(clusterable_participant_indexes) < max(2, min_clusterable_participants):
+    if precheck.clusterable_participant_count < max(2, min_clusterable_participants):
         return AnalysisInsufficientDataReasonEnum.not_enough_clusterable_participants
-    if len(clusterable_participant_indexes) < group_count:
+    if precheck.clusterable_participant_count < group_count:
         return AnalysisInsufficientDataReasonEnum.not_enough_samples_for_group_count
-
-    unique_vote_vectors = {
-        tuple(
-            vote_by_participant_opinion.get(
-                (participant_index, opinion.local_opinion_index),
-                0,
-            )
-            for opinion in snapshot.opinions
-        )
-        for participant_index in clusterable_participant_indexes
-    }
-    if len(unique_vote_vectors) < 2:
+    if precheck.unique_vote_vector_count < 2:
         return AnalysisInsufficientDataReasonEnum.not_enough_unique_points
-
     return None
 
 
+def _mix_vote_codes(vote_codes: NDArray[np.uint64]) -> NDArray[np.uint64]:
+    mixed = vote_codes + np.uint64(0x9E3779B97F4A7C15)
+    mixed = (mixed ^ (mixed >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    mixed = (mixed ^ (mixed >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return mixed ^ (mixed >> np.uint64(31))
+
+
+def _count_unique_vote_vectors(
+    *,
+    vote_matrix: VoteMatrixColumns,
+    participant_indexes: NDArray[np.int32],
+) -> int:
+    if len(participant_indexes) == 0:
+        return 0
+    row_positions = np.searchsorted(participant_indexes, vote_matrix.participant_indexes)
+    clamped_row_positions = np.minimum(row_positions, len(participant_indexes) - 1)
+    cast_votes = (participant_indexes[clamped_row_positions] == vote_matrix.participant_indexes) & (
+        vote_matrix.votes != 0
+    )
+    vote_codes = vote_matrix.opinion_indexes[cast_votes].astype(np.uint64) * np.uint64(2) + (
+        vote_matrix.votes[cast_votes] > 0
+    ).astype(np.uint64)
+    row_hashes = np.zeros(len(participant_indexes), dtype=np.uint64)
+    np.add.at(row_hashes, row_positions[cast_votes], _mix_vote_codes(vote_codes))
+    return len(np.unique(row_hashes))
+
+
 def _get_attr(value: object, attr_name: str) -> object:
     if not hasattr(value, attr_name):
         msg = f"red-dwarf result missing {attr_name}"
@@ -861,40 +1028,36 @@ def _calculate_silhouette_score(participants_df: pd.DataFrame) -> float | None:
         return -1.0
 
     coords = clusterable_df.loc[:, ["x", "y"]].to_numpy(dtype=float)
-    sample_scores: list[float] = []
-    for index, label in enumerate(labels):
-        same_cluster_indexes = np.flatnonzero(labels == label)
-        other_cluster_scores: list[float] = []
-
-        same_cluster_distances = [
-            float(np.linalg.norm(coords[index] - coords[other_index]))
-            for other_index in same_cluster_indexes
-            if other_index != index
-        ]
-        if not same_cluster_distances:
-            return -1.0
-        same_cluster_mean = sum(same_cluster_distances) / len(same_cluster_distances)
-
-        for other_label in unique_labels:
-            if other_label == label:
-                continue
-            other_cluster_indexes = np.flatnonzero(labels == other_label)
-            distances = [
-                float(np.linalg.norm(coords[index] - coords[other_index]))
-                for other_index in other_cluster_indexes
-            ]
-            if distances:
-                other_cluster_scores.append(sum(distances) / len(distances))
-
-        nearest_other_cluster_mean = min(other_cluster_scores)
-        denominator = max(same_cluster_mean, nearest_other_cluster_mean)
-        sample_scores.append(
-            0.0
-            if denominator == 0
-            else (nearest_other_cluster_mean - same_cluster_mean) / denominator
+    label_indexes = np.searchsorted(unique_labels, labels)
+    label_membership = np.zeros((len(labels), len(unique_labels)))
+    label_membership[np.arange(len(labels)), label_indexes] = 1.0
+    block_size = max(1, SILHOUETTE_BLOCK_ELEMENT_LIMIT // len(labels))
+
+    sample_scores = np.empty(len(labels))
+    for block_start in range(0, len(labels), block_size):
+        block_end = min(block_start + block_size, len(labels))
+        x_offsets = coords[block_start:block_end, 0, np.newaxis] - coords[np.newaxis, :, 0]
+        y_offsets = coords[block_start:block_end, 1, np.newaxis] - coords[np.newaxis, :, 1]
+        distances = np.sqrt(x_offsets * x_offsets + y_offsets * y_offsets)
+        mean_distances = (distances @ label_membership) / counts
+        block_rows = np.arange(block_end - block_start)
+        block_label_indexes = label_indexes[block_start:block_end]
+        same_cluster_means = (
+            mean_distances[block_rows, block_label_indexes]
+            * counts[block_label_indexes]
+            / (counts[block_label_indexes] - 1)
+        )
+        mean_distances[block_rows, block_label_indexes] = np.inf
+        nearest_other_cluster_means = mean_distances.min(axis=1)
+        denominators = np.maximum(same_cluster_means, nearest_other_cluster_means)
+        sample_scores[block_start:block_end] = np.divide(
+            nearest_other_cluster_means - same_cluster_means,
+            denominators,
+            out=np.zeros(len(block_rows)),
+            where=denominators != 0,
         )
 
-    return sum(sample_scores) / len(sample_scores)
+    return float(sample_scores.mean())
 
 
 def _group_size_bounds(groups: list[ComputedOpinionGroup]) -> tuple[int, int]:
@@ -1146,18 +1309,21 @@ def _consensus_by_local_opinion_index(
 
 def _compute_snapshot_opinion_metrics(
     *,
-    snapshot: PreparedInputSnapshot,
+    snapshot: AnalysisComputeInput,
     routing_priority_candidate: ComputedOpinionGroupCandidate | None,
 ) -> list[SnapshotOpinionMetrics]:
-    vote_counts_by_opinion = {
-        opinion.local_opinion_index: {1: 0, -1: 0, 0: 0} for opinion in snapshot.opinions
-    }
-    for vote in snapshot.votes:
-        counts = vote_counts_by_opinion.setdefault(
-            vote.local_opinion_index,
-            {1: 0, -1: 0, 0: 0},
-        )
-        counts[vote.vote] = counts.get(vote.vote, 0) + 1
+    vote_matrix = snapshot.vote_matrix
+    opinion_slot_count = max(
+        [opinion.local_opinion_index + 1 for opinion in snapshot.opinions],
+        default=0,
+    )
+    agree_counts, disagree_counts, pass_counts = (
+        np.bincount(
+            vote_matrix.opinion_indexes[vote_matrix.votes == vote],
+            minlength=opinion_slot_count,
+        ).tolist()
+        for vote in (1, -1, 0)
+    )
 
     routing_priority_by_opinion = (
         {
@@ -1170,13 +1336,12 @@ def _compute_snapshot_opinion_metrics(
 
     snapshot_opinions: list[SnapshotOpinionMetrics] = []
     for opinion in snapshot.opinions:
-        counts = vote_counts_by_opinion[opinion.local_opinion_index]
         snapshot_opinions.append(
             SnapshotOpinionMetrics(
                 local_opinion_index=opinion.local_opinion_index,
-                num_agrees=counts.get(1, 0),
-                num_disagrees=counts.get(-1, 0),
-                num_passes=counts.get(0, 0),
+                num_agrees=agree_counts[opinion.local_opinion_index],
+                num_disagrees=disagree_counts[opinion.local_opinion_index],
+                num_passes=pass_counts[opinion.local_opinion_index],
                 routing_priority=routing_priority_by_opinion.get(opinion.local_opinion_index),
             )
         )
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from agora_analysis_worker_shared.analysis_compute import (
+    ComputedAnalysisBundle,
+    RedDwarfContractError,
+    compute_analysis_bundle,
+)
+from agora_analysis_worker_shared.input_snapshot import SnapshotOpinion, VoteMatrixColumns
+
+if TYPE_CHECKING:
+    from agora_analysis_worker_shared.analysis_compute import (
+        AnalysisComputeInput,
+        RedDwarfRunner,
+        RedDwarfWarmStart,
+    )
+    from agora_analysis_worker_shared.config import ComputeEngine
+    from agora_analysis_worker_shared.db import OpinionGroupConfigRecord
+
+log = logging.getLogger(__name__)
+
+
+class AnalysisComputeWorkerError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class CompactComputeInput:
+    conversation_id: int
+    data_generation: int
+    opinion_columns: bytes
+    vote_matrix: VoteMatrixColumns
+
+
+@dataclass(frozen=True)
+class _ComputeVoteMatrix:
+    conversation_id: int
+    data_generation: int
+    opinions: list[SnapshotOpinion]
+    vote_matrix: VoteMatrixColumns
+
+
+@dataclass(frozen=True)
+class _ComputeFailure:
+    non_retryable: bool
+    error_type: str
+    message: str
+    remote_traceback: str
+
+
+def compact_compute_input(snapshot: AnalysisComputeInput) -> CompactComputeInput:
+    opinion_columns = np.array(
+        [
+            (opinion.opinion_id, opinion.opinion_content_id, opinion.local_opinion_index)
+            for opinion in snapshot.opinions
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 3)
+    return CompactComputeInput(
+        conversation_id=snapshot.conversation_id,
+        data_generation=snapshot.data_generation,
+        opinion_columns=opinion_columns.tobytes(),
+        vote_matrix=snapshot.vote_matrix,
+    )
+
+
+def expand_compute_input(compact: CompactComputeInput) -> _ComputeVoteMatrix:
+    opinion_columns = np.frombuffer(compact.opinion_columns, dtype=np.int64).reshape(-1, 3)
+    return _ComputeVoteMatrix(
+        conversation_id=compact.conversation_id,
+        data_generation=compact.data_generation,
+        opinions=[
+            SnapshotOpinion(
+                opinion_id=opinion_id,
+                opinion_content_id=opinion_content_id,
+                local_opinion_index=local_opinion_index,
+            )
+            for opinion_id, opinion_content_id, local_opinion_index in opinion_columns.tolist()
+        ],
+        vote_matrix=compact.vote_matrix,
+    )
+
+
+def _initialize_compute_process() -> None:
+    # Importing this module in the child already loads red-dwarf, pandas and sklearn;
+    # touching the pipeline here keeps that cost out of the first claimed conversation.
+    from reddwarf.implementations.polis import run_pipeline
+
+    _ = run_pipeline
+
+
+def _compute_compact_bundle(
+    compact: CompactComputeInput,
+    config: OpinionGroupConfigRecord,
+    run_red_dwarf_pipeline: RedDwarfRunner | None,
+    warm_start: RedDwarfWarmStart | None,
+) -> ComputedAnalysisBundle | _ComputeFailure:
+    try:
+        return compute_analysis_bundle(
+            snapshot=expand_compute_input(compact),
+            config=config,
+            run_red_dwarf_pipeline=run_red_dwarf_pipeline,
+            warm_start=warm_start,
+        )
+    except RedDwarfContractError as error:
+        return _compute_failure(error, non_retryable=True)
+    except Exception as error:
+        return _compute_failure(error, non_retryable=False)
+
+
+def _compute_failure(error: Exception, *, non_retryable: bool) -> _ComputeFailure:
+    return _ComputeFailure(
+        non_retryable=non_retryable,
+        error_type=type(error).__name__,
+        message=str(error),
+        remote_traceback="".join(traceback.format_exception(error)),
+    )
+
+
+def _error_from_compute_failure(failure: _ComputeFailure) -> Exception:
+    message = f"{failure.message}\n\nRemote traceback:\n{failure.remote_traceback}"
+    if failure.non_retryable:
+        return RedDwarfContractError(message)
+    return AnalysisComputeWorkerError(f"{failure.error_type}: {message}")
+
+
+class AnalysisComputePool:
+    def __init__(
+        self,
+        *,
+        engine: ComputeEngine,
+        max_workers: int,
+        run_red_dwarf_pipeline: RedDwarfRunner | None = None,
+    ) -> None:
+        self.engine: ComputeEngine = engine
+        self.max_workers = max_workers
+        self._run_red_dwarf_pipeline = run_red_dwarf_pipeline
+        self._lock = Lock()
+        self._thread_executor: ThreadPoolExecutor | None = None
+        self._process_executor: ProcessPoolExecutor | None = None
+        if engine == "thread":
+            self._thread_executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="analysis-compute",
+            )
+        else:
+            self._process_executor = self._start_process_executor()
+
+    def _start_process_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_compute_process,
+        )
+
+    def submit(
+        self,
+        *,
+        snapshot: AnalysisComputeInput,
+        config: OpinionGroupConfigRecord,
+        warm_start: RedDwarfWarmStart | None = None,
+    ) -> Future[ComputedAnalysisBundle]:
+        if self._thread_executor is not None:
+            return self._thread_executor.submit(
+                compute_analysis_bundle,
+                snapshot=snapshot,
+                config=config,
+                run_red_dwarf_pipeline=self._run_red_dwarf_pipeline,
+                warm_start=warm_start,
+            )
+
+        compact = compact_compute_input(snapshot)
+        bundle_future: Future[ComputedAnalysisBundle] = Future()
+        with self._lock:
+            executor = self._process_executor
+            if executor is None:
+                executor = self._start_process_executor()
+                self._process_executor = executor
+            try:
+                remote_future = self._submit_remote(
+                    executor,
+                    compact=compact,
+                    config=config,
+                    warm_start=warm_start,
+                )
+            except BrokenProcessPool:
+                log.warning("[AnalysisComputePool] Replacing broken compute process pool")
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = self._start_process_executor()
+                self._process_executor = executor
+                remote_future = self._submit_remote(
+                    executor,
+                    compact=compact,
+                    config=config,
+                    warm_start=warm_start,
+                )
+
+        def resolve(done: Future[ComputedAnalysisBundle | _ComputeFailure]) -> None:
+            error = done.exception()
+            if error is not None:
+                bundle_future.set_exception(error)
+                return
+            outcome = done.result()
+            if isinstance(outcome, _ComputeFailure):
+                bundle_future.set_exception(_error_from_compute_failure(outcome))
+                return
+            bundle_future.set_result(outcome)
+
+        remote_future.add_done_callback(resolve)
+        return bundle_future
+
+    def _submit_remote(
+        self,
+        executor: ProcessPoolExecutor,
+        *,
+        compact: CompactComputeInput,
+        config: OpinionGroupConfigRecord,
+        warm_start: RedDwarfWarmStart | None,
+    ) -> Future[ComputedAnalysisBundle | _ComputeFailure]:
+        return executor.submit(
+            _compute_compact_bundle,
+            compact,
+            config,
+            self._run_red_dwarf_pipeline,
+            warm_start,
+        )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._thread_executor is not None:
+                self._thread_executor.shutdown(wait=True)
+                self._thread_executor = None
+            if self._process_executor is not None:
+                self._process_executor.shutdown(wait=True, cancel_futures=True)
+                self._process_executor = None
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, cast
+
+from pydantic import TypeAdapter, ValidationError
+
+from agora_analysis_worker_shared.analysis_compute import (
+    ComputedAnalysisBundle,
+    RedDwarfWarmStart,
+    red_dwarf_warm_start_from_bundle,
+)
+from agora_analysis_worker_shared.input_snapshot import canonical_json_bytes
+
+if TYPE_CHECKING:
+    from valkey import Valkey
+
+    from agora_analysis_worker_shared.db import OpinionGroupConfigRecord
+
+log = logging.getLogger(__name__)
+
+ANALYSIS_RESULT_CACHE_KEY_PREFIX = "analysis:result:"
+COMPUTED_ANALYSIS_BUNDLE_ADAPTER = TypeAdapter(ComputedAnalysisBundle)
+
+
+def analysis_result_cache_key(
+    *,
+    input_hash: str,
+    config: OpinionGroupConfigRecord,
+    analysis_engine_epoch: int,
+) -> str:
+    return hashlib.sha256(
+        canonical_json_bytes(
+            {
+                "input_hash": input_hash,
+                "analysis_engine_epoch": analysis_engine_epoch,
+                "spec": {
+                    "id": config.spec.id,
+                    "min_clusterable_participants": config.spec.min_clusterable_participants,
+                    "min_votes_per_participant": config.spec.min_votes_per_participant,
+                    "max_group_count": config.spec.max_group_count,
+                },
+                "variants": sorted(
+                    [variant.id, variant.group_count] for variant in config.variants
+                ),
+            }
+        )
+    ).hexdigest()
+
+
+class AnalysisResultCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        vk: Valkey | None = None,
+        shared_ttl_seconds: int = 0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self._vk = vk if shared_ttl_seconds > 0 else None
+        self._bundles: OrderedDict[str, ComputedAnalysisBundle] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._bundles)
+
+    def get(self, key: str) -> ComputedAnalysisBundle | None:
+        bundle = self._bundles.get(key)
+        if bundle is not None:
+            self._bundles.move_to_end(key)
+            return bundle
+        if self._vk is None:
+            return None
+        try:
+            raw_bundle = cast("str | bytes | None", self._vk.get(_shared_key(key)))
+        except Exception as error:
+            log.warning("[AnalysisResultCache] Shared result lookup failed: %s", error)
+            return None
+        if raw_bundle is None:
+            return None
+        try:
+            bundle = COMPUTED_ANALYSIS_BUNDLE_ADAPTER.validate_json(raw_bundle)
+        except ValidationError:
+            log.warning("[AnalysisResultCache] Ignoring undecodable shared result key=%s", key)
+            return None
+        self._remember(key, bundle)
+        return bundle
+
+    def put(self, key: str, bundle: ComputedAnalysisBundle) -> None:
+        self._remember(key, bundle)
+        if self._vk is None:
+            return
+        try:
+            self._vk.set(
+                _shared_key(key),
+                COMPUTED_ANALYSIS_BUNDLE_ADAPTER.dump_json(bundle).decode(),
+                ex=self.shared_ttl_seconds,
+            )
+        except Exception as error:
+            log.warning("[AnalysisResultCache] Shared result store failed: %s", error)
+
+    def _remember(self, key: str, bundle: ComputedAnalysisBundle) -> None:
+        if self.max_entries <= 0:
+            return
+        self._bundles[key] = bundle
+        self._bundles.move_to_end(key)
+        while len(self._bundles) > self.max_entries:
+            self._bundles.popitem(last=False)
+
+
+class RedDwarfWarmStartCache:
+    def __init__(self, *, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._warm_starts: OrderedDict[tuple[int, int], RedDwarfWarmStart] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._warm_starts)
+
+    def get(self, *, conversation_id: int, opinion_group_spec_id: int) -> RedDwarfWarmStart | None:
+        key = (conversation_id, opinion_group_spec_id)
+        warm_start = self._warm_starts.get(key)
+        if warm_start is not None:
+            self._warm_starts.move_to_end(key)
+        return warm_start
+
+    def remember(
+        self,
+        *,
+        opinion_group_spec_id: int,
+        bundle: ComputedAnalysisBundle,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        key = (bundle.conversation_id, opinion_group_spec_id)
+        warm_start = red_dwarf_warm_start_from_bundle(bundle)
+        if warm_start is None:
+            self._warm_starts.pop(key, None)
+            return
+        self._warm_starts[key] = warm_start
+        self._warm_starts.move_to_end(key)
+        while len(self._warm_starts) > self.max_entries:
+            self._warm_starts.popitem(last=False)
+
+
+def _shared_key(key: str) -> str:
+    return f"{ANALYSIS_RESULT_CACHE_KEY_PREFIX}{key}"
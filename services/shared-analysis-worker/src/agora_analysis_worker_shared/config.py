@@ -19,6 +19,7 @@ log = logging.getLogger(__name__)
 ALLOWED_VALKEY_SCHEMES = {"valkey", "valkeys", "redis", "rediss"}
 MATH_UPDATER_ENV_PREFIX = "MATH_UPDATER_"
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+ComputeEngine = Literal["thread", "process"]
 SimulationMode = Literal[
     "off",
     "success",
@@ -195,6 +196,11 @@ class Settings(BaseSettings):
     db_claim_batch_size: int = Field(default=8, ge=1)
     db_write_batch_size: int = Field(default=10, ge=1)
     max_compute_concurrency: int = Field(default=4, ge=1)
+    compute_engine: ComputeEngine = "thread"
+    input_snapshot_cache_size: int = Field(default=64, ge=0)
+    analysis_result_cache_size: int = Field(default=32, ge=0)
+    analysis_result_shared_cache_ttl_seconds: int = Field(default=0, ge=0)
+    red_dwarf_warm_start_cache_size: int = Field(default=0, ge=0)
     max_ai_description_concurrency: int = Field(default=4, ge=1)
     lease_ttl_seconds: int = Field(default=45, ge=1)
     heartbeat_interval_seconds: int = Field(default=15, ge=1)
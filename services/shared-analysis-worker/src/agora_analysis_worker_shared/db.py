@@ -3,10 +3,12 @@ from __future__ import annotations
 import logging
 import uuid
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Literal, TypedDict
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
+from psycopg import sql as psycopg_sql
 from pydantic import TypeAdapter, ValidationError
 from sqlalchemy import and_, case, func, or_, select, tuple_, update
 from sqlalchemy import insert as sqlalchemy_insert
@@ -67,7 +69,15 @@ from agora_analysis_worker_shared.generated_models import (
 from agora_analysis_worker_shared.generated_models import (
     PremiumFeature as PremiumFeatureEnum,
 )
-from agora_analysis_worker_shared.input_snapshot import PreparedInputSnapshot, VoteInputRow
+from agora_analysis_worker_shared.input_snapshot import (
+    IncrementalSnapshotBase,
+    PreparedInputSnapshot,
+    VoteInputColumns,
+    VoteInputColumnsBuilder,
+    VoteInputDelta,
+    VoteInputRow,
+    apply_vote_input_delta,
+)
 from agora_analysis_worker_shared.lineage_matching import (
     NewLineageGroup,
     PreviousLineageGroup,
@@ -93,6 +103,48 @@ PREMIUM_ANALYSIS_FEATURE = PremiumFeatureEnum.analysis_variants
 VOTE_MILESTONE_SEEDS: tuple[int, ...] = ()
 MILESTONE_MULTIPLIERS = ((1, 1), (25, 10), (5, 1))
 POSTGRES_INSERT_BIND_PARAM_LIMIT = 60_000
+VOTE_INPUT_FETCH_YIELD_PER = 10_000
+# Column order and binary COPY type of each table persisted with bulk_insert_rows
+BULK_COPY_COLUMNS_BY_TABLE: dict[str, tuple[tuple[str, str], ...]] = {
+    "analysis_snapshot_opinion": (
+        ("analysis_snapshot_id", "int4"),
+        ("opinion_id", "int4"),
+        ("opinion_content_id", "int4"),
+        ("local_opinion_index", "int4"),
+        ("num_agrees", "int4"),
+        ("num_disagrees", "int4"),
+        ("num_passes", "int4"),
+        ("routing_priority", "float4"),
+    ),
+    "opinion_group_candidate_opinion_metrics": (
+        ("candidate_id", "int4"),
+        ("analysis_snapshot_opinion_id", "int4"),
+        ("group_aware_consensus_agree", "float4"),
+        ("group_aware_consensus_disagree", "float4"),
+        ("divisiveness", "float4"),
+        ("majority_type", "text"),
+        ("majority_probability_success", "float4"),
+        ("agreement_rank", "int4"),
+        ("disagreement_rank", "int4"),
+        ("divisiveness_rank", "int4"),
+    ),
+    "opinion_group_user": (
+        ("candidate_id", "int4"),
+        ("group_id", "int4"),
+        ("user_id", "uuid"),
+    ),
+    "opinion_group_opinion_stats": (
+        ("group_id", "int4"),
+        ("analysis_snapshot_opinion_id", "int4"),
+        ("num_agrees", "int4"),
+        ("num_disagrees", "int4"),
+        ("num_passes", "int4"),
+        ("representative_agreement_type", "text"),
+        ("representative_probability_agreement", "float4"),
+        ("representative_number_agreement", "int4"),
+        ("raw_repness", "jsonb"),
+    ),
+}
 log = logging.getLogger(__name__)
 type _LineageDecisionAction = Literal["reuse", "create"]
 type _LineageDecisionReason = Literal[
@@ -102,18 +154,23 @@ type _LineageDecisionReason = Literal[
 ]
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
 
-    from sqlalchemy import Engine
+    import psycopg
+    from sqlalchemy import Engine, Row, Select
     from sqlalchemy.sql.elements import ColumnElement
 
     from agora_analysis_worker_shared.analysis_compute import (
+        CandidateOpinionMetrics,
         ComputedAnalysisBundle,
         ComputedGroupOpinionStats,
         ComputedOpinionGroup,
         ComputedOpinionGroupCandidate,
         JsonObject,
+        SnapshotOpinionMetrics,
     )
+    from agora_analysis_worker_shared.generated_models import Base
+    from agora_analysis_worker_shared.input_snapshot import SnapshotOpinion
 
 
 @dataclass(frozen=True)
@@ -131,7 +188,10 @@ class ClaimedWorkItem:
 @dataclass(frozen=True)
 class ClaimedInputBatch:
     claims: list[ClaimedWorkItem]
-    rows_by_conversation_id: dict[int, list[VoteInputRow]]
+    vote_columns_by_conversation_id: dict[int, VoteInputColumns]
+    incremental_bases_by_conversation_id: dict[int, IncrementalSnapshotBase] = field(
+        default_factory=dict
+    )
 
 
 @dataclass(frozen=True)
@@ -222,6 +282,54 @@ def _iter_chunks[T](values: list[T], *, chunk_size: int) -> Iterator[list[T]]:
         yield values[start : start + chunk_size]
 
 
+def bulk_insert_rows(
+    session: Session,
+    *,
+    model: type[Base],
+    values: Sequence[Mapping[str, object]],
+) -> str:
+    columns = BULK_COPY_COLUMNS_BY_TABLE.get(model.__tablename__)
+    if columns is None:
+        msg = f"no bulk COPY columns for table {model.__tablename__}"
+        raise ValueError(msg)
+    if session.get_bind().dialect.name == "postgresql":
+        _copy_rows(session, table_name=model.__tablename__, columns=columns, values=values)
+        return "copy"
+    chunk_size = _max_rows_per_insert(column_count=len(columns))
+    for chunk in _iter_chunks(list(values), chunk_size=chunk_size):
+        session.execute(sqlalchemy_insert(model).values([dict(value) for value in chunk]))
+    return "insert"
+
+
+def _copy_rows(
+    session: Session,
+    *,
+    table_name: str,
+    columns: tuple[tuple[str, str], ...],
+    values: Iterable[Mapping[str, object]],
+) -> None:
+    driver_connection = cast(
+        "psycopg.Connection[Any]",
+        session.connection().connection.driver_connection,
+    )
+    column_names = [column_name for column_name, _copy_type in columns]
+    statement = psycopg_sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(
+        psycopg_sql.Identifier(table_name),
+        psycopg_sql.SQL(", ").join(psycopg_sql.Identifier(name) for name in column_names),
+    )
+    with driver_connection.cursor() as cursor, cursor.copy(statement) as copy:
+        copy.set_types([copy_type for _column_name, copy_type in columns])
+        for value in values:
+            copy.write_row([_copy_value(value[column_name]) for column_name in column_names])
+
+
+def _copy_value(value: object) -> object:
+    # Enum columns are sent as their text label, which is also their binary wire format.
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
 def _checkpoint_reason_insert_value(
     *,
     conversation_view_snapshot_id: int,
@@ -367,7 +475,45 @@ def _invalid_representative_group_opinion_stat_count(
     return invalid_count
 
 
-def _group_opinion_stats_insert_value(
+def snapshot_opinion_insert_value(
+    *,
+    analysis_snapshot_id: int,
+    opinion: SnapshotOpinion,
+    metrics: SnapshotOpinionMetrics,
+) -> dict[str, object]:
+    return {
+        "analysis_snapshot_id": analysis_snapshot_id,
+        "opinion_id": opinion.opinion_id,
+        "opinion_content_id": opinion.opinion_content_id,
+        "local_opinion_index": metrics.local_opinion_index,
+        "num_agrees": metrics.num_agrees,
+        "num_disagrees": metrics.num_disagrees,
+        "num_passes": metrics.num_passes,
+        "routing_priority": metrics.routing_priority,
+    }
+
+
+def candidate_opinion_metrics_insert_value(
+    *,
+    candidate_id: int,
+    analysis_snapshot_opinion_id: int,
+    metric: CandidateOpinionMetrics,
+) -> dict[str, object]:
+    return {
+        "candidate_id": candidate_id,
+        "analysis_snapshot_opinion_id": analysis_snapshot_opinion_id,
+        "group_aware_consensus_agree": metric.group_aware_consensus_agree,
+        "group_aware_consensus_disagree": metric.group_aware_consensus_disagree,
+        "divisiveness": metric.divisiveness,
+        "majority_type": metric.majority_type,
+        "majority_probability_success": metric.majority_probability_success,
+        "agreement_rank": metric.agreement_rank,
+        "disagreement_rank": metric.disagreement_rank,
+        "divisiveness_rank": metric.divisiveness_rank,
+    }
+
+
+def group_opinion_stats_insert_value(
     *,
     group_id: int,
     analysis_snapshot_opinion_id: int,
@@ -546,7 +692,9 @@ def claim_work_items_and_fetch_inputs_batch(
     lease_ttl_seconds: int,
     limit: int,
     analysis_engine_epoch: int,
+    previous_bases_by_conversation_id: Mapping[int, IncrementalSnapshotBase] | None = None,
 ) -> ClaimedInputBatch:
+    previous_bases = previous_bases_by_conversation_id or {}
     with Session(engine) as session:
         session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
         claims = _claim_work_items_batch(
@@ -557,15 +705,48 @@ def claim_work_items_and_fetch_inputs_batch(
             limit=limit,
             analysis_engine_epoch=analysis_engine_epoch,
         )
-        rows_by_conversation_id = _fetch_vote_input_rows_batch(
+        data_generation_by_conversation_id = {
+            claim.conversation_id: claim.data_generation
+            for claim in claims
+            if claim.persisted_analysis_snapshot_id is None
+        }
+        deltas_by_conversation_id = _fetch_vote_input_deltas_batch(
+            session,
+            since_vote_content_id_by_conversation_id={
+                conversation_id: previous_bases[conversation_id].max_vote_content_id
+                for conversation_id in data_generation_by_conversation_id
+                if conversation_id in previous_bases
+            },
+        )
+        incremental_bases_by_conversation_id: dict[int, IncrementalSnapshotBase] = {}
+        for conversation_id, delta in deltas_by_conversation_id.items():
+            incremental_base = apply_vote_input_delta(
+                base=previous_bases[conversation_id],
+                delta=delta,
+                data_generation=data_generation_by_conversation_id[conversation_id],
+            )
+            if incremental_base is None:
+                log.info(
+                    "[MathUpdaterDB] Incremental input snapshot mismatch; "
+                    "falling back to full vote fetch conversation_id=%d",
+                    conversation_id,
+                )
+                continue
+            incremental_bases_by_conversation_id[conversation_id] = incremental_base
+        vote_columns_by_conversation_id = _fetch_vote_input_columns_batch(
             session,
-            conversation_ids=[claim.conversation_id for claim in claims],
+            conversation_ids=[
+                claim.conversation_id
+                for claim in claims
+                if claim.conversation_id not in incremental_bases_by_conversation_id
+            ],
         )
         session.commit()
 
     return ClaimedInputBatch(
         claims=claims,
-        rows_by_conversation_id=rows_by_conversation_id,
+        vote_columns_by_conversation_id=vote_columns_by_conversation_id,
+        incremental_bases_by_conversation_id=incremental_bases_by_conversation_id,
     )
 
 
@@ -915,33 +1096,27 @@ def fetch_claimable_work_conversation_ids(
     return [row.conversation_id for row in rows]
 
 
-def fetch_vote_input_rows_batch(
+def fetch_vote_input_columns_batch(
     engine: Engine,
     *,
     conversation_ids: list[int],
-) -> dict[int, list[VoteInputRow]]:
+) -> dict[int, VoteInputColumns]:
     with Session(engine) as session:
-        return _fetch_vote_input_rows_batch(
+        return _fetch_vote_input_columns_batch(
             session,
             conversation_ids=conversation_ids,
         )
 
 
-def _fetch_vote_input_rows_batch(
-    session: Session,
-    *,
-    conversation_ids: list[int],
-) -> dict[int, list[VoteInputRow]]:
-    if not conversation_ids:
-        return {}
-
-    query = (
+def _vote_input_rows_query(*, conversation_ids: list[int]) -> Select[Any]:
+    return (
         select(
             Opinion.conversation_id,
             PolisConversationConfig.analysis_data_generation,
             Vote.author_id,
             Opinion.id.label("opinion_id"),
             Opinion.current_content_id.label("opinion_content_id"),
+            VoteContent.id.label("vote_content_id"),
             VoteContent.vote,
         )
         .select_from(Vote)
@@ -960,27 +1135,121 @@ def _fetch_vote_input_rows_batch(
                 Opinion.current_content_id.is_not(None),
             )
         )
+    )
+
+
+def _vote_input_row(row: Row[Any]) -> VoteInputRow:
+    return VoteInputRow(
+        conversation_id=row.conversation_id,
+        data_generation=row.analysis_data_generation,
+        user_id=row.author_id,
+        opinion_id=row.opinion_id,
+        opinion_content_id=row.opinion_content_id,
+        vote=row.vote.value,
+        vote_content_id=row.vote_content_id,
+    )
+
+
+def _fetch_vote_input_columns_batch(
+    session: Session,
+    *,
+    conversation_ids: list[int],
+) -> dict[int, VoteInputColumns]:
+    if not conversation_ids:
+        return {}
+
+    query = _vote_input_rows_query(conversation_ids=conversation_ids).order_by(
+        Opinion.conversation_id, Vote.author_id, Opinion.id
+    )
+
+    # Rows arrive grouped by conversation, so only the conversation being
+    # streamed is held as Python objects; finished ones are packed into arrays.
+    vote_columns_by_conversation_id: dict[int, VoteInputColumns] = {}
+    builder = VoteInputColumnsBuilder()
+    current_conversation_id: int | None = None
+    for row in session.execute(
+        query,
+        execution_options={"yield_per": VOTE_INPUT_FETCH_YIELD_PER},
+    ):
+        if row.conversation_id != current_conversation_id:
+            if current_conversation_id is not None:
+                vote_columns_by_conversation_id[current_conversation_id] = builder.build()
+            builder = VoteInputColumnsBuilder()
+            current_conversation_id = row.conversation_id
+        builder.append(
+            data_generation=row.analysis_data_generation,
+            user_id=row.author_id,
+            opinion_id=row.opinion_id,
+            opinion_content_id=row.opinion_content_id,
+            vote=row.vote.value,
+            vote_content_id=row.vote_content_id,
+        )
+    if current_conversation_id is not None:
+        vote_columns_by_conversation_id[current_conversation_id] = builder.build()
+
+    for conversation_id in conversation_ids:
+        if conversation_id not in vote_columns_by_conversation_id:
+            vote_columns_by_conversation_id[conversation_id] = VoteInputColumnsBuilder().build()
+    return vote_columns_by_conversation_id
+
+
+def _fetch_vote_input_deltas_batch(
+    session: Session,
+    *,
+    since_vote_content_id_by_conversation_id: dict[int, int],
+) -> dict[int, VoteInputDelta]:
+    if not since_vote_content_id_by_conversation_id:
+        return {}
+
+    conversation_ids = list(since_vote_content_id_by_conversation_id)
+    eligible_votes = _vote_input_rows_query(conversation_ids=conversation_ids).subquery()
+    totals_query = select(
+        eligible_votes.c.conversation_id,
+        func.count().label("vote_count"),
+        func.coalesce(func.sum(eligible_votes.c.vote_content_id), 0).label("vote_content_id_sum"),
+        func.coalesce(func.sum(eligible_votes.c.opinion_content_id), 0).label(
+            "opinion_content_id_sum"
+        ),
+    ).group_by(eligible_votes.c.conversation_id)
+    changed_rows_query = (
+        _vote_input_rows_query(conversation_ids=conversation_ids)
+        .where(
+            or_(
+                *(
+                    and_(
+                        Opinion.conversation_id == conversation_id,
+                        VoteContent.id > since_vote_content_id,
+                    )
+                    for conversation_id, since_vote_content_id in (
+                        since_vote_content_id_by_conversation_id.items()
+                    )
+                )
+            )
+        )
         .order_by(Opinion.conversation_id, Vote.author_id, Opinion.id)
     )
 
-    rows_by_conversation_id: dict[int, list[VoteInputRow]] = {
+    totals_by_conversation_id = {
+        row.conversation_id: row for row in session.execute(totals_query).all()
+    }
+    changed_rows_by_conversation_id: dict[int, list[VoteInputRow]] = {
         conversation_id: [] for conversation_id in conversation_ids
     }
-    rows = session.execute(query).all()
+    for row in session.execute(changed_rows_query).all():
+        changed_rows_by_conversation_id[row.conversation_id].append(_vote_input_row(row))
 
-    for row in rows:
-        rows_by_conversation_id[row.conversation_id].append(
-            VoteInputRow(
-                conversation_id=row.conversation_id,
-                data_generation=row.analysis_data_generation,
-                user_id=row.author_id,
-                opinion_id=row.opinion_id,
-                opinion_content_id=row.opinion_content_id,
-                vote=row.vote.value,
-            )
+    deltas_by_conversation_id: dict[int, VoteInputDelta] = {}
+    for conversation_id, since_vote_content_id in since_vote_content_id_by_conversation_id.items():
+        totals = totals_by_conversation_id.get(conversation_id)
+        deltas_by_conversation_id[conversation_id] = VoteInputDelta(
+            conversation_id=conversation_id,
+            since_vote_content_id=since_vote_content_id,
+            rows=changed_rows_by_conversation_id[conversation_id],
+            vote_count=0 if totals is None else int(totals.vote_count),
+            vote_content_id_sum=0 if totals is None else int(totals.vote_content_id_sum),
+            opinion_content_id_sum=0 if totals is None else int(totals.opinion_content_id_sum),
         )
-
-    return rows_by_conversation_id
+    return deltas_by_conversation_id
 
 
 def upsert_input_snapshots_batch(
@@ -1039,7 +1308,7 @@ def upsert_input_snapshots_batch(
                             "input_hash": snapshot.input_hash,
                             "opinion_count": len(snapshot.opinions),
                             "participant_count": len(snapshot.participants),
-                            "vote_count": len(snapshot.votes),
+                            "vote_count": len(snapshot.vote_matrix),
                             "compression": AnalysisCompressionEnum.zstd,
                             "payload": snapshot.payload,
                         }
@@ -2057,7 +2326,7 @@ def _persist_conversation_view_snapshots(
                 else None,
                 "is_closed": state.is_closed,
                 "opinion_count": counters.opinion_count,
-                "vote_count": len(input_snapshot.votes),
+                "vote_count": len(input_snapshot.vote_matrix),
                 "participant_count": len(input_snapshot.participants),
                 "total_opinion_count": counters.total_opinion_count,
                 "total_vote_count": counters.total_vote_count,
@@ -2089,7 +2358,7 @@ def _persist_conversation_view_snapshots(
             selected_candidate=selected,
             conversation_state=state_by_conversation_id[pair[0]],
             opinion_count=counters_by_conversation_id[pair[0]].opinion_count,
-            vote_count=len(prepared_input_snapshots_by_conversation_id[pair[0]].votes),
+            vote_count=len(prepared_input_snapshots_by_conversation_id[pair[0]].vote_matrix),
             participant_count=len(
                 prepared_input_snapshots_by_conversation_id[pair[0]].participants
             ),
@@ -3437,18 +3706,13 @@ def persist_computed_analysis_results_batch(
             for metrics in bundle.snapshot_opinions:
                 opinion = opinion_by_local_index[metrics.local_opinion_index]
                 snapshot_opinion_values.append(
-                    {
-                        "analysis_snapshot_id": snapshot_id_by_conversation_id[
+                    snapshot_opinion_insert_value(
+                        analysis_snapshot_id=snapshot_id_by_conversation_id[
                             claim.conversation_id
                         ],
-                        "opinion_id": opinion.opinion_id,
-                        "opinion_content_id": opinion.opinion_content_id,
-                        "local_opinion_index": metrics.local_opinion_index,
-                        "num_agrees": metrics.num_agrees,
-                        "num_disagrees": metrics.num_disagrees,
-                        "num_passes": metrics.num_passes,
-                        "routing_priority": metrics.routing_priority,
-                    }
+                        opinion=opinion,
+                        metrics=metrics,
+                    )
                 )
         snapshot_opinion_id_by_conversation_local_index: dict[tuple[int, int], int] = {}
         if snapshot_opinion_values:
@@ -3456,39 +3720,32 @@ def persist_computed_analysis_results_batch(
                 "[MathUpdaterDB] Inserting analysis_snapshot_opinion rows=%d",
                 len(snapshot_opinion_values),
             )
-            chunk_size = _max_rows_per_insert(column_count=8)
-            if len(snapshot_opinion_values) > chunk_size:
-                log.info(
-                    "[MathUpdaterDB] Chunking analysis_snapshot_opinion rows=%d "
-                    "max_rows_per_chunk=%d",
-                    len(snapshot_opinion_values),
-                    chunk_size,
-                )
-            inserted_snapshot_opinion_count = 0
-            for chunk in _iter_chunks(snapshot_opinion_values, chunk_size=chunk_size):
-                chunk_insert = (
-                    sqlalchemy_insert(AnalysisSnapshotOpinion)
-                    .values(chunk)
-                    .returning(
-                        AnalysisSnapshotOpinion.id,
-                        AnalysisSnapshotOpinion.analysis_snapshot_id,
-                        AnalysisSnapshotOpinion.local_opinion_index,
-                    )
-                )
-                chunk_rows = session.execute(chunk_insert).all()
-                inserted_snapshot_opinion_count += len(chunk_rows)
-                snapshot_opinion_id_by_conversation_local_index.update(
-                    {
-                        (
-                            snapshot_id_to_conversation_id[row.analysis_snapshot_id],
-                            row.local_opinion_index,
-                        ): row.id
-                        for row in chunk_rows
-                    }
+            write_method = bulk_insert_rows(
+                session,
+                model=AnalysisSnapshotOpinion,
+                values=snapshot_opinion_values,
+            )
+            # The snapshots were created in this transaction, so every row under them is new.
+            snapshot_opinion_rows = session.execute(
+                select(
+                    AnalysisSnapshotOpinion.id,
+                    AnalysisSnapshotOpinion.analysis_snapshot_id,
+                    AnalysisSnapshotOpinion.local_opinion_index,
+                ).where(
+                    AnalysisSnapshotOpinion.analysis_snapshot_id.in_(snapshot_id_to_conversation_id)
                 )
+            ).all()
+            snapshot_opinion_id_by_conversation_local_index = {
+                (
+                    snapshot_id_to_conversation_id[row.analysis_snapshot_id],
+                    row.local_opinion_index,
+                ): row.id
+                for row in snapshot_opinion_rows
+            }
             log.info(
-                "[MathUpdaterDB] Inserted analysis_snapshot_opinion rows=%d",
-                inserted_snapshot_opinion_count,
+                "[MathUpdaterDB] Inserted analysis_snapshot_opinion rows=%d method=%s",
+                len(snapshot_opinion_rows),
+                write_method,
             )
 
         result_insert = (
@@ -3596,22 +3853,15 @@ def persist_computed_analysis_results_batch(
                     (claim.conversation_id, candidate.opinion_group_variant_id)
                 ]
                 candidate_opinion_metric_values.extend(
-                    {
-                        "candidate_id": candidate_id,
-                        "analysis_snapshot_opinion_id": (
+                    candidate_opinion_metrics_insert_value(
+                        candidate_id=candidate_id,
+                        analysis_snapshot_opinion_id=(
                             snapshot_opinion_id_by_conversation_local_index[
                                 (claim.conversation_id, metric.local_opinion_index)
                             ]
                         ),
-                        "group_aware_consensus_agree": metric.group_aware_consensus_agree,
-                        "group_aware_consensus_disagree": metric.group_aware_consensus_disagree,
-                        "divisiveness": metric.divisiveness,
-                        "majority_type": metric.majority_type,
-                        "majority_probability_success": metric.majority_probability_success,
-                        "agreement_rank": metric.agreement_rank,
-                        "disagreement_rank": metric.disagreement_rank,
-                        "divisiveness_rank": metric.divisiveness_rank,
-                    }
+                        metric=metric,
+                    )
                     for metric in candidate.opinion_metrics
                     if (
                         claim.conversation_id,
@@ -3624,18 +3874,11 @@ def persist_computed_analysis_results_batch(
                 "[MathUpdaterDB] Inserting opinion_group_candidate_opinion_metrics rows=%d",
                 len(candidate_opinion_metric_values),
             )
-            chunk_size = _max_rows_per_insert(column_count=10)
-            if len(candidate_opinion_metric_values) > chunk_size:
-                log.info(
-                    "[MathUpdaterDB] Chunking opinion_group_candidate_opinion_metrics "
-                    "rows=%d max_rows_per_chunk=%d",
-                    len(candidate_opinion_metric_values),
-                    chunk_size,
-                )
-            for chunk in _iter_chunks(candidate_opinion_metric_values, chunk_size=chunk_size):
-                session.execute(
-                    sqlalchemy_insert(OpinionGroupCandidateOpinionMetrics).values(chunk)
-                )
+            bulk_insert_rows(
+                session,
+                model=OpinionGroupCandidateOpinionMetrics,
+                values=candidate_opinion_metric_values,
+            )
 
         assessment_values: list[dict[str, object]] = []
         for claim in claims:
@@ -3759,7 +4002,7 @@ def persist_computed_analysis_results_batch(
                         if snapshot_opinion_id is None:
                             continue
                         group_opinion_values.append(
-                            _group_opinion_stats_insert_value(
+                            group_opinion_stats_insert_value(
                                 group_id=group_id,
                                 analysis_snapshot_opinion_id=snapshot_opinion_id,
                                 opinion_stats=opinion_stats,
@@ -3770,15 +4013,11 @@ def persist_computed_analysis_results_batch(
                 "[MathUpdaterDB] Inserting opinion_group_user rows=%d",
                 len(group_user_values),
             )
-            chunk_size = _max_rows_per_insert(column_count=3)
-            if len(group_user_values) > chunk_size:
-                log.info(
-                    "[MathUpdaterDB] Chunking opinion_group_user rows=%d max_rows_per_chunk=%d",
-                    len(group_user_values),
-                    chunk_size,
-                )
-            for chunk in _iter_chunks(group_user_values, chunk_size=chunk_size):
-                session.execute(sqlalchemy_insert(OpinionGroupUser).values(chunk))
+            bulk_insert_rows(
+                session,
+                model=OpinionGroupUser,
+                values=group_user_values,
+            )
         if group_opinion_values:
             duplicates = _duplicate_group_opinion_stat_keys(group_opinion_values)
             invalid_representative_count = _invalid_representative_group_opinion_stat_count(
@@ -3801,23 +4040,15 @@ def persist_computed_analysis_results_batch(
                 len(duplicates),
                 invalid_representative_count,
             )
-            chunk_size = _max_rows_per_insert(column_count=9)
-            if len(group_opinion_values) > chunk_size:
-                log.info(
-                    "[MathUpdaterDB] Chunking opinion_group_opinion_stats rows=%d "
-                    "max_rows_per_chunk=%d",
-                    len(group_opinion_values),
-                    chunk_size,
-                )
-            for chunk in _iter_chunks(group_opinion_values, chunk_size=chunk_size):
-                session.execute(
-                    sqlalchemy_insert(OpinionGroupOpinionStats).values(
-                        [dict(value) for value in chunk]
-                    )
-                )
+            write_method = bulk_insert_rows(
+                session,
+                model=OpinionGroupOpinionStats,
+                values=group_opinion_values,
+            )
             log.info(
-                "[MathUpdaterDB] Inserted opinion_group_opinion_stats rows=%d",
+                "[MathUpdaterDB] Inserted opinion_group_opinion_stats rows=%d method=%s",
                 len(group_opinion_values),
+                write_method,
             )
 
         survey_aggregate_snapshot_id_by_conversation_id = _persist_survey_aggregate_snapshots(
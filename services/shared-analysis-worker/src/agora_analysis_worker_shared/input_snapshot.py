@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import hashlib
 import json
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import zstandard as zstd
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
     from uuid import UUID
 
+    from numpy.typing import NDArray
+
 
 @dataclass(frozen=True)
 class VoteInputRow:
@@ -19,6 +25,83 @@ class VoteInputRow:
     opinion_id: int
     opinion_content_id: int
     vote: str
+    vote_content_id: int | None = None
+
+
+@dataclass(frozen=True, eq=False)
+class VoteInputColumns:
+    data_generations: frozenset[int]
+    user_ids: list[UUID]
+    participant_codes: NDArray[np.int32]
+    opinion_ids: NDArray[np.int64]
+    opinion_content_ids: NDArray[np.int64]
+    vote_content_ids: NDArray[np.int64]
+    votes: NDArray[np.int8]
+    has_missing_vote_content_id: bool
+
+    def __len__(self) -> int:
+        return len(self.votes)
+
+
+class VoteInputColumnsBuilder:
+    def __init__(self) -> None:
+        self._data_generations: set[int] = set()
+        self._participant_code_by_user_id: dict[UUID, int] = {}
+        self._participant_codes = array("i")
+        self._opinion_ids = array("q")
+        self._opinion_content_ids = array("q")
+        self._vote_content_ids = array("q")
+        self._votes = array("b")
+        self._has_missing_vote_content_id = False
+
+    def append(
+        self,
+        *,
+        data_generation: int,
+        user_id: UUID,
+        opinion_id: int,
+        opinion_content_id: int,
+        vote: str,
+        vote_content_id: int | None,
+    ) -> None:
+        self._data_generations.add(data_generation)
+        participant_code = self._participant_code_by_user_id.setdefault(
+            user_id, len(self._participant_code_by_user_id)
+        )
+        self._participant_codes.append(participant_code)
+        self._opinion_ids.append(opinion_id)
+        self._opinion_content_ids.append(opinion_content_id)
+        if vote_content_id is None:
+            self._has_missing_vote_content_id = True
+            vote_content_id = 0
+        self._vote_content_ids.append(vote_content_id)
+        self._votes.append(_vote_to_numeric(vote))
+
+    def build(self) -> VoteInputColumns:
+        return VoteInputColumns(
+            data_generations=frozenset(self._data_generations),
+            user_ids=list(self._participant_code_by_user_id),
+            participant_codes=np.frombuffer(self._participant_codes, dtype=np.int32).copy(),
+            opinion_ids=np.frombuffer(self._opinion_ids, dtype=np.int64).copy(),
+            opinion_content_ids=np.frombuffer(self._opinion_content_ids, dtype=np.int64).copy(),
+            vote_content_ids=np.frombuffer(self._vote_content_ids, dtype=np.int64).copy(),
+            votes=np.frombuffer(self._votes, dtype=np.int8).copy(),
+            has_missing_vote_content_id=self._has_missing_vote_content_id,
+        )
+
+
+def vote_input_columns_from_rows(rows: Iterable[VoteInputRow]) -> VoteInputColumns:
+    builder = VoteInputColumnsBuilder()
+    for row in rows:
+        builder.append(
+            data_generation=row.data_generation,
+            user_id=row.user_id,
+            opinion_id=row.opinion_id,
+            opinion_content_id=row.opinion_content_id,
+            vote=row.vote,
+            vote_content_id=row.vote_content_id,
+        )
+    return builder.build()
 
 
 @dataclass(frozen=True)
@@ -34,11 +117,23 @@ class SnapshotParticipant:
     local_participant_index: int
 
 
-@dataclass(frozen=True)
-class SnapshotVote:
-    local_participant_index: int
-    local_opinion_index: int
-    vote: int
+@dataclass(frozen=True, eq=False)
+class VoteMatrixColumns:
+    participant_indexes: NDArray[np.int32]
+    opinion_indexes: NDArray[np.int32]
+    votes: NDArray[np.int8]
+
+    def __len__(self) -> int:
+        return len(self.votes)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VoteMatrixColumns):
+            return NotImplemented
+        return (
+            np.array_equal(self.participant_indexes, other.participant_indexes)
+            and np.array_equal(self.opinion_indexes, other.opinion_indexes)
+            and np.array_equal(self.votes, other.votes)
+        )
 
 
 @dataclass(frozen=True)
@@ -48,10 +143,31 @@ class PreparedInputSnapshot:
     input_hash: str
     compression: str
     payload: bytes
-    canonical_payload: dict[str, Any]
     opinions: list[SnapshotOpinion]
     participants: list[SnapshotParticipant]
-    votes: list[SnapshotVote]
+    vote_matrix: VoteMatrixColumns
+
+    @property
+    def canonical_payload(self) -> dict[str, Any]:
+        payload: dict[str, Any] = json.loads(zstd.ZstdDecompressor().decompress(self.payload))
+        return payload
+
+
+@dataclass(frozen=True, eq=False)
+class IncrementalSnapshotBase:
+    snapshot: PreparedInputSnapshot
+    vote_content_ids: NDArray[np.int64]
+    max_vote_content_id: int
+
+
+@dataclass(frozen=True)
+class VoteInputDelta:
+    conversation_id: int
+    since_vote_content_id: int
+    rows: list[VoteInputRow]
+    vote_count: int
+    vote_content_id_sum: int
+    opinion_content_id_sum: int
 
 
 def _vote_to_numeric(vote: str) -> int:
@@ -71,65 +187,129 @@ def canonical_json_bytes(payload: dict[str, Any]) -> bytes:
     ).encode("utf-8")
 
 
+def _canonical_vote_matrix_payload_bytes(
+    *,
+    conversation_id: int,
+    data_generation: int,
+    opinion_count: int,
+    participant_count: int,
+    vote_matrix: VoteMatrixColumns,
+) -> bytes:
+    header = canonical_json_bytes(
+        {
+            "schema_version": 1,
+            "conversation_id": conversation_id,
+            "data_generation": data_generation,
+            "opinion_count": opinion_count,
+            "participant_count": participant_count,
+        }
+    )
+    votes = ",".join(
+        f'{{"opinion_index":{opinion_index},"participant_index":{participant_index},"vote":{vote}}}'
+        for participant_index, opinion_index, vote in zip(
+            vote_matrix.participant_indexes.tolist(),
+            vote_matrix.opinion_indexes.tolist(),
+            vote_matrix.votes.tolist(),
+            strict=True,
+        )
+    )
+    return header[:-1] + b',"votes":[' + votes.encode("ascii") + b"]}"
+
+
+def _vote_keys(
+    *,
+    participant_indexes: NDArray[np.integer[Any]],
+    opinion_indexes: NDArray[np.integer[Any]],
+    opinion_count: int,
+) -> NDArray[np.int64]:
+    return participant_indexes.astype(np.int64) * max(opinion_count, 1) + opinion_indexes
+
+
 def prepare_input_snapshot(
     *,
     conversation_id: int,
     data_generation: int,
     rows: list[VoteInputRow],
 ) -> PreparedInputSnapshot:
-    opinion_ids = sorted({row.opinion_id for row in rows})
-    user_ids = sorted({row.user_id for row in rows}, key=str)
+    return prepare_input_snapshot_from_columns(
+        conversation_id=conversation_id,
+        data_generation=data_generation,
+        columns=vote_input_columns_from_rows(rows),
+    )
 
-    local_opinion_index_by_id = {opinion_id: index for index, opinion_id in enumerate(opinion_ids)}
-    local_participant_index_by_id = {user_id: index for index, user_id in enumerate(user_ids)}
 
-    opinion_content_id_by_id: dict[int, int] = {}
-    for row in rows:
-        opinion_content_id_by_id[row.opinion_id] = row.opinion_content_id
+def prepare_input_snapshot_from_columns(
+    *,
+    conversation_id: int,
+    data_generation: int,
+    columns: VoteInputColumns,
+) -> PreparedInputSnapshot:
+    opinion_ids, inverse_opinion_indexes = np.unique(columns.opinion_ids, return_inverse=True)
+    opinion_content_ids = np.zeros(len(opinion_ids), dtype=np.int64)
+    opinion_content_ids[inverse_opinion_indexes] = columns.opinion_content_ids
+    user_ids = sorted(columns.user_ids, key=str)
 
     opinions = [
         SnapshotOpinion(
             opinion_id=opinion_id,
-            opinion_content_id=opinion_content_id_by_id[opinion_id],
-            local_opinion_index=local_opinion_index_by_id[opinion_id],
+            opinion_content_id=opinion_content_id,
+            local_opinion_index=index,
+        )
+        for index, (opinion_id, opinion_content_id) in enumerate(
+            zip(opinion_ids.tolist(), opinion_content_ids.tolist(), strict=True)
         )
-        for opinion_id in opinion_ids
     ]
     participants = [
-        SnapshotParticipant(
-            user_id=user_id,
-            local_participant_index=local_participant_index_by_id[user_id],
-        )
-        for user_id in user_ids
+        SnapshotParticipant(user_id=user_id, local_participant_index=index)
+        for index, user_id in enumerate(user_ids)
     ]
-    votes = sorted(
-        [
-            SnapshotVote(
-                local_participant_index=local_participant_index_by_id[row.user_id],
-                local_opinion_index=local_opinion_index_by_id[row.opinion_id],
-                vote=_vote_to_numeric(row.vote),
-            )
-            for row in rows
-        ],
-        key=lambda vote: (vote.local_participant_index, vote.local_opinion_index),
-    )
-
-    payload = {
-        "schema_version": 1,
-        "conversation_id": conversation_id,
-        "data_generation": data_generation,
-        "opinion_count": len(opinions),
-        "participant_count": len(participants),
-        "votes": [
-            {
-                "participant_index": vote.local_participant_index,
-                "opinion_index": vote.local_opinion_index,
-                "vote": vote.vote,
-            }
-            for vote in votes
-        ],
-    }
-    raw_payload = canonical_json_bytes(payload)
+    participant_indexes = _local_participant_index_by_code(
+        user_ids=columns.user_ids,
+        local_participant_index_by_id={user_id: index for index, user_id in enumerate(user_ids)},
+    )[columns.participant_codes]
+    opinion_indexes = inverse_opinion_indexes.astype(np.int32)
+    order = np.lexsort((opinion_indexes, participant_indexes))
+
+    return _build_prepared_input_snapshot(
+        conversation_id=conversation_id,
+        data_generation=data_generation,
+        opinions=opinions,
+        participants=participants,
+        vote_matrix=VoteMatrixColumns(
+            participant_indexes=participant_indexes[order],
+            opinion_indexes=opinion_indexes[order],
+            votes=columns.votes[order],
+        ),
+    )
+
+
+def _local_participant_index_by_code(
+    *,
+    user_ids: list[UUID],
+    local_participant_index_by_id: Mapping[UUID, int],
+) -> NDArray[np.int32]:
+    return np.fromiter(
+        (local_participant_index_by_id[user_id] for user_id in user_ids),
+        dtype=np.int32,
+        count=len(user_ids),
+    )
+
+
+def _build_prepared_input_snapshot(
+    *,
+    conversation_id: int,
+    data_generation: int,
+    opinions: list[SnapshotOpinion],
+    participants: list[SnapshotParticipant],
+    vote_matrix: VoteMatrixColumns,
+) -> PreparedInputSnapshot:
+    raw_payload = _canonical_vote_matrix_payload_bytes(
+        conversation_id=conversation_id,
+        data_generation=data_generation,
+        opinion_count=len(opinions),
+        participant_count=len(participants),
+        vote_matrix=vote_matrix,
+    )
     compressed_payload = zstd.ZstdCompressor(level=3).compress(raw_payload)
 
     return PreparedInputSnapshot(
@@ -138,31 +318,251 @@ def prepare_input_snapshot(
         input_hash=hashlib.sha256(raw_payload).hexdigest(),
         compression="zstd",
         payload=compressed_payload,
-        canonical_payload=payload,
         opinions=opinions,
         participants=participants,
-        votes=votes,
+        vote_matrix=vote_matrix,
+    )
+
+
+def build_incremental_snapshot_base(
+    *,
+    snapshot: PreparedInputSnapshot,
+    columns: VoteInputColumns,
+) -> IncrementalSnapshotBase | None:
+    if columns.has_missing_vote_content_id:
+        return None
+
+    snapshot_opinion_ids = np.fromiter(
+        (opinion.opinion_id for opinion in snapshot.opinions),
+        dtype=np.int64,
+        count=len(snapshot.opinions),
+    )
+    row_keys = _vote_keys(
+        participant_indexes=_local_participant_index_by_code(
+            user_ids=columns.user_ids,
+            local_participant_index_by_id={
+                participant.user_id: participant.local_participant_index
+                for participant in snapshot.participants
+            },
+        )[columns.participant_codes],
+        opinion_indexes=np.searchsorted(snapshot_opinion_ids, columns.opinion_ids),
+        opinion_count=len(snapshot.opinions),
+    )
+    if len(np.unique(row_keys)) != len(snapshot.vote_matrix):
+        return None
+
+    vote_content_ids = columns.vote_content_ids[np.argsort(row_keys, kind="stable")]
+    return IncrementalSnapshotBase(
+        snapshot=snapshot,
+        vote_content_ids=vote_content_ids,
+        max_vote_content_id=int(vote_content_ids.max(initial=0)),
+    )
+
+
+def apply_vote_input_delta(
+    *,
+    base: IncrementalSnapshotBase,
+    delta: VoteInputDelta,
+    data_generation: int,
+) -> IncrementalSnapshotBase | None:
+    previous = base.snapshot
+    if any(
+        row.vote_content_id is None or row.data_generation != data_generation for row in delta.rows
+    ):
+        return None
+
+    previous_user_ids = [participant.user_id for participant in previous.participants]
+    previous_opinion_ids = [opinion.opinion_id for opinion in previous.opinions]
+    user_ids = previous_user_ids
+    added_user_ids = {row.user_id for row in delta.rows}.difference(previous_user_ids)
+    if added_user_ids:
+        user_ids = sorted([*previous_user_ids, *added_user_ids], key=str)
+    opinion_ids = previous_opinion_ids
+    added_opinion_ids = {row.opinion_id for row in delta.rows}.difference(previous_opinion_ids)
+    if added_opinion_ids:
+        opinion_ids = sorted([*previous_opinion_ids, *added_opinion_ids])
+
+    local_participant_index_by_id = {user_id: index for index, user_id in enumerate(user_ids)}
+    local_opinion_index_by_id = {opinion_id: index for index, opinion_id in enumerate(opinion_ids)}
+    participant_index_remap = np.array(
+        [local_participant_index_by_id[user_id] for user_id in previous_user_ids],
+        dtype=np.int32,
     )
+    opinion_index_remap = np.array(
+        [local_opinion_index_by_id[opinion_id] for opinion_id in previous_opinion_ids],
+        dtype=np.int32,
+    )
+
+    opinion_content_id_by_id = {
+        opinion.opinion_id: opinion.opinion_content_id for opinion in previous.opinions
+    }
+    for row in delta.rows:
+        opinion_content_id_by_id[row.opinion_id] = row.opinion_content_id
+
+    previous_matrix = previous.vote_matrix
+    participant_indexes = participant_index_remap[previous_matrix.participant_indexes]
+    opinion_indexes = opinion_index_remap[previous_matrix.opinion_indexes]
+    votes = previous_matrix.votes
+    vote_content_ids = base.vote_content_ids
+    if delta.rows:
+        delta_participant_indexes = np.fromiter(
+            (local_participant_index_by_id[row.user_id] for row in delta.rows),
+            dtype=np.int32,
+            count=len(delta.rows),
+        )
+        delta_opinion_indexes = np.fromiter(
+            (local_opinion_index_by_id[row.opinion_id] for row in delta.rows),
+            dtype=np.int32,
+            count=len(delta.rows),
+        )
+        previous_keys = _vote_keys(
+            participant_indexes=participant_indexes,
+            opinion_indexes=opinion_indexes,
+            opinion_count=len(opinion_ids),
+        )
+        delta_keys = _vote_keys(
+            participant_indexes=delta_participant_indexes,
+            opinion_indexes=delta_opinion_indexes,
+            opinion_count=len(opinion_ids),
+        )
+        positions = np.searchsorted(previous_keys, delta_keys)
+        replaced = np.zeros(len(delta_keys), dtype=bool)
+        in_bounds = positions < len(previous_keys)
+        replaced[in_bounds] = previous_keys[positions[in_bounds]] == delta_keys[in_bounds]
+        kept = np.ones(len(previous_keys), dtype=bool)
+        kept[positions[replaced]] = False
+
+        participant_indexes = np.concatenate((participant_indexes[kept], delta_participant_indexes))
+        opinion_indexes = np.concatenate((opinion_indexes[kept], delta_opinion_indexes))
+        votes = np.concatenate(
+            (
+                votes[kept],
+                np.fromiter(
+                    (_vote_to_numeric(row.vote) for row in delta.rows),
+                    dtype=np.int8,
+                    count=len(delta.rows),
+                ),
+            )
+        )
+        vote_content_ids = np.concatenate(
+            (
+                vote_content_ids[kept],
+                np.fromiter(
+                    (row.vote_content_id or 0 for row in delta.rows),
+                    dtype=np.int64,
+                    count=len(delta.rows),
+                ),
+            )
+        )
+        order = np.lexsort((opinion_indexes, participant_indexes))
+        participant_indexes = participant_indexes[order]
+        opinion_indexes = opinion_indexes[order]
+        votes = votes[order]
+        vote_content_ids = vote_content_ids[order]
+
+    opinion_content_ids = np.array(
+        [opinion_content_id_by_id[opinion_id] for opinion_id in opinion_ids],
+        dtype=np.int64,
+    )
+    merged_keys = _vote_keys(
+        participant_indexes=participant_indexes,
+        opinion_indexes=opinion_indexes,
+        opinion_count=len(opinion_ids),
+    )
+    if (
+        len(votes) != delta.vote_count
+        or np.any(merged_keys[1:] == merged_keys[:-1])
+        or int(vote_content_ids.sum()) != delta.vote_content_id_sum
+        or int(opinion_content_ids[opinion_indexes].sum()) != delta.opinion_content_id_sum
+    ):
+        return None
+
+    snapshot = _build_prepared_input_snapshot(
+        conversation_id=previous.conversation_id,
+        data_generation=data_generation,
+        opinions=[
+            SnapshotOpinion(
+                opinion_id=opinion_id,
+                opinion_content_id=int(opinion_content_ids[index]),
+                local_opinion_index=index,
+            )
+            for index, opinion_id in enumerate(opinion_ids)
+        ],
+        participants=[
+            SnapshotParticipant(user_id=user_id, local_participant_index=index)
+            for index, user_id in enumerate(user_ids)
+        ],
+        vote_matrix=VoteMatrixColumns(
+            participant_indexes=participant_indexes,
+            opinion_indexes=opinion_indexes,
+            votes=votes,
+        ),
+    )
+    return IncrementalSnapshotBase(
+        snapshot=snapshot,
+        vote_content_ids=vote_content_ids,
+        max_vote_content_id=int(vote_content_ids.max(initial=0)),
+    )
+
+
+class InputSnapshotCache:
+    def __init__(self, *, max_conversations: int) -> None:
+        self.max_conversations = max_conversations
+        self._bases: OrderedDict[int, IncrementalSnapshotBase] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._bases)
+
+    def bases_for(self, conversation_ids: Iterable[int]) -> dict[int, IncrementalSnapshotBase]:
+        bases: dict[int, IncrementalSnapshotBase] = {}
+        for conversation_id in conversation_ids:
+            base = self._bases.get(conversation_id)
+            if base is not None:
+                self._bases.move_to_end(conversation_id)
+                bases[conversation_id] = base
+        return bases
+
+    def remember(self, base: IncrementalSnapshotBase) -> None:
+        if self.max_conversations <= 0:
+            return
+        conversation_id = base.snapshot.conversation_id
+        self._bases[conversation_id] = base
+        self._bases.move_to_end(conversation_id)
+        while len(self._bases) > self.max_conversations:
+            self._bases.popitem(last=False)
+
+    def discard(self, conversation_id: int) -> None:
+        self._bases.pop(conversation_id, None)
 
 
 def prepare_input_snapshots_batch(
     *,
     data_generation_by_conversation_id: dict[int, int],
-    rows_by_conversation_id: dict[int, list[VoteInputRow]],
+    vote_columns_by_conversation_id: Mapping[int, VoteInputColumns],
+    incremental_bases_by_conversation_id: Mapping[int, IncrementalSnapshotBase] | None = None,
 ) -> dict[int, PreparedInputSnapshot]:
+    incremental_bases = incremental_bases_by_conversation_id or {}
     snapshots: dict[int, PreparedInputSnapshot] = {}
     for conversation_id, data_generation in data_generation_by_conversation_id.items():
-        rows = rows_by_conversation_id.get(conversation_id, [])
-        data_generations = {row.data_generation for row in rows}
-        if len(data_generations) > 1:
+        incremental_base = incremental_bases.get(conversation_id)
+        if incremental_base is not None:
+            if incremental_base.snapshot.data_generation != data_generation:
+                msg = f"stale incremental input snapshot for conversation {conversation_id}"
+                raise ValueError(msg)
+            snapshots[conversation_id] = incremental_base.snapshot
+            continue
+        columns = vote_columns_by_conversation_id.get(conversation_id)
+        if columns is None:
+            columns = VoteInputColumnsBuilder().build()
+        if len(columns.data_generations) > 1:
             msg = f"mixed data generations for conversation {conversation_id}"
             raise ValueError(msg)
-        if data_generations and data_generations.pop() != data_generation:
+        if columns.data_generations and data_generation not in columns.data_generations:
             msg = f"stale input rows for conversation {conversation_id}"
             raise ValueError(msg)
-        snapshots[conversation_id] = prepare_input_snapshot(
+        snapshots[conversation_id] = prepare_input_snapshot_from_columns(
             conversation_id=conversation_id,
             data_generation=data_generation,
-            rows=rows,
+            columns=columns,
         )
     return snapshots
@@ -0,0 +1,70 @@
+"""Shared test fixtures.
+
+Podman users can still set DOCKER_HOST manually before running tests:
+  DOCKER_HOST="unix://$(podman machine inspect --format '{{.ConnectionInfo.PodmanSocket.Path}}')" \
+  uv run pytest
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import Engine, create_engine
+from testcontainers.core.config import testcontainers_config
+from testcontainers.postgres import PostgresContainer
+
+from agora_analysis_worker_shared.generated_models import Base
+
+
+def _configure_docker_host() -> None:
+    if os.environ.get("DOCKER_HOST"):
+        return
+
+    try:
+        result = subprocess.run(
+            [
+                "podman",
+                "machine",
+                "inspect",
+                "--format",
+                "{{.ConnectionInfo.PodmanSocket.Path}}",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return
+
+    socket_path = result.stdout.strip()
+    if socket_path:
+        os.environ["DOCKER_HOST"] = f"unix://{socket_path}"
+
+
+_configure_docker_host()
+
+# Disable Ryuk for Podman compatibility (must be set before any container starts)
+testcontainers_config.ryuk_disabled = True
+
+
+@pytest.fixture(scope="session")
+def postgres_container() -> Generator[PostgresContainer]:
+    """Start a single Postgres container for the entire test session."""
+    container = PostgresContainer("postgres:17", driver="psycopg")
+    container.start()
+    yield container
+    container.stop()
+
+
+@pytest.fixture()
+def pg_engine(postgres_container: PostgresContainer) -> Generator[Engine]:
+    """Per-test engine over freshly created analysis tables."""
+    engine = create_engine(postgres_container.get_connection_url())
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
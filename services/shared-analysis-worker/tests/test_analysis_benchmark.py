@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agora_analysis_worker_shared.analysis_benchmark import (
+    BenchmarkCase,
+    main,
+    run_benchmark_case,
+    synthetic_vote_columns,
+)
+from agora_analysis_worker_shared.db import (
+    OpinionGroupConfigRecord,
+    OpinionGroupSpecRecord,
+    OpinionGroupVariantRecord,
+)
+
+CASE = BenchmarkCase(name="tiny", participant_count=40, opinion_count=12, density=0.6)
+
+
+@dataclass(frozen=True)
+class FakeRedDwarfResult:
+    participants_df: pd.DataFrame
+    statements_df: pd.DataFrame
+    group_comment_stats: pd.DataFrame
+    repness: dict[int, list[dict[str, object]]]
+    consensus: dict[str, list[dict[str, object]]]
+
+
+@dataclass(frozen=True)
+class FakeRedDwarfOutcome:
+    outcome: str
+    result: FakeRedDwarfResult
+
+
+def fake_runner(
+    *,
+    votes: list[dict[str, int]],
+    min_user_vote_threshold: int,
+    max_group_count: int,
+    force_group_count: int | None = None,
+    candidate_group_counts: list[int] | None = None,
+    init_centers: list[list[float]] | None = None,
+) -> FakeRedDwarfOutcome:
+    participant_ids = sorted({vote["participant_id"] for vote in votes})
+    return FakeRedDwarfOutcome(
+        outcome="success",
+        result=FakeRedDwarfResult(
+            participants_df=pd.DataFrame(
+                {
+                    "x": [float(participant_id % 2) for participant_id in participant_ids],
+                    "y": [participant_id / 100 for participant_id in participant_ids],
+                    "cluster_id": [participant_id % 2 for participant_id in participant_ids],
+                },
+                index=pd.Index(participant_ids, name="participant_id"),
+            ),
+            statements_df=pd.DataFrame(
+                {"priority": [0.9, 0.7], "extremity": [0.2, 0.1]},
+                index=pd.Index([0, 1], name="statement_id"),
+            ),
+            group_comment_stats=pd.DataFrame(
+                {"na": [6, 0], "nd": [0, 6], "ns": [6, 6]},
+                index=pd.MultiIndex.from_tuples(
+                    [(0, 0), (1, 0)],
+                    names=["group_id", "statement_id"],
+                ),
+            ),
+            repness={
+                0: [{"tid": 0, "repful-for": "agree", "p-success": 0.9, "n-success": 6}],
+                1: [{"tid": 0, "repful-for": "disagree", "p-success": 0.9, "n-success": 6}],
+            },
+            consensus={"agree": [], "disagree": []},
+        ),
+    )
+
+
+def _config() -> OpinionGroupConfigRecord:
+    return OpinionGroupConfigRecord(
+        spec=OpinionGroupSpecRecord(
+            id=1,
+            min_clusterable_participants=2,
+            min_votes_per_participant=2,
+            max_group_count=2,
+        ),
+        variants=[OpinionGroupVariantRecord(id=20, opinion_group_spec_id=1, group_count=2)],
+    )
+
+
+def test_synthetic_vote_columns_are_reproducible_for_a_seed() -> None:
+    columns = synthetic_vote_columns(case=CASE, seed=7)
+    same_seed = synthetic_vote_columns(case=CASE, seed=7)
+
+    assert np.array_equal(columns.votes, same_seed.votes)
+    assert np.array_equal(columns.participant_codes, same_seed.participant_codes)
+    assert set(np.unique(columns.votes).tolist()) <= {-1, 0, 1}
+    assert 0 < len(columns) <= CASE.participant_count * CASE.opinion_count
+    assert columns.opinion_ids.max() <= CASE.opinion_count
+
+
+def test_benchmark_case_reports_per_stage_timings_as_json() -> None:
+    report = run_benchmark_case(
+        case=CASE,
+        seed=7,
+        repeat=2,
+        config=_config(),
+        run_red_dwarf_pipeline=fake_runner,
+    )
+
+    assert report["name"] == "tiny"
+    assert report["votes"] == len(synthetic_vote_columns(case=CASE, seed=7))
+    assert report["outcome"] == "success"
+    assert report["successful_group_counts"] == [2]
+    assert report["persist_write_method"] is None
+    assert report["timings_ms"]["persist_ms"] is None
+    for stage in ["snapshot_prep_ms", "red_dwarf_ms", "post_processing_ms", "silhouette_ms"]:
+        timing = report["timings_ms"][stage]
+        assert 0 <= timing["min"] <= timing["median"] <= timing["max"]
+    assert (
+        report["input_hash"]
+        == run_benchmark_case(
+            case=CASE,
+            seed=7,
+            repeat=1,
+            config=_config(),
+            run_red_dwarf_pipeline=fake_runner,
+        )["input_hash"]
+    )
+    assert json.loads(json.dumps(report)) == report
+
+
+def test_benchmark_requires_at_least_one_repeat(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(ValueError, match="repeat must be at least 1"):
+        run_benchmark_case(case=CASE, seed=7, repeat=0, run_red_dwarf_pipeline=fake_runner)
+    with pytest.raises(SystemExit):
+        main(["--repeat", "0"])
+
+    assert "must be at least 1" in capsys.readouterr().err
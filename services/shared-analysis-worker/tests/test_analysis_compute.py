@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from agora_analysis_worker_shared import analysis_compute
 from agora_analysis_worker_shared.analysis_compute import (
+    ComputeStageTimings,
     RedDwarfContractError,
     compute_analysis_bundle,
+    red_dwarf_warm_start_from_bundle,
 )
 from agora_analysis_worker_shared.db import (
     OpinionGroupConfigRecord,
@@ -231,6 +236,7 @@ def test_compute_analysis_bundle_is_testable_with_injected_runner() -> None:
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         called_candidate_group_counts.append(candidate_group_counts)
         assert len(votes) == 12
@@ -275,6 +281,101 @@ def test_compute_analysis_bundle_is_testable_with_injected_runner() -> None:
     assert representative_opinion.agreement_type == "agree"
 
 
+def test_warm_start_seeds_red_dwarf_with_previous_group_centers() -> None:
+    snapshot = prepare_input_snapshot(
+        conversation_id=10,
+        data_generation=3,
+        rows=_snapshot_rows(),
+    )
+    called_init_centers: list[list[list[float]] | None] = []
+
+    def fake_runner(
+        *,
+        votes: list[dict[str, int]],
+        min_user_vote_threshold: int,
+        max_group_count: int,
+        force_group_count: int | None = None,
+        candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
+    ) -> FakeRedDwarfSuccess:
+        called_init_centers.append(init_centers)
+        return FakeRedDwarfSuccess(
+            FakeRedDwarfCandidatesResult(
+                candidates=[
+                    FakeRedDwarfCandidateSuccess(group_count=2, result=_fake_result(2)),
+                    FakeRedDwarfCandidateSuccess(group_count=3, result=_fake_result(3)),
+                ],
+            ),
+        )
+
+    bundle = compute_analysis_bundle(
+        snapshot=snapshot,
+        config=_config(),
+        run_red_dwarf_pipeline=fake_runner,
+    )
+    warm_start = red_dwarf_warm_start_from_bundle(bundle)
+    assert warm_start is not None
+    warm_bundle = compute_analysis_bundle(
+        snapshot=snapshot,
+        config=_config(),
+        run_red_dwarf_pipeline=fake_runner,
+        warm_start=warm_start,
+    )
+
+    assert np.allclose(warm_start.init_centers_by_group_count[2], [[0.05, 0.05], [10.05, 10.05]])
+    assert called_init_centers == [None, warm_start.init_centers_by_group_count[3]]
+    assert np.allclose(
+        warm_start.init_centers_by_group_count[3], [[0.05, 0.05], [10, 10], [10.1, 10.1]]
+    )
+    assert warm_bundle == bundle
+
+
+def test_compute_stage_timings_record_red_dwarf_and_silhouette_time() -> None:
+    snapshot = prepare_input_snapshot(
+        conversation_id=10,
+        data_generation=3,
+        rows=_snapshot_rows(),
+    )
+    red_dwarf_calls = 0
+
+    def fake_runner(
+        *,
+        votes: list[dict[str, int]],
+        min_user_vote_threshold: int,
+        max_group_count: int,
+        force_group_count: int | None = None,
+        candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
+    ) -> FakeRedDwarfSuccess:
+        nonlocal red_dwarf_calls
+        red_dwarf_calls += 1
+        return FakeRedDwarfSuccess(
+            FakeRedDwarfCandidatesResult(
+                candidates=[
+                    FakeRedDwarfCandidateSuccess(group_count=2, result=_fake_result(2)),
+                    FakeRedDwarfCandidateSuccess(group_count=3, result=_fake_result(3)),
+                ],
+            ),
+        )
+
+    timings = ComputeStageTimings()
+    timed_bundle = compute_analysis_bundle(
+        snapshot=snapshot,
+        config=_config(),
+        run_red_dwarf_pipeline=fake_runner,
+        timings=timings,
+    )
+
+    assert red_dwarf_calls == 1
+    assert timings.red_dwarf_seconds > 0
+    assert timings.silhouette_seconds > 0
+    assert timed_bundle == compute_analysis_bundle(
+        snapshot=snapshot,
+        config=_config(),
+        run_red_dwarf_pipeline=fake_runner,
+    )
+
+
 def test_duplicate_representative_sets_hide_only_the_affected_candidate() -> None:
     snapshot = prepare_input_snapshot(
         conversation_id=10,
@@ -289,6 +390,7 @@ def test_duplicate_representative_sets_hide_only_the_affected_candidate() -> Non
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         return FakeRedDwarfSuccess(
             FakeRedDwarfCandidatesResult(
@@ -366,6 +468,7 @@ def test_same_representative_statement_with_different_stance_is_allowed() -> Non
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         return FakeRedDwarfSuccess(
             _fake_result_with_repness(
@@ -416,6 +519,7 @@ def test_compute_analysis_bundle_short_circuits_insufficient_data() -> None:
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         raise AssertionError("red-dwarf should not run for insufficient data")
 
@@ -436,6 +540,62 @@ def test_compute_analysis_bundle_short_circuits_insufficient_data() -> None:
     )
 
 
+def test_precheck_treats_passes_as_missing_votes_for_unique_points() -> None:
+    snapshot = prepare_input_snapshot(
+        conversation_id=10,
+        data_generation=3,
+        rows=[
+            VoteInputRow(
+                conversation_id=10,
+                data_generation=3,
+                user_id=user_id,
+                opinion_id=opinion_id,
+                opinion_content_id=opinion_id + 1000,
+                vote=vote,
+            )
+            for user_id, votes in [
+                (USER_A, {100: "agree", 101: "disagree", 102: "pass"}),
+                (USER_B, {100: "agree", 101: "disagree"}),
+                (USER_C, {101: "disagree", 100: "agree", 102: "pass"}),
+            ]
+            for opinion_id, vote in votes.items()
+        ],
+    )
+
+    def runner_that_should_not_be_called(
+        *,
+        votes: list[dict[str, int]],
+        min_user_vote_threshold: int,
+        max_group_count: int,
+        force_group_count: int | None = None,
+        candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
+    ) -> FakeRedDwarfSuccess:
+        raise AssertionError("red-dwarf should not run for insufficient data")
+
+    bundle = compute_analysis_bundle(
+        snapshot=snapshot,
+        config=OpinionGroupConfigRecord(
+            spec=OpinionGroupSpecRecord(
+                id=1,
+                min_clusterable_participants=2,
+                min_votes_per_participant=2,
+                max_group_count=4,
+            ),
+            variants=[
+                OpinionGroupVariantRecord(id=20, opinion_group_spec_id=1, group_count=2),
+                OpinionGroupVariantRecord(id=40, opinion_group_spec_id=1, group_count=4),
+            ],
+        ),
+        run_red_dwarf_pipeline=runner_that_should_not_be_called,
+    )
+
+    assert [candidate.outcome_reason for candidate in bundle.candidates] == [
+        AnalysisInsufficientDataReasonEnum.not_enough_unique_points,
+        AnalysisInsufficientDataReasonEnum.not_enough_samples_for_group_count,
+    ]
+
+
 def test_singleton_group_candidates_are_displayable_for_three_groups() -> None:
     snapshot = prepare_input_snapshot(
         conversation_id=10,
@@ -450,6 +610,7 @@ def test_singleton_group_candidates_are_displayable_for_three_groups() -> None:
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         assert force_group_count == 3
         assert candidate_group_counts is None
@@ -490,6 +651,7 @@ def test_singleton_group_candidates_are_hidden_for_two_groups() -> None:
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         assert force_group_count == 2
         assert candidate_group_counts is None
@@ -532,6 +694,7 @@ def test_candidate_assessment_records_cv_balance_and_selection_score() -> None:
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         return FakeRedDwarfSuccess(_fake_result(force_group_count or 2))
 
@@ -558,6 +721,85 @@ def test_candidate_assessment_records_cv_balance_and_selection_score() -> None:
     assert assessment.selection_score is not None
 
 
+def _reference_silhouette(coords: np.ndarray, cluster_ids: list[int]) -> float:
+    """Mean silhouette from the full pairwise distance matrix."""
+    labels = np.array(cluster_ids)
+    distances = np.linalg.norm(coords[:, np.newaxis, :] - coords[np.newaxis, :, :], axis=2)
+    scores: list[float] = []
+    for index, label in enumerate(labels):
+        same = labels == label
+        same[index] = False
+        if not same.any():
+            scores.append(0.0)
+            continue
+        intra = float(distances[index, same].mean())
+        nearest = min(
+            float(distances[index, labels == other].mean())
+            for other in np.unique(labels)
+            if other != label
+        )
+        scores.append((nearest - intra) / max(intra, nearest))
+    return sum(scores) / len(scores)
+
+
+def test_candidate_silhouette_score_matches_reference_across_blocks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(analysis_compute, "SILHOUETTE_BLOCK_ELEMENT_LIMIT", 64)
+    snapshot = prepare_input_snapshot(
+        conversation_id=10,
+        data_generation=3,
+        rows=_snapshot_rows(),
+    )
+    rng = np.random.default_rng(7)
+    cluster_ids = [index % 3 for index in range(30)]
+    coords = rng.normal(size=(30, 2)) + np.array(cluster_ids)[:, np.newaxis] * 2.5
+    result = _fake_result(3)
+    participants_df = pd.DataFrame(
+        {
+            "x": coords[:, 0],
+            "y": coords[:, 1],
+            "to_cluster": [True for _cluster_id in cluster_ids],
+            "cluster_id": cluster_ids,
+        },
+        index=pd.Index(range(len(cluster_ids)), name="participant_id"),
+    )
+
+    def fake_runner(
+        *,
+        votes: list[dict[str, int]],
+        min_user_vote_threshold: int,
+        max_group_count: int,
+        force_group_count: int | None = None,
+        candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
+    ) -> FakeRedDwarfSuccess:
+        return FakeRedDwarfSuccess(
+            FakeRedDwarfResult(
+                participants_df=participants_df,
+                statements_df=result.statements_df,
+                group_comment_stats=result.group_comment_stats,
+                repness=result.repness,
+                consensus=result.consensus,
+            )
+        )
+
+    bundle = compute_analysis_bundle(
+        snapshot=snapshot,
+        config=_single_variant_config(),
+        run_red_dwarf_pipeline=fake_runner,
+    )
+
+    assessment = bundle.candidates[0].assessment
+    assert assessment is not None
+    assert assessment.silhouette_score is not None
+    assert math.isclose(
+        assessment.silhouette_score,
+        _reference_silhouette(coords, cluster_ids),
+        rel_tol=1e-12,
+    )
+
+
 def test_imbalanced_candidate_records_cv_without_hiding() -> None:
     snapshot = prepare_input_snapshot(
         conversation_id=10,
@@ -572,6 +814,7 @@ def test_imbalanced_candidate_records_cv_without_hiding() -> None:
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         return FakeRedDwarfSuccess(_result_with_groups(cluster_ids=[0] * 40 + [1, 1]))
 
@@ -611,6 +854,7 @@ def test_missing_group_representative_opinions_hides_candidate() -> None:
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         result = _fake_result(force_group_count or 2)
         return FakeRedDwarfSuccess(
@@ -653,6 +897,7 @@ def test_unknown_insufficient_data_reason_is_stored_as_other() -> None:
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         return FakeRedDwarfSuccess(
             FakeRedDwarfCandidatesResult(
@@ -695,6 +940,7 @@ def test_group_comment_stats_ns_is_total_votes_not_passes() -> None:
         max_group_count: int,
         force_group_count: int | None = None,
         candidate_group_counts: list[int] | None = None,
+        init_centers: list[list[float]] | None = None,
     ) -> FakeRedDwarfSuccess:
         assert len(votes) == 12
         assert min_user_vote_threshold == 2
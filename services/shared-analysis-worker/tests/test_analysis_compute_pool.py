@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import pandas as pd
+import pytest
+
+from agora_analysis_worker_shared.analysis_compute import RedDwarfContractError
+from agora_analysis_worker_shared.analysis_compute_pool import (
+    AnalysisComputePool,
+    AnalysisComputeWorkerError,
+    compact_compute_input,
+    expand_compute_input,
+)
+from agora_analysis_worker_shared.db import (
+    OpinionGroupConfigRecord,
+    OpinionGroupSpecRecord,
+    OpinionGroupVariantRecord,
+)
+from agora_analysis_worker_shared.input_snapshot import (
+    PreparedInputSnapshot,
+    VoteInputRow,
+    prepare_input_snapshot,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+CONTRACT_VIOLATING_MAX_GROUP_COUNT = 99
+
+
+@dataclass(frozen=True)
+class FakeRedDwarfResult:
+    participants_df: pd.DataFrame
+    statements_df: pd.DataFrame
+    group_comment_stats: pd.DataFrame
+    repness: dict[int, list[dict[str, object]]]
+    consensus: dict[str, list[dict[str, object]]]
+
+
+@dataclass(frozen=True)
+class FakeRedDwarfOutcome:
+    outcome: str
+    result: FakeRedDwarfResult | None = None
+
+
+def fake_runner(
+    *,
+    votes: list[dict[str, int]],
+    min_user_vote_threshold: int,
+    max_group_count: int,
+    force_group_count: int | None = None,
+    candidate_group_counts: list[int] | None = None,
+    init_centers: list[list[float]] | None = None,
+) -> FakeRedDwarfOutcome:
+    if max_group_count == CONTRACT_VIOLATING_MAX_GROUP_COUNT:
+        return FakeRedDwarfOutcome(outcome="exploded")
+    participant_ids = sorted({vote["participant_id"] for vote in votes})
+    return FakeRedDwarfOutcome(
+        outcome="success",
+        result=FakeRedDwarfResult(
+            participants_df=pd.DataFrame(
+                {
+                    "x": [float(participant_id % 2) for participant_id in participant_ids],
+                    "y": [participant_id / 100 for participant_id in participant_ids],
+                    "cluster_id": [participant_id % 2 for participant_id in participant_ids],
+                },
+                index=pd.Index(participant_ids, name="participant_id"),
+            ),
+            statements_df=pd.DataFrame(
+                {"priority": [0.9, 0.7], "extremity": [0.2, 0.1]},
+                index=pd.Index([0, 1], name="statement_id"),
+            ),
+            group_comment_stats=pd.DataFrame(
+                {"na": [6, 0], "nd": [0, 6], "ns": [6, 6]},
+                index=pd.MultiIndex.from_tuples(
+                    [(0, 0), (1, 0)],
+                    names=["group_id", "statement_id"],
+                ),
+            ),
+            repness={
+                0: [{"tid": 0, "repful-for": "agree", "p-success": 0.9, "n-success": 6}],
+                1: [{"tid": 0, "repful-for": "disagree", "p-success": 0.9, "n-success": 6}],
+            },
+            consensus={"agree": [], "disagree": []},
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def process_pool() -> Iterator[AnalysisComputePool]:
+    pool = AnalysisComputePool(engine="process", max_workers=1, run_red_dwarf_pipeline=fake_runner)
+    yield pool
+    pool.shutdown()
+
+
+def _snapshot(*, participant_count: int = 12) -> PreparedInputSnapshot:
+    rows: list[VoteInputRow] = []
+    for participant_index in range(participant_count):
+        user_id = UUID(int=participant_index + 1)
+        leaning = "agree" if participant_index % 2 == 0 else "disagree"
+        opposite = "disagree" if leaning == "agree" else "agree"
+        for opinion_id, vote in enumerate(
+            [leaning, leaning, opposite, "pass" if participant_index % 3 else leaning],
+            start=100,
+        ):
+            rows.append(
+                VoteInputRow(
+                    conversation_id=10,
+                    data_generation=3,
+                    user_id=user_id,
+                    opinion_id=opinion_id,
+                    opinion_content_id=opinion_id + 1000,
+                    vote=vote,
+                )
+            )
+    return prepare_input_snapshot(conversation_id=10, data_generation=3, rows=rows)
+
+
+def _config(
+    *,
+    max_group_count: int = 2,
+    variants: list[OpinionGroupVariantRecord] | None = None,
+) -> OpinionGroupConfigRecord:
+    return OpinionGroupConfigRecord(
+        spec=OpinionGroupSpecRecord(
+            id=1,
+            min_clusterable_participants=2,
+            min_votes_per_participant=2,
+            max_group_count=max_group_count,
+        ),
+        variants=[OpinionGroupVariantRecord(id=20, opinion_group_spec_id=1, group_count=2)]
+        if variants is None
+        else variants,
+    )
+
+
+def test_compact_compute_input_round_trips_vote_matrix() -> None:
+    snapshot = _snapshot()
+
+    expanded = expand_compute_input(compact_compute_input(snapshot))
+
+    assert expanded.conversation_id == snapshot.conversation_id
+    assert expanded.data_generation == snapshot.data_generation
+    assert expanded.opinions == snapshot.opinions
+    assert expanded.vote_matrix == snapshot.vote_matrix
+
+
+def test_process_engine_matches_thread_engine(process_pool: AnalysisComputePool) -> None:
+    snapshot = _snapshot()
+    config = _config()
+    thread_pool = AnalysisComputePool(
+        engine="thread",
+        max_workers=1,
+        run_red_dwarf_pipeline=fake_runner,
+    )
+    try:
+        thread_bundle = thread_pool.submit(snapshot=snapshot, config=config).result()
+    finally:
+        thread_pool.shutdown()
+    process_bundle = process_pool.submit(snapshot=snapshot, config=config).result()
+
+    assert len(process_bundle.candidates[0].groups) == 2
+    assert process_bundle == thread_bundle
+
+
+def test_process_engine_keeps_contract_errors_non_retryable(
+    process_pool: AnalysisComputePool,
+) -> None:
+    future = process_pool.submit(
+        snapshot=_snapshot(),
+        config=_config(max_group_count=CONTRACT_VIOLATING_MAX_GROUP_COUNT),
+    )
+
+    with pytest.raises(RedDwarfContractError, match="unknown red-dwarf outcome exploded"):
+        future.result()
+
+
+def test_process_engine_keeps_retryable_errors_retryable(
+    process_pool: AnalysisComputePool,
+) -> None:
+    future = process_pool.submit(snapshot=_snapshot(), config=_config(variants=[]))
+
+    with pytest.raises(AnalysisComputeWorkerError, match="missing opinion-group variants"):
+        future.result()
+    assert not isinstance(future.exception(), RedDwarfContractError)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, cast
+from uuid import UUID
+
+import pandas as pd
+
+from agora_analysis_worker_shared.analysis_compute import (
+    ComputedAnalysisBundle,
+    compute_analysis_bundle,
+)
+from agora_analysis_worker_shared.analysis_result_cache import (
+    AnalysisResultCache,
+    analysis_result_cache_key,
+)
+from agora_analysis_worker_shared.db import (
+    OpinionGroupConfigRecord,
+    OpinionGroupSpecRecord,
+    OpinionGroupVariantRecord,
+)
+from agora_analysis_worker_shared.input_snapshot import (
+    PreparedInputSnapshot,
+    VoteInputRow,
+    prepare_input_snapshot,
+)
+
+if TYPE_CHECKING:
+    from valkey import Valkey
+
+
+@dataclass(frozen=True)
+class FakeRedDwarfResult:
+    participants_df: pd.DataFrame
+    statements_df: pd.DataFrame
+    group_comment_stats: pd.DataFrame
+    repness: dict[int, list[dict[str, object]]]
+    consensus: dict[str, list[dict[str, object]]]
+
+
+@dataclass(frozen=True)
+class FakeRedDwarfOutcome:
+    outcome: str
+    result: FakeRedDwarfResult
+
+
+class FakeValkey:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.values: dict[str, str] = {}
+        self.ttl_by_key: dict[str, int] = {}
+
+    def get(self, key: str) -> str | None:
+        if self.fail:
+            raise ConnectionError("valkey unavailable")
+        return self.values.get(key)
+
+    def set(self, key: str, value: str, *, ex: int) -> None:
+        if self.fail:
+            raise ConnectionError("valkey unavailable")
+        self.values[key] = value
+        self.ttl_by_key[key] = ex
+
+
+def fake_runner(
+    *,
+    votes: list[dict[str, int]],
+    min_user_vote_threshold: int,
+    max_group_count: int,
+    force_group_count: int | None = None,
+    candidate_group_counts: list[int] | None = None,
+    init_centers: list[list[float]] | None = None,
+) -> FakeRedDwarfOutcome:
+    participant_ids = sorted({vote["participant_id"] for vote in votes})
+    return FakeRedDwarfOutcome(
+        outcome="success",
+        result=FakeRedDwarfResult(
+            participants_df=pd.DataFrame(
+                {
+                    "x": [float(participant_id % 2) for participant_id in participant_ids],
+                    "y": [participant_id / 100 for participant_id in participant_ids],
+                    "cluster_id": [participant_id % 2 for participant_id in participant_ids],
+                },
+                index=pd.Index(participant_ids, name="participant_id"),
+            ),
+            statements_df=pd.DataFrame(
+                {"priority": [0.9, 0.7], "extremity": [0.2, 0.1]},
+                index=pd.Index([0, 1], name="statement_id"),
+            ),
+            group_comment_stats=pd.DataFrame(
+                {"na": [6, 0], "nd": [0, 6], "ns": [6, 6]},
+                index=pd.MultiIndex.from_tuples(
+                    [(0, 0), (1, 0)],
+                    names=["group_id", "statement_id"],
+                ),
+            ),
+            repness={
+                0: [{"tid": 0, "repful-for": "agree", "p-success": 0.9, "n-success": 6}],
+                1: [{"tid": 0, "repful-for": "disagree", "p-success": 0.9, "n-success": 6}],
+            },
+            consensus={"agree": [], "disagree": []},
+        ),
+    )
+
+
+def _snapshot() -> PreparedInputSnapshot:
+    rows: list[VoteInputRow] = []
+    for participant_index in range(12):
+        leaning = "agree" if participant_index % 2 == 0 else "disagree"
+        opposite = "disagree" if leaning == "agree" else "agree"
+        for opinion_id, vote in enumerate([leaning, leaning, opposite, "pass"], start=100):
+            rows.append(
+                VoteInputRow(
+                    conversation_id=10,
+                    data_generation=3,
+                    user_id=UUID(int=participant_index + 1),
+                    opinion_id=opinion_id,
+                    opinion_content_id=opinion_id + 1000,
+                    vote=vote,
+                )
+            )
+    return prepare_input_snapshot(conversation_id=10, data_generation=3, rows=rows)
+
+
+def _config(*, variants: list[OpinionGroupVariantRecord] | None = None) -> OpinionGroupConfigRecord:
+    return OpinionGroupConfigRecord(
+        spec=OpinionGroupSpecRecord(
+            id=1,
+            min_clusterable_participants=2,
+            min_votes_per_participant=2,
+            max_group_count=2,
+        ),
+        variants=[OpinionGroupVariantRecord(id=20, opinion_group_spec_id=1, group_count=2)]
+        if variants is None
+        else variants,
+    )
+
+
+def _bundle() -> ComputedAnalysisBundle:
+    return compute_analysis_bundle(
+        snapshot=_snapshot(),
+        config=_config(),
+        run_red_dwarf_pipeline=fake_runner,
+    )
+
+
+def test_cache_key_covers_input_config_and_engine_epoch() -> None:
+    variants = [
+        OpinionGroupVariantRecord(id=20, opinion_group_spec_id=1, group_count=2),
+        OpinionGroupVariantRecord(id=21, opinion_group_spec_id=1, group_count=3),
+    ]
+    config = _config(variants=variants)
+    key = analysis_result_cache_key(input_hash="abc", config=config, analysis_engine_epoch=1)
+
+    assert key == analysis_result_cache_key(
+        input_hash="abc",
+        config=_config(variants=list(reversed(variants))),
+        analysis_engine_epoch=1,
+    )
+    assert key != analysis_result_cache_key(
+        input_hash="abd", config=config, analysis_engine_epoch=1
+    )
+    assert key != analysis_result_cache_key(
+        input_hash="abc", config=config, analysis_engine_epoch=2
+    )
+    assert key != analysis_result_cache_key(
+        input_hash="abc",
+        config=replace(config, spec=replace(config.spec, min_votes_per_participant=3)),
+        analysis_engine_epoch=1,
+    )
+    assert key != analysis_result_cache_key(
+        input_hash="abc",
+        config=_config(
+            variants=[variants[0], replace(variants[1], group_count=4)],
+        ),
+        analysis_engine_epoch=1,
+    )
+
+
+def test_local_cache_evicts_least_recently_used_bundle() -> None:
+    bundle = _bundle()
+    cache = AnalysisResultCache(max_entries=2)
+
+    cache.put("a", bundle)
+    cache.put("b", bundle)
+    assert cache.get("a") is bundle
+    cache.put("c", bundle)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is bundle
+    assert cache.get("c") is bundle
+
+
+def test_shared_cache_round_trips_bundle_between_workers() -> None:
+    snapshot = _snapshot()
+    bundle = _bundle()
+    assert bundle.candidates[0].groups
+    key = analysis_result_cache_key(
+        input_hash=snapshot.input_hash,
+        config=_config(),
+        analysis_engine_epoch=1,
+    )
+    vk = FakeValkey()
+    AnalysisResultCache(max_entries=0, vk=cast("Valkey", vk), shared_ttl_seconds=60).put(
+        key, bundle
+    )
+
+    other_worker = AnalysisResultCache(max_entries=4, vk=cast("Valkey", vk), shared_ttl_seconds=60)
+
+    assert vk.ttl_by_key == {f"analysis:result:{key}": 60}
+    assert other_worker.get(key) == bundle
+    assert len(other_worker) == 1
+
+
+def test_shared_cache_failures_fall_back_to_compute() -> None:
+    cache = AnalysisResultCache(
+        max_entries=0,
+        vk=cast("Valkey", FakeValkey(fail=True)),
+        shared_ttl_seconds=60,
+    )
+
+    cache.put("a", _bundle())
+
+    assert cache.get("a") is None
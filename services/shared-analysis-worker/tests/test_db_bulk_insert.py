@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, create_engine, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from agora_analysis_worker_shared import db
+from agora_analysis_worker_shared.generated_models import (
+    AnalysisSnapshotOpinion,
+    Base,
+    OpinionGroup,
+    OpinionGroupCandidateOpinionMetrics,
+    OpinionGroupOpinionStats,
+    OpinionGroupUser,
+    VoteEnumSimple,
+)
+
+# Where the generated models differ from the V0062 migration that bulk COPY writes into
+MIGRATED_SCHEMA_STATEMENTS = (
+    "ALTER TABLE analysis_snapshot_opinion ALTER COLUMN routing_priority TYPE real",
+    "ALTER TABLE opinion_group_candidate_opinion_metrics "
+    "ALTER COLUMN group_aware_consensus_agree TYPE real, "
+    "ALTER COLUMN group_aware_consensus_disagree TYPE real, "
+    "ALTER COLUMN divisiveness TYPE real, "
+    "ALTER COLUMN majority_probability_success TYPE real",
+    "ALTER TABLE opinion_group_opinion_stats "
+    "ALTER COLUMN representative_probability_agreement TYPE real, "
+    "ALTER COLUMN raw_repness TYPE jsonb USING raw_repness::jsonb",
+    *(
+        f"ALTER TABLE {table_name} ALTER COLUMN created_at SET DEFAULT now()"
+        for table_name in (
+            "analysis_snapshot_opinion",
+            "opinion_group_candidate_opinion_metrics",
+            "opinion_group_user",
+            "opinion_group_opinion_stats",
+        )
+    ),
+)
+
+# Every column holds a distinct value so a misordered COPY column cannot round-trip
+COPY_ROUND_TRIP_ROWS: list[tuple[type[Base], list[dict[str, object]]]] = [
+    (
+        AnalysisSnapshotOpinion,
+        [
+            {
+                "analysis_snapshot_id": 1,
+                "opinion_id": 2,
+                "opinion_content_id": 3,
+                "local_opinion_index": 4,
+                "num_agrees": 5,
+                "num_disagrees": 6,
+                "num_passes": 7,
+                "routing_priority": 0.75,
+            },
+            {
+                "analysis_snapshot_id": 1,
+                "opinion_id": 12,
+                "opinion_content_id": None,
+                "local_opinion_index": 14,
+                "num_agrees": 0,
+                "num_disagrees": 0,
+                "num_passes": 0,
+                "routing_priority": None,
+            },
+        ],
+    ),
+    (
+        OpinionGroupCandidateOpinionMetrics,
+        [
+            {
+                "candidate_id": 1,
+                "analysis_snapshot_opinion_id": 2,
+                "group_aware_consensus_agree": 0.5,
+                "group_aware_consensus_disagree": 0.25,
+                "divisiveness": 0.125,
+                "majority_type": VoteEnumSimple.disagree,
+                "majority_probability_success": 0.875,
+                "agreement_rank": 3,
+                "disagreement_rank": 4,
+                "divisiveness_rank": 5,
+            },
+            {
+                "candidate_id": 1,
+                "analysis_snapshot_opinion_id": 12,
+                "group_aware_consensus_agree": None,
+                "group_aware_consensus_disagree": None,
+                "divisiveness": None,
+                "majority_type": None,
+                "majority_probability_success": None,
+                "agreement_rank": None,
+                "disagreement_rank": None,
+                "divisiveness_rank": None,
+            },
+        ],
+    ),
+    (
+        OpinionGroupUser,
+        [
+            {"candidate_id": 1, "group_id": 2, "user_id": UUID(int=3)},
+            {"candidate_id": 1, "group_id": 12, "user_id": UUID(int=13)},
+        ],
+    ),
+    (
+        OpinionGroupOpinionStats,
+        [
+            {
+                "group_id": 1,
+                "analysis_snapshot_opinion_id": 2,
+                "num_agrees": 3,
+                "num_disagrees": 4,
+                "num_passes": 5,
+                "representative_agreement_type": VoteEnumSimple.agree,
+                "representative_probability_agreement": 0.625,
+                "representative_number_agreement": 6,
+                "raw_repness": {"tid": 2, "repful-for": "agree", "p-test": 1.5},
+            },
+            {
+                "group_id": 1,
+                "analysis_snapshot_opinion_id": 12,
+                "num_agrees": 0,
+                "num_disagrees": 0,
+                "num_passes": 0,
+                "representative_agreement_type": None,
+                "representative_probability_agreement": None,
+                "representative_number_agreement": None,
+                "raw_repness": None,
+            },
+        ],
+    ),
+]
+
+
+def _create_engine() -> Engine:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        AnalysisSnapshotOpinion,
+        OpinionGroupCandidateOpinionMetrics,
+        OpinionGroupUser,
+        OpinionGroupOpinionStats,
+    ],
+)
+def test_copy_columns_cover_every_written_column(model: type[Base]) -> None:
+    columns = db.BULK_COPY_COLUMNS_BY_TABLE[model.__tablename__]
+
+    assert {column_name for column_name, _copy_type in columns} == {
+        column.name for column in model.__table__.columns
+    } - {"id", "created_at"}
+
+
+def test_bulk_insert_rejects_tables_without_copy_columns() -> None:
+    engine = _create_engine()
+
+    with Session(engine) as session, pytest.raises(ValueError, match="no bulk COPY columns"):
+        db.bulk_insert_rows(session, model=OpinionGroup, values=[])
+
+
+def test_bulk_insert_falls_back_to_chunked_inserts_on_sqlite(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(db, "POSTGRES_INSERT_BIND_PARAM_LIMIT", 18)
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    values = [
+        {
+            "group_id": 5,
+            "analysis_snapshot_opinion_id": snapshot_opinion_id,
+            "num_agrees": 3,
+            "num_disagrees": 1,
+            "num_passes": 0,
+            "representative_agreement_type": VoteEnumSimple.agree,
+            "representative_probability_agreement": 0.75,
+            "representative_number_agreement": 3,
+            "raw_repness": {"tid": snapshot_opinion_id, "repful-for": "agree"},
+            "created_at": created_at,
+        }
+        for snapshot_opinion_id in range(5)
+    ]
+    engine = _create_engine()
+
+    with Session(engine) as session:
+        write_method = db.bulk_insert_rows(
+            session,
+            model=OpinionGroupOpinionStats,
+            values=values,
+        )
+        db.bulk_insert_rows(
+            session,
+            model=OpinionGroupUser,
+            values=[
+                {"candidate_id": 4, "group_id": 5, "user_id": UUID(int=7), "created_at": created_at}
+            ],
+        )
+        stats = session.scalars(
+            select(OpinionGroupOpinionStats).order_by(
+                OpinionGroupOpinionStats.analysis_snapshot_opinion_id
+            )
+        ).all()
+        group_user = session.scalars(select(OpinionGroupUser)).one()
+
+    assert write_method == "insert"
+    assert [row.analysis_snapshot_opinion_id for row in stats] == [0, 1, 2, 3, 4]
+    assert stats[4].representative_agreement_type == VoteEnumSimple.agree
+    assert stats[4].raw_repness == {"tid": 4, "repful-for": "agree"}
+    assert group_user.user_id == UUID(int=7)
+
+
+@pytest.mark.parametrize(
+    ("model", "values"),
+    COPY_ROUND_TRIP_ROWS,
+    ids=[model.__tablename__ for model, _values in COPY_ROUND_TRIP_ROWS],
+)
+def test_bulk_insert_copies_rows_into_postgres(
+    pg_engine: Engine,
+    model: type[Base],
+    values: list[dict[str, object]],
+) -> None:
+    with pg_engine.begin() as connection:
+        for statement in MIGRATED_SCHEMA_STATEMENTS:
+            connection.execute(text(statement))
+
+    with Session(pg_engine) as session:
+        write_method = db.bulk_insert_rows(session, model=model, values=values)
+        session.commit()
+
+    table = model.__table__
+    with pg_engine.connect() as connection:
+        rows = connection.execute(select(table).order_by(table.c.id)).mappings().all()
+
+    assert write_method == "copy"
+    assert [{column_name: row[column_name] for column_name in values[0]} for row in rows] == values
+    assert all(isinstance(row["created_at"], datetime) for row in rows)
@@ -1,19 +1,77 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from uuid import UUID
 
+import numpy as np
 import zstandard as zstd
 
 from agora_analysis_worker_shared.input_snapshot import (
+    IncrementalSnapshotBase,
+    InputSnapshotCache,
+    VoteInputColumnsBuilder,
+    VoteInputDelta,
     VoteInputRow,
+    apply_vote_input_delta,
+    build_incremental_snapshot_base,
     canonical_json_bytes,
     prepare_input_snapshot,
     prepare_input_snapshots_batch,
+    vote_input_columns_from_rows,
 )
 
 USER_A = UUID("00000000-0000-0000-0000-00000000000a")
 USER_B = UUID("00000000-0000-0000-0000-00000000000b")
+USER_C = UUID("00000000-0000-0000-0000-00000000000c")
+USER_0 = UUID("00000000-0000-0000-0000-000000000000")
+
+
+def _row(
+    user_id: UUID,
+    opinion_id: int,
+    vote: str,
+    *,
+    vote_content_id: int,
+    data_generation: int = 3,
+) -> VoteInputRow:
+    return VoteInputRow(
+        conversation_id=10,
+        data_generation=data_generation,
+        user_id=user_id,
+        opinion_id=opinion_id,
+        opinion_content_id=opinion_id * 10,
+        vote=vote,
+        vote_content_id=vote_content_id,
+    )
+
+
+def _base(rows: list[VoteInputRow]) -> IncrementalSnapshotBase:
+    base = build_incremental_snapshot_base(
+        snapshot=prepare_input_snapshot(conversation_id=10, data_generation=3, rows=rows),
+        columns=vote_input_columns_from_rows(rows),
+    )
+    assert base is not None
+    return base
+
+
+def _delta(
+    *,
+    base: IncrementalSnapshotBase,
+    current_rows: list[VoteInputRow],
+) -> VoteInputDelta:
+    return VoteInputDelta(
+        conversation_id=10,
+        since_vote_content_id=base.max_vote_content_id,
+        rows=[
+            row
+            for row in current_rows
+            if row.vote_content_id is not None and row.vote_content_id > base.max_vote_content_id
+        ],
+        vote_count=len(current_rows),
+        vote_content_id_sum=sum(row.vote_content_id or 0 for row in current_rows),
+        opinion_content_id_sum=sum(row.opinion_content_id for row in current_rows),
+    )
 
 
 def test_prepare_input_snapshot_uses_local_indexes_only() -> None:
@@ -56,12 +114,17 @@ def test_prepare_input_snapshot_uses_local_indexes_only() -> None:
     }
     assert "00000000" not in raw_payload.decode("utf-8")
     assert "1000" not in raw_payload.decode("utf-8")
+    assert raw_payload == canonical_json_bytes(payload)
+    assert snapshot.input_hash == hashlib.sha256(raw_payload).hexdigest()
+    assert snapshot.vote_matrix.participant_indexes.dtype == np.int32
+    assert snapshot.vote_matrix.opinion_indexes.dtype == np.int32
+    assert snapshot.vote_matrix.votes.tolist() == [1, -1]
 
 
 def test_prepare_empty_input_snapshot_for_insufficient_data() -> None:
     snapshots = prepare_input_snapshots_batch(
         data_generation_by_conversation_id={10: 4},
-        rows_by_conversation_id={10: []},
+        vote_columns_by_conversation_id={10: VoteInputColumnsBuilder().build()},
     )
 
     snapshot = snapshots[10]
@@ -70,8 +133,118 @@ def test_prepare_empty_input_snapshot_for_insufficient_data() -> None:
     assert snapshot.canonical_payload["votes"] == []
 
 
+def test_streamed_vote_columns_build_the_same_snapshot_as_rows() -> None:
+    rows = [
+        _row(USER_C, 200, "disagree", vote_content_id=7),
+        _row(USER_C, 100, "agree", vote_content_id=4),
+        _row(USER_A, 200, "pass", vote_content_id=9),
+        _row(USER_0, 100, "agree", vote_content_id=2),
+    ]
+    builder = VoteInputColumnsBuilder()
+    for row in rows:
+        builder.append(
+            data_generation=row.data_generation,
+            user_id=row.user_id,
+            opinion_id=row.opinion_id,
+            opinion_content_id=row.opinion_content_id,
+            vote=row.vote,
+            vote_content_id=row.vote_content_id,
+        )
+    columns = builder.build()
+
+    snapshot = prepare_input_snapshots_batch(
+        data_generation_by_conversation_id={10: 3},
+        vote_columns_by_conversation_id={10: columns},
+    )[10]
+    base = build_incremental_snapshot_base(snapshot=snapshot, columns=columns)
+
+    assert columns.user_ids == [USER_C, USER_A, USER_0]
+    assert columns.participant_codes.tolist() == [0, 0, 1, 2]
+    assert columns.votes.dtype == np.int8
+    assert columns.votes.tolist() == [-1, 1, 0, 1]
+    assert snapshot == prepare_input_snapshot(conversation_id=10, data_generation=3, rows=rows)
+    assert [participant.user_id for participant in snapshot.participants] == [
+        USER_0,
+        USER_A,
+        USER_C,
+    ]
+    assert base is not None
+    assert base.vote_content_ids.tolist() == [2, 9, 4, 7]
+
+
 def test_canonical_json_bytes_are_stable() -> None:
     left = canonical_json_bytes({"b": 1, "a": [2, 3]})
     right = canonical_json_bytes({"a": [2, 3], "b": 1})
 
     assert left == right
+
+
+def test_incremental_snapshot_matches_full_rebuild() -> None:
+    previous_rows = [
+        _row(USER_A, 100, "agree", vote_content_id=1),
+        _row(USER_A, 200, "disagree", vote_content_id=2),
+        _row(USER_B, 100, "pass", vote_content_id=3),
+    ]
+    current_rows = [
+        _row(USER_0, 200, "agree", vote_content_id=6, data_generation=4),
+        _row(USER_A, 100, "agree", vote_content_id=1, data_generation=4),
+        _row(USER_A, 200, "agree", vote_content_id=5, data_generation=4),
+        _row(USER_B, 100, "pass", vote_content_id=3, data_generation=4),
+        _row(USER_C, 150, "disagree", vote_content_id=4, data_generation=4),
+    ]
+    base = _base(previous_rows)
+
+    incremental = apply_vote_input_delta(
+        base=base,
+        delta=_delta(base=base, current_rows=current_rows),
+        data_generation=4,
+    )
+    full = prepare_input_snapshot(conversation_id=10, data_generation=4, rows=current_rows)
+
+    assert incremental is not None
+    assert incremental.snapshot == full
+    assert incremental.max_vote_content_id == 6
+    full_base = build_incremental_snapshot_base(
+        snapshot=full,
+        columns=vote_input_columns_from_rows(current_rows),
+    )
+    assert full_base is not None
+    assert incremental.vote_content_ids.tolist() == full_base.vote_content_ids.tolist()
+
+
+def test_incremental_snapshot_rejects_delta_that_hides_removed_votes() -> None:
+    previous_rows = [
+        _row(USER_A, 100, "agree", vote_content_id=1),
+        _row(USER_B, 100, "disagree", vote_content_id=2),
+    ]
+    current_rows = [
+        _row(USER_A, 100, "agree", vote_content_id=1, data_generation=4),
+        _row(USER_C, 100, "agree", vote_content_id=3, data_generation=4),
+    ]
+    base = _base(previous_rows)
+
+    assert (
+        apply_vote_input_delta(
+            base=base,
+            delta=_delta(base=base, current_rows=current_rows),
+            data_generation=4,
+        )
+        is None
+    )
+
+
+def test_input_snapshot_cache_evicts_least_recently_used_conversation() -> None:
+    cache = InputSnapshotCache(max_conversations=1)
+    base = _base([_row(USER_A, 100, "agree", vote_content_id=1)])
+
+    cache.remember(base)
+    assert cache.bases_for([10, 11]) == {10: base}
+
+    cache.remember(
+        IncrementalSnapshotBase(
+            snapshot=prepare_input_snapshot(conversation_id=11, data_generation=1, rows=[]),
+            vote_content_ids=np.array([], dtype=np.int64),
+            max_vote_content_id=0,
+        )
+    )
+    assert list(cache.bases_for([10, 11])) == [11]